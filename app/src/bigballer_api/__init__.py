@@ -12,7 +12,9 @@ bigballer web - collect items
     You should have received a copy of the GNU Affero General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import asyncio
 import time
+import traceback
 from urllib.parse import urlencode
 from uuid import uuid4
 from typing_extensions import Annotated
@@ -21,22 +23,40 @@ from acouchbase.transactions import AttemptContext
 from couchbase.exceptions import (
     DocumentNotFoundException,
 )
-from couchbase.options import TransactionQueryOptions
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey, RSAPrivateKey
+from couchbase.options import GetOptions
 from fastapi import Depends, FastAPI, HTTPException, Query, Request, Security, status
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from fastapi.security import APIKeyCookie
+import httpx
 import jwt
-import requests
 
-from bigballer_api.data import close_db, cluster, connect_db, get_scope
+from bigballer_api import (
+    auth,
+    data,
+    item_schema,
+    pagination,
+    pinecones,
+    response_cache,
+    steam,
+    trade_locks,
+    user_search,
+)
+from bigballer_api.data import close_db, cluster, connect_db
 import bigballer_api.generator as roller
+from bigballer_api.jobs import enqueue, start_workers, stop_workers
 from bigballer_api.models import (
+    Item,
+    ItemsPage,
     ItemsQuery,
+    ItemStatus,
+    PineconeBalance,
+    Trade,
     TradeQuery,
     TradeRequest,
+    TradesPage,
     TradeStatusUpdate,
+    UserSearchResult,
+    round_display_floats,
 )
 from bigballer_api.settings import settings
 
@@ -44,35 +64,38 @@ from bigballer_api.settings import settings
 api_key_cookie = APIKeyCookie(name="access_token", auto_error=True)
 
 
-app = FastAPI(title="BigBaller API", description="", version="0.0.1")
+# Handlers return their responses directly, so response_model only
+# documents them and FastAPI does not validate or re-encode anything
+app = FastAPI(
+    title="BigBaller API",
+    description="",
+    version="0.0.1",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_event_handler("startup", connect_db)
+app.add_event_handler("startup", steam.open_client)
+app.add_event_handler("startup", start_workers)
+app.add_event_handler("startup", user_search.start)
+app.add_event_handler("shutdown", user_search.stop)
+app.add_event_handler("shutdown", stop_workers)
+app.add_event_handler("shutdown", steam.close_client)
 app.add_event_handler("shutdown", close_db)
+app.add_event_handler("shutdown", roller.shutdown)
 
 
-with open(settings().public_key_filepath, "rb") as public_key_file:
-    PUBLIC_KEY: RSAPublicKey = serialization.load_pem_public_key(
-        public_key_file.read()
-    )  # pyright: ignore [reportGeneralTypeIssues]
-
-with open(settings().private_key_filepath, "rb") as private_key_file:
-    PRIVATE_KEY: RSAPrivateKey = serialization.load_pem_private_key(
-        private_key_file.read(), password=None
-    )  # pyright: ignore [ reportGeneralTypeIssues]
-
-
-async def check_api_key(api_key: str = Security(api_key_cookie)) -> str:
+async def check_api_key(api_key: str = Security(api_key_cookie)) -> dict:
     try:
-        return jwt.decode(api_key, PUBLIC_KEY, ["RS256"])
-    except jwt.DecodeError:
+        return auth.verify_token(api_key)
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
 
-@app.get("/items", tags=["items"])
+@app.get("/items", tags=["items"], response_model=ItemsPage)
 async def get_items(
     items_query: Annotated[ItemsQuery, Depends()], api_key=Depends(check_api_key)
 ):
-    bigballer_scope = await get_scope()
+    bigballer_scope = data.scope()
 
     if items_query.user_id is not None:
         user_id = items_query.user_id
@@ -86,70 +109,96 @@ async def get_items(
         user_id = api_key["claimed_id"]
         private_keys = ", trade_id"
 
+    # Only pages without private keys are the same for everyone
+    cache_key = None
+    if private_keys == "":
+        cache_key = await response_cache.key(
+            "items", user_id, items_query.cursor, items_query.limit
+        )
+        cached = await response_cache.get(cache_key)
+        if cached is not None:
+            return ORJSONResponse(cached)
+
+    keyset_filter, keyset_params = pagination.keyset_params(items_query.cursor)
     items = bigballer_scope.query(
-        f"SELECT META().id, appraisal, modifier, name, rarity{private_keys} FROM items WHERE owner = $user_id OFFSET $offset LIMIT $limit",
+        f"SELECT META().id, creation_time, {', '.join(item_schema.SUMMARY_FIELDS)}{private_keys} FROM items WHERE owner = $user_id {keyset_filter} {pagination.KEYSET_ORDER} LIMIT $limit",
         user_id=user_id,
-        offset=items_query.offset,
-        limit=items_query.limit,
+        limit=items_query.limit + 1,
+        **keyset_params,
     )
 
-    return JSONResponse({"items": [i async for i in items.rows()]})
+    rows, next_cursor = pagination.page(
+        [i async for i in items.rows()], items_query.limit
+    )
 
+    page = {
+        "items": [roller.resolve_words(item_schema.decode(i)) for i in rows],
+        "next_cursor": next_cursor,
+    }
+    await response_cache.put(cache_key, page)
 
-@app.post("/roll", tags=["items"])
+    return ORJSONResponse(page)
+
+
+@app.post("/roll", tags=["items"], response_model=dict[str, Item])
 async def post_roll(pack: bool = False, api_key=Depends(check_api_key)):
-    bigballer_scope = await get_scope()
-    col_users = bigballer_scope.collection("users")
-    col_items = bigballer_scope.collection("items")
+    col_users = data.users()
+    col_items = data.items()
 
-    exception = None
+    if pack:
+        num_rolls = settings().rolls_per_pack
+        cost = settings().pack_roll_cost
+    else:
+        num_rolls = 1
+        cost = settings().roll_cost
 
+    # Only cheap rolls happen here, rendering is queued once they are saved
+    creation_time = round(time.time() * 1000)  # Unix milliseconds
     rolls = {}
+    for _ in range(num_rolls):
+        item_id = str(uuid4())
+        roll = roller.roll(item_id)
+        roll["owner"] = api_key["claimed_id"]
+        roll["creation_time"] = creation_time
+        roll["status"] = "pending"
 
-    async def tx(context: AttemptContext):
-        nonlocal exception, rolls
+        rolls[item_id] = roll
 
-        try:
-            user_query = await context.get(col_users, api_key["claimed_id"])
-        except DocumentNotFoundException:  # New user
-            if pack:
-                exception = HTTPException(status.HTTP_404_NOT_FOUND)
-                return
+    steam_summary = None
 
-            res = requests.get(
-                "https://api.steampowered.com/ISteamUser/GetPlayerSummaries/v0002/",
-                params={
-                    "key": settings().steam_api_key,
-                    "steamids": api_key["claimed_id"].rsplit("/", 1)[1],
-                },
+    try:
+        paid = await pinecones.spend(
+            col_users, api_key["claimed_id"], cost, item_count=len(rolls)
+        )
+    except DocumentNotFoundException:  # New user, their first roll is free
+        if pack:
+            raise HTTPException(status.HTTP_404_NOT_FOUND)
+
+        try:
+            steam_summary = await steam.get_player_summary(
+                api_key["claimed_id"].rsplit("/", 1)[1]
+            )
+        except httpx.HTTPStatusError:
+            steam_summary = None
+        except (httpx.TransportError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Bad response from steam account service. Steam may be down",
             )
-            try:
-                res.raise_for_status()
-                steam_summary = res.json()["response"]["players"][0]
-            except requests.exceptions.HTTPError:
-                exception = HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Unable to locate steam account",
-                )
-                return
-            except requests.exceptions.JSONDecodeError:
-                exception = HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail="Bad response from steam account service. Steam may be down",
-                )
-                return
 
-            item_id = str(uuid4())
-            creation_time = round(time.time() * 1000)
-            roll = roller.generate(item_id)
-            roll["owner"] = api_key["claimed_id"]
-            roll["creation_time"] = creation_time
+        if steam_summary is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Unable to locate steam account",
+            )
 
+        async def tx(context: AttemptContext):
             await context.insert(
                 col_users,
                 api_key["claimed_id"],
                 {
-                    "items": [item_id],
+                    "item_count": len(rolls),
+                    "trade_count": 0,
                     "creation_time": creation_time,
                     "last_pinecone_time": creation_time,
                     "pinecones": settings().starting_pinecones,
@@ -161,49 +210,91 @@ async def post_roll(pack: bool = False, api_key=Depends(check_api_key)):
                     "steam_avatarfull": steam_summary["avatarfull"],
                 },
             )
-            await context.insert(col_items, item_id, roll)
-            rolls = {item_id: roll}
-        else:  # existing user
-            user = user_query.content_as[dict]
+            for key, roll in rolls.items():
+                await context.insert(col_items, key, item_schema.encode(roll))
 
-            if pack:
-                num_rolls = settings().rolls_per_pack
-                cost = settings().pack_roll_cost
-            else:
-                num_rolls = 1
-                cost = settings().roll_cost
+        await cluster().transactions.run(
+            tx  # pyright: ignore [reportGeneralTypeIssues]
+        )
+    else:  # existing user
+        if not paid:
+            raise HTTPException(
+                status.HTTP_400_BAD_REQUEST, detail="Insufficient pinecones"
+            )
 
-            if user["pinecones"] < cost:
-                exception = HTTPException(
-                    status.HTTP_400_BAD_REQUEST, detail="Insufficient pinecones"
-                )
-                return
-            creation_time = round(time.time() * 1000)  # Unix milliseconds
-            for _ in range(num_rolls):
-                item_id = str(uuid4())
-                roll = roller.generate(item_id)
-                roll["owner"] = api_key["claimed_id"]
-                roll["creation_time"] = creation_time
+        inserts = await asyncio.gather(
+            *[
+                col_items.insert(key, item_schema.encode(roll))
+                for key, roll in rolls.items()
+            ],
+            return_exceptions=True,
+        )
+        errors = [e for e in inserts if isinstance(e, Exception)]
+        if len(errors) > 0:
+            # Take the whole roll back
+            await asyncio.gather(
+                *[
+                    col_items.remove(key)
+                    for key, result in zip(rolls, inserts)
+                    if not isinstance(result, Exception)
+                ],
+                return_exceptions=True,
+            )
+            await pinecones.refund(
+                col_users, api_key["claimed_id"], cost, item_count=len(rolls)
+            )
+            raise errors[0]
 
-                rolls[item_id] = roll
+    if steam_summary is not None:  # New user
+        user_search.add(
+            api_key["claimed_id"],
+            steam_summary["personaname"],
+            steam_summary["avatarmedium"],
+        )
 
-            user["items"].extend(list(rolls.keys()))
-            user["pinecones"] -= cost
+    if len(rolls) > 0:
+        enqueue(list(rolls.keys()))
 
-            await context.replace(user_query, user)
+    await response_cache.invalidate(api_key["claimed_id"])
 
-            for key, roll in rolls.items():
-                await context.insert(col_items, key, roll)
+    response = {k: roller.resolve_words(v) for k, v in rolls.items()}
+    if settings().response_float_digits is not None:
+        response = {
+            k: round_display_floats(v, settings().response_float_digits)
+            for k, v in response.items()
+        }
 
-    await cluster().transactions.run(tx)  # pyright: ignore [reportGeneralTypeIssues]
+    return ORJSONResponse(response)
 
-    if exception is not None:
-        raise exception  # pyright: ignore [reportGeneralTypeIssues]
 
-    return JSONResponse(rolls)
+@app.get("/item/{item_id}/status", tags=["items"], response_model=ItemStatus)
+async def get_item_status(item_id: str, _=Depends(check_api_key)):
+    col_items = data.items()
 
+    try:
+        item_query = await col_items.get(
+            item_id, GetOptions(project=item_schema.STATUS_FIELDS)
+        )
+    except DocumentNotFoundException:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    item = item_schema.decode(item_query.content_as[dict])
+    # Items rolled before rendering was queued have no status
+    item_status = item.get("status", "ready")
+    export_path = item.get("export_path")
+    variant_key = item.get("variant_key")
+
+    return ORJSONResponse(
+        {
+            "id": item_id,
+            "status": item_status,
+            "export_path": export_path,
+            "variant_key": variant_key,
+        }
+    )
 
-@app.get("/trades", tags=["trades"])
+
+@app.get("/trades", tags=["trades"], response_model=TradesPage)
 async def get_trades(
     trade_query: Annotated[TradeQuery, Depends()], api_key=Depends(check_api_key)
 ):
@@ -211,22 +302,26 @@ async def get_trades(
         f"AND status = '{trade_query.status}'" if trade_query.status is not None else ""
     )
 
-    bigballer_scope = await get_scope()
+    bigballer_scope = data.scope()
 
+    keyset_filter, keyset_params = pagination.keyset_params(trade_query.cursor)
     trades_query = bigballer_scope.query(
-        f"SELECT META().id, status, sender_id, recipient_id FROM trades WHERE sender_id = $user_id {status_filter} ORDER BY creation_time OFFSET $offset LIMIT $limit",
+        f"SELECT META().id, creation_time, status, sender_id, recipient_id FROM trades WHERE sender_id = $user_id {status_filter} {keyset_filter} {pagination.KEYSET_ORDER} LIMIT $limit",
         user_id=api_key["claimed_id"],
-        offset=trade_query.offset,
-        limit=trade_query.limit,
+        limit=trade_query.limit + 1,
+        **keyset_params,
+    )
+
+    rows, next_cursor = pagination.page(
+        [t async for t in trades_query.rows()], trade_query.limit
     )
 
-    return JSONResponse([t async for t in trades_query.rows()])
+    return ORJSONResponse({"trades": rows, "next_cursor": next_cursor})
 
 
-@app.get("/trade/{trade_id}", tags=["trades"])
+@app.get("/trade/{trade_id}", tags=["trades"], response_model=Trade)
 async def get_trade(trade_id: str, api_key=Depends(check_api_key)):
-    bigballer_scope = await get_scope()
-    col_trades = bigballer_scope.collection("trades")
+    col_trades = data.trades()
 
     try:
         trade_query = await col_trades.get(trade_id)
@@ -238,7 +333,7 @@ async def get_trade(trade_id: str, api_key=Depends(check_api_key)):
     if trade["sender_id"] != api_key["claimed_id"]:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
 
-    return JSONResponse(content=trade)
+    return ORJSONResponse(content=trade)
 
 
 @app.post("/trade/{trade_id}", tags=["trades"])
@@ -247,9 +342,8 @@ async def post_trade_status(
     status_update: TradeStatusUpdate,
     api_key=Depends(check_api_key),
 ):
-    bigballer_scope = await get_scope()
-    col_users = bigballer_scope.collection("users")
-    col_trades = bigballer_scope.collection("trades")
+    col_users = data.users()
+    col_trades = data.trades()
 
     try:
         trade_query = await col_trades.get(trade_id)
@@ -264,44 +358,66 @@ async def post_trade_status(
             detail="Cannot update a trade that is not pending",
         )
 
+    # Checked again inside the transactions, the trade may have been
+    # accepted, rejected or cancelled since it was read
+    not_pending = HTTPException(
+        status.HTTP_409_CONFLICT, detail="Trade is no longer pending"
+    )
+    exception = None
+
     if status_update.new_status == "accept":
         if api_key["claimed_id"] != trade["recipient_id"]:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
         async def tx(context: AttemptContext):
-            context.query(
-                "UPDATE bigballer.bigballer.items USE KEYS $trade_items UNSET trade_id",
-                TransactionQueryOptions(
-                    named_parameters={
-                        "trade_items": trade["sender_items"],
-                        "trade_id": trade_id,
-                    }
-                ),
-            )
+            nonlocal exception
 
-            sender_query = await context.get(col_users, trade["sender_id"])
-            sender = sender_query.content_as[dict]
+            exception = None
 
-            recipient_query = await context.get(col_users, trade["recipient_id"])
-            recipient = recipient_query.content_as[dict]
-
-            if len(trade["sender_items"]) > 0:
-                sender_set = set(trade["sender_items"])
-                sender["items"] = [i for i in sender["items"] if i not in sender_set]
+            trade_query = await context.get(col_trades, trade_id)
+            current_trade = trade_query.content_as[dict]
+            if current_trade["status"] != "sent":
+                exception = not_pending
+                return
 
-                recipient["items"].extend(trade["sender_items"])
+            # Ownership is only recorded on the items, so accepting swaps their owners
+            try:
+                await trade_locks.exchange(context, current_trade, trade_id)
+            except trade_locks.TradeLockError:
+                exception = HTTPException(
+                    status.HTTP_409_CONFLICT,
+                    detail="Traded items have changed hands",
+                )
+                return
 
-            if len(trade["recipient_items"]) > 0:
-                recipient_set = set(trade["recipient_items"])
-                recipient["items"] = [
-                    i for i in recipient["items"] if i not in recipient_set
-                ]
+            for user_id, received, given in [
+                (
+                    current_trade["sender_id"],
+                    current_trade["recipient_items"],
+                    current_trade["sender_items"],
+                ),
+                (
+                    current_trade["recipient_id"],
+                    current_trade["sender_items"],
+                    current_trade["recipient_items"],
+                ),
+            ]:
+                user_query = await context.get(col_users, user_id)
+                user = user_query.content_as[dict]
+                data.update_user_summary(user, item_count=len(received) - len(given))
+                await context.replace(user_query, user)
 
-                sender["items"].extend(trade["sender_items"])
+            current_trade["status"] = "completed"
+            await context.replace(trade_query, current_trade)
 
         await cluster().transactions.run(
             tx  # pyright: ignore [reportGeneralTypeIssues]
         )
+
+        if exception is not None:
+            raise exception
+
+        await response_cache.invalidate(trade["sender_id"], trade["recipient_id"])
     else:
         if (
             status_update.new_status == "reject"
@@ -316,23 +432,29 @@ async def post_trade_status(
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
         async def tx(context: AttemptContext):
-            context.query(
-                "UPDATE bigballer.bigballer.items USE KEYS $trade_items UNSET trade_id",
-                TransactionQueryOptions(
-                    named_parameters={
-                        "trade_items": list(trade["sender_items"]),
-                        "trade_id": trade_id,
-                    }
-                ),
-            )
+            nonlocal exception
+
+            exception = None
+
+            trade_query = await context.get(col_trades, trade_id)
+            current_trade = trade_query.content_as[dict]
+            if current_trade["status"] != "sent":
+                exception = not_pending
+                return
 
-            trade["status"] = (
+            await trade_locks.unlock(context, current_trade["sender_items"], trade_id)
+
+            current_trade["status"] = (
                 "rejected" if status_update.new_status == "reject" else "cancelled"
             )
-            trade_query = await context.get(col_trades, trade_id)
-            await context.replace(trade_query, trade)
+            await context.replace(trade_query, current_trade)
 
-    await cluster().transactions.run(tx)  # pyright: ignore [reportGeneralTypeIssues]
+        await cluster().transactions.run(
+            tx  # pyright: ignore [reportGeneralTypeIssues]
+        )
+
+        if exception is not None:
+            raise exception
 
 
 @app.post("/trade", tags=["trades"])
@@ -347,30 +469,37 @@ async def post_new_trade(trade_request: TradeRequest, api_key=Depends(check_api_
             status.HTTP_400_BAD_REQUEST, "Trade must involve at least 1 item"
         )
 
-    bigballer_scope = await get_scope()
-    col_users = bigballer_scope.collection("users")
+    col_users = data.users()
 
-    try:
-        await col_users.get(trade_request.recipient_id)
-    except DocumentNotFoundException:
-        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Recipient does not exist")
+    recipient_exists, items_query = await asyncio.gather(
+        col_users.exists(trade_request.recipient_id),
+        data.get_multi(
+            data.items(),
+            trade_request.sender_items | trade_request.recipient_items,
+            project=["owner", "trade_id"],
+        ),
+    )
 
-    trade_items = list(trade_request.sender_items.union(trade_request.recipient_items))
+    if not recipient_exists.exists:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Recipient does not exist")
 
-    items_query = bigballer_scope.query(
-        "SELECT META().id, owner, trade_id FROM items WHERE META().id IN $ids",
-        ids=trade_items,
-    )
+    if len(items_query.errors) > 0:
+        for error in items_query.errors.values():
+            traceback.print_exception(error)
+        raise HTTPException(
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Unable to look up the traded items, try again later",
+        )
 
     found_items = {api_key["claimed_id"]: set(), trade_request.recipient_id: set()}
-    async for item in items_query.rows():
+    for item_id, item in items_query.found.items():
         if item.get("trade_id"):
             if item["owner"] == api_key["claimed_id"]:
                 raise HTTPException(
                     status.HTTP_401_UNAUTHORIZED
                 )  # Item is already in a trade
 
-        found_items[item["owner"]].add(item["id"])
+        found_items.setdefault(item["owner"], set()).add(item_id)
 
     if (
         found_items[api_key["claimed_id"]] != trade_request.sender_items
@@ -380,8 +509,8 @@ async def post_new_trade(trade_request: TradeRequest, api_key=Depends(check_api_
             status.HTTP_401_UNAUTHORIZED
         )  # All items must exist and have the correct owner
 
-    col_users = bigballer_scope.collection("users")
-    col_trades = bigballer_scope.collection("trades")
+    col_users = data.users()
+    col_trades = data.trades()
 
     trade_id = str(uuid4())
 
@@ -394,93 +523,111 @@ async def post_new_trade(trade_request: TradeRequest, api_key=Depends(check_api_
         "status": "sent",
     }
 
+    exception = None
+
     async def tx(context: AttemptContext):
-        context.query(
-            "UPDATE bigballer.bigballer.items USE KEYS $trade_items SET trade_id = $trade_id",
-            TransactionQueryOptions(
-                named_parameters={
-                    "trade_items": list(trade_request.sender_items),
-                    "trade_id": trade_id,
-                }
-            ),
-        )
+        nonlocal exception
+
+        exception = None
+
+        try:
+            await trade_locks.lock(
+                context, trade["sender_items"], api_key["claimed_id"], trade_id
+            )
+        except trade_locks.TradeLockError:
+            exception = HTTPException(
+                status.HTTP_401_UNAUTHORIZED
+            )  # Items changed hands or joined another trade since they were checked
+            return
 
         # Add trade to both users
         for user_id in [api_key["claimed_id"], trade_request.recipient_id]:
             user_query = await context.get(col_users, user_id)
             user = user_query.content_as[dict]
-
-            try:
-                user["trades"].append(trade_id)
-            except KeyError:
-                user["trades"] = [trade_id]
-
+            data.update_user_summary(user, trade_count=1)
             await context.replace(user_query, user)
 
         await context.insert(col_trades, trade_id, trade)
 
     await cluster().transactions.run(tx)  # pyright: ignore [reportGeneralTypeIssues]
 
+    if exception is not None:
+        raise exception
+
 
-@app.post("/pinecones", tags=["users"])
+@app.post("/pinecones", tags=["users"], response_model=PineconeBalance)
 async def post_pinecones(api_key=Depends(check_api_key)):
-    bigballer_scope = await get_scope()
-    col_users = bigballer_scope.collection("users")
+    col_users = data.users()
 
-    exists = await col_users.exists(api_key["claimed_id"])
-    if not exists.exists:
+    try:
+        user_query = await col_users.get(
+            api_key["claimed_id"], GetOptions(project=pinecones.FIELDS)
+        )
+    except DocumentNotFoundException:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
 
-    new_pinecones = 0
-    total_pinecones = 0
-
-    async def tx(context: AttemptContext):
-        nonlocal new_pinecones, total_pinecones
+    user = user_query.content_as[dict]
+    new_pinecones, _ = pinecones.accrued(user, round(time.time() * 1000))
 
-        current_time = round(time.time() * 1000)
+    return ORJSONResponse(
+        {
+            "new_pinecones": new_pinecones,
+            "total_pinecones": user["pinecones"] + new_pinecones,
+        }
+    )
 
-        user_query = await context.get(col_users, api_key["claimed_id"])
-        user = user_query.content_as[dict]
 
-        total_pinecones = user["pinecones"]
+@app.get("/users", tags=["users"], response_model=list[UserSearchResult])
+async def get_users(
+    like: str = Query(regex=r"^[^\% \\]{3,64}$"),
+    limit: int | None = Query(None, gt=0, le=20),
+    _=Depends(check_api_key),
+):
+    return ORJSONResponse(
+        user_search.search(like, limit or settings().user_search_limit)
+    )
 
-        time_delta = current_time - user["last_pinecone_time"]
-        if time_delta > settings().pinecone_base_rate:
-            # Number of elapsed periods since last update
-            #  ex: if period is 5 minutes and 11 minutes have elapsed,
-            #  then periods_delta == 2
-            periods_delta = time_delta // settings().pinecone_base_rate
 
-            new_pinecones = periods_delta * settings().pinecone_base_amount
-            total_pinecones = user["pinecones"] + new_pinecones
-            user["pinecones"] = total_pinecones
-            user["last_pinecone_time"] = current_time
+def _health_status(db_health: dict) -> int:
+    return (
+        status.HTTP_200_OK if db_health["ok"] else status.HTTP_503_SERVICE_UNAVAILABLE
+    )
 
-            await context.replace(user_query, user)
 
-    await cluster().transactions.run(tx)  # pyright: ignore [reportGeneralTypeIssues]
+@app.get("/health", tags=["health"])
+async def get_health():
+    db_health = await data.health()
 
-    return JSONResponse(
-        {"new_pinecones": new_pinecones, "total_pinecones": total_pinecones}
+    return ORJSONResponse(
+        {
+            "ok": db_health["ok"],
+            "services": {
+                name: service["ok"] for name, service in db_health["services"].items()
+            },
+        },
+        status_code=_health_status(db_health),
     )
 
 
-@app.get("/users", tags=["users"])
-async def get_users(
-    like: str = Query(regex=r"^[^\% \\]{3,64}$"), _=Depends(check_api_key)
-):
-    like = like + "%"
+@app.get("/health/details", tags=["health"])
+async def get_health_details(api_key=Depends(check_api_key)):
+    # Database endpoints and cache sizes are internal
+    if api_key["claimed_id"] not in settings().admin_ids:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
 
-    bigballer_scope = await get_scope()
+    db_health = await data.health()
 
-    users_query = bigballer_scope.query(
-        "SELECT META().id, steam_personaname, steam_avatarmedium FROM users WHERE LOWER(steam_personaname) LIKE LOWER($like) LIMIT $limit",
-        like=like,
-        limit=5,
+    return ORJSONResponse(
+        {
+            "ok": db_health["ok"],
+            "database": db_health,
+            "glb_cache": roller.glb_cache_stats(),
+            "response_cache": response_cache.stats(),
+            "token_cache": auth.cache_stats(),
+        },
+        status_code=_health_status(db_health),
     )
 
-    return JSONResponse([t async for t in users_query.rows()])
-
 
 # Partially adapted from: https://github.com/xamey/steam-openid-fastapi/
 #  Also see:
@@ -519,21 +666,16 @@ async def get_login_response(request: Request):
         "openid.signed": request.query_params["openid.signed"],
         "openid.sig": request.query_params["openid.sig"],
     }
-    res = requests.get(str(settings().oid_endpoint), params=validation_params)
 
     try:
-        res.raise_for_status()
-        if not res.text == "ns:http://specs.openid.net/auth/2.0\nis_valid:true\n":
-            raise ValueError
-    except (requests.HTTPError, ValueError):
+        valid = await steam.check_openid_authentication(validation_params)
+    except httpx.HTTPError:
+        valid = False
+
+    if not valid:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
-    token = jwt.encode(
-        {"claimed_id": request.query_params["openid.claimed_id"]},
-        key=PRIVATE_KEY,
-        algorithm="RS256",
-        headers={"kid": "app_rsa_public.pem"}
-    )
+    token = auth.mint_token(request.query_params["openid.claimed_id"])
 
     response = RedirectResponse(
         url=str(settings().website_url), status_code=status.HTTP_303_SEE_OTHER
@@ -542,7 +684,7 @@ async def get_login_response(request: Request):
     response.set_cookie(
         key="access_token",
         value=token,
-        expires=60 * 60 * 24 * 30,  # 1 month
+        expires=settings().jwt_lifetime,
         secure=True,
         httponly=False,
         samesite="strict",
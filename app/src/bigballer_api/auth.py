@@ -0,0 +1,106 @@
+"""
+bigballer web - collect items
+    Copyright (C) 2023  Michael Manis - michaelmanis@tutanota.com
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Access tokens
+
+Tokens are signed with the private key and name the public key that verifies
+them in their kid header. To rotate keys, move the current public key into
+settings().jwt_previous_public_keys so tokens signed with it keep working
+until they expire. The signing algorithm follows the key type (RS256, ES256 or
+EdDSA), EC and Ed25519 keys are much cheaper to sign with and make far smaller
+tokens than RSA ones
+
+Verified tokens are cached, so most requests skip signature verification
+"""
+import hashlib
+import time
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+import jwt
+
+from bigballer_api.cache import LRUCache
+from bigballer_api.settings import settings
+
+
+def _algorithm(key) -> str:
+    if isinstance(key, (rsa.RSAPrivateKey, rsa.RSAPublicKey)):
+        return "RS256"
+    if isinstance(key, (ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey)):
+        return "ES256"
+    if isinstance(key, (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey)):
+        return "EdDSA"
+    raise ValueError(f"Unsupported key type {type(key).__name__}")
+
+
+def _load_public_key(filepath: str):
+    with open(filepath, "rb") as public_key_file:
+        return serialization.load_pem_public_key(public_key_file.read())
+
+
+with open(settings().private_key_filepath, "rb") as private_key_file:
+    PRIVATE_KEY = serialization.load_pem_private_key(
+        private_key_file.read(), password=None
+    )
+ALGORITHM = _algorithm(PRIVATE_KEY)
+
+# kid -> public key, algorithm
+PUBLIC_KEYS = {
+    kid: (key, _algorithm(key))
+    for kid, key in [
+        (settings().jwt_key_id, _load_public_key(settings().public_key_filepath)),
+        *[
+            (kid, _load_public_key(filepath))
+            for kid, filepath in settings().jwt_previous_public_keys.items()
+        ],
+    ]
+}
+
+_verified_tokens = LRUCache(settings().jwt_cache_size, settings().jwt_cache_ttl)
+
+
+def mint_token(claimed_id: str) -> str:
+    return jwt.encode(
+        {
+            "claimed_id": claimed_id,
+            "exp": round(time.time()) + settings().jwt_lifetime,
+        },
+        key=PRIVATE_KEY,  # pyright: ignore [reportGeneralTypeIssues]
+        algorithm=ALGORITHM,
+        headers={"kid": settings().jwt_key_id},
+    )
+
+
+def verify_token(token: str) -> dict:
+    """Returns the token's claims, raises jwt.InvalidTokenError"""
+    token_hash = hashlib.sha256(token.encode("utf-8")).digest()
+
+    claims = _verified_tokens.get(token_hash)
+    if claims is not None:
+        return claims
+
+    kid = jwt.get_unverified_header(token).get("kid", settings().jwt_key_id)
+    if not isinstance(kid, str) or kid not in PUBLIC_KEYS:
+        raise jwt.InvalidTokenError(f"Unknown key id {kid}")
+    key, algorithm = PUBLIC_KEYS[kid]
+
+    claims = jwt.decode(
+        token, key, [algorithm]  # pyright: ignore [reportGeneralTypeIssues]
+    )
+    _verified_tokens.set(token_hash, claims, claims.get("exp"))
+    return claims
+
+
+def cache_stats() -> dict:
+    return _verified_tokens.stats()
@@ -12,29 +12,113 @@ bigballer web - collect items
     You should have received a copy of the GNU Affero General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from acouchbase.bucket import Bucket, Scope
+import asyncio
+from collections import Counter
+from typing import Iterable, NamedTuple
+
+from acouchbase.bucket import Bucket
 from acouchbase.cluster import Cluster
+from acouchbase.collection import AsyncCollection
+from acouchbase.scope import AsyncScope
 from couchbase.auth import PasswordAuthenticator
-from couchbase.options import ClusterOptions
+from couchbase.diagnostics import PingState, ServiceType
+from couchbase.exceptions import CouchbaseException, DocumentNotFoundException
+from couchbase.options import ClusterOptions, GetOptions, PingOptions
 
 from bigballer_api.settings import settings
 
 
+WARM_UP_SERVICES = [ServiceType.KeyValue, ServiceType.Query]
+
 _cluster: Cluster = None
+_bucket: Bucket = None
+_scope: AsyncScope = None
+_users: AsyncCollection = None
+_items: AsyncCollection = None
+_trades: AsyncCollection = None
 
 
 def cluster() -> Cluster:
     return _cluster
 
 
-async def get_scope() -> Scope:
-    bucket: Bucket = _cluster.bucket("bigballer")
-    await bucket.on_connect()
-    return bucket.scope("bigballer")
+def scope() -> AsyncScope:
+    return _scope
+
+
+def users() -> AsyncCollection:
+    return _users
+
+
+def items() -> AsyncCollection:
+    return _items
+
+
+def trades() -> AsyncCollection:
+    return _trades
+
+
+class MultiGetResult(NamedTuple):
+    # key -> document (or its projected fields)
+    found: dict[str, dict]
+    missing: list[str]
+    # key -> whatever else went wrong fetching it
+    errors: dict[str, Exception]
+
+
+async def get_multi(
+    collection: AsyncCollection,
+    keys: Iterable[str],
+    project: list[str] | None = None,
+) -> MultiGetResult:
+    """
+    Fetches documents by key, all at once. With project, only those paths
+    are returned. One key failing does not fail the others
+    """
+    keys = list(dict.fromkeys(keys))
+    options = GetOptions(project=project) if project is not None else GetOptions()
+
+    results = await asyncio.gather(
+        *[collection.get(key, options) for key in keys], return_exceptions=True
+    )
+
+    found = {}
+    missing = []
+    errors = {}
+    for key, result in zip(keys, results):
+        if isinstance(result, DocumentNotFoundException):
+            missing.append(key)
+        elif isinstance(result, Exception):
+            errors[key] = result
+        else:
+            found[key] = result.content_as[dict]
+
+    return MultiGetResult(found, missing, errors)
+
+
+def update_user_summary(user: dict, item_count: int = 0, trade_count: int = 0):
+    """
+    Adjusts a user document's counters in place. Which items and trades
+    belong to a user is only recorded on the items and trades themselves,
+    so user documents stay the same size however much they own. Documents
+    still holding the old items/trades id lists are converted on the way
+    """
+    for field, legacy_field, delta in [
+        ("item_count", "items", item_count),
+        ("trade_count", "trades", trade_count),
+    ]:
+        if field not in user:
+            user[field] = len(user.get(legacy_field, []))
+        user.pop(legacy_field, None)
+        user[field] += delta
 
 
 async def connect_db():
-    global _cluster
+    """
+    Resolves every handle once and pings the services the API needs,
+    so a bad connection fails startup instead of the first requests
+    """
+    global _cluster, _bucket, _scope, _users, _items, _trades
 
     _cluster = await Cluster.connect(
         str(settings().db_url),
@@ -43,6 +127,58 @@ async def connect_db():
         ),
     )
 
+    _bucket = _cluster.bucket("bigballer")
+    await _bucket.on_connect()
+    _scope = _bucket.scope("bigballer")
+    _users = _scope.collection("users")
+    _items = _scope.collection("items")
+    _trades = _scope.collection("trades")
+
+    ping_result = await _bucket.ping(PingOptions(service_types=WARM_UP_SERVICES))
+    for service_type in WARM_UP_SERVICES:
+        reports = ping_result.endpoints.get(service_type, [])
+        if not any(report.state == PingState.OK for report in reports):
+            raise CouchbaseException(
+                message=f"No {service_type.value} endpoint of the database is reachable"
+            )
+
+
+async def health() -> dict:
+    """Ping results and connection counts per service"""
+    ping_result = await _bucket.ping(PingOptions(service_types=WARM_UP_SERVICES))
+    diagnostics = await _cluster.diagnostics()
+
+    services = {}
+    for service_type in WARM_UP_SERVICES:
+        reports = ping_result.endpoints.get(service_type, [])
+        services[service_type.value] = {
+            "ok": any(report.state == PingState.OK for report in reports),
+            "endpoints": [
+                {
+                    "remote": report.remote,
+                    "state": report.state.value,
+                    "latency_ms": (
+                        report.latency.total_seconds() * 1000
+                        if report.latency is not None
+                        else None
+                    ),
+                }
+                for report in reports
+            ],
+        }
+
+    connections = {
+        service_type.value: dict(Counter(report.state.value for report in reports))
+        for service_type, reports in diagnostics.endpoints.items()
+    }
+
+    return {
+        "ok": all(service["ok"] for service in services.values()),
+        "state": diagnostics.state.value,
+        "services": services,
+        "connections": connections,
+    }
+
 
 async def close_db():
     await _cluster.close()
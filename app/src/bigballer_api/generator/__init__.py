@@ -12,16 +12,33 @@ bigballer web - collect items
     You should have received a copy of the GNU Affero General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import asyncio
+import hashlib
 import math
 from pathlib import Path
 import random
 
-import boto3
+import numpy as np
 
 from bigballer_api.settings import settings
-from bigballer_api.generator._words import modifiers, names, appraisals
-from bigballer_api.generator import _blender_generator, _color_generator
-
+from bigballer_api.generator._words import (
+    WORD_TABLE_VERSION,
+    appraisals,
+    modifiers,
+    names,
+    word_table,
+)
+from bigballer_api.generator import (
+    _blender_generator,
+    _color_generator,
+    _glb_cache,
+    _sampler,
+    _storage,
+)
+
+
+# Bump whenever roll() draws differently for the same seed
+GENERATOR_VERSION = 3
 
 rarity_names = ["common", "notable", "pristine", "sublime", "transcendant"]
 
@@ -287,29 +304,76 @@ weight_variance = (0.925, 1.075)  # +/-7.5% weight variance range
 SIGNED_INT32_MAX = 2**31 - 1
 SIGNED_INT32_MIN = -(2**31)
 
+STAT_NAMES = ["VIT", "END", "STR", "DEX", "RES", "INT", "FAI"]
+COLOR_SCHEME_STYLES = [
+    "monochrome",
+    "complementary",
+    "adjacent",
+    "triad",
+    "tetrad",
+    "random",
+]
+# Rows are indexed by material count - 1
+color_scheme_weights = [
+    [100, 0, 0, 0, 0, 0],
+    [49, 49, 0, 0, 0, 2],
+    [14, 14, 35, 35, 0, 2],
+    [4, 4, 10, 10, 70, 2],
+]
+material_upgrade_chance = 0.1
+
+sampler = _sampler.RollSampler(
+    rarity_names,
+    rarity_table,
+    material_rarity_table,
+    material_upgrade_chance,
+    color_scheme_weights,
+)
+
+
+glb_cache: _glb_cache.GlbCache | None = None
+
+
+async def shutdown():
+    await _blender_generator.close_pool()
 
-if settings().use_s3:
-    s3 = boto3.Session(profile_name=settings().aws_profile).client("s3")
 
+def resolve_words(item: dict) -> dict:
+    """
+    Returns a copy of the item with its word ids swapped
+    for the modifier, name and appraisal they stand for
+    """
+    if "words" not in item:  # Rolled before items stored word ids
+        return item
 
-def resolve_color(c):
+    item = dict(item)
+    word_ids = item.pop("words")
+    table = word_table(word_ids["version"])
+    item["modifier"] = table["modifiers"][word_ids["modifier"]]
+    item["name"] = table["names"][word_ids["name"]]
+    item["appraisal"] = table["appraisals"][word_ids["appraisal"]]
+
+    return item
+
+
+def resolve_color(c, rng: random.Random):
     return _color_generator.ryb_shift(
         *c["hsv"],
-        random.randrange(
+        rng.randrange(
             -c["hue_variance"],
             c["hue_variance"],
         ),
     )
 
 
-def resolve_basic_color_material(c):
-    if random.random() <= 0.01:
-        metalness = random.uniform(0.3, 1)
+def resolve_basic_color_material(c, rng: random.Random):
+    if rng.random() <= 0.01:
+        metalness = rng.uniform(0.3, 1)
     else:
         metalness = 0
 
-    if random.random() <= 0.01:
-        transmission = random.uniform(0.2, 0.9)
+    if rng.random() <= 0.01:
+        transmission = rng.uniform(0.2, 0.9)
     else:
         transmission = 0
 
@@ -317,11 +381,15 @@ def resolve_basic_color_material(c):
     # but only allow one or the other
     # roll both to avoid metal appearing more often than transmissive
     if transmission > 0 and metalness > 0:
-        if random.random() > 0.5:
+        if rng.random() > 0.5:
             transmission = 0
         else:
             metalness = 0
 
+    return custom_material(metalness, transmission, rng.uniform(1.3, 2), c)
+
+
+def custom_material(metalness: float, transmission: float, ior: float, color) -> dict:
     return {
         "name": "custom",
         "metalness": metalness,
@@ -329,37 +397,61 @@ def resolve_basic_color_material(c):
         "transmission": transmission,
         "opacity": 0 if transmission > 0 else 1,
         "thickness": 0,
-        "ior": random.uniform(1.3, 2),
-        "color": c,
+        "ior": ior,
+        "color": color,
     }
 
 
-def resolve_material(m):
-    resolved_mat = {
+def resolve_material(m, rng: random.Random):
+    return table_material(m, resolve_color(rng.choice(m["colors"]), rng))
+
+
+def table_material(m: dict, color) -> dict:
+    """A material of material_rarity_table, in one of its colors"""
+    return {
         "name": m["name"],
         "metalness": m["metalness"],
         "transmission": m["transmission"],
         "opacity": 0 if m["transmission"] > 0 else 1,
         "thickness": m.get("thickness", 0),
         "ior": m["ior"],
-        "color": resolve_color(random.choice(m["colors"])),
+        "color": color,
+        "roughness": m.get("roughness", 0 if m["metalness"] == 1 else 1),
     }
-    try:
-        resolved_mat["roughness"] = m["roughness"]
-    except KeyError:
-        resolved_mat["roughness"] = 0 if m["metalness"] == 1 else 1
 
-    return resolved_mat
 
+def item_seed(unique_key: str) -> int:
+    # Not hash(), that is salted per process.
+    # 48 bits so the seed survives being stored as a JSON number
+    digest = hashlib.sha256(unique_key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:6], "big")
+
+
+def roll(unique_key: str, seed: int | None = None):
+    """
+    Roll all of an item's attributes. This is cheap, the mesh itself
+    is built later by render() from the returned "mesh" parameters
+
+    Every draw comes from the item's own RNG, seeded from its key unless
+    a seed is given, so the same seed always rolls the same item
+    as long as GENERATOR_VERSION hasn't changed
+    """
+    if seed is None:
+        seed = item_seed(unique_key)
+    rng = random.Random(seed)
 
-def generate(unique_key: str):
-    modifier = random.choice(modifiers)
-    baller_name = random.choice(names)
-    appraisal = random.choice(appraisals)
+    # Only word ids are stored, see resolve_words()
+    modifier_id = rng.randrange(len(modifiers))
+    name_id = rng.randrange(len(names))
+    appraisal_id = rng.randrange(len(appraisals))
 
-    roll = random.random()  # lower = better
+    # lower = better
+    rarity_index, roll, next_rarity_value = sampler.rarity(rng)
+    rarity_name = rarity_names[rarity_index]
+    if rarity_index == len(rarity_names) - 1:
+        next_rarity_value = max_stats_roll
 
-    height_roll = random.random()
+    height_roll = rng.random()
     height_cm = height_range_cm[0] + height_roll * (
         height_range_cm[1] - height_range_cm[0]
     )  # value should be uniform random between height_range_cm values
@@ -370,43 +462,32 @@ def generate(unique_key: str):
         )
         weight_grams = extra_weight_range_grams[0] + height_roll * (
             extra_weight_range_grams[1] - extra_weight_range_grams[0]
-        ) * random.uniform(weight_variance[0], weight_variance[1])
+        ) * rng.uniform(weight_variance[0], weight_variance[1])
     else:
         weight_grams = weight_range_grams[0] + height_roll * (
             weight_range_grams[1] - weight_range_grams[0]
-        ) * random.uniform(weight_variance[0], weight_variance[1])
-
-    # find the correct rarity name to match the roll
-    next_rarity_value = max_stats_roll
-    rarity_name = rarity_names[0]
-    for name_, req_value in rarity_table.items():
-        if roll <= req_value:
-            rarity_name = name_
-            break
-        else:
-            next_rarity_value = req_value
-    rarity_index = rarity_names.index(rarity_name)  # lazy
+        ) * rng.uniform(weight_variance[0], weight_variance[1])
 
     # roll can be lower than max_rarity value (1.3 out of 1 million rolls)
-    stats_roll = random.uniform(next_rarity_value, roll)
+    stats_roll = rng.uniform(next_rarity_value, roll)
 
     #  approaches infinity at 0, reaches 0 at 1
     points = math.tan((1 - stats_roll) * (math.pi / 2))
 
     skill_points_to_distribute = round(points)
 
-    stat_names = ["VIT", "END", "STR", "DEX", "RES", "INT", "FAI"]
-    random.shuffle(stat_names)
+    stat_names = list(STAT_NAMES)
+    rng.shuffle(stat_names)
 
     # max percentage ranges from an equal share
     # to 75% of remaining stat points
-    max_pct_to_take = random.uniform(1 / len(stat_names), 0.75)
+    max_pct_to_take = rng.uniform(1 / len(stat_names), 0.75)
 
     base_stats = {}
     for stat in stat_names:
         # roll for actual percentage to take and calculate points
         points_to_take = round(
-            random.uniform(0, max_pct_to_take) * skill_points_to_distribute
+            rng.uniform(0, max_pct_to_take) * skill_points_to_distribute
         )
         # clamp from 1 to 99
         base_stats[stat] = min(99, max(1, points_to_take))
@@ -414,7 +495,7 @@ def generate(unique_key: str):
 
     # distrbute any leftover points to a random skill
     if skill_points_to_distribute > 0:
-        stat_name = random.choice(stat_names)
+        stat_name = rng.choice(stat_names)
         base_stats[stat_name] = min(
             99, base_stats[stat_name] + skill_points_to_distribute
         )
@@ -422,7 +503,7 @@ def generate(unique_key: str):
     item_count = 0
     item_rarity = 0.1
     # 10% chance of item, multiple item chance / 2 each time
-    while random.random() <= item_rarity:
+    while rng.random() <= item_rarity:
         item_rarity /= 2
         item_count += 1
 
@@ -430,29 +511,29 @@ def generate(unique_key: str):
         item_count = SIGNED_INT32_MAX
 
     eye_count = 2
-    while random.random() <= 0.3:
+    while rng.random() <= 0.3:
         eye_count += 1
 
     # 1/10,000 chance for 0 or 1 eyes
     # probability of 10+ eyes is < 1/10,000
     # so skip this in case of 10+ eyes
-    if eye_count < 10 and random.random() <= 0.0001:
-        eye_count = random.choice((0, 1))
+    if eye_count < 10 and rng.random() <= 0.0001:
+        eye_count = rng.choice((0, 1))
 
     if eye_count > SIGNED_INT32_MAX:
         eye_count = SIGNED_INT32_MAX
 
-    has_headwear = random.choice([True, False])
+    has_headwear = rng.choice([True, False])
 
     if rarity_index < 3:  # Under sublime
         # 70% chance to get a generated color scheme
-        use_color_scheme = random.random() <= 0.7
+        use_color_scheme = rng.random() <= 0.7
     else:
         use_color_scheme = False
 
     # 10% chance of multicolored eyes, 50% for items
-    multicolored_eyes = random.random() <= 0.1
-    multicolored_items = random.random() > 0.5
+    multicolored_eyes = rng.random() <= 0.1
+    multicolored_items = rng.random() > 0.5
 
     if use_color_scheme:
         # determine how many colors are required
@@ -464,67 +545,49 @@ def generate(unique_key: str):
         if has_headwear:
             material_count += 1
 
-        # Weighted probability for different color schemes
-        if material_count == 1:
-            style_choices = ["monochrome"]
-            weights = [100]
-        elif material_count == 2:
-            style_choices = ["monochrome", "complementary", "random"]
-            weights = [49, 49, 2]
-        elif material_count == 3:
-            style_choices = [
-                "monochrome",
-                "complementary",
-                "adjacent",
-                "triad",
-                "random",
-            ]
-            weights = [14, 14, 35, 35, 2]
-        else:  # >= 4
-            style_choices = [
-                "monochrome",
-                "complementary",
-                "adjacent",
-                "triad",
-                "tetrad",
-                "random",
-            ]
-            weights = [4, 4, 10, 10, 70, 2]
-        chosen_style = random.choices(style_choices, weights=weights, k=1)[0]
+        chosen_style = COLOR_SCHEME_STYLES[sampler.color_scheme(material_count, rng)]
 
         if chosen_style == "random":
             resolved_body_material = resolve_basic_color_material(
-                _color_generator.random_color()
+                _color_generator.random_color(rng), rng
             )
 
             if has_headwear:
                 resolved_headwear_material = resolve_basic_color_material(
-                    _color_generator.random_color()
+                    _color_generator.random_color(rng), rng
                 )
             else:
                 resolved_headwear_material = None
 
             if multicolored_eyes:
                 resolved_eye_materials = [
-                    resolve_basic_color_material(_color_generator.random_color())
+                    resolve_basic_color_material(
+                        _color_generator.random_color(rng), rng
+                    )
                     for _ in range(eye_count)
                 ]
             else:
                 resolved_eye_materials = [
-                    resolve_basic_color_material(_color_generator.random_color())
+                    resolve_basic_color_material(
+                        _color_generator.random_color(rng), rng
+                    )
                 ]
 
             if multicolored_items:
                 resolved_item_materials = [
-                    resolve_basic_color_material(_color_generator.random_color())
+                    resolve_basic_color_material(
+                        _color_generator.random_color(rng), rng
+                    )
                     for _ in range(item_count)
                 ]
             else:
                 resolved_item_materials = [
-                    resolve_basic_color_material(_color_generator.random_color())
+                    resolve_basic_color_material(
+                        _color_generator.random_color(rng), rng
+                    )
                 ]
         else:
-            base_color = _color_generator.random_color()
+            base_color = _color_generator.random_color(rng)
             palette = [base_color]
             if chosen_style == "tetrad":
                 palette.extend(_color_generator.generate_tetrad(*base_color))
@@ -537,7 +600,7 @@ def generate(unique_key: str):
                     _color_generator.generate_adjacent(*base_color, degrees=180)
                 )
 
-            resolved_body_material = resolve_basic_color_material(palette[0])
+            resolved_body_material = resolve_basic_color_material(palette[0], rng)
             palette_index = 1 % len(palette)
 
             if eye_count > 0:
@@ -550,7 +613,7 @@ def generate(unique_key: str):
                 # eye_shades.insert(len(eye_shades) // 2, eye_color)
 
                 resolved_eye_materials = [
-                    resolve_basic_color_material(eye_shades[a % len(eye_shades)])
+                    resolve_basic_color_material(eye_shades[a % len(eye_shades)], rng)
                     for a in range(eye_count)
                 ]
             else:
@@ -566,7 +629,7 @@ def generate(unique_key: str):
                 # item_shades.insert(len(item_shades) // 2, item_color)
 
                 resolved_item_materials = [
-                    resolve_basic_color_material(item_shades[a % len(item_shades)])
+                    resolve_basic_color_material(item_shades[a % len(item_shades)], rng)
                     for a in range(item_count)
                 ]
             else:
@@ -574,97 +637,82 @@ def generate(unique_key: str):
 
             if has_headwear:
                 resolved_headwear_material = resolve_basic_color_material(
-                    random.choice(
+                    rng.choice(
                         _color_generator.generate_shades(*palette[palette_index])
-                    )
+                    ),
+                    rng,
                 )
             else:
                 resolved_headwear_material = []
 
     else:
-        allowed_materials = material_rarity_table[rarity_name]
-        # 10% chance to upgrade material rarity
-        # keep re-rolling on success
-        for name in rarity_names[rarity_index:]:
-            if random.random() <= 0.1:
-                allowed_materials = material_rarity_table[name]
-            else:
-                break
+        # chance to upgrade material rarity, re-rolled on every success
+        material_tier = sampler.material_tier(rarity_index, rng)
+        allowed_materials = sampler.tier_materials(material_tier)
 
-        body_material = random.choice(allowed_materials)
-        resolved_body_material = resolve_material(body_material)
+        body_material = rng.choice(allowed_materials)
+        resolved_body_material = resolve_material(body_material, rng)
 
         if has_headwear:
-            headwear_material = random.choice(allowed_materials)
-            resolved_headwear_material = resolve_material(headwear_material)
+            headwear_material = rng.choice(allowed_materials)
+            resolved_headwear_material = resolve_material(headwear_material, rng)
         else:
             resolved_headwear_material = None
 
         # allow lower-rarity materials for items / eyes
-        for name in rarity_names:
-            if name == rarity_name:
-                break
-            allowed_materials.extend(material_rarity_table[name])
+        allowed_materials = sampler.part_materials(rarity_index, material_tier)
 
         if eye_count > 0:
             if multicolored_eyes:
-                eye_materials = random.choices(
+                eye_materials = rng.choices(
                     allowed_materials,
                     k=eye_count,  # pyright: ignore [reportGeneralTypeIssues]
                 )
             else:
-                eye_materials = [random.choice(allowed_materials)]
+                eye_materials = [rng.choice(allowed_materials)]
         else:
             eye_materials = []
 
         resolved_eye_materials = []
         for mat in eye_materials:
-            resolved_eye_materials.append(resolve_material(mat))
+            resolved_eye_materials.append(resolve_material(mat, rng))
 
         if item_count > 0:
             if multicolored_items:
-                item_materials = random.choices(
+                item_materials = rng.choices(
                     allowed_materials,
                     k=item_count,  # pyright: ignore [reportGeneralTypeIssues]
                 )
             else:
-                item_materials = [random.choice(allowed_materials)]
+                item_materials = [rng.choice(allowed_materials)]
         else:
             item_materials = []
 
         resolved_item_materials = []
         for mat in item_materials:
-            resolved_item_materials.append(resolve_material(mat))
+            resolved_item_materials.append(resolve_material(mat, rng))
 
-    baller_filename = f"baller_{unique_key}.glb"
-    export_path = Path(settings().base_baller_output_path, baller_filename)
-    _blender_generator.generate_baller(
-        export_path=export_path,
-        seed=random.randrange(
+    mesh = {
+        "seed": rng.randrange(
             SIGNED_INT32_MIN, SIGNED_INT32_MAX
         ),  # Blender-defined min/max
-        height=height_cm / 100,
-        weight=weight_grams,
-        body_noise=random.choice([True, False]),
-        headwear=has_headwear,
-        item_count=item_count,
-        eye_count=eye_count,
-    )
-
-    if settings().use_s3:
-        s3_key = Path(settings().s3_bucket_prefix, baller_filename).as_posix()
-        s3.upload_file(  # pyright: ignore [reportUnboundVariable]
-            export_path.as_posix(), settings().s3_bucket_name, s3_key
-        )
-
-        export_path_str = f"{settings().cdn_prefix}/{baller_filename}"
-    else:
-        export_path_str = export_path.as_posix()
+        "height": height_cm / 100,
+        "weight": weight_grams,
+        "body_noise": rng.choice([True, False]),
+        "headwear": has_headwear,
+        "item_count": item_count,
+        "eye_count": eye_count,
+    }
 
     return {
-        "modifier": modifier,
-        "name": baller_name,
-        "appraisal": appraisal,
+        "seed": seed,
+        "generator_version": GENERATOR_VERSION,
+        "words": {
+            "version": WORD_TABLE_VERSION,
+            "modifier": modifier_id,
+            "name": name_id,
+            "appraisal": appraisal_id,
+        },
         "roll": roll,
         "rarity_name": rarity_name,
         "points": points,
@@ -676,5 +724,339 @@ def generate(unique_key: str):
         "headwear_material": resolved_headwear_material,
         "eye_materials": resolved_eye_materials,
         "item_materials": resolved_item_materials,
-        "export_path": export_path_str,
+        "mesh": mesh,
+    }
+
+
+def reroll(unique_key: str, item: dict) -> dict:
+    """Recompute all of a stored item's attributes from its seed"""
+    if item.get("generator_version") != GENERATOR_VERSION:
+        raise ValueError(
+            f"Item {unique_key} was not rolled by generator version {GENERATOR_VERSION}"
+        )
+
+    return roll(unique_key, item["seed"])
+
+
+def _get_glb_cache() -> _glb_cache.GlbCache:
+    global glb_cache
+
+    if glb_cache is None:
+        glb_cache = _glb_cache.GlbCache(
+            # Not the output path itself, older items' GLBs live there
+            Path(settings().base_baller_output_path, "cache"),
+            settings().glb_cache_max_bytes,
+        )
+
+    return glb_cache
+
+
+def export_url(mesh_key: str) -> str:
+    """Where the GLB of mesh_key is published"""
+    return _storage.get_storage().url(f"{mesh_key}.glb")
+
+
+async def _publish(mesh_key: str, glb_path: Path | None) -> str:
+    storage = _storage.get_storage()
+    name = f"{mesh_key}.glb"
+
+    if not await storage.exists(name):
+        await storage.upload(
+            glb_path, name
+        )  # pyright: ignore [reportGeneralTypeIssues]
+
+    return export_url(mesh_key)
+
+
+def _quantize(
+    value: float, value_range: tuple[float, float], steps: int
+) -> tuple[int, float]:
+    """Returns the step value falls in and the middle of that step"""
+    low, high = value_range
+    step = min(steps - 1, max(0, int((value - low) / (high - low) * steps)))
+    return step, low + (step + 0.5) * (high - low) / steps
+
+
+def variant_mesh(mesh: dict) -> tuple[str, dict]:
+    """
+    Snap an item's mesh parameters to one of a small set of geometry variants
+
+    Materials are applied when the model is loaded, so every item with the same
+    variant key can share a single GLB
+    """
+    steps = settings().geometry_variant_steps
+    max_parts = settings().geometry_variant_max_parts
+
+    height_cm = mesh["height"] * 100
+    if height_cm >= extra_height_range_cm[0]:
+        size = "xl"
+        height_range = extra_height_range_cm
+        weight_range = extra_weight_range_grams
+    else:
+        size = "m"
+        height_range = height_range_cm
+        weight_range = weight_range_grams
+    weight_range = (weight_range[0], weight_range[1] * weight_variance[1])
+
+    height_step, height_cm = _quantize(height_cm, height_range, steps)
+    weight_step, weight = _quantize(mesh["weight"], weight_range, steps)
+    eye_count = min(mesh["eye_count"], max_parts)
+    item_count = min(mesh["item_count"], max_parts)
+
+    variant_key = "-".join(
+        [
+            size,
+            f"h{height_step}",
+            f"w{weight_step}",
+            f"e{eye_count}",
+            f"i{item_count}",
+            "hw" if mesh["headwear"] else "nohw",
+            "noise" if mesh["body_noise"] else "smooth",
+        ]
+    )
+
+    return variant_key, {
+        # Same shape every time the variant is rendered
+        "seed": int.from_bytes(
+            hashlib.sha256(variant_key.encode("utf-8")).digest()[:4],
+            "big",
+            signed=True,
+        ),
+        "height": height_cm / 100,
+        "weight": weight,
+        "body_noise": mesh["body_noise"],
+        "headwear": mesh["headwear"],
+        "item_count": item_count,
+        "eye_count": eye_count,
+    }
+
+
+async def render_batch(meshes: dict[str, dict]) -> dict[str, dict | Exception]:
+    """
+    Run Blender once for every rolled item's mesh parameters
+    and publish the results concurrently (to S3 if it is enabled)
+
+    Models are stored by a hash of their mesh parameters, so meshes which were
+    already rendered (or published) skip Blender (and publishing).
+    With settings().geometry_variants, meshes are first snapped to their
+    geometry variant (see variant_mesh())
+
+    Maps each key to {"export_path": ..., "mesh_key": ..., "variant_key": ...},
+    or to the exception that stopped it from being rendered
+    """
+    cache = _get_glb_cache()
+
+    variant_keys = {key: None for key in meshes}
+    if settings().geometry_variants:
+        meshes = dict(meshes)
+        for key, mesh in meshes.items():
+            variant_keys[key], meshes[key] = variant_mesh(mesh)
+
+    mesh_keys = {key: _glb_cache.mesh_hash(mesh) for key, mesh in meshes.items()}
+    unique_meshes = {mesh_keys[key]: mesh for key, mesh in meshes.items()}
+
+    # Other batches run at the same time and share the cache
+    with cache.pinned(unique_meshes):
+        glb_paths = {mesh_key: cache.get(mesh_key) for mesh_key in unique_meshes}
+        missing = [mesh_key for mesh_key, path in glb_paths.items() if path is None]
+        # Evicted locally but already published, nothing left to do for these
+        published = await asyncio.gather(
+            *[_storage.get_storage().exists(f"{mesh_key}.glb") for mesh_key in missing],
+            return_exceptions=True,
+        )
+        missing = [
+            mesh_key for mesh_key, found in zip(missing, published) if found is not True
+        ]
+
+        render_paths = {
+            mesh_key: cache.render_path_for(mesh_key) for mesh_key in missing
+        }
+        errors = await _blender_generator.generate_ballers(
+            [
+                {"export_path": render_paths[mesh_key], **unique_meshes[mesh_key]}
+                for mesh_key in missing
+            ]
+        )
+
+        results: dict[str, str | Exception] = {}
+        for mesh_key, error in zip(missing, errors):
+            if error is None:
+                glb_paths[mesh_key] = cache.put(mesh_key, render_paths[mesh_key])
+            else:
+                render_paths[mesh_key].unlink(missing_ok=True)
+                results[mesh_key] = error
+
+        rendered = [mesh_key for mesh_key in unique_meshes if mesh_key not in results]
+        export_paths = await asyncio.gather(
+            *[_publish(mesh_key, glb_paths[mesh_key]) for mesh_key in rendered],
+            return_exceptions=True,
+        )
+        results.update(zip(rendered, export_paths))
+
+    cache.trim()
+
+    return {
+        key: (
+            {
+                "export_path": results[mesh_key],
+                "mesh_key": mesh_key,
+                "variant_key": variant_keys[key],
+            }
+            if isinstance(results[mesh_key], str)
+            else results[mesh_key]
+        )
+        for key, mesh_key in mesh_keys.items()
+    }
+
+
+def glb_cache_stats() -> dict:
+    return _get_glb_cache().stats()
+
+
+async def render(unique_key: str, mesh: dict) -> dict:
+    """
+    Run Blender for a rolled item's mesh parameters
+    and publish the result (to S3 if it is enabled)
+
+    Returns {"export_path": ..., "mesh_key": ..., "variant_key": ...}
+    """
+    result = (await render_batch({unique_key: mesh}))[unique_key]
+    if isinstance(result, Exception):
+        raise result
+
+    return result
+
+
+async def generate(unique_key: str):
+    """Roll and render an item in one go"""
+    item = roll(unique_key)
+    item.update(await render(unique_key, item["mesh"]))
+    return item
+
+
+async def generate_batch(keys: list[str]) -> dict[str, dict]:
+    """Roll and render several items with a single Blender job"""
+    items = {key: roll(key) for key in keys}
+
+    results = await render_batch({key: item["mesh"] for key, item in items.items()})
+    for key, item in items.items():
+        if isinstance(results[key], Exception):
+            raise results[key]
+        item.update(results[key])  # pyright: ignore [reportGeneralTypeIssues]
+
+    return items
+
+
+def generate_many(n: int, rng: np.random.Generator | None = None) -> dict:
+    """
+    Roll n items at once with the same distributions as roll(), for
+    pre-computing roll batches and economy simulations
+
+    Materials and colors are not resolved, only the tiers they would be
+    drawn from. Returns a dict of columns, each an array of length n:
+        modifier_id, name_id, appraisal_id: word ids into WORD_TABLE_VERSION
+        roll, rarity (index into rarity_names), points, height_roll,
+        height (cm), weight (grams)
+        base_stats: (n, len(STAT_NAMES)) points per stat, in STAT_NAMES order
+        item_count, eye_count, headwear, body_noise, seed
+        color_scheme: index into COLOR_SCHEME_STYLES, -1 for table materials
+        material_tier: index into rarity_names of the body material tier,
+            -1 for color schemes
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    modifier_id = rng.integers(len(modifiers), size=n)
+    name_id = rng.integers(len(names), size=n)
+    appraisal_id = rng.integers(len(appraisals), size=n)
+
+    rarity, roll, lower_bounds = sampler.rarity_many(rng, n)
+    lower_bounds[rarity == len(rarity_names) - 1] = max_stats_roll
+
+    height_roll = rng.random(n)
+    height_cm = height_range_cm[0] + height_roll * (
+        height_range_cm[1] - height_range_cm[0]
+    )
+    variance = rng.uniform(weight_variance[0], weight_variance[1], n)
+    extra_height = height_cm >= extra_height_minimum
+    height_cm = np.where(
+        extra_height,
+        extra_height_range_cm[0]
+        + height_roll * (extra_height_range_cm[1] - extra_height_range_cm[0]),
+        height_cm,
+    )
+    weight_grams = np.where(
+        extra_height,
+        extra_weight_range_grams[0]
+        + height_roll
+        * (extra_weight_range_grams[1] - extra_weight_range_grams[0])
+        * variance,
+        weight_range_grams[0]
+        + height_roll * (weight_range_grams[1] - weight_range_grams[0]) * variance,
+    )
+
+    stats_roll = lower_bounds + (roll - lower_bounds) * rng.random(n)
+    points = np.tan((1 - stats_roll) * (np.pi / 2))
+
+    # Stats are handed out in a random order, each taking a random share
+    # of what is left over
+    remaining = np.round(points)
+    order = np.argsort(rng.random((n, len(STAT_NAMES))), axis=1)
+    max_pct_to_take = rng.uniform(1 / len(STAT_NAMES), 0.75, n)
+    base_stats = np.empty((n, len(STAT_NAMES)), dtype=np.int64)
+    rows = np.arange(n)
+    for a in range(len(STAT_NAMES)):
+        points_to_take = np.round(rng.random(n) * max_pct_to_take * remaining)
+        base_stats[rows, order[:, a]] = np.clip(points_to_take, 1, 99)
+        remaining -= points_to_take
+
+    leftover = rows[remaining > 0]
+    leftover_stats = rng.integers(len(STAT_NAMES), size=len(leftover))
+    base_stats[leftover, leftover_stats] = np.minimum(
+        99, base_stats[leftover, leftover_stats] + remaining[leftover]
+    )
+
+    # Each extra item is half as likely as the last
+    item_count = np.zeros(n, dtype=np.int64)
+    active = rows
+    item_rarity = 0.1
+    while len(active) > 0:
+        active = active[rng.random(len(active)) <= item_rarity]
+        item_count[active] += 1
+        item_rarity /= 2
+
+    eye_count = 2 + rng.geometric(0.7, n) - 1
+    few_eyes = (eye_count < 10) & (rng.random(n) <= 0.0001)
+    eye_count[few_eyes] = rng.integers(2, size=few_eyes.sum())
+
+    headwear = rng.random(n) < 0.5
+    body_noise = rng.random(n) < 0.5
+    seed = rng.integers(SIGNED_INT32_MIN, SIGNED_INT32_MAX, n)
+
+    use_color_scheme = (rarity < 3) & (rng.random(n) <= 0.7)  # Under sublime
+    material_count = 1 + (eye_count > 0) + (item_count > 0) + headwear
+    color_scheme = sampler.color_scheme_many(material_count, rng)
+    color_scheme = np.where(use_color_scheme, color_scheme, -1)
+
+    material_tier = sampler.material_tier_many(rarity, rng)
+    material_tier = np.where(use_color_scheme, -1, material_tier)
+
+    return {
+        "modifier_id": modifier_id,
+        "name_id": name_id,
+        "appraisal_id": appraisal_id,
+        "roll": roll,
+        "rarity": rarity,
+        "points": points,
+        "base_stats": base_stats,
+        "height_roll": height_roll,
+        "height": height_cm,
+        "weight": weight_grams,
+        "item_count": item_count,
+        "eye_count": eye_count,
+        "headwear": headwear,
+        "body_noise": body_noise,
+        "seed": seed,
+        "color_scheme": color_scheme,
+        "material_tier": material_tier,
     }
@@ -12,40 +12,241 @@ bigballer web - collect items
     You should have received a copy of the GNU Affero General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import asyncio
+import itertools
+import json
 from pathlib import Path
-import subprocess
 
 from bigballer_api.settings import settings
 
 
-def generate_baller(
-    export_path: Path,
-    seed: int,
-    height: float,
-    weight: float,
-    body_noise: bool,
-    headwear: bool,
-    item_count: int,
-    eye_count: int,
-):
-    result = subprocess.run(
-        [
+WORKER_SCRIPT_FILEPATH = Path(__file__).with_name("_blender_worker.py")
+RESULT_MARKER = "@@bigballer@@"  # Must match _blender_worker.RESULT_MARKER
+
+
+class BlenderError(Exception):
+    pass
+
+
+class BlenderTimeoutError(BlenderError):
+    pass
+
+
+class _BlenderWorker:
+    """
+    A single Blender process which has loaded the base .blend file
+    and runs generation jobs sent over stdin
+    """
+
+    def __init__(self, process: asyncio.subprocess.Process):
+        self.jobs_run = 0
+        self._process = process
+        # start() always opens both pipes
+        self._stdin: asyncio.StreamWriter = process.stdin  # pyright: ignore
+        self._stdout: asyncio.StreamReader = process.stdout  # pyright: ignore
+
+    @classmethod
+    async def start(cls) -> "_BlenderWorker":
+        process = await asyncio.create_subprocess_exec(
             settings().blender_binary_filepath,
             settings().base_baller_blend_filepath,
             "--background",
             "--python",
-            settings().baller_generation_script_filepath,
+            WORKER_SCRIPT_FILEPATH.as_posix(),
             "--",  # start of python script args
-            export_path.resolve().as_posix(),
-            str(seed),
-            str(height),
-            str(weight),
-            str(body_noise),
-            str(headwear),
-            str(item_count),
-            str(eye_count),
-        ],
-        capture_output=True,
-    )
-
-    print(result.stdout.decode("utf-8"))
+            settings().baller_generation_script_filepath,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        worker = cls(process)
+
+        # Wait for Blender to finish starting up before accepting jobs
+        await worker._wait_for_result(settings().blender_job_timeout)
+        return worker
+
+    async def _read_result(self) -> dict | None:
+        while True:
+            line = (await self._stdout.readline()).decode("utf-8")
+            if not line:  # stdout was closed, so the process has exited
+                return None
+
+            if line.startswith(RESULT_MARKER):
+                return json.loads(line[len(RESULT_MARKER) :])
+
+            print(line, end="")
+
+    async def _wait_for_result(self, timeout: float) -> dict:
+        try:
+            result = await asyncio.wait_for(self._read_result(), timeout)
+        except asyncio.TimeoutError:
+            await self.kill()
+            raise BlenderTimeoutError(
+                f"Blender worker timed out after {timeout} seconds"
+            )
+
+        if result is None:
+            raise BlenderError(
+                f"Blender worker exited with code {await self._process.wait()}"
+            )
+
+        return result
+
+    def alive(self) -> bool:
+        return self._process.returncode is None
+
+    async def run(self, job_id: int, batch: list[list[str]]) -> list[str | None]:
+        """Returns the error output of each run in the batch, None if it succeeded"""
+        self.jobs_run += 1
+        try:
+            self._stdin.write(
+                (json.dumps({"id": job_id, "batch": batch}) + "\n").encode("utf-8")
+            )
+            await self._stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise BlenderError("Blender worker is not accepting jobs") from e
+
+        result = await self._wait_for_result(
+            settings().blender_job_timeout * len(batch)
+        )
+        return result["errors"]
+
+    async def close(self):
+        try:
+            self._stdin.close()
+            await asyncio.wait_for(self._process.wait(), 5)
+        except (OSError, asyncio.TimeoutError):
+            await self.kill()
+
+    async def kill(self):
+        if self.alive():
+            self._process.kill()
+        await self._process.wait()
+
+
+class _BlenderPool:
+    """
+    Fixed-size pool of warm Blender workers. Workers are started lazily,
+    replaced when they crash or time out, and recycled after
+    settings().blender_jobs_per_worker jobs to keep their memory in check
+    """
+
+    def __init__(self, size: int):
+        self._job_ids = itertools.count()
+        self._closed = False
+        self._workers: set[_BlenderWorker] = set()
+        # None is a free slot that doesn't have a running worker yet
+        self._idle: asyncio.LifoQueue[_BlenderWorker | None] = asyncio.LifoQueue()
+        for _ in range(size):
+            self._idle.put_nowait(None)
+
+    async def _start_worker(self) -> _BlenderWorker:
+        worker = await _BlenderWorker.start()
+        self._workers.add(worker)
+        return worker
+
+    async def _discard_worker(self, worker: _BlenderWorker, kill: bool = False):
+        self._workers.discard(worker)
+        if kill:
+            await worker.kill()
+        else:
+            await worker.close()
+
+    async def run(self, batch: list[list[str]]) -> list[str | None]:
+        if self._closed:
+            raise BlenderError("Blender pool is closed")
+
+        worker = await self._idle.get()
+        try:
+            # Retry once on a fresh worker if the first one crashed
+            for attempt in range(2):
+                if worker is None or not worker.alive():
+                    if worker is not None:
+                        await self._discard_worker(worker, kill=True)
+                    worker = None
+                    worker = await self._start_worker()
+
+                try:
+                    errors = await worker.run(next(self._job_ids), batch)
+                    break
+                except BlenderTimeoutError:
+                    raise
+                except BlenderError:
+                    if attempt == 1:
+                        raise
+
+            if worker.jobs_run >= settings().blender_jobs_per_worker:
+                await self._discard_worker(worker)
+                worker = None
+        except asyncio.CancelledError:
+            # The job may still be running, so this worker is out of sync
+            if worker is not None:
+                await self._discard_worker(worker, kill=True)
+                worker = None
+            raise
+        finally:
+            self._idle.put_nowait(worker)
+
+        return errors  # pyright: ignore [reportUnboundVariable]
+
+    async def close(self):
+        self._closed = True
+        workers = list(self._workers)
+        self._workers.clear()
+        await asyncio.gather(*[worker.close() for worker in workers])
+
+
+_pool: _BlenderPool | None = None
+
+
+def _get_pool() -> _BlenderPool:
+    global _pool
+
+    if _pool is None:
+        _pool = _BlenderPool(settings().blender_pool_size)
+    return _pool
+
+
+async def close_pool():
+    global _pool
+
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+async def _run_one_shot(batch: list[list[str]]) -> list[str | None]:
+    worker = await _BlenderWorker.start()
+    try:
+        return await worker.run(0, batch)
+    finally:
+        await worker.close()
+
+
+async def generate_ballers(ballers: list[dict]) -> list[BlenderError | None]:
+    """
+    Build and export every baller in a single Blender job
+
+    Each baller is a dict of generate_baller() keyword arguments.
+    Returns an error for each baller which failed, None for the ones that didn't
+    """
+    batch = [
+        [
+            b["export_path"].resolve().as_posix(),
+            str(b["seed"]),
+            str(b["height"]),
+            str(b["weight"]),
+            str(b["body_noise"]),
+            str(b["headwear"]),
+            str(b["item_count"]),
+            str(b["eye_count"]),
+        ]
+        for b in ballers
+    ]
+
+    if settings().blender_pool_size > 0:
+        errors = await _get_pool().run(batch)
+    else:  # Pool disabled, cold start a Blender process just for this batch
+        errors = await _run_one_shot(batch)
+
+    return [BlenderError(e) if e is not None else None for e in errors]
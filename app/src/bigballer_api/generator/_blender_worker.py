@@ -0,0 +1,75 @@
+"""
+bigballer web - collect items
+    Copyright (C) 2023  Michael Manis - michaelmanis@tutanota.com
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Long-lived Blender worker. This file is executed *inside* Blender:
+
+    blender baller.blend --background --python _blender_worker.py -- generate.py
+
+Jobs are read from stdin as one JSON object per line and results are written
+to stdout as one JSON object per line, prefixed with RESULT_MARKER so they can
+be told apart from anything Blender or the generation script prints.
+
+A job is a batch of generation script argument lists. Its result holds one
+entry per argument list, either null or the traceback of that run.
+The worker exits once stdin is closed.
+"""
+import json
+import runpy
+import sys
+import traceback
+
+import bpy  # pyright: ignore [reportMissingImports]
+
+
+RESULT_MARKER = "@@bigballer@@"
+
+
+def run_script(generation_script: str, args: list[str]):
+    # The generation script reads its arguments after "--", same as a one-shot run
+    sys.argv = [sys.argv[0], "--", *args]
+    try:
+        runpy.run_path(generation_script, run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise RuntimeError(f"Generation script exited with code {e.code}")
+    finally:
+        # Throw away everything the script did to the scene
+        bpy.ops.wm.revert_mainfile()
+
+
+def main():
+    generation_script = sys.argv[sys.argv.index("--") + 1]
+
+    print(RESULT_MARKER + json.dumps({"ready": True}), flush=True)
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        job = json.loads(line)
+        errors = []
+        for args in job["batch"]:
+            try:
+                run_script(generation_script, args)
+            except Exception:
+                errors.append(traceback.format_exc())
+            else:
+                errors.append(None)
+
+        print(
+            RESULT_MARKER + json.dumps({"id": job["id"], "errors": errors}), flush=True
+        )
+
+
+main()
@@ -19,6 +19,8 @@ and cross-checking results
 import colorsys
 import random
 
+import numpy as np
+
 from bigballer_api.generator import _color_tables
 
 
@@ -31,20 +33,54 @@ def hsv_to_hex(hue, sat, val):
     return f"0x{r:02x}{g:02x}{b:02x}"
 
 
+def hsv_to_rgb_many(colors: np.ndarray) -> np.ndarray:
+    """colorsys.hsv_to_rgb() for an (..., 3) array of HSV colors"""
+    hue, sat, val = np.moveaxis(colors, -1, 0)
+    sector = np.floor(hue * 6)
+    f = hue * 6 - sector
+    sector = sector.astype(np.int64) % 6
+    p = val * (1 - sat)
+    q = val * (1 - sat * f)
+    t = val * (1 - sat * (1 - f))
+
+    r = np.choose(sector, [val, q, p, p, t, val])
+    g = np.choose(sector, [t, val, val, q, p, p])
+    b = np.choose(sector, [p, p, t, val, val, q])
+    return np.stack([r, g, b], axis=-1)
+
+
+def hsv_to_hex_many(colors: np.ndarray) -> np.ndarray:
+    """hsv_to_hex() for an (..., 3) array of HSV colors"""
+    # Same rounding as round(), half to even
+    rgb = np.round(hsv_to_rgb_many(colors) * 255).astype(np.int64)
+    packed = rgb[..., 0] << 16 | rgb[..., 1] << 8 | rgb[..., 2]
+    return np.char.mod("0x%06x", packed)
+
+
 def ryb_shift(hue, sat, val, degrees):
     """
     This will shift the color hue by degrees on a custom RYB color wheel
     NOT the RGB color wheel
     """
-    ryb_hue = _color_tables.rgb_hue_lut[round(hue * 360 % 360)]
-    shifted_hue = (ryb_hue + degrees / 360) % 1
-    ryb_shifted = (_color_tables.ryb_hue_lut[round(shifted_hue * 360)], sat, val)
-    return ryb_shifted
+    ryb_hue = _color_tables.rgb_to_ryb_hue(hue)
+    shifted_hue = float(_color_tables.ryb_to_rgb_hue(ryb_hue + degrees / 360))
+    return shifted_hue, sat, val
 
 
-def random_color():
+def ryb_shift_many(colors: np.ndarray, degrees) -> np.ndarray:
+    """
+    ryb_shift() for an (..., 3) array of HSV colors,
+    degrees can be a scalar or an array matching colors[..., 0]
+    """
+    colors = np.array(colors, dtype=np.float64)
+    ryb_hue = _color_tables.rgb_to_ryb_hue(colors[..., 0])
+    colors[..., 0] = _color_tables.ryb_to_rgb_hue(ryb_hue + np.divide(degrees, 360))
+    return colors
+
+
+def random_color(rng: random.Random):
     # Hue, Sat, Val
-    return random.random(), random.random(), random.random()
+    return rng.random(), rng.random(), rng.random()
 
 
 def generate_shades(hue, sat, val, max_distance=0.15, shade_pairs=2):
@@ -80,6 +116,41 @@ def generate_shades(hue, sat, val, max_distance=0.15, shade_pairs=2):
     ]
 
 
+def _offsets_many(num: np.ndarray, max_distance, shade_pairs) -> np.ndarray:
+    """generate_shades()'s get_offsets() for an array of values"""
+    num = num[:, None]
+    steps = np.arange(1, shade_pairs + 1)
+    total_desired_distance = max_distance * shade_pairs
+
+    below = np.where(
+        total_desired_distance > num,
+        num / (shade_pairs + 1) * steps,
+        num - max_distance * steps[::-1],
+    )
+    above = np.where(
+        total_desired_distance + num > 1,
+        num + (1 - num) / (shade_pairs + 1) * steps,
+        num + max_distance * steps,
+    )
+    return np.concatenate([below, num, above], axis=1)
+
+
+def generate_shades_many(
+    colors: np.ndarray, max_distance=0.15, shade_pairs=2
+) -> np.ndarray:
+    """
+    generate_shades() for an (n, 3) array of HSV colors,
+    returns an (n, shade_pairs * 2 + 1, 3) array
+    """
+    colors = np.asarray(colors, dtype=np.float64)
+    sat_offsets = _offsets_many(colors[:, 1], max_distance, shade_pairs)
+    val_offsets = _offsets_many(colors[:, 2], max_distance, shade_pairs)
+
+    # val should decrease as sat increases
+    hue = np.broadcast_to(colors[:, 0:1], sat_offsets.shape)
+    return np.stack([hue, sat_offsets, val_offsets[:, ::-1]], axis=-1)
+
+
 def generate_adjacent(hue, sat, val, degrees=30):
     return ryb_shift(hue, sat, val, 360 - degrees), ryb_shift(hue, sat, val, degrees)
 
@@ -11,62 +11,84 @@ bigballer web - collect items
     GNU Affero General Public License for more details.
     You should have received a copy of the GNU Affero General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Lookup tables between the custom RYB color wheel and RGB hues
+
+The wheel is defined by an RGB color every 20 degrees, linearly interpolated
+in between. ryb_to_rgb_hue_lut holds the RGB hue of the wheel every
+1 / STEPS_PER_DEGREE degrees, unwrapped so it rises from 0 to 1. Lookups
+interpolate between entries, in both directions
 """
-import colorsys
+import numpy as np
+
+
+STEPS_PER_DEGREE = 10
+
+_wheel_degrees = np.arange(0, 361, 20)
+_wheel_colors = np.array(
+    [
+        (1, 0, 0),
+        (1, 89 / 255, 0),
+        (1, 137 / 255, 0),
+        (1, 170 / 255, 0),
+        (1, 198 / 255, 0),
+        (1, 225 / 255, 0),
+        (1, 1, 0),
+        (198 / 255, 1, 0),
+        (137 / 255, 1, 0),
+        (0, 1, 0),
+        (0, 1, 178 / 255),
+        (0, 172 / 255, 1),
+        (0, 77 / 255, 1),
+        (23 / 255, 0, 1),
+        (93 / 255, 0, 1),
+        (164 / 255, 0, 1),
+        (1, 0, 207 / 255),
+        (1, 0, 99 / 255),
+        (1, 0, 0),
+    ]
+)
 
 
-_colors = {
-    "0": (1, 0, 0),
-    "20": (1, 89 / 255, 0),
-    "40": (1, 137 / 255, 0),
-    "60": (1, 170 / 255, 0),
-    "80": (1, 198 / 255, 0),
-    "100": (1, 225 / 255, 0),
-    "120": (1, 1, 0),
-    "140": (198 / 255, 1, 0),
-    "160": (137 / 255, 1, 0),
-    "180": (0, 1, 0),
-    "200": (0, 1, 178 / 255),
-    "220": (0, 172 / 255, 1),
-    "240": (0, 77 / 255, 1),
-    "260": (23 / 255, 0, 1),
-    "280": (93 / 255, 0, 1),
-    "300": (164 / 255, 0, 1),
-    "320": (1, 0, 207 / 255),
-    "340": (1, 0, 99 / 255),
-    "360": (1, 0, 0),
-}
+def rgb_to_hue_many(rgb: np.ndarray) -> np.ndarray:
+    """colorsys.rgb_to_hsv()'s hue for an (..., 3) array of colors"""
+    r, g, b = np.moveaxis(rgb, -1, 0)
+    maxc = rgb.max(axis=-1)
+    spread = maxc - rgb.min(axis=-1)
+    safe_spread = np.where(spread == 0, 1, spread)
 
-_interp_colors = [(1, 0, 0)]
-_cur_step = _colors["0"]
-_next_step = _colors["20"]
-for a in range(1, 360):
-    delta = a % 20
-    if delta == 0:
-        _interp_colors.append(_next_step)
-        _cur_step = _next_step
-        _next_step = _colors[str(a + 20)]
-    else:
-        c = (
-            _cur_step[0] + (_next_step[0] - _cur_step[0]) * (delta / 20),
-            _cur_step[1] + (_next_step[1] - _cur_step[1]) * (delta / 20),
-            _cur_step[2] + (_next_step[2] - _cur_step[2]) * (delta / 20),
+    rc = (maxc - r) / safe_spread
+    gc = (maxc - g) / safe_spread
+    bc = (maxc - b) / safe_spread
+    hue = np.select(
+        [r == maxc, g == maxc],
+        [bc - gc, 2 + rc - bc],
+        4 + gc - rc,
+    )
+    return np.where(spread == 0, 0, (hue / 6) % 1)
+
+
+ryb_degrees_lut = np.linspace(0, 360, 360 * STEPS_PER_DEGREE + 1)
+ryb_to_rgb_hue_lut = np.unwrap(
+    rgb_to_hue_many(
+        np.stack(
+            [
+                np.interp(ryb_degrees_lut, _wheel_degrees, _wheel_colors[:, c])
+                for c in range(3)
+            ],
+            axis=-1,
         )
-        _interp_colors.append(c)
+    ),
+    period=1,
+)
+assert np.all(np.diff(ryb_to_rgb_hue_lut) > 0), "RYB wheel hues must keep rising"
+
+
+def ryb_to_rgb_hue(ryb_hue):
+    """Takes and returns hues in [0, 1), scalars or arrays"""
+    return np.interp(np.mod(ryb_hue, 1) * 360, ryb_degrees_lut, ryb_to_rgb_hue_lut) % 1
 
-ryb_hue_lut = [colorsys.rgb_to_hsv(*c)[0] for c in _interp_colors]
 
-rgb_hue_lut = [0]
-_prev_value = 0
-for key, value in enumerate(ryb_hue_lut[1:], 1):
-    value_degrees = round(value * 360)
-    if value_degrees == _prev_value:
-        pass
-    elif value_degrees == _prev_value + 1:
-        rgb_hue_lut.append(key / 360)
-    else:
-        delta = value_degrees - _prev_value
-        for a in range(1, delta):
-            rgb_hue_lut.append((key - 1 + 1 / delta * a) / 360)
-        rgb_hue_lut.append(key / 360)
-    _prev_value = value_degrees
+def rgb_to_ryb_hue(rgb_hue):
+    """Takes and returns hues in [0, 1), scalars or arrays"""
+    return np.interp(np.mod(rgb_hue, 1), ryb_to_rgb_hue_lut, ryb_degrees_lut) / 360 % 1
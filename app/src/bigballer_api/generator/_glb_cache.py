@@ -0,0 +1,153 @@
+"""
+bigballer web - collect items
+    Copyright (C) 2023  Michael Manis - michaelmanis@tutanota.com
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Content-addressed store of rendered GLBs
+
+A mesh only depends on its generation parameters and on the Blender inputs
+(base .blend file and generation script), so GLBs are stored under a hash of
+all of those. Identical parameters are only ever rendered once (per batch,
+concurrent batches may render the same mesh and both put() it)
+"""
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+import hashlib
+import json
+import os
+from pathlib import Path
+import re
+from typing import Iterable
+from uuid import uuid4
+
+from bigballer_api.settings import settings
+
+
+_KEY = re.compile(r"[0-9a-f]{64}")
+_TMP_NAME = re.compile(r"[0-9a-f]{64}\.[0-9a-f]{32}\.tmp\.glb")
+
+
+@lru_cache
+def _blender_inputs_digest() -> bytes:
+    digest = hashlib.sha256()
+    for filepath in (
+        settings().base_baller_blend_filepath,
+        settings().baller_generation_script_filepath,
+    ):
+        with open(filepath, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.digest()
+
+
+def mesh_hash(mesh: dict) -> str:
+    digest = hashlib.sha256(_blender_inputs_digest())
+    digest.update(json.dumps(mesh, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class GlbCache:
+    """
+    GLBs on disk, keyed by mesh_hash(). Only files named like keys are ever
+    adopted from the directory. trim() evicts the least recently used files
+    to get back under max_bytes, except pinned ones. Recency survives
+    restarts through file modification times
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._sizes: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._pins: Counter[str] = Counter()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entries = []
+        for path in self.directory.glob("*.glb"):
+            if _TMP_NAME.fullmatch(path.name):  # Left over from a failed render
+                path.unlink(missing_ok=True)
+                continue
+            if not _KEY.fullmatch(path.stem):
+                continue
+            stat = path.stat()
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._sizes[key] = size
+            self._total_bytes += size
+
+        self.trim()
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{key}.glb"
+
+    def render_path_for(self, key: str) -> Path:
+        """Where to render a GLB before it is added with put(), unique per call"""
+        return self.directory / f"{key}.{uuid4().hex}.tmp.glb"
+
+    def get(self, key: str) -> Path | None:
+        if key not in self._sizes:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._sizes.move_to_end(key)
+        path = self.path_for(key)
+        os.utime(path)
+        return path
+
+    def put(self, key: str, render_path: Path) -> Path:
+        path = self.path_for(key)
+        os.replace(render_path, path)
+
+        self._total_bytes -= self._sizes.pop(key, 0)
+        self._sizes[key] = path.stat().st_size
+        self._total_bytes += self._sizes[key]
+
+        return path
+
+    @contextmanager
+    def pinned(self, keys: Iterable[str]):
+        """Keeps trim() from evicting keys, e.g. until they are published"""
+        keys = list(keys)
+        self._pins.update(keys)
+        try:
+            yield
+        finally:
+            self._pins.subtract(keys)
+            self._pins = +self._pins
+
+    def trim(self):
+        """Call once added files are no longer needed, e.g. after publishing"""
+        for key in list(self._sizes):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if key in self._pins:
+                continue
+
+            self._total_bytes -= self._sizes.pop(key)
+            self.path_for(key).unlink(missing_ok=True)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._sizes),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,179 @@
+"""
+bigballer web - collect items
+    Copyright (C) 2023  Michael Manis - michaelmanis@tutanota.com
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Precomputed samplers for the weighted choices made by roll()
+
+Everything is built once from the generator's tables, so every draw is O(1)
+and rolling never builds or mutates a list
+"""
+import random
+from typing import Sequence
+
+import numpy as np
+
+
+class AliasTable:
+    """
+    Walker's alias method (Vose's construction). Draws index i with
+    probability weights[i] / sum(weights) from a single uniform number
+    """
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [a for a, p in enumerate(scaled) if p < 1]
+        large = [a for a, p in enumerate(scaled) if p >= 1]
+        while len(small) > 0 and len(large) > 0:
+            s = small.pop()
+            g = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = g
+            scaled[g] += scaled[s] - 1
+            (small if scaled[g] < 1 else large).append(g)
+        # Whatever is left over is 1 up to floating point error
+
+        self.n = n
+        self._prob = prob
+        self._alias = alias
+        self._prob_array = np.array(prob)
+        self._alias_array = np.array(alias)
+
+    def draw(self, rng: random.Random) -> int:
+        u = rng.random() * self.n
+        a = int(u)
+        return a if u - a < self._prob[a] else self._alias[a]
+
+    def draw_many(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        u = rng.random(size) * self.n
+        a = u.astype(np.int64)
+        return np.where(u - a < self._prob_array[a], a, self._alias_array[a])
+
+
+def upgrade_weights(rarity_index: int, tier_count: int, chance: float) -> list[float]:
+    """
+    Chance of each material tier for an item of rarity_index.
+    Upgrades are re-rolled after every success, but the first success
+    only re-picks the item's own tier
+    """
+    weights = [0.0] * tier_count
+    chain_length = tier_count - rarity_index
+    for successes in range(chain_length + 1):
+        p = chance**successes
+        if successes < chain_length:
+            p *= 1 - chance
+        weights[rarity_index + max(successes - 1, 0)] += p
+
+    return weights
+
+
+class RollSampler:
+    """
+    rarity_names goes from most common to rarest and rarity_table maps
+    rarity names (rarest first) to the highest roll of that rarity.
+    Anything above the last entry is rarity_names[0]
+    """
+
+    def __init__(
+        self,
+        rarity_names: list[str],
+        rarity_table: dict[str, float],
+        material_rarity_table: dict[str, list[dict]],
+        material_upgrade_chance: float,
+        color_scheme_weights: Sequence[Sequence[float]],
+    ):
+        tier_count = len(rarity_names)
+
+        # (low, high] roll range of each rarity
+        self._rarity_bands = [(0.0, 1.0)] * tier_count
+        low = 0.0
+        for name, high in rarity_table.items():
+            self._rarity_bands[rarity_names.index(name)] = (low, high)
+            low = high
+        self._rarity_bands[0] = (low, 1.0)
+        self._rarity_band_array = np.array(self._rarity_bands)
+        self._rarity = AliasTable([high - low for low, high in self._rarity_bands])
+
+        self._material_tiers = [
+            AliasTable(upgrade_weights(a, tier_count, material_upgrade_chance))
+            for a in range(tier_count)
+        ]
+
+        self._tier_materials = [
+            tuple(material_rarity_table[name]) for name in rarity_names
+        ]
+        # Eyes and items may also use any material below the item's rarity
+        self._part_materials = {
+            (rarity_index, material_tier): tuple(
+                material_rarity_table[rarity_names[material_tier]]
+                + [
+                    m
+                    for name in rarity_names[:rarity_index]
+                    for m in material_rarity_table[name]
+                ]
+            )
+            for rarity_index in range(tier_count)
+            for material_tier in range(rarity_index, tier_count)
+        }
+
+        self._color_schemes = [AliasTable(row) for row in color_scheme_weights]
+
+    def rarity(self, rng: random.Random) -> tuple[int, float, float]:
+        """Returns a rarity index, a roll within it and the lowest roll it allows"""
+        rarity_index = self._rarity.draw(rng)
+        low, high = self._rarity_bands[rarity_index]
+        return rarity_index, high - rng.random() * (high - low), low
+
+    def rarity_many(
+        self, rng: np.random.Generator, size: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        rarity_index = self._rarity.draw_many(rng, size)
+        low, high = self._rarity_band_array[rarity_index].T
+        return rarity_index, high - rng.random(size) * (high - low), low
+
+    def material_tier(self, rarity_index: int, rng: random.Random) -> int:
+        return self._material_tiers[rarity_index].draw(rng)
+
+    def material_tier_many(
+        self, rarity_index: np.ndarray, rng: np.random.Generator
+    ) -> np.ndarray:
+        return _draw_grouped(self._material_tiers, rarity_index, rng)
+
+    def tier_materials(self, material_tier: int) -> tuple[dict, ...]:
+        return self._tier_materials[material_tier]
+
+    def part_materials(self, rarity_index: int, material_tier: int) -> tuple[dict, ...]:
+        return self._part_materials[(rarity_index, material_tier)]
+
+    def color_scheme(self, material_count: int, rng: random.Random) -> int:
+        return self._color_schemes[material_count - 1].draw(rng)
+
+    def color_scheme_many(
+        self, material_count: np.ndarray, rng: np.random.Generator
+    ) -> np.ndarray:
+        return _draw_grouped(self._color_schemes, material_count - 1, rng)
+
+
+def _draw_grouped(
+    tables: list[AliasTable], table_index: np.ndarray, rng: np.random.Generator
+) -> np.ndarray:
+    """Draws from tables[table_index[i]] for every i"""
+    draws = np.empty(len(table_index), dtype=np.int64)
+    for a, table in enumerate(tables):
+        rows = np.flatnonzero(table_index == a)
+        draws[rows] = table.draw_many(rng, len(rows))
+    return draws
@@ -0,0 +1,155 @@
+"""
+bigballer web - collect items
+    Copyright (C) 2023  Michael Manis - michaelmanis@tutanota.com
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Where rendered GLBs are published for clients to load
+
+S3Storage streams files into (multipart, when large) uploads through a single
+transfer manager shared by the whole process. LocalStorage copies files into
+a directory instead, for development and tests
+"""
+import asyncio
+import os
+from pathlib import Path
+import shutil
+from uuid import uuid4
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+
+from bigballer_api.settings import settings
+
+
+GLB_CONTENT_TYPE = "model/gltf-binary"
+# Published files are named by a hash of their contents, so they never change
+GLB_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class S3Storage:
+    def __init__(self):
+        files = settings().upload_concurrency
+        parts = settings().upload_part_concurrency
+
+        self._client = boto3.Session(profile_name=settings().aws_profile).client(
+            "s3",
+            config=Config(
+                max_pool_connections=files * parts,
+                retries={"mode": "standard"},
+            ),
+        )
+        self._transfer_config = TransferConfig(
+            multipart_threshold=settings().upload_multipart_threshold,
+            multipart_chunksize=settings().upload_multipart_threshold,
+            max_concurrency=parts,
+        )
+        self._semaphore = asyncio.Semaphore(files)
+        self._known: set[str] = set()
+
+    def _key(self, name: str) -> str:
+        return Path(settings().s3_bucket_prefix, name).as_posix()
+
+    def url(self, name: str) -> str:
+        return f"{settings().cdn_prefix}/{name}"
+
+    async def exists(self, name: str) -> bool:
+        if name in self._known:
+            return True
+
+        try:
+            # boto3 is blocking, keep it off the event loop
+            await asyncio.to_thread(
+                self._client.head_object,
+                Bucket=settings().s3_bucket_name,
+                Key=self._key(name),
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+
+        self._known.add(name)
+        return True
+
+    def _upload_file(self, filepath: Path, name: str):
+        with open(filepath, "rb") as f:
+            self._client.upload_fileobj(
+                f,
+                settings().s3_bucket_name,
+                self._key(name),
+                ExtraArgs={
+                    "ContentType": GLB_CONTENT_TYPE,
+                    "CacheControl": GLB_CACHE_CONTROL,
+                },
+                Config=self._transfer_config,
+            )
+
+    async def upload(self, filepath: Path, name: str):
+        async with self._semaphore:
+            for attempt in range(1, settings().upload_max_attempts + 1):
+                try:
+                    await asyncio.to_thread(self._upload_file, filepath, name)
+                    break
+                except (BotoCoreError, ClientError):
+                    if attempt == settings().upload_max_attempts:
+                        raise
+                    await asyncio.sleep(
+                        settings().upload_retry_backoff * 2 ** (attempt - 1)
+                    )
+
+        self._known.add(name)
+
+
+class LocalStorage:
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def url(self, name: str) -> str:
+        if settings().cdn_prefix:
+            return f"{settings().cdn_prefix}/{name}"
+
+        return (self.directory / name).as_posix()
+
+    async def exists(self, name: str) -> bool:
+        return (self.directory / name).exists()
+
+    async def upload(self, filepath: Path, name: str):
+        # Unique, the same name may be uploaded by several batches at once
+        tmp_path = self.directory / f".{name}.{uuid4().hex}.tmp"
+        try:
+            await asyncio.to_thread(shutil.copyfile, filepath, tmp_path)
+            os.replace(tmp_path, self.directory / name)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
+_storage: S3Storage | LocalStorage | None = None
+
+
+def get_storage() -> S3Storage | LocalStorage:
+    global _storage
+
+    if _storage is None:
+        if settings().use_s3:
+            _storage = S3Storage()
+        else:
+            _storage = LocalStorage(
+                Path(
+                    settings().local_storage_path
+                    or Path(settings().base_baller_output_path, "published")
+                )
+            )
+
+    return _storage
@@ -11,7 +11,91 @@ bigballer web - collect items
     GNU Affero General Public License for more details.
     You should have received a copy of the GNU Affero General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Versioned word tables, memory-mapped from _words_v{version}.bin
+(compiled by gen.py)
+
+Items store word ids, which are indexes into a specific table version,
+so every table version that items were rolled with has to stay around.
+New items are rolled with WORD_TABLE_VERSION
+
+File layout, all integers little-endian:
+    header:  magic (4s) | format version (H) | list count (H) | table version (I)
+    table:   one entry per list,
+             name (16s, NUL padded) | word count (I) | offsets start (Q)
+    lists:   per list, word count + 1 offsets (I) into the blob that follows,
+             then the UTF-8 blob. Word i is blob[offsets[i]:offsets[i + 1]]
+
+Words are only decoded when they are looked up, so picking a random word
+is O(1) and never materializes the whole list
 """
-modifiers=['uncoiling', 'tough', 'photoelectronic', 'queerer', 'Borrowing', 'imperative', 'touring', 'chest-back-lat-shoulder', 'stanch', 'fishing', '17-1/2-inch', 'replacing', 'pulsing', 'bedraggled', 'breakin', 'liquidating', 'defeating', 'vanishing', 'skindiving', 'presentational', 'twelve-year', 'adamant', 'national', 'vulgar', 'Gathering', 'Sitting', 'desultory', 'disreputable', 'ambivalent', 'garish', 'inharmonious', 'thinkin', 'Thankful', 'anti-Soviet', 'hearing', 'supine', 'beardown', 'dusty', 'papery', 'epiphyseal-diaphyseal', 'Available', 'Walking', 'non-service-connected', 'unbeknownst', 'alive', 'abstract', 'incepting', 'burned-out', 'deeper', 'pro-Castro', 'backward', 'thirsty', 'inviolate', 'Actual', 'licking', 'placid', 'culminating', 'first', 'grandiloquent', 'logging', 'even-handed', 'fundamental', 'safe-cracking', 'noncommittal', 'expandable', 'fuller', 'commoner', 'timid', 'dope-ridden', 'yellow-brown', 'viscous', 'insinuating', 'shunning', 'preparatory', 'Zaporogian', 'wrecking', 'rearranging', 'coconut-containing', 'vernacular', 'left-of-center', 'playful', 'industrial', 'shirking', 'wailing', 'cross-sectional', 'run-of-the-mine', 'Frowning', 'nonliterary', 'womanly', 'thawing', 'two-season', 'Current', 'unfunny', 'public-spirited', "Monday's", 'degrading', 'indomitable', 'semi-literate', 'bachelor-type', 'fast-firing', 'Inter-American', 'Consitutional', 'fanciful', 'Brown', 'Racial', 'akin', 'pastry-lined', 'shaggy', 'semi-autonomous', "stealin'", 'squirting', 'nearing', 'anatomic', 'low-ceilinged', 'impinging', 'anti-submarine', "ships'", 'documentary-type', 'many-sided', 'land-locked', 'maladjusted', 'blockading', 'neon-lighted', 'anti-Negro', 'neat', 'runaway', 'capitalizing', 'university-trained', 'forwarding', 'dripping', 'shiny', 'campaigning', 'smoke-stained', 'Miscellaneous', 'epicyclical', 'skouting', 'poverty-stricken', 'graver', 'thermostated', 'non-intellectual', 'hopping', 'sibilant', 'endangering', 'endeavoring', 'hundred-yen', 'tode', 'anticipating', 'unsprayed', 'Publick', 'sub-Christian', 'interlocking', 'seditious', 'short-cutting', 'cat-like', 'gaming', 'neuromuscular', 'environing', 'ergotropic', 'Irish', 'polemical', 'serviceable', "Listenin'", 'muscle-bound', 'Notable', 'Missionary', 'depending', 'fussy', 'neuronal', 'late', 'musical', 'variable', 'hypophyseal', 'passionate', 'Goddamn', 'transpirating', 'whistling', 'aforesaid', 'scathing', 'intoxicating', 'all-consuming', 'super', 'obedience-trained', 'scabrous', 'disillusioning', 'sacred', 'awash', 'quarter-century-old', 'jammed-together', 'presenting', 'pathologic', 'twenty-first', 'effectual', '600-mile', 'Regional', 'belated', 'Pensive', 'friable', 'beauteous', 'unventilated', 'archaic', 'gothic', 'crummy', 'directional', 'Effective', 'medium-sized', 'Working', 'dipping', 'w-i-d-e', 'decorative', 'hurrying', 'holding', 'retinal', 'detonating', 'refreshing', 'Lousy', 'conversant', 'rustic', 'self-extinguishing', 'mopping', 'expounding', 'inventing', 'Neutral', 'growling', 'bucolic', 'newly-plowed', 'Gentile-Jewish', 'investing', 'prohibitive', 'surface-active', 'predicting', 'barbed', 'reliving', 'rococo', 'demographic', 'stringy', 'pumping', 'hydrous', 'too-naked', 'brushy', 'rich', 'printable', 'explanatory', 'adjudging', 'puffing', 'native-born', 'unready', 'reddish', 'ornraier', 'wild', 're-establishing', 'insane', 'policy-making', 'stalking', 'large-enough', 'intrepid', 'pro-Hearst', 'dilute', 'sharp-limbed', 'German-language', 'apocryphal', 'building', 'Islamic', 'Wet', 'automotive', 'impressionistic', 'disobedient', 'repentant', 'void', 'ciliated', 'Shedding', 'scooting', 'stomping', 'collar-to-collar', 'Afro-Cuban', 'dietary', 'thinner', 'endless', 'repainting', 'developing', "becomin'", 'impurity-doped', 'Hitching', 'improving', 'rejecting', 'rumbling', 'soldierly', 'willful', 'metabolic', 'lisping', 'piling', 'welcoming', 'offsetting', '3,000-foot', 'ineligible', 'unnamed', 'Rococo', 'exotic', 'rat-a-tat-tatty', 'hypothetical', 'American', 'inflicting', 'cost-finding', 'inattentive', 'loose-jointed', 'Personal', 'conserving', 'unchanged', 'triple-checked', 'suspicious', 'diatomic', 'swarthy', 'scrambling', 'insolent', 'parrot-like', 'happy', 'titanic', 'lower', 'surly', 'frolicking', 'beardless', 'enterprising', 'grass-green', 'Perfect', 'ballooning', 'spine-chilling', 'intercollegiate', 'subsistent', 'clamoring', 'Moroccan', 'Gallant', 'considering', "soldiers'", 'iniquitous', 'Pyhrric', 'tantamount', 'versatile', 'survey-type', 'cheery', 'oxaloacetic', 'Preserving', 'woolly-headed', 'insulating', 'Bad', 'preparing', 'bull-roaring', 'basking', 'gregarious', 'Independent', 'oft-repeated', 'lashing', 'incipient', "countin'", 'Referring', 'well-prepared', 'gold', 'racing', 'tranquil', 'scary', 'magenta', 'Crossing', 'Drawing', 'noncombatant', 'withdrawing', 'topping', 'lean', 'debt-free', 'east-west', 'Chewing', 'loath', 'Accounting', 'two-week', 'Active', 'capacious', 'illustrious', 'submachine', 'lighting', 'blustery', 'papillary', 'earthly', 'wiry', 'Caring', 'distinguishable', 'unsheathing', 'uncertain', 'Sophoclean', "veterans'", 'medieval', 'shooting', 'discussing', 'restoring', 'inaugural', 'serial', 'shaky', 'needle-sharp', 'reassuring', '60-city', 'minimizing', 'unliterary', 'coloring', 'fog-enshrouded', 'multivalent', 'soliciting', 'classificatory', 'histochemical', 'Dangerous', 'drilling', 'Ducking', 'post-operative', 'strict', 'Declarative', 'costlier', 'bemaddening', "pastors'", 'dissenting', 'notorious', "showin'", 'stultifying', 'mineralogical', 'erroneous', 'cooing', 'downwind', 'unpaid', 'stranding', 'battle-shattered', 'typewritten', 'sneering', 'scrubbing', 'a.', 'frightening', 'inspiring', 'anchoring', 'powerless', '35-foot', 'swaggering', 'spread-out', 'allowing', 'Begging', 'inconvenient', 'able', 'pearl-gray', 'elaborate', 'white-dominated', 'outmoded', 'autonomic', 'evocative', 'ionic', 'commemorating', 'feather-like', "bustlin'", 'saucy', 'decisional', 'dabbing', 'moneyed', 'objecting', 'all-woman', 'harboring', 'boundless', 'weaker', 'single-spaced', 'clear-channel', 'shivery', 'foppish', 'complaining', 'bonding', 'naming', 'nucleic', 'questioning', 'Platonic', 'milder', 'conventional-type', 'eerie', 'straight-backed', 'nearer', 'shrill', 'sealing', 'Avoiding', 'a-drinking', 'tomato-red', 'ill', 'cell-free', 'neon-lit', 'unrelenting', 'strumming', 'unbroken', 'audio', 'saving', 'Bully', 'adept', 'hexagonal', 'eventual', 'Public', 'accidental', 'fatal', 'considerable', 'well-educated', 'aboriginal', 'new', 'closer', 'co-opting', "hours'", 'brimful', "lions'", 'alleging', 'fonder', 'restricting', 'screw-loose', 'Jungian', 'kindly', 'wrapping', 'plunging', 'unimpassioned', 'Melodious', 'marginal', 'double-strength', 'erythroid', 'telomeric', 'terrorizing', 'only', 'nebulous', 'hand-in-glove', 'Free', 'felonious', 'Preliminary', 'mauling', 'infallible', 'declarative', 'Shy', 'tart', 'Rhythmic', 'digging', 'multimegaton', "seein'", 'wild-eyed', 'vicious', 'hatchet-faced', 'longer', 'realizing', 'all-American', 'unchristian', 'leavin', 'resistant', 'tasteless', 'irregular', 'daytime', 'illegitimate', 'detrimental', 'resulting', 'service-connected', 'humming', "Nurses'", 'uncomforted', 'broadening', 'facial', 'declamatory', 'profit-maximizing', 'skillful', 'reorganizing', 'straight-A', 'permanent', 'wartorn', '12-year-old', 'silent', 'post-World', 'enervating', 'Remembering', 'thunder-purple', 'gnarled', 'pedagogical', 'child-bearing', 'anti-Semitic', 'harvesting', 'bottom-living', 'premature', 'schoolgirlish', 'feeble', 'intermediate', 'all-powerful', "pushin'", 'modernistic', 'peacemaking', 'pseudo-anthropological', 'brilliant', 'automatic', 'losing', 'five-days-a-week', 'facing', 'noting', 'presidential', 'greening', 'inescapable', 'Unruly', 'resiny', 'undergoing', 'Impressive', 'Looking', 'well-known', 'seventeen-year-old', 'merrymaking', 'curbing', 'responsive', 'over/under', 'homely', 'wiggling', 'starting', 'quipping', 'gubernatorial', 'Periodic', 'baggy', 'nation-wide', 'Elementary', 'Considerable', 'pre-Anglo-Saxon', 'capitalist-democratic', 'introspective', 'galling', 'mating', 'unwitting', 'Impossible', 'still-building', "writers'", 'button-down', '240-grain', 'familiar', 'expansive', 'Residential', 'uniformed', 'unnourished', 'three-part', 'Sudanese', 'alternative', 'decreasing', 'cancer-ridden', 'Lawmaking', 'Applying', 'Pakistani', 'truculent', 'suffocating', 'faulty', 'Dead', 'chimera-chasing', 'hard-fought', 'afire', 'paving', 'tragic', 'palm-studded', 'False', 'choppy', 'nothing-down', 'less-hurried', 'Wondering', 'physiological', 'novel', 'startling', 'outstate', 'solid-fueled', 'praising', 'screechy', 'extra-thick', 'grief-stricken', '5th', 'vulpine', 'untraditional', 'Interviewing', '30-inch', 'putty-like', 'livable', 'suitably-loaded', 'stropping', 'canonist', 'bloodless', 'illegal', 'anastomotic', 'post-war', 'pulverizing', 'instant', 'neonatal', 'unerring', 'anti-polio', 'troubling', 'quitting', 'flaunting', '508-yard', 'subtle', 'unendurable', 'summer-winter', 'trading', 'toasting', 'smoother', 'possessive', 'Beginning', 'excruciating', 'Fearful', 'fourteen-nation', 'molecular', 'featureless', 'surface-declaring', 'lower-middle', 'uninhibited', 'buying', 'foreseeing', 'escaping', 'fell', 'labeling', 'imaginary', 'Solving', 'captivating', 'viewing', '400-pound', 'antisocial', 'gabbling', 'kicking', 'digital', "Exterminatin'", 'phonologic', "producin'", 'mouldering', 'beginning', 'buff', 'staying', 'outer', 'foolproof', 'competent', 'Stammering', 'frequent', 'stateless', "assessors'", 'Unique', 'dromozootic', 'dormant', 'dictating', 'Corroborating', 'shaking', 'abrasion-resistant', 'front-back', 'instrumental-reward', 'transluscent', 'clearing', 'compensatory', 'Underlying', 'pro-U.N.F.P.', 'wry', 'well-made', 'aching', 'pantomimic', '25-year-old', 'Florentine', 'collective', 'swaying', 'neuropsychiatric', 'Yellow', 'embodying', 'sanitary', 'ruining', 'remunerative', 'unlawful', 'immemorial', 'puerile', 'mighty', 'unfair', 'forming', 'naturalistic', 'destructive', 'quieter', 'somber', 'ol', 'germane', 'birch-paneled', 'commit', 'stony', 'fresh-ground', "p'lite", 'Good', 'centuries-old', 'working', 'distraught', 'withering', 'computing', 'Washing', 'foreclosing', 'German', 'diverging', 'inclusive', 'red-faced', 'slim-waisted', 'four-hour', 'red-and-yellow', 'out-of-town', 'thirty-year', 'austere', 'slinging', 'handling', 'pleasing', '100-million-lb.', 'spongy', 'unrecognizable', 'cut-down', 'unblushing', 'olivefaced', "ever-lovin'", 'whopping', 'laundering', 'nonequivalent', 'truthful', "killin'", 'host-specific', '72-hole', 'stout', 'inarticulate', 'hypnotic', 'Unusual', 'inducing', 'writing', 'slippery', 'unique', 'bodied', 'run-up', 'smelling', 'handsome', 'American-trained', 'acid', 'three-sectioned', 'incomplete', 'ski', 'assailing', 'monolithic', 'abysmal', 'agitating', 'introducing', 'heavy-faced', 'unseemly', 'winning', 'atmospheric', 'exalting', 'quelling', 'multicolor', 'pre-cooled', 'salaried', 'attaching', 'Scandinavian', 'blank', 'Present', 'cockeyed', 'stifling', 'unarmed', 'skinny', 'countless', 'inter-species', 'concealing', 'retail', 'predictive', 'resonant', 'fugitive', 'interclass', 'granular-type', 'relentless', 'empirical', 'across-the-board', 'foamed-in-place', 'spinning', 'inert', 'growing', 'employing', 'sane', 'high-pitched', 'blasting', 'Serving', 'synchronous', '25,000-man', 'curtained', 'hydrophobic', 'sweltering', 'traumatic', 'quantitative', 'opinionated', 'warning', "months'", 'Chinese-inspired', 'undetected', 'disheartening', 'undeserved', 'Metropolitan', 'wanton', 'calamitous', 'deformational', 'follicular', 'paternalistic', 'all-knowing', 'far-away', 'farther', 'crystallizing', 'passable', 'Seeming', 'injection-molded', 'indifferent', 'short-skirted', 'redder', 'composing', 'granting', 'Insuring', 'pleural', 'rotund', 'jingling', 'year-round', 'foundering', '900-calorie', 'dressing', 'maximal', 'fastidious', 'Ithacan', 'unmagnified', 'ensuing', 'humanitarian', 'construing', 'Extending', 'stone-blind', 'Certain', 'thunderous', 'purifying', 'gut-flattening', 'abstractive', 'Heating', 're-moralizing', 'deathward', 'future', 'aberrant', 'feudal', 'exasperating', 'fusing', 'competing', 'taller', 'difficult', 'parting', 'symptomatic', 'impassive', 'carefree', 'modular', 'hungrier', 'Glorious', 'unthematic', 'buckle-on', 'unintended', 'multilateral', 'unwise', 'adipic', 'self-centered', 'imperfect', 'scintillating', 'robbing', 'voluminous', 'talented', 'Savory', 'Single-seeded', 'headlining', 'long-familiar', 'Straightening', 'mammalian', 'anti-B', 'pre-1960', 'borrowing', 'expeditious', 'mendacious', 'Pretty', 'unrepentant', 'offhand', 'flawless', 'copious', 'British', 'alleviating', 'evidencing', 'boating', 'booming', 'unremarkable', '25-liter', 'Whole', 'bestubbled', 'unfriendly', 'brotherly', 'transcendant', "cutters'", '645-acre', 'mid', 'half-closed', 'Clasping', 'neurotic', 'hand-covered', 'negligent', 'bluish', 'drowning', 'crazy', 'silken', 'holier-than-thou', 'squeamish', 'misty-eyed', 'darkhaired', 'dumping', 'wind-blown', 'trundling', 'penetrating', 'bangish', 'semi-catatonic', 'business-like', 'orthodontic', 'Neglecting', 'Unconcerned', 'barbarous', 'charitable', 'insufficient', 'vehement', 'unsupported', 'prime', 'coronary', 'pubescent', 'White-shirted', 'over-the-counter', 'evident', 'plush', 'horizontal', 'subordinate', 'chatting', 'polymeric', 'Specific', 'alien', 'Anglo-Jewish', 'smug', 'unlimited', 'informing', 'scuttling', 'artery-pulmonary', 'prim', 'hypocritical', 'multi-valued', 'deliberate', 'holy', 'enhancing', 'stimulatory', 'Gradual', 'Steady', 'obscene', 'two-burner', 'warmhearted', 'undaunted', 'two-nosed', 'interminable', 'Capable', 'sweet-sounding', 'fun-filled', 'Duplicate', 'college-oriented', 'Southern', '4-month', 'Pale', 'spavined', '16-year-old', 'prompt', 'explicit', 'ould', 'costly', '6-foot-10', 'insubordinate', 'woodworking', 'Russian-dominated', 'perpetual', 'lacy', "seizin'", '2-liter', 'unrealistic', 'extraterrestrial', "grabbin'", 'unworkable', 'field-sequential', 'brand-new', 'junior-senior', '4-year', 'coy', 'scanning', 'clonic', "lyin'", 'preferential', 'photochemical', 'Becoming', 'Conventional', 'anionic', 'incompatible', 'death-like', 'featuring', 'isotopic', 'steaming', 'junior-philosophical', 'above-mentioned', 'middle', 'unpublished', 'tardy', 'high-legged', 'audible', 'sneezing', 'Britannic', 'break-neck', 'pinkish-white', 'individual', 'plausible', 'lonesome', 'puissant', 'stepped-up', 'restraining', 'vertebral', 'Unlimited', 'peridontal', 'incompetent', 'face-saving', 'many-faced', 'devoid', 'Constitutional', 'concurrent', 'geographical', 'transmissible', 'ludicrous', 'very', 'resuming', 'axiomatic', 'little-known', "pleasin'", 'muttering', 'ultramodern', 'progressive', 'edible', 'gradient', 'discrete', 'equidistant', 'overhearing', 'adroit', 'intermediary', 'experimental', 'screeching', 'prevailing', 'unaffected', 'bullish', 'improbable', 'prosecuting', 'Red-prone', 'glad', 'kosher', 'air-to-surface', 'Yankee', 'Diocesan', 'foreign-sounding', 'Ardent', 'carven', 'glossy', 'sweet', 'hugging', 'neighboring', 'purring', 'standby', 'harmonic', 'influencing', 'Spenglerian', 'non-Catholic', 'beneficient', 'much-craved', 'unaccountable', 'signing', 'bicycle-auto', 'southeast', 'pessimistic', 'motionless', 'truer', 'free-buying', 'decrying', 'prosperous', 'Soaring', 'profitable', 'threatening', 'integral', 'shimming', 'resistive', 'select', 'Greek', 'exhausting', 'sorrel', 'stuffy', 'beckoning', 'Nostalgic', 'mitigating', 'higher-priced', 'titular', 'one-room', 'flocking', 'five-round', 'beef-feeding', 'geo-political', 'incurring', 'blocking', 'snapping', '600-yard', 'tumultuous', 'twenty-fifth', 'world-famous', 'childless', 'intrusive', 'off-beat', 'intradepartmental', 'ten-concert', 'improper', 'exhaustible', 'ensuring', 'jiving', 'maladroit', 'untracked', 'sliding', 'blonde-haired', "embalmers'", 'pert', 'ivy-covered', 'mailing', 'minifying', 'anti-infective', 'vernal', 'auburn', "gettin'", 'black-and-yellow', 'inefficient', '22-day', 'proximate', 'scoring', 'anthropological-religious', 'calm', 'Slender', 'exhaustive', 'whisking', 'absorptive', 'counteracting', 'prophetic', "registrants'", 'gnawing', 'Human', 'base-stealing', 'instinctual', 'dramatizing', 'Seeing', 'pre-Fair', 'freshborn', 'floppy', 'concluding', 'communicating', 'Christ-like', 'inhibitory', 'barren', 'patent-sharing', 'lithe', 'smooching', 'flaring', 'overdoing', 'proximal', 'Bitter', 'alveolar', 'cursing', 'self-consuming', 'per-day', 'axial', 'Sociological', 'procreative', 'Fretting', 'moneymaking', 'uphill', 'crashing', 'superb', 'concave', 'non-linear', 'policing', 'three-day', 'uncombable', 'unequalled', 'absorbing', 'ill-equipped', 'incandescent', 'world-renowned', 'Passing', 'pertaining', 'contagious', 'anecdotal', 'franker', 'debonair', 'infectious', 'spilling', 'so-so', 'song-writing', 'crooked', 'well-developed', 'rational', 'Tibetan-like', 'flintless', 'requesting', 'mistaking', 'female', 'penurious', 'cathodophoretic', "stations'", 'twirling', 'interdenominational', 'bullet-riddled', 'isolating', 'judicial', 'geocentric', 'Sensing', 'newly', 'pasting', 'nursing', 'blue-draped', 'inextricable', 'pelting', 'fictive', 'casual', 'feasible', 'octagonal', 'Lighting', 'libelous', 'dramatical', 'sizzling', 'Foreseeing', 'disintegrative', 'Scottish', 'multichannel', 'cockier', 'frigid', 'step-by-step', 'ingratiating', 'companionable', 'deceiving', 'foamy-necked', 'bending', 'unsurpassed', 'workmanlike', 'pre-war', 'marine', "strainin'", 'overhead', 'funny', 'wholesome', 'whole', 'incomparable', '160-ml.', 'Participating', 'polytonal', 'ancestral', 'shade-darkened', 'down', 'major', 'ranking', 'three-man', 'played-out', 'pre-Revolutionary', 'chinless', 'bailing', '16-hour', '28th', 'juicy', 'unrelated', 'usable', 'confidential', 'interstate', 'thudding', 'bordering', 'blood-thirsty', 'vomiting', 'olive-green', 'half-swimming', 'tweedy', 'philosophizing', 'shark-infested', 'less-dramatic', 'combat-tested', 'pointed', 'breaching', 'accurate', 'hard-nosed', 'well-informed', '24-in.', 'clearer', 'undisturbed', 'Spencerian', 'Facing', 'fragile', 'graceful', 'Opening', 'unscrupulous', 'rancorous', 'filming', 'stroking', 'Demonstrating', 'avenging', 'mosaic', 'desirable', 'mooring', 'pyknotic', 'avaricious', 'Cuban', 'retentive', 'war-dirty', 'Palladian', 'meager', 'singling', 'poetizing', 'Simple', 'express', 'remedial', 'well', 'matching', 'seeking', 'gentler', 'force-fear', 'quicker', 'rampant', 'swollen', 'Displaying', 'all-time', 'thermal', 'Australian', 'bizarre', 'flamboyant', 'heliocentric', 'fatherly', 'unruffled', 'pedestrian', 'Etruscan', 'imperial', 'wrongful', 'drafting', 'ice-feeling', 'lonely', 'terrific', 'tipping', 'fourteenth', 'well-meaning', 'pre-academic', 'unimpaired', 'horrifying', 'two-disc', 'heavier', 'downright', 'fruitful', 'Low-flying', 'incident', 'Varian', 'greedy', 'Unfriendly', 'negative', 'folklike', 'theatergoing', 'biennial', 'unimpressed', 'warmer', 'socio-political', 'brainy', 'protesting', 'Hanoverian', 'Royal', 'Significant', 'vicelike', 'Reeves-type', 'periphrastic', 'Bleaching', 'Uninhibited', 'pontifical', '3-year-old', 'bucking', 'fractious', 'stalwart', 'heat-denatured', 'captious', 'denouncing', 'fast-frozen', 'Running', '16th', 'frustrating', 'bigoted', 'behavioral', "Summer's", 'everlasting', 'steely', 'feverish', 'Capitalist', 'unnecessary', 'discriminatory', 'western-style', 'Welsh', 'Further', 'granulocytic', 'ten-hour', 'contractual', 'no-valued', 'combating', 'high-up', 'divisive', 'wraith-like', 'university-wide', 'white-clad', 'paranoid', 'cleaner', 'relevant', "Students'", 'epic', 'spring-back', 'dismal', 'Helpless', 'slaying', 'caliche-topped', 'replete', 'sacrosanct', 'chipper', 'Serbantian', 'demonstrable', 'Historical', 'insecure', 'nuclear', 'pre-empting', 'nonverbal', 'taxing', 'sheer', 'plodding', 'commanding', 'bland', 'Educational', 'carousing', 'administrative', 'slivery', 'suffering', 're-arguing', 'potential', 'Asteroidal', 'mincing', 'easy', 'downward', 'influent', '6-foot-3-inch', 'unkempt', 'driftin', 'sappy', 'glorying', 'unsolved', 'needy', 'knot-tying', '23d', 'grooming', '2-over-par', 'crystalline', 'cinematic', 'drooping', 'inferior', 'concise', 'suspect', 'sold-out', 'lifelike', 'Content', 'omitting', 'indivisible', 'deriving', 'pint-sized', '21-inch', "ladies'", 'Itching', 'less-traveled', 'tintable', 'final', 'classic', 'broadcasting', 'long-keeping', 'live', 'half-cocked', 'cost-raising', 'non-academic', 'antihistorical', 'illogical', 'indecisive', 'invisible', 'satisfying', 'downtalking', 'soulful', 'inexcusable', 'ultimate', 'sinister', 'liberal', 'tiptoeing', '14th', 'stronger', 'biophysical', 'much-copied', 'erecting', 'oval', 'ominous', 'basing', 'wispy', 'Holy', 'persecutory', 'yelping', 'seafaring', 'wasteful', 'fortunate', 'subscribing', 'slamming', '8-year-old', 'fusty', 'orthographic', 'bothering', 'ill-prepared', 'far-reaching', 'postal', 'simpler', 'warmed-over', 'inhabiting', 'sentient', 'present-time', 'bulky', 'unresolved', 'forbidding', 'Exclusive', 'three-dimensional', 'nondrying', 'Binomial', 'Judeo-Christian', 'wee', 'Receiving', 'monotone', 'onrushing', 'ever-growing', '23rd', 'obligational', 'fruitless', 'fleeting', 'red-bellied', 'interweaving', 'Georgian', 'detecting', 'electing', 'pretending', 'eliminating', 'intra-company', 'cloudy', 'participating', 'north-bound', 'educating', 'erupting', 'solid', 'Quickening', 'tropho-', '21-year', 'Economic', 'non-supervisory', 'epoch-making', 'inconsiderable', 'optimizing', 'week-old', 'Philippine', 'socio-structural', 'controlling', 'ornate', 'maroon', 'fiber-coupled', 'elegant', 'oftener', 'bilingual', 'devotional', "subjects'", 'ebullient', 'weeping', 'unobtainable', 'consanguineous', 'brown', 'treasonous', 'tidal', 'American-Jewish', 'Coaching', 'valiant', 'greate', 'esoteric', 'trustworthy', 'pre-cast', 'unauthentic', 'living', 'plinking', 'deferring', 'Unanalyzed', "mothers'", 'illustrative', 'obsolete', 'peeking', 'five-volume', 'Apropos', 'stepping', 'sizable', 'simultaneous', 'unsurmountable', 'finishing', 'sexy', 'coup-proof', 'unattractive', 'well-equipped', 'challenging', 'exogamous', 'balmy', 'Commencing', 'unstructured', 'rolling', 'eye-gouging', 'textured', 'handmade', 'much-needed', 'visceral', 'Indicating', 'gray-haired', '100-brick', 'south-central', 'Contemporary', 'lilac', 'alarmist', 'unacceptable', 'action-packed', 'banding', 'emptier', '10-team', 'vibrant', 'uninterrupted', 'Freudian', 'entry-limited', 'pending', 'every-day', 'tutoring', 'heart-warming', 'untrammeled', 'stirring', 'rootless', 'woolen', 'southward', 'peripheral', 'Considering', 'French-born', 'motley', 'bouncing', 'revamping', "hifalutin'", 'Ordinary', 'Pre-shaped', 'upper-lower', 'devious', 'occupational', 'roughish', 'gambling', "Friday's", 'unable', 'makeshift', 'unsuccessful', 'issuing', 'eccentric', 'reaching', 'experiential', 'self-employed', 'confining', 'shipping', 'all-round', 'clothbound', 'multi-family', 'honorary', 'gilt', 'colloidal', 'undisrupted', 'resolving', 'Filling', 'outdoor', 'flood-ravaged', 'Secret', 'annoying', 'backwoods-and-sand-hill', 'lawmaking', 'Stuart-family', 'world-shattering', 'transcendental', 'acting', 'servicing', 'Giving', 'shocking', 'stinging', 'modish', 'accentual', 'profuse', 'limbic', 'Social', 'goddam', 'emaciated', 'Manual', 'Drunken', 'semi-abstract', 'reaping', 'vying', 'bovine', 'rebelling', 'state-owned', 'dreamin', 'unexpended', 'constructive', 'Talking', 'Hellenic', 'planning', 'fiftieth', 'sponsoring', 'hypothalamic-cortical', 'carving', 'diocesan', 'level', 'colorful', 'Treasonable', 'inclement', 'unprocurable', 'spell-binding', 'strutting', 'multi-purpose', 'sympathetic', 'historic', 'flavoring', 'make-work', 'up-jutting', 'musing', 'blushing', 'useless', 'considerate', 'proclaiming', 'intactible', 'full', 'unmarried', 'drowsing', 'Middle', 'puncturing', 'humanistic', 'vivacious', 'stocking', 'residual', 'dual-channel', 'immanent', 'nonsystematic', 'neutral', 'sprawling', 'Orange', 'antisubmarine', 'heightening', 'Pressing', 'tolerable', 'Hatless', 'Charming', 'larger', 'natal', 'duplex', 'soothing', 'ecumenical', 'balancing', 'maturational', 'a-coming', 'spectrometric', 'favorable', 'highlighting', 'prudent', 'authoritarian', 'superior', 'fetching', 'eleventh', 'portentous', 'five-a-week', 'serving', 'superstitious', 'monthly', 'suggesting', 'pitiable', 'gathering', 'hip', 'ocean-going', 'myeloid', 'shy', 'flat', 'selfeffacing', 'parliamentary', 'macabre', 'thermonuclear', 'flat-bottomed', 'flyaway', 'shapeless', 'gentle', 'aggregate', 'symbolical', 'weird', 'long-sought', 'wording', 'writhing', '25th', 'Herculean', 'veterinary', 'Direct', 'anthropological', 'observational', 'fifth', 'fabricating', 'circuitous', 'polygynous', 'guttural', 'Minoan-Mycenaean', 'pitiful', 'recondite', "sellers'", 'idealistic', 'sketching', 'idle', 'Operational', 'lasting', 'non-taxable', '9th', 'oratorical', 'coagulating', 'duller', 'carved-out-of-solid', 'polynomial', 'tolerating', 'Female', 'insulting', 'possessing', 'gross', 'sedimentary', 'French', 'lurid', 'crazy-wonderful', 'jackbooted', 'slugging', 'suburbanite', '2-inch', 'Superior', 'Portuguese', '16-page', 'delineating', 'sharper', 'hateful', 'recurrent', 'repudiating', 'irremediable', 'founding', 'well-read', 'grandiose', 'unstapled', 'Nuclear', '6-hr.', 'regular', 'loosely-taped', 'air-conditioned', 'cubist', 'pigmented', 'hard-boiled', 'appropriating', 'blue', 'mechanical', 'two-colored', 'uneconomic', 'upland', 'shivering', 'Thermogravimetric', 'fifteen-minute', 'vacuous', 'Extraordinary', 'sentimental', 'capable', 'Burgundian', 'Grabbing', 'aromatick', 'Sorry', 'romantic', 'bowing', 'sectarian', 'optimistic', 'emeritus', 'statesmanlike', 'religious', 'reedy', 'operable', 'thorough', 'rounding', 'much-discussed', 'headless', 'anti-Colmer', 'Jewish', 'scurrilous', 'superfluous', 'tepid', 'youthful', 'contemptuous', 'overlooking', 'insuperable', 'recreational', 'skirting', 'sending', 'controversial', 'uncluttered', 'post-attack', 'purporting', 'case-by-case', 'critical', 'fatuous', 'Heavy-coated', 'crucifying', 'attractive', 'cool', 'nervous', 'flipping', 'long-acting', 'Thermal', 'Yiddish', 'Recognizing', 'ransacking', 'Mono-unsaturated', 'Cursing', 'lobular', 'scientifically-trained', 'Jutish', 'Haying', 'lactating', 'Hebrew', 'internal-external', 'rationalist', 'slightly-smoking', 'fifty-ninth', 'unchecked', 'idiomatic', 'unlikely', 'devising', 'grunting', 'ungrateful', 'edgy', 'incapable', 'clear-cut', 'cranelike', 'food-processing', 'blinking', 'scimitar-wielding', 'sweet-sour', 'newly-created', 'miscellaneous', 'homebound', 'belonging', 'Assisting', 'tight', 'cypress-like', 'dental', 'proposing', 'Little', 'Heavenly', 'curling', 'stupefying', 'reducing', 'corresponding', 'filthy', 'topographic', 'blanche', 'Flemish', 'thirty-mile', 'unbelieving', 'awry', 'wholesale', 'bespectacled', 'reportorial', 'contemplating', 'extramarital', 'Acquiring', 'immaterial', 'five-minute', 'gun-slinging', 'honey-in-the-sun', 'partial', 'budget-altering', '26th', 'well-stocked', 'refueling', 'exiling', 'centering', 'worn-faced', 'Federal', 'outdistancing', "guests'", 'unquiet', 'laden', 'choice', 'tormenting', 'hit-and-run', 'impending', 'extruding', 'adverbial', 'Fifth', 'tricky', 'four-letter', 'terrifying', 'escorting', 'worthy', 'gruesome', 'once-in-a-lifetime', 'levi-clad', 'weighing', 'Central', 'famed', 'absent-minded', 'ideal', 'amatory', 'operative', 'unoccupied', 'gangling', '8-1/2-foot', 'self-evident', 'dipole', 'lower-priced', 'won-lost', 'unwed', 'quarterly', 'hustling', 'shape-up', 'anticipatory', 'boyish', 'phonemic', 'unreleased', 'breeding', "states'", 'Sufficient', 'parsympathetic', 'prior', 'isotonic', 'roomy', 'dual-road-up', 'Native', 'luminous', 'colonnaded', 'nodding', 'moral', 'canning', 'phosphate-buffered', 'glowing', 'pee-wee', 'crusading', 'exact', 'abounding', 'rimless', 'blithe', 'geopolitical', 'warlike', 'well-fleshed', 'Individual', 'not-quite-perfect', 'preparative', 'groaning', 'bright', 'homemade', 'winking', 'insensitive', 'responsible', 'refusing', 'rosy', 'unpretentious', 'hypothalamic', 'arresting', 'chatty', 'ankle-deep', 'crimson', 'stereo', 'praying', 'lacey', 'general-appeal', 'comprehensive', 'runing', 'necessitating', 'honoring', 'playing', 'abnormal', 'injunctive', 'trivial', 'unrewarding', 'outspoken', 'builtin', 'Public-spirited', 'traditionalistic', 'repetitious', 'pounding', 'Powerful', 'world-wide', 'sclerotic', 'aiming', 'rubbery', 'indispensible', 'return', 'socialist', 'Voting', 'tactical', 'two-family', 'Spatial', '10-year', 'soldiering', 'self-proclaimed', 'maneuvering', 'gassy', 'coastal', 'co-ordinating', 'resin-saturated', 'mediumistic', 'calculating', 'well-written', 'unenforcible', 'bustling', 'self-reliant', 'bluff', 'Government-owned', 'helicopter-borne', 'excellent', 'assigning', 'mountainous', 'fingerprinting', 'departing', 'thievin', 'pro-neutralist', '17th', 'ultra-modern', 'modernizing', 'invading', 'reeling', 'driving', 'unsatisfactory', 'pug-nosed', 'pre-school', 'numerical', 'fanning', 'Blasphemous', 'illuminating', 'antic', 'unfired', 'evolutionary', 'oppressive', 'hocking', 'salient', 'perusing', 'worth', 'craggy', 'entering', 'rambling', 'unshielded', 'autistic', 'invulnerable', 'underlining', 'grubby', 'unsteady', 'definitive', 'monodisperse', 'non-instinctive', 'loose', 'psychotic', 'tiring', 'modeling', 'after-hours', 'diverse', '4th', 'immutable', 'condemning', "rulers'", 'scatterbrained', "composers'", 'dextrous-fingered', "confusin'", 'gulling', 'adventuring', 'unauthorized', 'bleak', 'Vending', 'comin', 'languid', 'instigating', 'oversize', "horses'", 'reckless', 'extracting', 'later', 'florid', 'lethal', 'checking', 'languishing', 'outward', 'unromantic', "field-hands'", 'tucking', 'tough-looking', 'Careful', 'prevalent', 'Episcopal', 'non-job-connected', 'gum-chewing', 'Clean', 'jerking', 'three-night', 'reminiscing', 'stormy', 'Geatish', 'off-the-cuff', 'poly-unsaturated', 'uncalled', 'bloodstained', 'hastily-summoned', 'sunbaked', 'clear-headed', 'traipsing', 'crowning', 'one-story', '14-term', 'Slight', 'leaderless', 'stamping', 'two-and-a-half-mile', 'sky-reaching', 'ill-starred', 'looming', 'bridged-T', 'bronchiolar', 'brief', 'clerical-lay', 'motoring', 'haranguing', 'all-female', 'correct', 'stately', 'pillared', 'Democratic-endorsed', 'infertile', 'woeful', 'testimonial', 'myocardial', 'dead', 'extending', 'affectionate', 'Living', 'infamous', 'wordy', 'vivid', 'four-jet', 'consultative', 'happier', 'slight', 'signaling', 'vertical', 'data-processing', 'unheated', 'bio-medical', 'plummeting', 'dilating', 'full-sized', 'all-Negro', 'basic', 'two-year', 'propelling', 'nimbler', 'intelligent', 'sun-inflamed', 'yellow', 'Advance', 'infinite', 'disdainful', 'low-priced', 'thwarting', 'red-tailed', 'disputable', 'agricultural', 'insuring', 'dreamy', 'meditative', 'logical', 'coaching', "takin'", 'Kneeling', '3-foot', 'out-dated', 'off-duty', 'home-bound', 'One-armed', 'environmental', 'five-coordinate', 'Commanding', 'art-filled', 'Visiting', 'plus-one', 'indignant', 'attributable', 'burglarproof', 'unadjusted', 'sun-browned', 'complying', 'enlarging', 'Rear', 'Leasing', 'scanty', 'paying', 'half-drunk', 'storing', "Saturday's", 'semi-serious', 'celebrating', 'Theoretical', 'scribing', 'alluring', 'weasel-worded', 'paralinguistic', 'amenable', 'skilled', 'bubbly', 'forging', 'remembering', 'binomial', 'first-class', 'parkish', '15th', 'structural', 'interdepartmental', 'Representing', 'fifty-dollar', 'interfering', 'Following', 'breathing', 'knowledgeable', 'self-locking', 'seven-stories', 'middle-sized', 'post-census', 'politico-sociological', 'otherworldly', 'halcyon', 'unalloyed', 'readable', 'elbowing', 'diminutive', 'alliterative', 'widthwise', 'unbelievable', 'long-awaited', 'conditional', 'reeking', 'rippling', 'determinable', 'nudging', 'Democratic', 'combatant', 'case-hardened', 'higher', 'Honest', 'metaphysical', 'unpacking', 'different', 'christianizing', 'snippy', 'regrettable', 'enjoying', 'electoral', 'Janus-faced', 'skylarking', 'damn', 'mud-sweat-and-tears', 'non-Federal', 'Poor', 'glottochronological', 'gret', 'business-minded', 'Ukrainian', 'non-social', 'shallower', 'preferring', 'mass-building', 'Building', 'banishing', 'unmalicious', 'thrilling', 'water-holding', 'benevolent', 'skipping', 'Trinitarian', 'huddling', 'scratching', 'readying', 'fat', 'liberalizing', 'Precise', 'camp-made', 'wacky', 'deprecatory', 'expressionless', 'indistinguishable', 'sustaining', 'precipitating', 'ever-changing', 'adolescent', 'modest', 'grisly', 'commutator-like', 'needing', 'spic', 'landing', 'three-hour', 'unnameable', 'womb-to-tomb', 'dishonest', 'dependent', 'Burmese', 'unscientific', 'stinking', "poeple's", 'traitorous', 'bombarding', 'contemptible', 'filial', 'slenderer', 'ageless', 'Algerian', 'three-masted', 'exaggerating', 'Pentecostal', "grownups'", 'remounting', 'definite', 'anti-aircraft', 'Tunisian', 'Italian', 'diagonal', 'greying', 'cotton-growing', 'sylvan', 'sole', 'enlightening', 'debatable', 'corruptible', 'welling', 'status-conscious', 'mineral-rich', 'sopping', 'equitable', 'diabolical', 'goin', "walkin'", 'prospective', 'dominating', 'old-fashioned', 'inexhaustible', 'revising', 'protective', 'countervailing', 'sun-tanned', 'trusting', 'aeronautical', 'even', 'imperceptible', 'Interfaith', 'reciprocal', 'inhuman', 'skilful', 'rebellious', 'braying', 'outlandish', 'disappearing', 'cathodoluminescent', 'bleaching', 'awkward', 'sayin', 'shoving', 'Similar', '24-sheet', 'appreciative', 'itemizing', 'leading', 'snow-covered', 'squinting', 'imitating', 'six-point', 'braweling', 'delinquent', 'totalistic', '2d', 'verdant', 'bio-', 'sweeter', 'coolheaded', 'restating', 'unjustifiable', 'substantial', 'uniting', 'concerted', 'brushing', 'Slavic', 'compressive', 'pertinent', 'waggling', 'bolstering', 'gastrointestinal', "customers'", 'herding', 'thoroughgoing', 'mass', 'honest', 'Brahmsian', 'exploratory', 'shapely', 'radar-controlled', 'institution-wide', 'resentful', 'continuous', 'occupying', 'disaffiliated', 'incorrigible', 'Squatting', '13th', 'Sunday-school', 'confirming', 'fronting', 'bedridden', 'exerting', 'irreversible', 'sticky-fingered', '10-milligram', 'placeless', 'resembling', 'offshore', 'abject', 'reupholstering', 'quarter-to-quarter', 'over-', 'arable', 'Falling', 'homicidal', 'graying', 'equivalent', 'insisting', 'encyclopedic', '2-score-year', 'Middle-Eastern', 'leaden', 'unamused', 'typing', 'russet-colored', 'taking', 'joining', 'Upper', 'disconcerting', 'Glad', 'brisk', 'unpremeditated', 'immodest', 'shipshape', 'constructing', '70-mile-long', 'furnishing', 'sovereign', 'tedious', 'ninetieth', 'Painting', 'nonpoisonous', 'risking', 'clambering', 'Rapping', 'vocational', 'greatcoated', 'two-day', 'two-timing', 'vaguely-imagined', 'spanning', 'Larger', 'adjustable', 'post-independence', "survivors'", 'chronological', 'lukewarm', 'newfound', 'full-scale', 'Panting', 'Transparent', 'Sporting', 'labor-based', 'unlovely', 'hacking', 'unheeded', 'thirty-sixth', 'roughshod', 'obsessive-compulsive', 'untimely', 'frenetic', 'consolidating', 'cut-and-dried', 'architectonic', 'undivided', 'identifiable', 'upriver', 'blue-green', 'mischievous', 'Searching', 'sighting', 'recruiting', 'touchy', 'death-locked', 'cocky', 'allegorical', 'bronzy-green-gold', 'diagnosable', '90-degree', 'socio-economic', 'gorgeous', 'pungent', 'Faustian', 'hazardous', 'self-critical', 'arterial', 'taunting', 'untenanted', 'exhilarating', 'coordinate', 'wearing', 'soluble', 'riotous', 'unwanted', 'glib', 'half-grown', 'steep', 'relative', 'urgent', 'Returning', "brandin'", '15-year-old', 'behaving', 'equatorial', 'budgetary', 'shooing', 'lovelorn', 'lifelong', 'self-effacing', 'pushing', 'nationwide', 'endogamous', 'ventilating', 'ambrosial', 'fussing', 'antislavery', '30-year', 'state-administered', 'pernicious', 'indicative', 'basting', 'scheduling', 'Soviet-Chinese', 'sizeable', 'unpleased', 'appreciating', 'learning', 'plucking', 'cancelling', 'verbal', 'knitting', 'discounting', 'Government-blessed', 'mild', 'power-starved', 'interspecies', 'unidentified', 'dystopian', 'Denver-area', 'individual-contributor', 'narrowing', 'ministerial', 'reinforcing', "company's", 'melodic', 'periodic', 'wintering', 'larval', 'hermetic', '24-inch', 'content', 'clutching', 'prescriptive', 'joyful', 'purposeless', 'distressing', 'cosmic', 'amending', 'Pink', 'time-honored', 'collectible', 'English-dialogue', 'installing', 'tax-paying', 'inopportune', 'awakening', 'childish', 'partisan', 'balking', 'bickering', 'methodological', 'Fine', 'populous', 'petting', 'fluorescein-labeled', 'toneless', 'ten-foot', 'walloping', 'nation-building', 'heavenly', 'doffing', 'sparkling', 'hardboiled', 'threading', 'pale-blue', 'inanimate', 'long-stemmed', 'doing', '165-unit', 'causal', 'grumbling', 'limitless', 'big', 'coupling', 'galactic', 'defenseless', 'Different', 'Evangelical', 'hot', 'artless', 'earnest', 'imcomparable', 'rationing', 'prosaic', 'sleepless', 'avant-garde', "colonists'", 'drier', 'overaggressive', 'Recovering', 'impersonal', 'evaluative', 'down-and-out', 'Meinckian', 'snowing', 'tyrannical', 'Well-stretched', 'comparative', 'undersea', 'suggestive', 'give-away', 'layering', 'chillier', 'gentile', 'fattening', '87th', 'Arabian', 'overdue', 'roving', 'Anglican', 'neural', 'lawless', 'Angry', '1M', 'listening', 'first-rate', 'lesser-known', 'galvanizing', 'alert', 'senile', 'five-foot', 'legitimate', 'resurrecting', 'supportive', 'effusive', 'French-Canadian', 'Extreme', 'blatant', 'unstable', "teams'", 'too-expensive', 'throttling', 'inexpensive', 'needless', 'self-assertive', 'scraping', 'Routine', 'merciless', 'intensive', 'Administrative', 'extreme', 'ten-year', 'Vivacious', 'abstaining', 'structuring', 'scholastic', 'precedent-based', 'distal', 'trembling', 'curving', 'blood-soaked', 'lumpy', 'kinesthetic', 'middle-aged', 'new-spilled', "motorists'", 'maturing', 'unhappy', 'Olympian', 'Supporting', 'transplanting', 'hand-made', 'heathen', 'bridal', 'profound', 'wooden', 'hollering', 'ousting', 'unifying', 'messing', '8-channel', 'green-brown', 'stereophonic', 'deplorable', 'bumptious', 'hair-raising', 'memorable', 'philosophical', 'perceiving', 'supercritical', 'unconscious', 'scrounging', 'paralleling', 'drop', 'solicitous', 'unforseen', 'ineffective', "runnin'", 'Hitting', 'enduring', 'unsure', 'dotting', 'information-seeking', 'gray', 'altitude-azimuth-mounted', 'ghastly', 'lamechian', 'narrow', 'multi-phase', 'three-fold', 'mystical', 'allowable', 'rapt', 'undisciplined', 'signal-to-noise', 'decanting', 'supplanting', 'bright-eyed', 'shambling', 'twitching', 'rough-hewn', 'Afro-Asian', 'rotating', 'ultrasonic', 'like', 'crucial', 'unhealthy', 'anti-Catholic', 'ardent', 'tragi-comic', 'stiffer', 'box-sized', 'Local', 'Engineering', 'undeclared', 'atavistic', 'pastoral', 'priestly', 'short', 'ultra-efficient', 'unchangeable', 'Approaching', 'Newtonian', 'morale-enhancing', 'six-gallon', 'successive', 'Toasting', 'Keeping', 'subsidiary', 'frivolous', 'rugged', 'leaky', 'inadvertent', 'unrevealing', 'out-of-step', 'sensing', 'transferring', 'judging', 'maximum', 'sandwich-type', 'navy', 'elemental', 'Desiring', 'arduous', 'long-known', 'mile-long', 'yanking', 'twenty-eighth', 'Handing', 'shirt-sleeved', 'braving', 'rotary', 'wall-to-wall', 'three-way', 'outrageous', 'occidental', 'printing', 'irresolute', 'crumbly', 'solitary', 'skinless', 'motivating', 'wonder-working', 'thousandth', 'unfaithful', 'part-time', 'fumbling', 'sacral', 'matriarchal', 'Glowering', 'sedate', 'examining', 'healing', '7-passenger', 'nine-chambered', 'trackless', 'assisting', 'optical', 'Rooseveltian', 'Wishing', 'agreed-on', 'sultry', 'sixteenth', 'plunking', 'longstanding', 'globe-girdling', 'Seasonal', 'older', 'horrible', 'egg-hatching', 'formidable', "Sportin'", 'penny-wise', 'hoydenish', 'marshalling', 'uncompromising', 'fuzzed', 'green', 'bony', 'aristocratic', 'peace-loving', 'wrenching', 'Kohnstamm-negative', 'alight', 'toilsome', 'sundry', 'wondering', 'sucking', 'unstressed', 'demythologizing', 'True', 'disruptive', 'secondary', 'back', 'unplumbed', 'hectic', 'drab-haired', 'deteriorating', 'hitless', 'hundred-leaf', 'Failing', 'influential', 'Youngish', 'using', '58th', 'grieving', 'indiscriminate', 'Expecting', 'hemming', 'avoiding', 'geographic', 'economizing', 'off-color', 'tolerant', 'nonchurchgoing', 'unflagging', 'substantive', 'Nodding', 'smart', 'barrel-vaulted', 'windless', 'baptismal', 'rockstrewn', 'exterminating', 'indefinable', 'intimal', 'Decanting', 'detectable', 'waitin', 'crooning', 'yawning', 'maximizing', 'asking', 'combing', 're-thinking', 'perennial', 'unjustified', 'impotent', 'distilling', 'lighter', 'timely', 'promising', 'Emerging', 'occasional', 'cedar-roofed', 'dry-eyed', 'semi-public', 'hundred-and-eighty-degree', 'golden-crusted', 'loose-loaded', 'selecting', 'good', 'tax-free', 'bogus', 'airborne', 'pacifistic', 'bouffant', 'linking', "prayin'", 'contacting', '26-year-old', 'unbidden', 'crass', 'executive', 'figurative', 'bringing', 'orney', 'Cleaning', 'definable', '4-day', 'all-out', 'seasonal', 'dissident', 'fellow', "rockin'", 'societal', 'world-ignoring', 'astounding', 'un-American', 'intermolecular', 'abusive', 'spirited', 'public', 'wus', 'dabbling', 'Lovely', 'slim', 'altering', 'besieging', 'giddy', 'eloquent', 'rock-steady', '12-oz.', 'Catholic', 'unconditional', 'domestic', 'unpopular', 'scolding', 'foot-high', 'blissful', 'adhesive', 'unsympathetic', 'four-fold', 'grading', 'blonde-headed', 'Water-soluble', 'citywide', 'gauche', 'overhand', 'single-handed', 'pre-literate', '29th', 'Such', 'useful', 'state-local', 'Permian', 'Competent', 'inquisitive', 'jumping', 'conditioning', 'birdlike', 'overwhelming', 'full-bodied', 'Contemplating', 'tuxedoed', 'Heading', 'stocky', 'sneaking', 'sour', 'soft-looking', 'dividing', 'usurious', 'bicameral', 'reasserting', 'miniscule', 'naval', 'personifying', 'metamorphic', 'thumping', 'preliminary', 'forgiving', 'tactful', 'switching', 'unmethodical', 'fragmentary', 'drunken', 'excess', 'Anxious', 'crouching', 'Abstract', 'trailing', 'residing', 'unfulfilled', 'singular', 'elder', 'reputable', 'meaning', 'fair-looking', 'fire-fighting', 'glacier-like', 'Final', 'misrepresenting', 'thrust-to-weight', 'wavy-haired', '5000-word', 'non-political', 'chemical', 'swanlike', 'workable', 'wishful', 'snap-in', 'arrowed', 'proselytizing', 'off-farm', 'congestive', 'precipice-walled', 'relinquishing', 'Classic', 'worrisome', 'black-clad', 'remodeling', 'wiser', 'catapulting', 'toppling', 'sterling', 'glowering', 'glandular', 'golden', "islands'", 'heavy', 'black-eyed', 'Shotgun-type', 'archeological', 'long-sleeved', 'disappointing', 'inconspicuous', 'stainless', 'fluorescent', 'Bolshevistic', 'squashed-looking', 'unthinkable', 'Bengali', 'gray-thatched', 'Tracking', 'Chinese', 'capturing', 'water-cooled', 'stark', 'tracing', 'misty', '44-year-old', 'choking', 'uncommon', 'speedy', 'theological', 'two-part', 'surprising', 'genial', 'non-Western', 'alternating', 'non-enzymatic', 'therapeutic', 'sixth', 'supreme', 'kidnapping', 'seventy-fifth', '34-hour', 'framing', 'implicit', 'sad', 'exorbitant', 'nosing', 'cortico-fugal', 'collosal', 'unwarrantable', 'gold-phone', 'Taking', 'canny', 'approachable', 'defective', '23-year-old', 'tribal', 'inciting', 'proud', 'propeller-driven', 'Maintaining', 'terminating', 'listless', '900-student', 'spherical', 'gazing', 'ghostly', 'conferring', 'smaller', 'alerting', 'Tracing', 'tsunami-warning', 'risky', 'facilitating', 'unreeling', 'junior-grade', 'respectable', 'Lilliputian', 'overweight', 'ceaseless', 'Cartesian', 'unservile', 'charting', 'intentioned', "students'", 'boorish', 'eight-inch', 'sloppy', 'getting', 'nasty', 'meek-mannered', 'fee-per-day', '42-inch', 'yachting', 'surrealist', 'pink', 'creating', 'Camping', 'jolly', 'geriatric', 'spectacular', 'tear-soaked', 'productive', 'irreparable', 'pervading', "let's-make-your-house-our-club", 'goal-oriented', 'maniacal', 'unequaled', 'Heretic', "masquers'", 'frosty', 'abandoning', 'Furiouser', 'appointing', 'trifling', 'stiff', 'scratchy', 'filling', '51st', 'grass-fed', 'steering', 'falling', 'dark-brown', 'simple-minded', 'deciding', 'awaiting', 'side-looking', 'Seizing', '30-piece', 'Reactionary', 'menacing', '220-yard', 'prefab', 'anxious', 'thanking', 'goggle-eyed', 'sweat-saturated', 'ready', 'unco-operative', 'artistic', 'third-dimensional', 'uncommitted', 'well-armed', 'dancelike', 'end-use', '4-under-par', 'figural', 'ornery', 'Mexican', 'mono-unsaturated', 'double-valued', 'enticing', 'literal', 'ancillary', 'insistent', 'Nearby', 'exponential', 'sitting', 'political', 'like-minded', 'waving', 'postage-prepaid', 'provincial', 'cause-and-effect', 'pictorial', 'commensurate', 'drawn-back', 'pre-employment', "gallivantin'", 'custom', 'unprofessional', 'Suitable', 'Messing', 'gunning', 'frightful', 'alma', 'economy', 'doubting', 'grasping', 'paraphrasing', 'two-record', 'foul', 'papal', 'dispensing', '139-foot', 'neutralist', 'budget-wise', 'repairing', 'readapting', 'unharmonious', 'trigger-happy', 'unseasonable', 'distinct', 'arousing', 'left', 'alcoholic', 'bottom', 'dishonouring', 'rural', 'unmarked', 'chilly', 'Scrupulous', 'unfinished', 'chargeable', 'problematical', 'dense', 'Drinking', 'fostering', 'interstellar', 'Theodosian', 'hackneyed', 'antiphonal', 'bifocal', 'quaking', 'bare-footed', 'recalling', 'securing', 'fanatical', 'cruel', 'psychological-intellectual', 'cholesterol-rich', 'Germano-Slavic', 'afraid', 'corrosive', 'circular', 'uncanny', 'Roman', 'hebephrenic', 'consecutive', 'emitting', 'Frail', 'shit-sick', 'Moving', 'enormous', 'three-inch', 'external', 'ten-by-ten-mile', 'semantic', 'non-institutionalized', 'bellowing', 'monkish', 'renouncing', 'half-dressed', 'anti-Christian', 'undergraduate', 'diurnal', 'Sprouting', 'Hypothesizing', 'waterproof', 'half-reluctant', 'eatable', 'waffle-pattern', 'apologetic', 'spotless', 'fair', 'drawn-out', 'flapping', 'performing', 'nettlesome', 'wobbling', 'deductable', 'jetting', 'negligible', 'loosening', 'Later', '72nd', 'talking', 'municipal', 'meandering', 'informational', 'fifty-third', 'stubby', 'forward', 'additional', 'mystic', 'frequency-independent', 'picking', 'warm', 'Fair', 'venereal', 'accumulating', 'Easy', 'folding', 'apartment-building', 'pound-foolish', 'Resolving', 'launching', 'Fairing', 'Twentieth-Century', 'depriving', 'Complementing', 'incoming', 'slatted', 'watchful', 'yellerish', 'excluding', 'adult', 'shady', 'unavoidable', 'under', 'resettling', 'Nonmagical', "Thursday's", 'vine-crisscrossed', 'jurisdictional', 'Feeling', 'unproved', 'Ridiculous', 'curious', 'sunshiny', 'Germanic', '12th', '3rd', 'attentive', 'Afraid', '208-pound', 'maintaining', '60-month', 'nonobservant', 'slovenly', 'impoverished', 'Sincere', 'despondent', 'super-charged', 'recuperating', 'regular-featured', 'slaughtering', 'open-handed', 'U.N.-chartered', 'Linguistic', 'migratory', 'pharmacological', 'grassroots-fueled', 'polycrystalline', 'front', 'glittering', 'conservatively-cravated', 'subliterary', 'unlined', 'anti-liquor', 'overblown', 'moon-splashed', 'radial', 'Moderate', 'stodgy', 'two-digit', 'newer', 'Campaigning', 'unsightly', 'Happy', 'icy', 'unreliable', 'understanding', 'practising', 'nighttime', 'non-Communist', 'trans-Atlantic', 'dauntless', 'unasterisked', 'dreamlike', 'sighing', 'long-lived', 'paradigmatic', 'magnetic', 'Swinging', 'aesthetic', 'OK', 'pleasant', 'windowless', 'year-end', 'reprehensible', 'well-wedged', 'reflecting', 'disproportionate', 'trucking', 'intimate', 'doctrinaire', 'biracial', 'Attic', 'tearing', 'boring', 'so-called', 'researching', 'brewing', 'double-breasted', 'foamy', 'prouder', '15-degree', 'mastering', 'useable', 'inaccurate', 'Sheer', 'thrifty', 'Negroid', 'architectural', 'refractive', 'forty-fifth', "today's", 'by-gone', 'hyperemic', 'Better', 'amateur', "singers'", 'scenic', 'hoping', 'revelling', 'undercover', 'unimaginable', 'immoral', 'yearly', 'hurling', 'hotter', "supervisors'", 'Three-day', 'war-ridden', 'discreet', 'monopolistic', 'vascular', 'immoderate', 'differentiating', 'zigzagging', 'physiologic', 'unstuck', 'gearing', 'longed-for', 'divan-like', 'backwoods', 'strategic', 'self-judging', 'overcurious', 'sublime', 'rummaging', 'hunched-up', 'pathetic', 'yellow-green', 'Indian', '24-hour', 'incriminating', 'unthinking', 'shuffling', 'lay', 'monogamous', 'pluralistic', 'Harnessing', 'owing', 'strange', 'hooting', 'Mellow', 'Charitable', 'mindless', 'nascent', 'Fat', 'distracting', 'aromatic', 'obtainable', 'mere', 'offending', 'inglorious', 'two-dimensional', 'crystallographic', 'passive', 'exact-size', 'non-negative', 'predictable', 'Faint', 'chapel-like', 'Zodiacal', 'validating', 'bombproof', 'according', 'hiring', 'Greek-born', 'destroying', 'comico-romantico', 'beady', 'partaking', 'Helping', '50-year', 'auspicious', 'pointless', '90-day', 'experimenting', 'contrasting', '62-year-old', 'actual', 'brass-bound', 'unopened', 'churchly', 'now-famous', 'ski-joring', 'easing', 'rhythmical', 'immaculate', 'extensive', 'coherent', 'wanting', 'nocturnal', 'Homemade', 'nerveless', 'college-educated', 'expressible', 'allocable', 'remorseful', 'movable', 'uninvolved', 'retaliating', 'Annual', 'existent', 'mute', 'incoherent', 'pressure-formed', 'unremitting', 'perilous', 'aggressive', 'prostrate', 'rigging', 'Sad', 'covering', 'quick', 'twenty-page', 'astral', 'pivotal', 'antiquated', 'well-rounded', 'wiping', 'venerable', 'masculine', 'high-topped', 'loathsome', 'dextrous', 'man-made', 'gravitational', 'spice-laden', 'polite', 'to-the-death', 'sharpening', 'researchable', 'pre-legislative', 'helluva', 'potting', 'laying', 'tumbling', 'sun-warmed', 'disquieting', 'bottling', 'fast', 'announcing', 'oncoming', 'replying', 'identical', 'prototypical', '4-year-old', 'arriving', 'fairing', 'bass', 'Moslem', 'rapidly-diminishing', 'fitting', 'anarchic', 'over-large', 'reigning', 'drunk', 'co-operating', 'Peruvian', 'nectareous', 'parklike', 'brooding', 'propping', 'bare-armed', 'measuring', 'unpadded', 'halfhearted', 'hit-and-miss', 'Owing', 'Smaller', 'numenous', 'Common', 'smoothing', 'winding', 'experienced', 'faster', 'black-crowned', 'brighter', 'five-gallon', '7-day', 'intolerable', 'hable', 'discerning', 'cu.', 'half-murmured', 'tentative', 'inalienable', 'closed-door', 'military-medical', 'glutinous', 'bluffing', 'preserving', 'double', 'ham-like', 'Swiss-born', 'big-chested', 'technical', 'English', 'emotional', 'ironical', 'malicious', 'Perennian', 'half-blood', 'presumptuous', 'deceased', 'coaxing', 'undisguised', 'arbitrary', 'unlicensed', 'irrelevant', 'inseparable', 'merchandising', 'compatible', 'Europeanish', 'peerless', 'undedicated', 'nociceptive', 'festive', 'enclosing', 'Gram-negative', 'resonable', 'snarling', '-ing', 'cooked-over', 'numbering', 'feathery', 'spectator-type', 'well-bound', 'spotting', 'embracing', 'asleep', 'low', 'sightseeing', 'light-flared', 'expectant', 'winsome', 'inter-town', 'chest-back-shoulder', 'blond', 'commonplace', 'rationalistic', 'thick-skulled', 'overage', 'surface', 'Communist-led', 'compulsory', 'sacrificing', 'assaying', 'Undismayed', 'all-inclusive', 'boisterous', 'Adequate', 'statewide', 'unwarranted', 'Presbyterian', 'lone', 'autocratic', 'fluctuating', 'unimposing', 'nonsensical', 'expensive', 'state-supported', 'self-sacrificing', 'scarecrowish', 'censorial', 'adrenal', 'philosophic', 'calorimetric', 'sardonic', 'steel-edged', 'pinging', 'intervening', 'leveling', 'sorting', 'self-appointed', 'triangular', 'pyramidal', 'idling', 'non-scientific', 'pre-Punic', '4-inch', 'impossible', 'promoting', 'enthusiastic', 'Admitting', 'teeming', 'Cascading', 'mono-', '5-run', 'conducive', 'gallant', 'presentable', 'plowing', 'incertain', 'empty', 'younger', 'cheaper', 'contending', 'Democratic-sponsored', 'Anglo-American', 'civilizational', '11th', 'propitious', 'deep-sounding', 'eidetic', 'three-axis', 'off-level', 'dreaming', 'straw-colored', 'brisker', 'bleating', 'brown-black', 'warm-toned', 'straight-haired', 'informative', 'intraepithelial', 'Jacksonian', 'glaring', 'kneeling', 'primping', 'graphical', 'mustachioed', 'Beloved', 'transverse', 'overcerebral', 'company-wide', 'glutamic', 'remarking', 'skeptical', 'gala', 'quick-drying', 'querulous', '4-passenger', 'anemic', 'utter', 'creditable', 'earth-bound', 'hard-come-by', 'spectrophotometric', 'travelogue-like', 'pearly', 'enjoyable', 'bombing', 'correlating', 'beaching', 'unmeritorious', 'nameless', 'eastern', 'farming', 'hilar', 'narrow-minded', 'Shylockian', 'Skipping', 'Military', 'poisonous', 'horselike', 'collegiate', 'dyspeptic', 'full-clad', 'piecemeal', 'super-empirical', 'collecting', 'upright', 'repugnant', 'interfaith', 'reading', 'subsequent', 'broad-nibbed', 'close', 'evaluating', 'innocent', 'more-than-ordinary', 'stunning', 'Rodding', 'jutting', 'Retracing', 'pre-Civil', 'arty', 'criss-cross', 'thyrotrophic', 'jewel-bright', '49th', 'preemployment', 'semi-ambiguous', 'tangy', 'selective', "janitors'", "overtakin'", 'timing', 'cutting', 'discouraging', 'filtering', 'succinct', 'parallel', 'Dropping', 'physical', 'non-figurative', 'winging', 'Operating', '16-mesh', 'gleaming', 'whining', 'unsuited', 'consular', 'lower-paid', 'reversing', 'Stern-faced', 'well-stuffed', 'absolute', 'cheering', 'cranky', 'treading', 'disrupting', 'ever-existent', 'professing', 'collapsing', 'unavailable', 'shrinking', 'hurt', 'black-bearded', 'wider', 'dust-swirling', 'stealing', 'unimpressive', 'necromantic', 'tensionless', 'non-productive', 'column-shaped', 'three-body', 'Inorganic', 'mathematical', 'no-trading', 'adverse', 'approximate', 'contracting', 'noble', 'lunar', 'circulatory', 'insipid', 'hairless', 'noticeable', 'quasi-folk', 'Dramatic', 'tingling', 'woolly-minded', 'monaural', 'rock-ribbed', 'optional', 'ungainly', 'seven-hit', 'stylish', 'masquerading', 'transpiring', 'mid-Victorian', 'bimonthly', 'luxuriosly-upholstered', 'helping', 'beating', 'Congressional', 'sleepy', '4-cell', 'Muffling', 'excusable', "worryin'", 'vain', 'heedless', 'marked', 'unrehearsed', 'instructing', '85-piece', 'alligatored', 'fearless', 'low-sudsing', 'scheming', 'photographic', 'lousy', 'woolly', 'rehearsing', 'adapting', 'drizzling', 'mechanistic', 'halting', 'high-ceilinged', 'persuading', 'apparent', 'student-directed', 'Sonic', 'Bogartian', '100-yard', 'preventing', 'anti-party', 'uninjectable', 'divulging', 'cognizant', 'metering', 'Teaching', 'indelible', 'Smarter', 'baneful', 'edging', 'unconditioned', 'loyal', 'last-named', 'busy', 'internationalist', 'biting', 'paling', 'anti-Nazi', 'accomplishing', 'astronomical', 'walk-to', 'dull-gray', 'camping-out', 'phobic-like', 'unyielding', 'Andean', 'Movable', 'emphatic', 'Outboard', 'brutal', '187-mile', 'Bedridden', 'Booby', 'pawing', 'threshing', '10-foot', 'long-', 'gray-looking', 'chopping', 'intellectual-literary', 'exempt', 'impracticable', 'reappearing', 'two-line', 'slower', 'dusty-slippered', 'authoritative', 'burgeoning', 'melancholy', 'conscientious', 'bumpin', 'troublesome', 'moving', 'flinching', 'kingdom-wide', 'irreverent', 'heaving', 'impaling', 'open-minded', 'involutorial', 'depicting', 'predominant', '8-inch', 'expressing', 'supernormal', 'port', 'cavin', 'uneconomical', 'nearsighted', 'governmental', 'multi-', 'well-established', 'serious', 'Twenty-one-year-old', 'above-noted', 'untreated', 'recounting', 'pressing', 'half-million', 'sapping', 'unfavorable', 'interim', 'terrestial', 'militant', 'spraying', 're-enacting', 'beautifying', 'trace', 'adequate', 'hairy', 'invariant', 'iron-poor', 'severe', 'Quiet', 'astringent', 'frothing', 'just', 'drive-in', 'limiting', 'ideational', 'splendid', 'thrusting', 'congratulatory', 'fabulous', 'unasked', "tourists'", 'egocentric', 'sordid', 'svelte', 'budget-making', 'wine', 'chortling', 'synergistic', 'aerial', 'curdling', 'Doric', 'making', 'propagandistic', 'unfounded', 'unmurmuring', 'careful', 'Ceramic', 'juvenile', 'abdominal', 'perky', 'unsafe', 'vulture-like', 'valuable', 'stumping', 'narcotic', 'delightful', 'cryptographic', 'interviewing', 'management-trained', 'faultless', "workers'", 'crowing', 'hard-surface', 'four-year', 'spleen-crushing', 'scoped', 'galloping', 'Plunking', 'official', 'murdering', 'transcending', 'Accidental', 'ironic', 'airy', 'crabbed', 'unallocable', 'practicing', 'jobless', 'ultramarine', 'Pausing', 'antiseptic', 'ocular', 'well-understood', 'Biological', 'chuffing', 'permissive', 'old-time', 'breath-taking', 'Naive', 'refuse-littered', 'medicinal', 'inconclusive', 'metallic', 'indescribable', 'sub-human', 'dire', 'differing', 'encroaching', 'rigid', 'tenacious', 'coppery', 'fretting', 'unconnected', 'anti-Castro', 'effective', 'Gazing', 'static', 'knee-length', 'brittle', 'meteorological', 'utilizing', 'Needless', 'capitalist', 'skiing', 'superimposing', 'Modern', 'overstepping', 'watery', 'reproductive', 'demanding', 'mosquito-plagued', 'ignoring', 'overriding', 'rightful', 'oversoft', 'Third', 'unforeseen', 'treating', 'protruding', 'amounting', 'recording', 'taboo', 'mercurial', 'lifeless', 'sociological', 'Circular', 'Byzantine', 'treacherous', 'sub-freezing', 'Dangling', 'show-offy', 'undoing', 'buckling', 'enrolling', "players'", 'primal', 'deft', 'circulating', 'timeless', 'intrinsic', 'oblivious', 'single-minded', 'seventy-foot', 'spying', 'Kissing', "Countin'", 'buccolic', 'counseling', 'stiff-backed', 'satirical', 'going', 'undetectable', 'slothful', 'atune', '689-page', 'visiting', 'semi-precious', 'moon-drenched', 'marketable', 'overpowering', 'well-worn', 'consorting', 'eight-and-a-half-foot', 'Great', 'blazing', 'decorating', 'profane', 'agile', 'near', 'untold', 'digestive', 'belching', '60-day', 'Thursday-night', 'spooky', 'profit-sharing', 'pre-assault', 'elfin', 'functional', 'Tall', 'freer', 'tawny', 'dropping', 'unadulterated', 'secret', 'amorphous', 'defunct', "chargin'", 'chromatographic', 'proteolytic', '3-hp.', 'refining', 'Unstained', 'heading', 'fencing', 'harsh', 'informal', 'preposterous', 'snobbish', 'starchy', 'jaunty', 'sacrificial', 'ritual', 'postgraduate', 'whispering', 'choosy', 'thinking', "dollars'", 'newly-scrubbed', 'unwomanly', 'anonymous', 'weary', 'Turning', 'near-blind', 'Prettier', 'unsaturated', 'semiempirical', 'throaty', 'continuing', 'decorous', 'deceitful', 'Popping', 'vast', 'genteel', 'inferential', 'corpuscular', 'fast-grossing', "children's", 'nominal', 'oblong', 'erratic', 'masterminding', 'textile', 'three-story', 'Climbing', 'wide-awake', 'free-for-all', 'disintegrating', 'bounding', 'sonic', 'enameling', "members'", 'senatorial', 'Strange', 'rooming', 'reviewing', 'expecting', 'semi-private', 'determining', 'Antisubmarine', 'ten-day', 'scouring', 'picketing', 'fourteen-year-old', 'designing', '3-inch', 'flooding', 'Laotian', 'creativity-oriented', 'wearisome', 'golfing', 'painting', 'Petite', 'interfacial', 'gargantuan', 'historical', 'hyped-up', 'purposive', 'well-defined', 'incorrect', 'quasi-governmental', 'loading', '12-inch', 'blot-like', 'Hebraic', 'epistolatory', 'original', 'teething', 'criminal', 'nicotine-choked', 'witty', 'perfect', 'mediating', 'lounging', 'Hiding', 'multi-state', 'undercut', 'contributing', 'Burly', 'harsher', 'record-high', 'parking', 'meaty', 'miniature', 'analyzable', 'unconquerable', 'wheezing', 'puppyish', 'contrary-to-reality', "two-bits'", 'chance', 'fermenting', "Tuesday's", 'autobiographical', 'retraining', 'twenty-dollar', "engineers'", 'urging', 'undigested', 'puffy', 'Resisting', 'evasive', 'three-bedroom', 'rock-carved', 'lining', 'remaining', 'slowing', 'hurtling', 'moon-round', 'flower-scented', 'teleological', 'heartless', 'genuine', "newspapers'", 'irritating', 'banal', 'initial', 'furbishing', 'chipping', 'multidimensional', 'impressive', 'horse-playing', 'literate', 'exquisite', 'wintry', 'convenient-type', 'eighteenth-century', 'unripe', 'Oriental', 'stabilizing-conserving', 'mule-drawn', "carpenters'", 'fabled', 'regulatory', 'portly', 'new-rich', 'whaling', 'A-1', 'creepy', 'denominational', 'Conservative', 'self-pitying', 'organizing', 'aloof', 'intricate', 'certifying', 'flowering', 'agrarian', 'extinct', 'rhythmic', 'doweling', 'preventive', 'arclike', 'trapping', 'branching', 'powdery', 'nondescript', 'once-dry', 'inadvisable', 'narrative', 'hard-bitten', 'unhurt', 'inveterate', 'Montenegrin', 'heathenish', 'courteous', 'internal', 'tossing', 'disabling', 'socioeconomic', 'clammy', 'prudential', 'fair-sized', 'undue', 'tacking', 'patronizing', 'tighter', 'sweaty', 'human', 'rabid', 'missile-type', 'habitual', 'formulaic', 'distinctive', 'gossiping', 'puritanical', 'comprising', 'durable', 'clattery', 'rediscovering', 'quiescent', 'nicer', 'obsolescent', 'peeping', 'reverse', 'metal-tasting', 'sloping', 'raiding', "networks'", 'clandestine', 'idiotic', 'Taoist', 'blood-bought', 'Franciscan', 'telescoping', 'inter-tribal', 'two-inch', 'beautifully-built', 'wrong', 'self-perceived', 'reimburseable', 'vicarious', 'electric', 'jocose', 'Vague', 'uni-directional', 'friction-free', 'extra-sensory', 'uncertified', 'insurgent', 'prominent', 'heavily-upholstered', 'Utopian', 'Synthetic', 'waist-length', 'glamorous', 'exposing', 'anti-French', 'complete', 'Sharp', 'cultivating', 'royal', 'psychopathic', 'Defining', 'posterior', 'over-simple', 'victorious', 'clever', 'Sweating', 'many-bodied', 'rocky', 'dusty-green', 'Petrarchan', 'psychically-blind', 'myopic', 'cladding', 'impolitic', 'Persianesque', 'center', 'sobering', 'grouping', 'tortuous', 'groveling', 'electrifying', 'Quietist', 'irresolvable', 'spiritual', 'Shakespearian', 'unsupportable', 'Oversized', 'chanting', 'wide-cut', 'five-cent', 'sexual', 'Einsteinian', 'Fuming', 'present-day', 'jocund', 'Middle-South', 'Napoleonic', 'Huge', 'Commandeering', 'inconsequential', 'procedural', 'meterological', 'dingy', 'oversized', 'flowing', 'pectoral-front', 'unpredictable', 'dried-out', 'dulcet', 'raw', 'chalky', 'all-white', 'unborn', 'symmetric', 'unearned', 'endurable', 'awful', 'Laodicean', 'chauffeur-driven', 'stationary', 'betting', 'cavorting', 'pegged-down', 'ancient', '75-minute', 'ideological', 'rooting', "Wednesday's", 'glancing', 'thin-lipped', 'sarcolemmal', 'finite', 'wide-eyed', 'flaky', 'citrated', 'compassionate', 'multicolored', 'kinder', 'fewer', 'homozygous', 'worn-out', 'uncooperative', 'parametric', 'corralling', 'satin-covered', 'Encouraging', 'affronting', 'tensional', 'hypodermic', 'lewd', 'falsifying', 'inspirational', 'plaintive', 'purpling', 'shiftless', 'trenchant', 'clannish', 'non-military', 'pursuing', 'incubating', 'removable', 'Infectious', 'proper', 'deadly', 'close-in', 'intent', 'reminiscent', 'thicker', 'Regulative', 'Airy', 'organic', 'Issuing', 'Complying', 'Shouldering', 'motioning', 'inhumane', 'light-weight', 'materials-handling', 'posthumous', 'pricing', 'Meaningful', 'recurring', 'cropping', 'Famed', 'ceremonial', 'hideous', 'fiscal', 'smashing', '10-hour', 'quarrelsome', 'heartfelt', 'unplowed', 'unwrinkled', 'real', 'sky-tapping', 'unpleasant', 'unassisted', 'shimmering', 'jockeying', 'English-Dutch', 'Retiring', 'anterior', 'intentional', 'jagged', 'joking', "holdin'", 'untidy', 'Airless', 'devilish', 'mouth-watering', 'nodular', 'orthorhombic', 'omniscient', 'individualizing', 'Lower', 'vaginal', 'illustrating', 'seismic', 'swift', 'biblical', 'wifely', 'hard', 'stray', 'nonfunctional', 'plain', 'merry', 'shortsighted', 'harder', 'vaster', 'fearing', 'unstained', 'explicable', 'authentic', 'bookish', 'wornout', 'all-important', 'Assuming', 'migrant', 'diagonalizable', 'anaerobic', 'fingering', 'noteworthy', 'five-month', 'diseased', 'selfless', 'red-turbaned', 'quarreling', "teammates'", 'feudalistic', 'yapping', 'deductible', 'untenable', 'convivial', 'pre-selling', 'undereducated', 'Austrian', 'rheumatic', 'spectral', 'distant', 'Providing', 'Inflammatory', 'spurious', 'Viewing', 'fancy', 'metropolitian', 'threes-fulfilled', 'basophilic', 'all-weather', 'Methodist', 'recovery', 'exploiting', 'contiguous', 'bearded', 'unvarying', 'underlying', 'overprotective', 'declining', 'base', 'salubrious', 'Diving', 'digesting', 'un-English', 'motive', 'non-artistic', 'scoreless', 'primitive', 'one-shot', 'contenting', 'duplicable', 'axiological', 'skidding', 'containing', 'portable', 'restful', 'shabby', 'unresponsive', 'noncommissioned', 'quaint', 'Electron-microscopical', 'slick', 'wounding', 'Guttman-type', 'rail-mobile', 'comminge', 'consulting', 'proficient', 'realer', '50-foot', 'grievous', 'beautifully-tapered', 'cunning', 'Speaking', 'rank', 'lovely', 'mumbling', 'producing', 'Intelligent', 'acid-fast', 'court-appointed', 'four-syllable', 'Mediumistic', 'cubic', 'two-valued', 'freakish', 'vexatious', 'directing', 'erudite', 'tender', 'glass-like', 'lidless', 'rhyming', 'appraising', '18-month', 'clapping', 'grammatical', 'drawing', '63d', 'freehand', 'chockfull', 'paleo-', 'nonacid', 'textual', 'sockdologizing', 'Splendid', 'messy', 'Incumbent', 'scarce', 'equating', 'socal', 'Fitting', 'Matching', 'cowering', 'redundant', 'stale', 'fighting', 'incumbent', "planters'", 'undefined', 'disgraceful', 'unusual', 'Differential', "cowbirds'", 'crocketed', 'careworn', 'sagging', 'quadrennial', 'staining', 'lettering', 'raftered', "laymen's", 'complacent', 'mitral', 'balling', 'target-hunting', 'Mobile', 'interplanetary', 'compensating', "builders'", 'coltish', 'seeing', 'deaf', 'scrawny', 'royalty-free', 'footing', 'booby', 'hard-to-get', 'Thermoforming', 'dim', 'asymptotic', 'linguistic', 'all-college', 'pig-infested', 'matrimonial', 'lilting', 'northeast', 'Albanian', 'geysering', 'summing', 'facaded', 'thin', "secretaries'", 'describing', 'grotesque', 'engineering', 'consequential', 'success-oriented', 'microscopical', 'pestilent', 'acrid', 'tenuous', 'above-ground', 'frontal', 'unambiguous', 'cornering', 'lofty', 'observant', 'evermounting', 'handsomer', 'Satisfactory', 'purging', 'doubling', 'damp', 'biologic', 'disproving', 'characterizing', 'rough', 'interlayer', 'all-something-or-the-other', "swimmers'", 'redecorating', 'grander', 'Hoped-for', 'outsized', 'municipally-sponsored', 'household-type', 'nonwhite', 'morphophonemic', 'totalitarian', 'girlish', 'coming', 'government-supported', 'elusive', 'Schnabelian', 'year-to-year', 'fast-opening', 'psychosomatic', "workin'", 'ruthless', 'barefoot', 'ungracious', 'well-organized', 'dismissing', 'bomb-proof', 'enzymatic', 'perfunctory', 'dressy', 'smiling', 'unworthy', 'yelling', 'design-conscious', 'charming', 'cross-cultural', 'eight-bar', 'coral-colored', 'Spectacular', 'moonlit', 'badgering', 'vesicular', 'forthright', 'attributing', 'breezy', 'light-colored', 'meritorious', 'aforementioned', 'triumphant', 'warm-blooded', 'deeming', 'Romantic', 'Professional', 'poring', 'dismounting', 'separate', 'surrounding', 'welcome', 'perceptible', 'stirling', 'nebular', 'chronic', 'fateful', 'odds-on', 'sounder', 'dampening', 'straggling', 'rocking', 'misunderstanding', 'darkling', 'city-wide', 'extravagant', 'wave-setting', 'sun-baked', 'non-objective', 'adulterous', 'class-biased', 'featherbedding', 'numb', 'French-polished', 'gummy', 'unleveled', 'Open', 'unwaivering', 'helpful', 'non-exempt', 'industry-wide', 'intriguing', 'understandable', 'mis-reading', 'blotting', 'prettier', 'hammerless', 'Devout', 'inappropriate', 'tensile', 'gullible', 'First', "throwin'", 'steeper', 'dueling', 'symbolizing', 'anxiety-released', 'solution-type', 'coinciding', '64-page', 'unadorned', 'sensory', 'Moravian', 'unreal', 'nasal', 'conducting', 'broken-backed', 'shouting', 'cooking', 'inside', 'suhthuhn', 'sounding', 'jade-handled', 'shifty', 'invoking', 'Soothing', 'waiting', 'comfortable', 'Strenuous', 'drought-seared', 'plentiful', 'emphysematous', 'solvating', 'ten-gallon', 'auditing', 'eschewing', 'drinking', 'autobiographic', 'giggling', 'non-pathogenic', 'eighty-sixth', 'comparing', 'monic', 'Internal', 'ruling', 'Early', 'corroding', 'mental', 'Fantastic', 'photon-counting', 'phenomenal', 'advertising', 'thankful', 'Gambling', "employers'", 'end-to-end', 'dumb', 'comely', 'high-powered', 'sanguineous', 'shatterproof', 'airless', 'Eating', 'way-out', 'vacuum-formed', 'swearing', 'screening', 'waterskiing', 'career-bound', 'Reducing', 'itinerant', 'kissing', 'treelike', 'turbulent', 'prying', 'green-tinted', 'hand-me-down', "wrappin'", 'Indefinite', 'all-county', 'tear-filled', 'sparse', 'earning', 'ash-blonde', 'multi-million-dollar', 'banking', 'retaining', 'cozier', "buyers'", 'disturbing', 'immortal', "neighbors'", 'direct', 'Facilitatory', 'admiring', 'liquor-crazed', 'browny-haired', 'colder', 'Psychical', 'expedient', 'effecting', 'basketball-playing', 'intergovernmental', 'lucky', 'storied', 'ridiculing', 'jollying', 'scriptural', 'diplomatic', 'dangling', 'picayune', 'acoustic', 'one-week-old', 'firm', 'inexperienced', 'civil', 'Extensive', 'raffish', 'superhuman', 'terming', 'two-color', 'Marvelous', 'fallacious', 'mother-naked', 'warbling', 'regarding', 'capitalistic', 'Physicochemical', 'money-hungry', 'godless', 'walking', 'polka-dotted', 'untrained', 'numinous', 'instantaneous', 'swivel', 'fashionable', 'English-Scottish-French', 'frank', 'touching', 'skimpy', 'crowding', 'sobbing', 'dubious', 'V-shaped', 'commencing', 'supplemental', 'pre-packed', 'cream', 'mindful', 'limp-looking', 'pharmaceutical', "machinists'", 'Apollonian', 'top-ranking', "horns'", 'gowned', 'ribald', 'deep-seated', 'cardiac', 'pro-Trujillo', 'Packing', 'curly', 'wretched', 'handless', 'preening', 'disbelieving', 'letting', 'far-sighted', 'clean', 'theoretical', 'hesitating', 'greeting', 'orbiting', 'meticulous', 'contributory', 'flicking', 'memorizing', 'chaotic', 'five-hundred-year-old', 'beige', 'unmotivated', 'pains-taking', 'foggy', 'Proceeding', 'bittersweet', "Seizin'", 'expendable', 'ten-month', 'homesick', 'unclean', 'unafraid', "dustin'", 'closed-circuit', 'road-shy', 'barging', 'silly', 'pre-Han', 'piteous', 'nonprofit', 'shrub-covered', 'geological', 'whirring', 'ruinous', 'specious', 'unreflective', 'Selective', 'allergic', 'sinewy', "parents'", 'scarcely-tapped', 'unrelieved', 'Mythological', 'So-called', 'non-absorbent', 'Shipping', 'particular', 'bobbing', 'low-boiling', 'hissing', 'two-run', 'eclipsing', 'blood-flecked', 'infidel', 'groundless', 'innate', 'delicate', 'well-kept', 'acidulous', 'rock-strewn', 'categorizing', 'revolutionary', 'darkening', 'rudimentary', 'besetting', 'Driving', 'straightening', 'crude', 'integrating', 'social-economic', 'terra-cotta-colored', 'ultravehement', 'admissible', 'apt', 'richer', 'cumulative', 'enveloping', 'chromic', 'abiding', 'seven-inch', 'streaming', 'remarrying', 'Leaving', 'taffycolored', 'important-looking', 'unfailing', 'morbid', 'unbreakable', 'fine-boned', 'completely-restored', 'tripping', 'financial', 'drifting', 'non', 'Hearing', '3', 'wide', 'seductive', "pounds'", 'oriental', 'crossroading', 'spicy', 'ordering', 'buzzing', 'Exceptional', "teachers'", 'palatable', 'ever-tightening', 'garrulous', 'bit-like', 'parasitic', 'algebraic', 'resident', 'bilinear', 'pegging', 'supplementary', 'still', 'pseudo-symmetric', 'over-arranged', 'volunteering', 'brute', 'Hegelian', 'conservative-liberal', 'drawling', 'lamming', 'half-swamped', 'eugenic', 'recipient', 'springing', 'hiding', 'Overwhelming', 'invariable', 'disobeying', 'inhibiting', 'velvety', 'constricting', 'redistricting', 'damning', 'farfetched', 'Meaning', 'sulking', 'dewy-eyed', 'applause-happy', 'guarding', 'minimum', 'pimplike', 'forensic', 'dissipating', 'dodging', 'stormbound', 'ostensible', 'outright', 'lightweight', 'talismanic', 'Blowing', 'departmental', 'inhomogeneous', 'heating', "'48", 'flanking', 'synthetic', 'grimmer', 'involving', 'incontrovertible', 'retrenching', 'congressional', 'own', 'perishing', 'undersize', 'lolling', 'surviving', '12-1/2-inch', 'such', 'interchangeable', 'anhydrous', 'Bizarre', 'Communist-type', 'super-secret', 'obsessive', 'Intense', 'nonsegregated', 'rating', 'scattering', 'desiring', 'vaulting', "manufacturers'", 'evoking', 'Fiscal', 'northerly', 'estranging', 'harmonious', 'faint', 'born', 'flaxen', 'swift-striding', 'prize-winning', 'damaging', 'somnolent', 'restless', '85-student', 'stimulating', 'elementary', 'Blind', 'Infamous', 'purple-black', 'withholding', 'imaginative', 'thyrotoxic', 'fat-soluble', 'non-repetitious', 'specifying', 'biconcave', 'photographing', 'closing', 'wide-sweeping', 'Microscopic', 'soaring', 'befitting', 'mythological', 'Unconscionable', 'loose-knit', 'compromising', 'swell', 'ultra-violet', 'relieving', 'disagreeable', 'adopting', 'Benedictine', 'counting', 'bracing', 'cylindrical', 'infiltrating', 'pristine', 'phrasing', 'shrilling', 'alphabetical', 'battling', 'blunt', 'usual', '5-day', 'dazzling', 'Turbulent', 'low-pitched', 'unquenched', 'one-inch', 'lecturing', 'conceding', 'vowing', 'hijacking', 'Heavy', 'aiding', 'chafing', 'stressful', 'unspecified', 'Artistic', 'sweet-faced', 'giant', 'red-rimmed', 'phosphorus-bridged', 'arithmetical', 'bearish', 'crying', 'unenthusiastic', 'continental', 'unshakeable', 'razing', 'previous', 'unwholesome', 'God-curst', 'palm-lined', 'four-lane', 'Sore', 'unmoved', 'renewable', 'bright-looking', 'lingering', 'mutational', 'manmade', 'angling', 'Additional', 'Getting', 'fascinating', 'Uniform', 'silver', 'composite', 'terrible', '25-ft.', 'flour-milling', 'pure', 'racking', '10-year-old', 'forty-year', 'white-suited', 'breaking', 'side', 'rapping', 'long-shanked', 'Babylonian', 'braver', 'Republican-controlled', 'naive', 'teasing', 'meek', 'atomic', 'ubiquitous', 'all-victorious', 'dollar-and-cents', 'attempting', 'Yeller', 'devoting', 'underprivileged', 'deviating', 'wandering', 'extra', 'twisty', 'self-contained', 'red', 'scaring', 'acquiring', 'homogeneous', 'atrophic', 'pokerfaced', 'undying', 'sluggish', 'Rugged', 'sceptical', 'dam', 'counterbalancing', 'briefer', 'symphonic', 'Neapolitan', 'desirous', 'prone', 'Fighting', 'fatty', 'beautiful', 'guitar-strumming', 'infrared', 'trail-worn', 'morose', 'dwindling', 'unabated', 'intergroup', 'gritty-eyed', 'self-correcting', 'capering', 'cerebral', 'strange-sounding', 'Venetian', 'intratissue', 'scrutinizing', 'freeing', 'broken-down', 'fifteen-mile', 'sky-carving', 'gradual', 'eighteenth', 'unhurried', 'Turkish', 'conceivable', 'Initiating', 'overbearing', 'post-Inaugural', 'junior', 'orderly', 'defying', 'loud', 'self-sufficient', 'intranasal', 'lower-cut', 'canceling', 'indolent', 'autumn-touched', 'Long-lived', '1/50th', 'dancing', 'funding', 'livelier', 'publicizing', 'Comprehensive', 'strafing', 'retreating', 'Wild', 'leaded', 'pregnant', '18th', 'arising', 'Supplementing', 'Occasional', 'beatific', 'on-the-scene', 'gooey', 'unenviable', 'dark-skinned', 'clinical', 'draining', 'petty', 'pale', 'Forebearing', 'badly-needed', 'injecting', 'over-all', 'clawing', 'Fierce', 'remoter', 'chinning', 'unforgettable', 'boxed-in', 'unreconstructed', 'Hot', 'Katangan', 'boosting', 'existing', 'objectionable', '42d', 'weaving', 'interpretative', 'Pursuing', 'ceasing', 'unceasing', 'emigrating', 'crossing', 'planting', 'wobbly', 'rapid', "asham'd", 'pornographic', 'volatile', 'priming', 'hit-run', 'pick-up', 'lighthearted', 'baking', 'Shakespearean', 'cloying', 'washing', 'bum', 'Dominant', 'travelling', 'tongue-in-cheek', 'Finding', 'telescopic', 'hooking', 'elderly', 'generous', 'shrubbery-lined', 'Shrewd', 'increasing', 'pre-conscious', 'specializing', 'gouging', 'playable', 'intra-city', 'priceless', 'haggling', 'scant', 'crash', 'Electrostatic', 'bugging', 'Strolling', 'centrifuging', 'sullying', 'hypo-', 'burning', '500-mile', 'expanding', 'laughing', 'calving', 'renowned', 'clucking', 'crawling', 'epigenetic', 'rubicund', 'systematic', 'shrewish', 'fouling', 'appealing', 'prodding', 'county-wide', 'Icelandic-speaking', '37-year-old', 'substitutionary', 'sodden', "referrin'", 'radiation-produced', 'habitable', '24th', 'coning', 'cheap', 'alluding', 'sinless', 'jubilant', 'pretrial', 'chunky', 'graduate', 'deducing', 'lapping', 'unpaintable', 'trigonal', 'unfrosted', 'yellowing', 'full-fledged', 'exploring', 'thirteenth', 'Difficult', 'glassy', 'Earlier', '24-hr.', 'eminent', 'unsung', 'court-length', 'persuasive', 'dependable', 'Ridiculing', 'slighter', 'availing', 'seminal', 'grovelike', 'simplistic', 'wouldbe', 'welding', 'prowling', 'material', 'father-and-son', 'appropriate', 'ministering', '6th', 'arching', 'luscious', 'donating', 'Argive', 'closeup', 'estimating', 'furiouser', 'spewing', 'arguing', 'bronze', 'anti-American', 'glinting', 'carboxy-labeled', 'superlative', 'ducking', 'semi-minor', 'bolting', 'up-to-date', '10th', 'textile-importing', 'Rarer', 'random', 'expert', 'managing', 'dapper', 'tax-exempt', 'slow-bouncing', 'salt-edged', 'whipping', 'rendering', 'sway-backed', 'caring', 'dominant', 'economical', 'voting', 'magnifying', 'insincere', 'sleeping', 'Texan', 'snoring', 'autumnal', 'guiltless', 'either-or', 'scornful', 'catchy', 'savoring', 'orgiastic', 'inactive', 'inexpressible', 'rip-roaring', 'metrical', 'Teutonic', 'initiating', 'foolish', 'traveling', 'rousing', 'unexamined', 'commuting', 'Naked', 'investigating', '19-foot', 'Crooked', 'temporary', "checkin'", '75th', 'marinating', "locatin'", 'mawkish', 'tangent', 'enviable', 'ammoniac', 'Letting', 'textile-producing', 'circumscribing', 'parental', 'satiric', 'veiling', 'Russian', 'undulating', 'sadistic', 'bone-weary', 'centralizing', 'Dallas-headquartered', 'undetermined', 'non-freezing', 'differentiable', 'steady', 'doltish', 'logistic', 'terminal', 'freedom-loving', 'authorizing', 'connecting', 'supplying', 'above', 'pro-tem', 'on-the-job', 'Celtic', 'itching', 'unannounced', 'lyking', 'Saturday-night', 'brave', 'Influential', 'fail-safe', 'overloud', 'bugeyed', 'shadowing', 'conflicting', 'Clapping', 'open-collared', 'self-defeating', 'downcast', 'disinterested', 'laissez-faire', 'bullying', 'wily', 'fertile', 'uncounted', 'nineteenth', 'inertial', 'foul-smelling', 'Continuous', 'Arabic', 'semi-special', 'ungodly', 'supra-personal', '205-pound', 'silvery', 'four-sided', 'Vocational', 'Beautiful', 'flammable', 'committing', 'purling', 'false-fronted', 'well-oriented', 'unparalleled', 'Eager', 'anti-discrimination', 'allotting', 'undeniable', 'leggy', 'tubular', 'longitudinal', 'sandy', 'sadder', 'doting', 'bi-monthly', 'ill-fated', 'Rousseauan', 'Belgian', 'perpetuating', 'pooling', 'unflattering', 'prejudicial', 'outside', 'perfidious', 'picturing', 'upstairs', 'allegoric', 'Folding', 'distasteful', 'migrating', 'blonde', 'transporting', 'unpunished', 'cosy', 'financing', "doctors'", 'downhill', 'friendlier', "talkin'", 'hardworking', 'necking', 'twelve-year-old', 'slacking', 'Assistant', '22-acre', 'peptizing', 'smuggling', 'sweet-tongued', 'parasympathetic', 'Venezuelan', 'reproducible', 'Dismounting', 'unfit', '20-year-old', 'dozing', 'averaging', 'copper', 'non-thermal', 'twentieth', 'spacing', 'up-and-coming', 'wholly-owned', 'echoing', "judges'", 'Christian', 'revolting', 'dimesize', 'Narrow', 'mud-beplastered', 'dull', 'well-planned', 'gloomy', 'roiling', 'amplifying', 'Numerous', 'clattering', 'frantic', 'subtracting', 'unqualified', '27th', 'liveried', 'sampling', 'muddling', "riflemen's", 'clerking', 'restive', 'diagnostic', 'unprotected', 'qualifying', "souls'", 'instructive', 'territorial', 'invincible', 'slow-moving', 'oedipal', 'intact', 'illicit', 'Gaining', 'daily', 'gymnastic', 'self-imposed', 'Future', 'transmittable', 'Ten-year-old', 'iron-clad', 'non-violent', 'gracious', 'complementary', 'aboveground', 'Quoting', 'multipurpose', '40-year-old', 'tense', 'corrupting', 'non-Greek', 'lunatic', 'exothermic', 'Athenian', 'day-to-day', 'egg-sized', 'irrevocable', 'seedless', 'woebegone', 'Firm', 'low-lying', 'spear-throwing', 'baser', "wearin'", 'knightly', 'height-to-diameter', 'swampy', 'condescending', 'real-analytic', 'payable', 'bare', 'four-element', '45-passenger', 'problematic', 'revealing', 'transcendent', 'aimless', 'confluent', '2-week', "boat's", 'diminishing', 'Unpublished', 'Observing', 'speaking', 'unheard', 'safekeeping', 'meteoric', 'cooling', 'sufficient', 'Canadian', 'Moon-faced', 'rasping', 'diffusing', 'criss-crossed', 'blood-filled', 'blaming', 'hilarious', 'speculative', 'relying', 'Side', 'dark-gray', 'Subsequent', 'uncharted', 'gagging', 'covert', 'leather-bound', 'outraged', 'nonspecific', '2-year-old', 'keening', 'surprise', 'incautious', 'irreconcilable', 'ragged', 'outgoing', 'climactic', 'fly-dotted', 'precise', 'futile', 'dispersing', 'tampering', 'regulative', 'Prussian', 'Maltese', 'causing', 'foreknown', 'social-political-economical', 'ending', 'sticky', 'fleshy', 'haggard', 'hasty', 'supplicating', 'grounding', 'limpid', 'complimentary', 'interlibrary', 'uneven', 'wagging', 'conspiratorial', 'burr-headed', 'furtive', 'unseen', 'ethnic', '11-inch', 'non-existent', 'selling', 'shoddy', 'apostolic', 'External', 'double-', 'merciful', 'broody', 'Asiatic', 'break-even', 'similar', 'amazing', 'augmenting', 'fibrocalcific', 'squashy', 'Ironic', 'minute', 'attending', 'long-established', 'London-bred', 'redeeming', 'liquid', 'unsharpened', 'semi-rigid', 'brushlike', 'suable', 'demure', 'pallid', 'intense', 'particularistic', 'repulsive', 'lobster-backed', 'volumetric', 'aerobic', 'out-of-the-way', 'atheistic', 'familar', 'week-long', 'indefinite', 'representing', 'creamy', 'three-front', 'hairier', 'rising', 'cognate', 'weak', 'growth-stunting', "driftin'", 'battery-powered', 'long-settled', 'unreasonable', 'Dallas-based', 'Southwestern', 'answering', 'drunker', 'unneeded', 'sight-seeing', 'heart-stopping', 'innumerable', 'ungallant', 'mysterious', 'repetitive', 'existential', 'expository', 'unglamorous', 'junior-year-abroad', 'thirtieth', 'imposing', 'storming', 'transmitting', 'Gaussian', 'inbreeding', 'absurd', 'unalterable', 'inaugurating', 'bestial', 'carrier-current', 'builder-dealer', 'Home-made', 'Castro-held', 'oleophobic', 'subbing', 'High', 'irrational', 'changeable', 'mobile', 'masonry', 'epigrammatic', 'non-contributory', 'sycophantic', 'entire', "farmers'", 'sporadic', '350th', 'napping', 'crotchety', "oxen's", 'peeling', 'irredeemable', 'stuffing', 'atom-like', 'circumspect', 'Vietnamese', 'ugly', 'interior', 'chic', 'unsettling', 'Congregational-Baptist', 'self-realized', 'cadaverous', 'wary', 'on-again-off-again', 'compact', 'regal', 'largely-silent', 'non-partisan', 'Laurentian', 'Warm', 'ramming', 'discriminating', "trees'", 'magic-practicing', 'implying', 'paramagnetic', 'Olympic', 'packing', 'astute', 'determinative', 'despairing', "cousins'", 'microbial', 'pit-run', 'marbleizing', 'sun-bleached', 'discourteous', 'perplexing', 'mashing', 'Curious', 'northern', 'symbolic-sounding', "critics'", 'loathing', 'self-deceiving', 'semi-nude', 'handier', 'global', 'gusty', 'build-better-for-less', 'humorous', 'unmanaged', 'organizational', 'isotropic', 'nonpartisan', 'Stimulating', 'cosmopolitan', 'supersensitive', 'impassioned', 'foot-loose', 'water-proof', 'Calling', 'unmeshed', 'frilly', 'soil-bearing', 'year-earlier', 'Sure', 'owne', 'Bursting', 'Egyptian', 'near-by', 'Mauve-colored', 'Carving', 'fifty-year', 'Dependent', 'concrete', 'saner', 'subservient', 'backing', 'unplagued', 'woven-root', 'idyllic', 'agonizing', 'fleet', 'mad', 'rectilinear', 'hyperbolic', 'unwounded', 'displaying', 'fearful', 'vouching', 'weakening', 'grayer', "pop'lar", 'unaccustomed', 'Sniffing', 'new-found', 'maternal', 'shallow', 'arabic', 'Brazilian', 'third-', 'allegro', 'pulsating', 'Cool', 'upward', 'punishable', 'saline', 'cagey', 'clairvoyant', "shootin'", 'illusive', "tonight's", 'naughty', 'throwing', 'outstanding', 'wide-open', 'subjective', "tomorrow's", 'cohesive', 'incisive', 'two-step', 'claret', 'mingling', 'technological', 'undecorated', 'Normal', 'native', 'Diametric', 'book-lined', 'homosexual', 'activating', 'Proximate', 'pastel-like', 'inquiring', 'darting', 'unequal', 'well-received', 'Shaking', 'plump', "meanin'", 'third-rate', 'high-', 'beribboned', 'asserting', "crouchin'", 'glottal', 'warmish', 'unmistakable', 'reflectance-measuring', 'extenuating', 'translucent', 'villainous', 'bygone', 'emanating', 'taxiing', 'abhorrent', 'rash', 'constructional', 'record-tying', 'miasmal', 'formulating', 'ikey-kikey', 'unwilling', 'unofficial', 'enchanting', 'lending', 'Hopkinsian', 'soft-', 'self-confident', 'whimpering', 'Farming', 'moonlike', 'extralegal', 'debunking', 'flotation-type', 'pasty', 'Crystallographic', "folks'", 'repayable', 'counterpointing', 'bubbling', 'Blue', 'Rinsing', 'Surrounding', 'diagnosing', 'inverse', 'semicircular', 'first-hand', 'thermometric', 'looting', 'industrious', 'Gorgeous', 'manifest', 'torso-defining', 'non-bearing', 'forgetting', 'money-saving', 'swindling', 'struggling', 'muscular', 'all-purpose', 'favoring', 'hollow', 'New', 'red-necked', 'low-heeled', 'pre-World-War-', 'potent', 'unbearable', 'university-educated', 'hurting', 'energetic', 'voltaic', 'Riding', 'stingy', 'seven-word', 'smoke-filled', 'libertarian', 'pathological', '4-homer', 'grand-looking', 'big-shouldered', 'distributing', 'applauding', 'housing', 'searing', 'delivering', 'photogenic', 'unloading', 'crumbling', 'Rare', 'Cruel', 'anchorite', 'pari-mutuel', 'unpatronizing', 'conformational', 'too-simple-to-be-true', 'undrinkable', 'thermodynamic', 'unshaven', 'fungal', 'stupendous', 'placing', 'blue-uniformed', '35-mm.-wide', 'megakaryocytic', 'wood-grained', 'logistical', 'grokking', 'bothersome', 'wonder', 'predominating', 'half-turned', 'softening', 'incorruptible', 'slash-mouthed', 'crested', 'palpable', 'convincing', 'exhibiting', "officers'", 'ascending', 'affecting', 'gratuitous', 'interpretable', 'lexical', 'lengthy', 'eyeing', 'monstrous', 'Indonesian', 'Tonal', 'pilfering', 'gnashing', 'enthralling', 'two-tail', 'determinate', 'haughty', 'hovering', 'Communistic', 'not-strictly-practical', 'obedient', 'aqueous', 'tidying', 'pre-Easter', 'fire-colored', 'wondrous', 'consummate', 'aging', 'raving', 'underpaid', 'splintery', 'consistent', 'Particular', 'teenage', 'anti-authoritarian', 'occlusive', 'hand-crafted', 'songful', 'searching', '12-shot', 'poetic', 'private', 'anomic', 'calculable', 'jazzy', 'veining', 'forward-moving', 'citybred', 'focal', 'instrument-jammed', 'convulsive', 'striding', 'Dominican', 'solar-electromagnetic-', 'Nonresidential', 'arteriolar-pulmonary', 'obvious', 'Spare', 'conjugating', 'unleashing', 'fervent', 'half-clad', 'three-inch-wide', 'inboard', 'idiosyncratic', 'transoceanic', 'Marine', 'fringed-wrapped', 'Sick', 'plugging', "years'", 'slavish', 'operating', 'Presidential', 'attendant', 'unpaved', 'underwater', 'malign', 'Hard', 'high-sudsing', 'gaited', 'grey', 'prohibiting', 'exceptional', 'communistic', 'anti-organization', 'Clever', 'sailing', 'permissible', 'elliptical', 'anti-secrecy', 'quiet-spoken', 'grey-haired', 'Sailing', 'imminent', 'funnier', 'Negro-appeal', 'recoilless', 'tapping', 'filmy', 'company-paid', 'heartbreaking', 'York-born', 'counterflow', 'moot', 'addressing', 'Infinite', 'polar', 'undepicted', 'sucker-rolling', 'burly', 'typical', 'pre-penicillin', 'bold', 'ingenious', 'finicky', 'maniclike', 'inane', 'cliffhanging', 'indulging', 'visible', 'instructional', '25-minute', 'combinable', 'Calm', 'unenunciated', 'assaulting', 'monophonic', 'drugless', 'heavy-handed', 'sociable', 'self-conceited', 'safe', 'government-to-government', 'Orthodontic', 'ripe', 'Wider', 'pricking', 'modern', 'straight', 'unprepared', 'Occupational', 'Prickly', 'forgetful', 'Swiss', 'evading', 'infant', 'frowning', 'dynastic', 'past', 'corporeal', 'broader', 'inshore', 'eosinophilic', 'contour-obliterating', 'Communist', 'Reviewing', 'Setting', 'credible', 'Nazi-minded', 'dark-green', 'meal-to-meal', 'advocating', 'tightening', 'Diplomatic', 'tame', 'Reversing', 'indecent', 'gnomelike', 'upbeat', 'comic', 'unsophisticated', 'undreamt', 'Dionysian', 'punishing', 'cushioning', 'moody', 'barometric', 'transatlantic', "smash-'em-down", 'above-water', 'fine-grained', 'metal-working', 'unsuspecting', 'navigating', 'leafy', 'insignificant', "smugglers'", 'Cutting', 'mimetic', 'attracting', 'Successful', 'punitive', 'mauve', 'leaping', 'stumbling', 'Merciful', 'mobilizing', 'igneous', 'aghast', 'machinelike', 'divining', 'faithful', 'Rhenish', 'displacing', 'utopian', 'Hamilton-oriented', 'ambulatory', '12-passenger', 'Literal', 'single-valued', 'macropathological', 'poisoning', 'self-deluded', '6-passenger', 'measurable', 'unrecognized', 'rare', 'extraordinary', 'shameful', "Shootin'", 'moderate', 'adherent', 'Carrying', '21-year-old', 'leering', 'rodding', 'thick-walled', 'gingerly', 'Burning', 'underhanded', 'tasteful', 'gifted', 'Fit', 'unappeasable', '6-inch', 'three-power', 'quizzical', "Followin'", 'calmer', 'submitting', 'capricious', 'Raw', 'inspecting', 'grassy', 'eying', 'ordinary', 'patrolling', '46th', 'kidding', 'virtual', 'natural', 'reiterating', 'aft', 'howling', 'melon-like', 'blue-black', 'blurry', 'moist', 'tragicomic', 'newly-appointed', 'perceptive', 'ebbing', 'diddling', 'coping', 'quadratic', 'semiarid', 'multi-year', 'excessive', 'kapok-filled', 'pondering', 'anomalous', 'ultra-high-speed', 'diluting', '127-mile', 'psychic', 'adventurous', 'misplacing', 'slanderous', 'pacing', 'well-dressed', 'over-night', 'multiplying', 'worrying', 'choreographic', 'towering', 'play-acting', 'Financing', 'Persian', 'spidery', 'poultry-loving', 'wayward', 'proving', 'doubtful', 'Initial', 'gritty', 'Nourishing', 'subverting', "boys'", 'Popish', 'rosy-fingered', 'isolationistic', 'meddling', 'grown-up', 'motional-modified', 'nightmarish', 'warehousing', 'achieving', 'barefooted', 'Sweeping', '380-foot', 'under-developed', 'cherry-flavored', 'Noticing', 'life-supporting', 'arteriolar', 'unattended', 'pro-Yankee', 'watering', 'mature', 'stating', 'Trading', 'Unitarian', 'impressing', 'uncousinly', 'anti-Communist', 'incontestable', 'dialing', 'Advertising', 'trouble-free', 'loquacious', 'Istiqlal-sponsored', 'face-to-face', 'hourly', 'onetime', 'vacuuming', 'ecological', 'scraggly', 'chivalrous', 'enriching', '4,000-foot', 'reactionary', 'effete', 'customary', 'thoughtless', 'ratiocinating', 'post-Civil', 'pathogenic', "pilots'", 'ignorant', 'shadowy', 'insubstantial', 'discontented', 'Hamiltonian', 'white-columned', 'bleary', 'multitudinous', 'bad-fitting', 'rescuing', 'rallying', 'shuttling', 'unexplained', 'portraying', 'twelve-hour', 'underwriting', 'surrendering', 'indigenous', 'rebuilding', 'Elemental', 'supporting', 'ice-cold', 'creative', 'semiquantitative', 'soundproof', 'earth-touching', 'patriarchal', 'follow-up', 'broke', 'mild-mannered', 'lessening', 'asymmetric', 'sacking', 'self-consistent', 'bestselling', 'sloganeering', 'swerving', 'hand-screened', "trippin'", 'marching', 'Repeating', 'Unglazed', "ol'", 'revenge-seeking', 'fine-feathered', 'medico-military', 'taut', 'eighty-fifth', 'Hauling', 'con', 'inapplicable', 'maggoty', 'women-trodden', 'sound', 'straining', 'early', 'orienting', 'taming', 'lackadaisical', 'compressing', 'masterly', 'secure', 'fast-moving', 'uninteresting', 'meretricious', 'net', 'fluttering', 'remolding', 'overturning', 'relishing', 'carnal', 'swooping', 'endorsing', 'rubbing', 'posing', "bishops'", 'reserving', 'far', '11-month-old', 'unformed', 'reforming', 'tinkering', 'uncolored', 'diabetic', 'redheaded', 'elite', 'standard', 'Nonresident', '520-acre', '225/hp', 'failing', 'heavy-framed', 'varicolored', 'indoor', 'adorable', 'amphibious', 'Reaching', 'antique', 'yodeling', 'purposeful', 'open', 'flushing', 'dust-thick', 'fifty-fifty', 'out-of-door', 'bombastic', 'sanctimonious', 'vigorous', 'constant', 'well-regulated', 'typifying', 'horn-rim', 'upper-', 'physiochemical', 'dashing', 'electrostatic', 'inept', 'wakening', 'commending', 'Adverbial', 'enforcing', 'reacting', 'dreary', 'three-month', 'out-of-pocket', 'bacterial', 'heartening', 'weatherbeaten', 'Cheerful', 'pious', 'melting', 'Believing', 'cosmological', 'preying', 'imitative', 'tireless', 'hard-earned', 'sweetish', 'opportune', 'bulging', 'sumptuous', 'relaxing', 'breathy', 'wooded', 'accidental-war', 'unclaimed', 'bone-deep', 'less-than-carload', '21st', 'fancy-free', 'untoward', 'unique-ingrown-screwedup', 'Evil', 'broadside', 'light-transmitting', 'Handmade', 'mundane', 'showy', 'upstanding', 'gaudy', 'unexplored', 'fine-chiseled', 'half-way', 'tending', 'brandishing', "standin'", 'Stupid', 'self-destructive', 'reconverting', 'veering', 'unlacing', 'dainty', 'cleaning', 'nationalizing', 'wet', 'respectful', 'killing', 'hesitant', 'resorting', 'duplicate', 'clean-top', 'Lacking', 'Small', 'suggested', 'talky', 'bibliographical', 'wistful', 'sicker', 'cooling-heating', 'Creative', '53-year-old', 'grinding', 'functioning', 'Wavy', 'ungoverned', 'recovering', 'Hungarian-born', 'outlining', 'concentric', 'typographic', 'swiping', 'adjectival', 'shoulder-high', 'sawed-off', 'respective', 'Seeking', 'plastic-covered', 'Budgeting', 'confessing', 'sensational', 'sophisticated', 'gigantic', 'discretionary', 'non-romantic', 'eighth', 'jolting', 'similarly', 'famous', 'establishing', 'ivory', 'botanical', 'reluctant', 'grabbing', 'opaque', 'onward-driving', 'schizophrenic', 'non-Soviet', 'impetuous', 'much-thumbed', 'Cheap', 'snowy', 'inhospitable', 'conscious', 'spelling', 'anti-assignment', 'protecting', 'Strict', 'receptive', 'Guatemalan', 'three-week', 'baroque', 'interpreting', 'cooler', 'Definite', 'thinning', 'proceeding', 'Unemployed', 'hot-blooded', 'retaliatory', 'sweat-soaked', 'Smug', 'ship-to-surface', 'retarding', 'creedal', "teen-agers'", 'summarizing', 'Flat', 'softer', 'waxen', 'Softer', 'indirect', 'tempting', 'recalcitrant', 'baseless', "nurses'", 'retailing', 'segmental', 'go-it-alone', 'worst-marked', 'regional', 'winless', 'lovable', 'agglutinating', 'striking', 'God-forsaken', 'Siberian', 'pinching', 'evidential', 'solemn', 'vine-embowered', 'blessing', 'bankrupt', 'confounding', 'humid', 'quivering', 'clanking', 'outworn', 'hysterical', 'plebeian', 'Franco-German', 'nonviolent', 'disparate', 'asocial', 'swarming', 'bad', 'pedigreed', 'tasting', '3-run', 'handing', 'providential', 'ripening', 'ribonucleic', 'quixotic', 'dimensioning', 'anti-intellectual', 'Stirring', 'smarter', 'magic', 'separating', 'belt-driven', 'rickety', 'choosing', 'Cooling', 'International', 'flashing', 'applying', 'unshaved', 'metaphorical', 'nuts', 'nagging', 'Dirty', 'symmetrical', 'impelling', 'successful', 'seven-shot', 'salting', 'hemorrhaging', 'unsold', 'luckier', 'Thinking', 'put-upon', 'miraculous', 'de-iodinating', "bustin'", 'glomerular', 'imperishable', 'navigable', 'ante-bellum', 'cave-like', 'lavender', 'curing', 'wise', 'nise', 'reveling', 'creek-filled', 'implacable', 'British-born', 'Black', 'rotten', 'prurient', 'monsoon-shrouded', 'Kind', 'amoral', 'bronchial', 'noisier', 'easy-going', 'raging', 'ascertainable', 'common', 'isocyanate-labeled', 'dirty', 'second-', 'thousand-legged', 'Cherokee', 'hawk-faced', 'bawling', 'hapless', 'gaseous', 'serene', 'masterful', 'healthful', "sayin'", 'long', 'non-white', 'Special', 'self-victimized', 'crafty', 'listing', 'vociferous', 'surgical', 'unacquainted', 'transforming', 'celestial', 'important', 'inconsistent', 'dual-ladder', 'frenzy-free', 'unaggressive', 'concentrating', 'doctrinal', 'London-based', 'rental', 'laureate', 'Appropriate', 'amicable', 'earlier', 'Solar', 'Snatching', 'intruding', 'Red', 'supervisory', 'anti-monopoly', 'kind', 'imperturbable', 'varityping', 'Polish', 'book-burning', 'immeasurable', 'faring', 'Cautious', 'exclaiming', 'old', 'fine', 'flitting', 'dogmatic', 'computational', 'discernable', 'three-building', 'engrossing', 'on-the-spot', 'wealthy', 'dark-blue', 'trend-following', 'amber', 'universal', 'stuck-up', 'dread', 'comforting', 'panting', 'Churchillian', 'downtrodden', 'camping', 'thyroidal', 'true', 'two-room', 'ferromagnetic', 'officiating', 'becoming', 'nonlinguistic', 'barring', 'unaided', 'tired', 'preschool', 'Muslim', 'speculating', 'hoarse', 'unfortunate', 'chill', "athletes'", 'mantic', 'Suspecting', 'malformed', 'radionic', 'apocalyptic', 'sickly', 'discorporate', 'bimolecular', 'manifold', "hangin'", 'undisputed', 'indefensible', 'life-long', 'vagrant', 'rocklike', 'collar', 'Ceartaine', 'snazzy', 'unachievable', 'agreeing', 'unselfish', 'greenish', 'fulminating', 'fatter', 'Inter-american', 'entropy-increasing', 'leaving', 'gaunt', 'rejoicing', 'Brief', 'classifying', 'two-component', 'putting', 'theatrical', 'receding', 'anti-Newtonian', 'after-duty', 'landscaping', 'government-controlled', 'injuring', 'traceable', 'donning', 'enabling', 'nine-game', 'lumbering', 'thickening', 'Fortunate', 'uneasy', 'fluent', 'contouring', 'city-owned', 'non-commissioned', 'paraxial', 'Holding', 'molesting', 'three-year', 'huge', 'black-tipped', 'well-publicized', 'Chicago-style', "seekin'", 'precision', 'studying', 'western', 'Traditional', 'abrupt', 'cold', 'juggling', 'popular', 'anti-trust', 'Supplemental', 'consequent', 'provisional', 'perpendicular', 'fixing', '45-degree', 'unaccompanied', 'adventitious', 'diverting', 'subconscious', 'uninvited', 'practical', 'dating', 'voluptuous', 'upper', 'crimsoning', 'Corinthian', 'racy', 'distinguishing', 'viselike', 'Strong', 'would-be', 'Compulsory', 'swift-footed', 'urinary', 'chubby', 'Ringing', 'clumsy', 'illusionary', 'eight-year', 'semi-isolated', 'Dry', 'hinting', 'infantile', 'home-bred', 'unreasoning', 'inflexible', 'Deductible', 'stone-still', 'straightforward', 'All-weather', 'hand-hewn', 'cyclical', 'Smiling', 'groping', 'facile', 'three-family', 'international', 'glorious', 'hiking', 'multi-product', 'unattainable', 'broad-scale', 'incarnate', 'dear', 'discoid', 'factual', 'eligible', 'Composite', 'abundant', 'olive-flushed', 'viscoelastic', "rubbin'", 'boasting', 'varitinted', 'social-climbing', '22nd', 'high-spirited', 'observing', 'incremental', 'wage-earning', 'protoplasmic', 'retrogressive', '50-inch', 'bilateral', '185th', 'gorging', 'momentous', 'God-given', 'good-natured', '37th', 'average', 'intrapulmonary', 'three-hundred-foot', 'ready-made', 'lyric', 'frothy', 'five-hundred-dollar', '390-foot', 'ontological', 'ostentatious', "darlin'", '130-year', 'Basing', 'careening', 'suitable', 'Boeotian', 'comprehending', 'staging', 'microscopic', 'dining', 'unsuitable', 'noiseless', 'rock-like', 'melodramatic', 'discovering', 'post-reapportionment', 'mediocre', 'Abnormal', 'warless', 'bitter', 'reversible', 'expectable', 'opulent', 'endogenous', 'no-good', 'conceiving', '145-pound', 'recognizable', 'earthy', 'Northeastern', 'extra-curricular', 'overvaulting', 'unorthodox', "wieners'", 'tremendous', 'Idle', 'Touring', 'attactive', 'hauling', 'arraigning', "herdin'", 'stressing', 'over-pretended', 'painful', 'outback', 'affirmative', 'budding', 'semi-conscious', 'exuberant', 'devastating', 'double-married', 'thermoforming', 'domineering', 'unpaired', 'fierce', 'bedfast', 'lop', 'seceding', 'sinking', 'uncontrollable', 'rundown', 'briefing', 'husband-wife', '75,000-ton', 'imponderable', 'accosting', '11-shot', 'bewitching', 'spending', 'floral', 'poking', "goin'", 'spurring', 'necrotic', 'roaming', 'testing', 'steroid-induced', 'long-bodied', 'Critical', 'unprofitable', 'one-gee', 'Choctaw', 'uncaused', 'squeaky', 'Follow-up', 'unwelcome', 'eternal', 'massing', 'documentary', 'tooling', 'painless', 'two-fisted', 'apathetic', 'soaking', 'Russo-American', 'nutritional', 'wrathful', '700-mile', 'indiscreet', 'Aggregate', 'counter-balanced', 'hatching', 'cortico-hypothalamic', 'Amateur', 'Denouncing', 'impeccable', 'objective', 'unfenced', 'agreeable', 'numerological', 'cleansing', 'full-time', 'interstage', 'transparent', 'meaningless', 'dainty-legged', 'Newport-based', 'deductive', 'trans-political', 'white', 'Positive', 'engulfing', 'swinging', 'owning', 'Coping', 'straight-out', 'hereditary', 'timeworn', 'fallible', 'utilitarian', '40-grain', 'Okay', 'trickling', 'bruising', 'sipping', 'harmful', 'second', 'Linking', 'refractory', 'dying', 'seeming', 'splashy', 'admonishing', 'endearing', 'schematic', 'spouting', 'psychotherapeutic', '65-year-old', 'rioting', 'salt-crusted', 'unlucky', 'Homeric', 'dealing', 'paunchy', 'ironing', 'artful', 'foraging', 'annual', 'now-historic', 'once-a-month', 'grinning', 'Antithyroid', 'folksy', 'calming', 'Atlantic', 'Nonspecific', 'soft-spoken', 'privately-owned', 'tinkling', 'Unsuccessful', 'Hanging', 'interposing', 'mounting', 'unruly', 'windy', 'spreading', 'retrograde', 'undiluted', 'causative', 'bloodshot', 'unprovocative', 'physical-chemical', 'panoramic', 'uncritical', 'sometimes-necessary', 'presiding', 'unconcerned', 'crack', 'dispassionate', 'sprinkling', 'inevitable', 'add-on', 'decaying', 'Aegean', 'interglacial', 'mustached', 'smooth', 'decadent', 'Wrong', 'form-creating', 'Arctic', 'Spike-haired', 'overflowing', 'Reflecting', 'opposing', 'overstraining', 'surreptitious', 'Cryptic', 'Pulling', 'Commercial', 'offering', 'broken-nosed', "startin'", 'resisting', 'Spiritual', 'Arterial', 'weaning', 'orange', 'commercial', 'super-Herculean', 'Successive', 'familial', 'dragging', 'slick-headed', 'defocusing', 'unburned', 'deviant', 'Resting', 'peremptory', 'leaning', 'glistening', 'material-formal', 'resultant', 'olden', 'furthering', 'door-fronted', 'dang', 'murmuring', 'tiresome', 'artificial', 'reasoning', 'demon-ridden', 'unfathomable', 'ticking', 'ecstatic', 'ninth', 'south', 'competitive', 'anarchical', 'Deep', 'contemporary', 'deep', '15-to-one', 'dizzy', 'always-present', 'smoldering', 'contradictory', 'symbolic', 'spoiling', 'mud-caked', 'craft-industrial', 'awarding', 'flaming', 'pouring', 'Incapable', 'misleading', 'over', 'dimensional', 'including', 'Wiry', 'dogged', 'volcanic', 'diving', 'Decorating', 'tokenish', '195-page', 'sterile', 'puckering', 'snubbing', 'reverent', 'counterfeit', 'maudlin', 'half-filled', 'baronial', '20th', 'docile', 'tilting', 'husky', 'sea-blessed', 'blacked-in', 'Biblical', 'Standing', 'pardonable', 'bristling', 'modal', 'newly-married', 'calling', 'rival', 'undersized', 'Fearless', 'thankless', 'bawdy', 'Young', 'Innumerable', 'percussive', 'commando-trained', 'swanky', 'formal', 'city-bred', 'mixing', 'wishing', 'flattering', 'Brooding', 'carrier-based', 'submerging', 'belaboring', 'twenty-mile', 'shorter', 'reciting', 'power-hungry', 'Looming', 'twelfth', 'consumptive', 'feigning', 'splitting', 'Ionic', 'pretty', 'constraining', 'speeding', 'socio-archaeological', 'dictatorial', 'pro', 'immediate', 'common-sense', 'Tooling', 'peaked', 'piping', 'heretofore-accepted', 'cassocked', 'pro-Western', 'clean-shaven', 'undimmed', 'morphemic', 'arid', 'unmodified', 'invalid', 'Standard', 'twotiming', 'oily', 'bobbin-to-cone', 'Selecting', 'solving', 'irksome', 'true-false', 'radiating', 'plenary', 'strong-made', 'central', 'infirm', 'irresponsible', 'raspberry', 'multi-colored', 'conning', 'Martian', 'gravid', 'law-abiding', 'cynical', 'perceptual', 'home-and-home', 'unproblematic', 'Light', 'biochemical', 'finely-spun', 'eating', 'petulant', 'epileptic', 'uncharged', 'characteristic', 'completing', 'residential', 'Discovering', 'overgenerous', 'small', 'rakish', 'decomposing', 'looking', 'Overt', 'systemic', 'Previous', 'preconscious', 'fawning', 'Bible-loving', 'veracious', 'tube-nosed', 'fourth', 'forthcoming', '300th', 'skimming', 'uttering', 'Completing', 'caloric', 'communicative', 'passing', 'exceeding', 'disloyal', 'ethereal', 'delphic', '1800-square-foot', 'stern', 'churning', 'Ravel-like', 'moth-eaten', 'dark-haired', 'furious', 'unperformed', 'leavened', 'homing', 'unspeakable', '125th', 'outlying', 'not-so-lonely', '10-day', 'untrue', 'denoting', 'pedimented', 'unstuffy', 'spitting', 'Magnetic', 'somatic', "Sunday's", 'subduing', 'after-school', 'text-ordered', 'illiterate', 'nautical', 'violating', 'unleavened', 'puzzling', 'far-ranging', 'congenital', 'non-polygynous', 'scudding', 'phony', 'slow-acting', 'alkaline', 'safer', 'oscillating', 'baleful', 'indecipherable', 'Wide', 'fifty-pound', 'leather-hard', 'majesterial', 'unsheltered', 'twenty-year', 'elephantine', 'cawing', 'etymological', 'clear', 'sturdy', 'well-grooved', "yellin'", 'Wooded', 'psychical', 'intersecting', 'repressive', 'threefold', 'stooping', 'patristic', 'clinging', 'monotonous', 'self-energizing', 'Graceful', 'Pistol-whipping', 'orbital', 'discernible', 'distortable', 'catlike', 'espousing', 'waspish', 'engaging', 'audio-visual', 'Second', 'blowing', 'well-fed', 'effortless', 'reconciling', 'inadequate', 'permitting', 'Lockian', 'appreciable', 'impertinent', 'Physical', 'contrite', 'mucking', 'simple-seeming', 'rainless', 'creaking', 'feline', 'world-shaking', 'mean', 'affirming', 'corny', 'rough-tough', 'circling', 'fecund', 'Full', 'Financial', 'uncourageous', 'loose-jowled', 'imprecise', 'categorical', 'thirty-caliber', 'hydrostatic', 'fore', 'pre-season', 'on-level', 'defiant', 'beneficial', 'fibrous', 'two-term', 'feasting', 'conceptual', 'tactual', 'indigent', 'five-column', 'illusory', 'greasy', 'psychoactive', 'helpless', 'sudden', 'Enzymatic', 'law-governed', 'still-dark', 'stable', 'anti-democratic', 'drama-filled', 'mining', 'credulous', 'sincere', 'well-to-do', 'Husky', 'short-lived', 'slopping', 'philanthropic', 'fresh', 'total', 'relationship-building', 'outstripping', 'acute', 'underground', 'standardizing', 'diversionary', 'ethical', 'wonderful', 'reporting', 'self-enclosed', 'unworn', 'conservative', 'detachable', 'well-deserved', 'Customary', 'uninfluenced', 'intellectual', 'easier', 'half-educated', 'bottomless', 'piddling', 'Putting', 'White', 'post-bellum', "women's", 'ringing', 'invaluable', 'rougher', 'Loyal', 'Consonantal', "artists'", 'disorderly', 'atypical', 'impractical', 'Asian', 'willowy', 'non-itemized', 'primeval', '36th', 'bulk', 'expiating', 'puny', 'expressive', 'pseudo', 'anti-missile', 'cozy', 'lusty', 'drowsy', 'never-predictable', 'querying', 'awe-inspiring', 'strapping', 'nonparticulate', 'curt', 'ki-yi-ing', 'thrombosed', 'ever-increasing', 'swank', 'nonmetallic', 'crazing', 'mournful', 'celiac', 'overgrazing', 'bargain-priced', 'clustering', 'bull-necked', 'coaxial', 'staring', 'pre-existent', 'staffing', 'Commenting', 'soul-searching', 'catalytic', 'Fundamental', 'publishing', 'worth-waiting-for', 'jangling', 'stiffening', 'voluble', '15-hit', 'frail', 'fourteen-team', 'meteoritic', 'denting', 'taut-nerved', 'knobby-knuckled', 'mulching', 'vital', 'floating', 'Reading', 'honorable', 'a-raising', 'gratifying', 'lowly', 'strait-laced', 'catching', 'problem-solving', 'relating', 'upsetting', 'one-sided', 'buoyant', 'Knowing', 'stirrin', 'Protogeometric', 'sudden-end', 'instrumental', 'Straight', 'mapping', 'righteous', 'youngish', 'false', 'smothering', 'By-passing', 'Large', 'uncontrolled', 'peppery', 'weather-resistant', 'wincing', 'gawky', 'contaminating', 'interlobular', 'oneasy', 'Fuzzy', 'calorie-heavy', 'stolid', 'Olde', 'intramural', 'on-stage', 'momentary', 'bragging', 'parading', 'longish', 'Kohnstamm-positive', 'Ready', 'grand', 'licensing', 'black-haired', 'monastic', 'peculiar', 'well-designed', 'dissembling', 'siding', 'skeletal', 'foregoing', 'conformist', 'voiceless', 'fee-per-case', '11-year', 'flashlight-type', 'discharging', 'Then', 'patent', 'coal-black', 'sprightly', 'goddamn', 'smallish', 'remanding', 'legged', 'bearing', 'impious', 'warming', 'waking', 'painstaking', 'Aligning', 'legal', 'Miltonic', 'nahce', 'minimal', 'Qualitative', 'renewing', 'unspoken', 'three-dimentional', 'feeding', 'seating', 'amusing', 'newborn', 'Rising', 'Coming', 'curative', 'Pre-attack', 'lifting', 'tripartite', 'third', 'costing', 'cute', 'imperious', 'three-foot', 'Dingy-looking', 'fetid', 'labile', 'louder', 'requiring', 'prodigious', 'fluid', 'lay-up', 'null-type', 'practicable', 'Telling', 'heady', 'eyd', 'explaining', 'democratic', 'Joking', 'stupid', 'godlike', 'fearsome', 'Rental', 'too-large', 'despoiling', "hankerin'", 'exclusive', 'right', 'trumped-up', 'leisurely', 'six-month', 'particularistic-seeming', 'wide-ranging', 'rusty', 'classical', 'Caucasian', 'legislation-delaying', 'Hunkerish', 'pliant', 'minor', 'aniseikonic', 'sooner', 'bake', 'accelerating', 'dangerous', 'indelicate', 'Recounting', 'corporate', 'brash', 'numerous', 'due', '150-milliampere', 'particulate', 'next-door', "beginners'", 'undressing', 'non-Jewish', 'rejoining', 'inorganic', 'truth-revealing', 'five-day', "buyin'", 'deluxe', 'majestic', 'studious', 'linen-covered', 'mock', "girls'", 'flat-topped', 'poling', 'awesome', 'tropical', 'stalling', 'nighted', 'general', 'widespread', 'chalk-white', 'sombre', 'exhaling', 'location-minded', 'Official', 'high-salaried', 'spotty', 'ole', 'Mennonite', 'smashed-out', 'Environmental', 'two-story', 'Braddock-against-the-Indians', 'co-operative', 'pestering', 'silky', "rain's", 'sedentary', 'unsigned', 'Contrary', 'contrary', 'remarkable', 'Just', '545-yard', 'inapt', 'uniform', 'shortening', 'worldly', 'unobtrusive', '50-megaton', 'mid-19th', 'esthetic', 'tell-tale', 'undreamed', 'trite', 'liberating', 'naked', 'naughtier', 'meditating', 'Swedish', 'last-mentioned', 'recumbent', 'Vocal', 'desolate', 'scooping', 'disdaining', 'compounding', 'versed', 'lacking', 'khaki', 'emerging', 'hindering', 'slapping', 'firmer', 'philological', 'sunken', 'yellow-bellied', 'unscathed', 'choral', 'half-crocked', "sportin'", 'Meager', 'Venturesome', 'Editorial', 'unwinding', 'boiling', 'tenebrous', 'present', 'experiencing', 'nonionic', 'Scientific', 'vitriolic', 'Trans-illuminated', 'protozoan', 'fictitious', '54th', 'Ten-thousand-dollar', 'Squeezing', 'decisive', 'modifying', 'obtaining', 'nonmusical', 'red-blooded', 'outboard', 'Front', 'overt', "maskers'", 'programming', 'intensifying', 'careless', 'positive', 'Tibetan', 'budgeting', 'browsing', 'advancing', 'individualistic', 'cataclysmic', 'candidate-picking', 'derogatory', 'learned', 'inoperable', 'reflective', 'consonant', 'warping', 'steadier', '10-gallon', 'healthier', 'athletic', 'short-of-war', 'Congolese', 'high', 'contriving', 'processing', 'non-propagating', 'Opaque', 'postwar', 'overconfident', 'persistent', 'diamond-studded', 'continual', 'Rummaging', 'outscoring', 'unanswered', 'arboreal', 'belowground', 'Drifting', 'Jewish-Gentile', '80-hp', 'complex-valued', 'Weekly', '1200-square-foot', 'shearing', 'Wooden', 'generating', 'servile', 'schooling', 'amorous', 'conspicuous', 'congregational', 'Hessian', '52-year', 'sheep-lined', 'two-way', 'Assyrian', 'drastic', 'no-driving', 'Bantu', "appearin'", 'staminate', 'cringing', 'archaeological', 'geometrical', 'sore', 'sudsing', 'misshapen', 'upper-middle', 'advertising-conscious', 'Elizabethan', 'approaching', 'psychological', 'interstitial', 'quiet', 'joint', 'torpid', 'khaki-bound', 'Presenting', 'rotting', 'undistinguished', "drivers'", 'specific', 'brownish', 'fortune-happy', 'anti-personality', 'tactile', 'convalescing', 'wheeling', 'multiple', 'harping', 'ineffectual', 'jovial', "men's", 'do-good', 'opening', '38-point', 'quickening', 'traditional', 'sparring', 'advantageous', 'dramatic', '25-mile-square', 'flexible', 'chainlike', 'time-cast', 'Elaborate', 'civilizing', 'killable', 'Inspiring', 'hospitable', 'psychoanalytic', 'vocalic', 'light-headed', 'finger-held', 'better-than-average', 'catering', '13/16-inch', 'telegraphing', 'childlike', 'trying', 'vexing', 'spiraling', 'Lithe', 'sinning', 'imcomplete', '5-passenger', 'mocking', 'half-digested', 'secularist', 'eye-undeceiving', 'unpartisan', 'Dealing', 'Precious', 'aware', 'other-directed', 'joyous', 'valid', 'Totaling', 'leguminous', 'seed-bearing', 'divisional', 'analeptic', 'fickle', '33-man', 'Writing', 'out-reaching', 'worshipping', 'concretistic', 'indigestible', 'interacting', 'leathery', 'truant', 'broad-brimmed', 'watching', 'free-burning', 'Norwegian', 'whimsical', 'ineluctable', "wive's", "weeks'", 'motherly', 'honeymooning', 'confident', 'humble', 'inborn', 'short-changing', 'stored-up', 'railway-based', 'phonetic', 'painteresque', 'unacknowledged', 'thimble-sized', 'conscionable', 'felling', 'gooshey', 'nutrient', 'marking', 'stubborn', 'defensive', 'recently-passed', 'aural', 'two-lane', 'surveying', 'converting', 'copying', 'observable', 'marrying', 'involuntary', 'cameo-like', 'well-balanced', 'tall-growing', 'by-passing', 'preflight', 'scholarly', 'dummy', 'half-crazy', 'polling', 'fantastic', 'stone-gray', 'settling', "growers'", 'non-volatile', 'go-to-war', "guerrilla-th'-wisp", 'complex', 'unanalyzed', 'unself-conscious', 'banging', 'better-remembered', 'rude', 'home-grown', 'virgin', 'sun-burned', 'punching', 'Finnish', 'consonantal', 'quasi-recitative', 'Papal', 'snappy', 'transitional', 'unphysical', 'anthropomorphic', 'tidy', 'doin', 'Victorian', 'thermoelectric', 'mousy', 'imagining', 'younguh', 'accepting', 'deep-sea', 'Natural', 'pressure-sensing', 'fashioning', 'untellable', 'preceeding', 'demoniac', '3-month', 'cognitive', 'missionary', 'rollicking', 'scampering', 'rustproof', 'disregarding', 'half-past', 'surplus', 'cruising', 'embarrassing', 'Arriving', 'well-braced', 'instinctive', 'hardy', 'hand-written', 'august', 'Unspeakable', 'Sizzling', 'regenerating', 'forgitful', 'shining', 'accessible', 'monitoring', "dancers'", 'convertible', 'dandy', 'willinge', 'weighty', 'alone', 'ranging', 'systematizing', 'anti-discriminatory', 'averting', 'inimical', 'self-conscious', 'dank', 'teetering', 'quirking', 'accommodating', 'Chipping', 'burnt-red', 'weekly', 'pelvic', 'taxpaying', 'lengthwise', 'persisting', 'whiskered', 'Trouble-free', 'efficient', 'littering', 'stretching', 'York-mind', 'second-rate', 'originating', 'zodiacal', 'unmindful', 'Tough', 'debating', 'unfertilized', 'recognizing', 'mayoral', 'waxing', 'complimenting', 'recoverable', 'transcultural', 'equal', 'fragrant', 'far-flung', 'thick', 'gruff', 'electro-magnetic', 'nestling', 'unuttered', '25-gallon', 'semiautomatic', 'wild-sounding', 'stacking', 'sniffing', 'cardinal', 'matchless', 'veteran', 'olive', 'promulgating', 'candid', 'incorporating', 'unlaundered', 'rehearing', 'future-time', 'tar-soaked', 'guileless', 'less', 'coveting', 'neo-', 'foster', 'mum', 'rustling', 'Placing', 'Fear-maddened', 'platitudinous', 'interlacing', 'belittling', 'horrid', 'ambiguous', 'employee-contributed', 'bright-green', 'quavering', 'exterior', 'foolhardy', 'clamorous', 'listener-supported', 'bigger', 'pre-set', 'fancying', 'educational', 'accomplished', 'deceptive', 'translating', 'molding', 'back-lighted', 'obstinate', 'odious', 'analytic', 'tracking', "skinnin'", 'fawn-colored', "Rammin'", 'conversing', 'gaining', 'frothier', 'social', 'unnoticed', 'fade-in', 'plain-spoken', 'chivying', 'tiered', 'combining', 'Morphophonemic', 'seventeen-inch', 'inflecting', 'inward', 'hazy', 'cheerful', 'prehistoric', 'dual', 'worse', 'delicately-textured', 'tradition-minded', 'dissolving', 'Fosterite', 'ashen', 'begging', 'tool', 'limping', 'deducting', 'Boating', "lawyers'", 'knocking', 'strengthening', 'guaranteed-neutral', 'non-hydrogen-bonded', 'well-molded', 'Abandoning', 'saying', 'guessing', 'per-year', 'sulky', 'affable', 'plotting', 'bettering', 'managerial', 'restrictive', "meetin'", 'witnessing', 'cross-legged', 'anti-Kennedy', 'soft', 'acceptable', 'imploring', 'wellknown', 'Understanding', 'threadbare', 'neuter', 'sentencing', 'red-visored', 'decreeing', 'sauterne', 'providing', 'far-off', 'willing', 'extirpating', 'operatic', "days'", "brothers'", 'fear-filled', 'fine-drawn', 'intangible', 'pepping', 'substituting', 'mesenteric', 'tipsy', 'triple', 'twittering', 'Centering', 'unpromising', 'pronouncing', 'smoky', 'inscrutable', 'seamless', 'incongruous', 'morphologic', 'uglier', 'suave', 'lace-drawn', 'straddling', 'resolute', "ginnin'", 'not-so-pale', 'round-eyed', 'monumental', 'wavy', 'bashful', 'round-tipped', 'poor', 'shopping', 'Piloting', 'cross', 'Puny', '27-year-old', 'hard-won', 'Sooner', 'mentioning', '25-foot', 'Rumanian', 'fun-loving', 'subsurface', 'forcing', 'Grecian', 'sporting', 'faceless', 'twofold', "Respondents'", 'stochastic', 'bouncy', 'anti-human', 'round-faced', 'willow-lined', 'resurgent', 'phenomenological', 'blasphemous', 'chromium-plated', 'unemotional', 'brain-wracking', 'terrestrial', 'unchallenged', 'area-wide', "grazin'", 'Winking', 'Tampering', 'projecting', 'Mass', 'fancier', 'cardiovascular', 'ring-labeled', 'silver-gray', 'Singing', 'non-public', "architects'", 'cavernous', 'shutting', 'veritable', 'trans-illuminated', 'wormy', 'dried-up', 'sinusoidal', 'recursive', 'happening', 'pig-drunk', 'rearing', 'quadric', 'radioactive', 'ultraviolet', 'peaceful', 'socially-oriented', 'squashing', 'coordinating', 'sized', 'incurable', 'pivoting', 'diffuse', 'slow-growing', 'uninterested', 'fading', 'whitehaired', 'undisclosed', 'overlying', 'normative', 'analogous', 'plastic', 'pulling', 'five-year', 'fast-growing', 'scavenging', 'beyond-normal', 'green-scaled', 'institutional', 'odd', 'lame', 'everyday', 'reuniting', 'short-cut', 'standing', 'southbound', 'pituitary', 'subatomic', 'indexing', "sachems'", 'Acceptable', 'Israeli', 'hitching', 'Stoic-patristic', '3/8-inch-thick', 'oleophilic', 'Anti-A', 'hour-long', 'tetragonal', 'complicating', 'virtuous', 'boon', 'delicious', 'superficial', 'independent', 'insurmountable', 'disseminating', 'inner', 'ashamed', 'advisory', 'syntactic', 'Hoping', 'muggy', 'out-of-bounds', 'open-ended', 'Stalinist-corrupted', 'magnificent', 'Relative', 'overhauling', 'Sicilian', 'interpeople', 'sickening', 'unsalted', 'manic-depressive', 'Protestant-dominated', 'synonymous', 'master', '12-month', 'scrumptious', "givin'", 'critical-intellectual', 'recommending', 'grappling', 'organismic', 'thieving', 'unkind', 'vibrating', 'Conceding', 'crisp', '67-year-old', 'east', 'surging', 'splenetic', 'vine-shaded', 'Korean', 'then', 'immovable', 'beaming', 'hungry', 'criticizing', 'inexorable', 'routine', 'on-site', 'neglecting', 'Graduate', 'Sharing', 'Waking', 'slender', 'relaying', 'foreboding', 'Sustaining', 'valueless', "examinin'", 'inexact', 'Halting', 'fugual', 'sublunary', 'Possible', 'less-indomitable', 'communicational', 'stepwise', 'wakeful', 'tertiary', 'inexpert', 'proprietory', 'school-leaving', 'pedantic', 'English-speaking', 'snob-clannish', 'intra-state', 'nonpolitical', 'rid', 'precarious', 'diachronic', 'gallus-snapping', 'clogging', 'slack', 'reclining', 'fiendish', 'disciplining', 'cross-eyed', 'alarming', 'waging', 'Stainless', 'anti-A', 'locating', 'Ideal', 'molten', 'voluntary', 'heat-processing', 'local', 'casting', 'planetary', 'topical', 'westerly', 'thematic', 'unsaid', 'Engaging', 'rinsing', 'defensible', 'seven-concert', 'day-after-day', 'bootlegging', 'perfecting', 'grim', 'Northwestern', 'semi-major', 'muddleheaded', 'sensual', 'powerful', 'injurious', 'undamaged', 'unaware', 'truth-packed', 'year-old', 'Scratching', 'hopeful', 'non-literary', 'declaring', '30-minute', 'obnoxious', 'wracking', 'gasping', 'mannered', 'flirtatious', 'half-transparent', 'brackish', 'sixteen-year-old', 'great', 'unending', 'knock-down', 'solar', 'good-size', 'day-by-day', 'black-and-orange', 'free-wheeling', 'pimpled', 'multi-lingual', 'tangential', 'reprobating', 'penniless', 'ratable', 'impassable', 'awake', 'adjacent', 'labor-saving', "askin'", 'constitutional', 'pervasive', 'Starting', 'pre-historic', 'manly', 'legendary', 'probable', 'Handsome', 'Tossing', 'piquant', 'pink-petticoated', 'circumpolar', 'Fishing', 'self-unloading', 'figuring', 'knifelike', 'run-scoring', 'ten-minute', 'pathless', 'See-through', 'Shivering', 'extraneous', 'supersonic', 'scouting', 'singing', 'harpy', 'Serious', 'registering', 'nonresident', 'zoning', 'simple', 'quoting', 'high-sounding', 'antagonistic', 'disarming', 'glassless', '18-1/2-inch', 'noxious', 'blood-specked', 'fifteenth', 'believing', 'hoped-for', 'scalar', 'bodily', 'sixty-five-mile', 'cherishing', 'Filigreed', 'Jacobean', 'gleeful', 'mending', 'do-it-yourself', 'comparable', 'subnormal', 'pro-Europe', 'Englishy', 'repeating', 'long-vanished', 'dynamic', 'take-up', 'resplendent', 'Western', 'coarse', 'overeating', 'appearing', 'silver-painted', 'tiny', 'Moorish', 'betraying', 'prima-facie', 'mist-like', 'Proper', 'civic', 'dialectical', 'undiminished', 'severe-looking', 'most-valuable', '80th', 'heterozygous', 'running', 'savory', 'starring', 'proverbial', 'thyroxine-binding', 'elastic', 'afferent', 'lengthening', 'Vital', 'lustrous', 'applicable', 'unfamiliar', 'ever-present', 'Stopping', 'lurking', 'Worse', 'Crimean', 'downing', 'missing', 'bipartisan', 'Meeting', 'colossal', 'sharp', 'north-south', 'inconceivable', 'military', 'diaphragmic', 'deploying', 'muddy-tasting', 'linear', 'significant', 'dog-eared', 'loud-voiced', 'evangelical', 'radiant', 'non-sentimental', 'barrel-wide', 'notching', 'brocaded', 'unexplainable', 'tea-drinking', 'cherry', 'Japanese', 'Baroque', 'gelatin-like', 'decentralizing', 'fiery', "doin'", 'nineteen-year-old', 'swimming', 'beetling', 'wicked', 'unimaginative', 'west', 'unmatched', 'Sipping', 'assuming', 'corrupt', 'sonorous', 'funeral', 'writing-like', 'good-living', 'sensuous', 'perishable', '6-year', 'Leaning', 'Politics-ridden', 'thundering', '31st', 'myriad', 'overnight', 'in-plant', 'parroting', 'Republican', 'renal', 'Violent', 'strolling', 'semi-processed', 'hot-slough', 'perspiring', 'poorer', 'notable', '30th', 'Armenian', 'unimproved', 'Sleepy-eyed', 'visual', 'snow-white', 'arranging', 'cohnfidunt', 'Anti-Communist', 'worldwide', 'sure-enough', 'occipital', 'undesirable', 'tan', 'rough-and-tumble', 'Anglo-Protestant', 'overeager', 'cursory', 'enacting', 'hopeless', 'confiding', 'two-hour', 'collonaded', 'easy-to-spot', 'bathing', 'full-banded', 'complaisant', 'Comparable', 'handy', '39-year-old', 'agreed-upon', 'precautionary', 'stopping', 'keen', 'intending', 'extant', 'pragmatic', 'connective', 'Hastening', 'stabilizing', 'academic', 'less-developed', 'tensioning', 'occurring', 'regaining', 'sternal', 'gold-filled', 'Bare', "dam'", 'Drying', 'malposed', 'all-too-brief', 'gyro-stabilized', 'all-night', 'palliative', 'radical', 'tulip-shaped', 'unjust', 'riding', 'iliac', 'creeping', 'high-rep', 'Hungarian', '70th', 'salacious', "sor'l", 'deluding', 'Pure', 'far-out', 'granular', 'good-looking', 'Rough', 'farmer-type', 'crisis-oriented', 'nonracial', 'Bacterial', 'unabashed', 'bolder', 'sympathizing', 'Unmarried', 'suburban', 'Christmas-season', 'wrong-headed', 'blending', 'a-crowing', 'penultimate', 'ginning', 'jocular', 'slow-scrambling', 'unappreciated', 'menial', 'nastier', 'Homozygous', 'bear-like', 'guiding', 'non-authoritative', 'p.', 'Thrifty', 'binding', 'negotiating', 'overactive', 'limber', 'Tribal', 'Higher', 'cellular', 'Continuing', 'clamping', 'irritable', 'graphic', 'fire-resistant', 'legislative', 'centric', 'middle-', 'babbiting', 'Sweet-sour', 'isothermal', 'cold-blooded', 'socialistic', 'nonchalant', 'Botulinal', 'whirling', 'teaming', 'edifying', 'wrestling', 'impulsive', "yesterday's", 'absent', 'per-game', 'luxurious', 'Communist-inspired', 'closely-packed', 'blunter', 'mirthless', 'distributive', 'groggy', 'shuddery', 'flailing', 'Practical', 'determing', 'zealous', 'Jovian', 'opportunistic', 'weather-royal', 'congenial', 'accompanying', 'envious', 'eager', 'rear', 'self-sustaining', 'over-occupied', 'money-minded', 'edentulous', 'fooling', 'pre-marital', 'lonelier', 'prewar', 'cents-per-hour', 'irreducible', 'universalistic', 'nearby', 'preprinting', 'hitting', 'brassy', 'Unimpressed', 'normal', 'entrusting', 'teensy', 'unblemished', 'slow', 'monetary', 'wire-haired', 'Moscow-allied', 'month-long', 'methodical', 'pseudo-scientific', 'scrub', 'swelling', 'never-to-be-forgotten', 'talkative', 'confusing', 'mortal', 'hemolytic', 'level-headed', 'Severe', 'courtly', 'unshakable', 'British-American', 'liking', 'shack-up', 'intercontinental', 'unfitting', 'captive', 'prosodic', 'peering', 'half-expressed', 'encephalographic', 'befuddling', 'purple', 'Danish', 'see-lective', 'amiss', 'meeting', 'pleading', 'unavailing', 'lowering', 'presuming', 'Curly', 'three-judge', 'Subject', 'baffling', 'premarital', 'Drunk', 'tenth', 'piercing', 'Square', 'soggy', 'rainy', 'trimming', 'token', 'Cassite', 'fluffy', 'resting', 'morbid-minded', 'substerilization', 'well-played', 'festering', 'moralistic', 'superlunary', 'clerical', 'overcoming', 'test-like', 'sinuous', 'unrequited', 'inherent', 'raping', 'whooping', 'hundredth', 'confronting', 'lyrical', "authors'", 'destitute', 'stellar', 'twice-a-year', 'graduating', 'impartial', 'Noting', 'appeasing', 'showering', 'frog-eating', 'Eurasian', "prevailin'", 'lavish', 'communal', 'fractional', 'salutary', 'unlamented', 'beefed-up', 'grade-constructed', 'incredible', 'revolving', 'Dear', 'removing', 'orchestral', 'biological', 'six-ton', 'gemlike', 'fifty-cent', 'speechless', 'finite-dimensional', 'fusiform', 'macromolecular', 'placating', 'free', 'Judicial', 'policy-oriented', 'resourceful', 'unsavory', 'romancing', 'intra-mural', 'transplantable', 'betel-stained', 'tying', 'earsplitting', 'alphabetic', 'raining', 'Tougher', 'dismaying', 'downstream', 'detestable', 'commenting', 'unknown', 'mandatory', "Shippin'", 'inaudible', 'ill-conceived', 'likely', 'reasonable', 'stringing', 'raucous', 'oviform', 'impenetrable', 'striving', 'nihilistic', 'Scrooge-like', 'secretarial', 'conciliatory', 'unprecedented', 'entertaining', 'worshipful', 'Cold', 'pianistic', 'further', 'spontaneous', 'rewarding', 'precocious', 'unused', 'malevolent', 'cannibalistic', 'coursing', 'focusing', 'lineal', 'concordant', 'homebuilding', 'unabridged', 'Colombian', 'purchasing', 'prancing', 'money-fed', 'locking', 'people-oriented', 'pressure-measuring', 'upturned', 'Home-keeping', 'Going', "lettin'", 'vile', 'ridding', 'thin-soled', 'addle-brained', 'vilifying', 'enforceable', 'high-minded', 'diligent', 'congruent', 'mourning', 'burdensome', 'slimmer', 'bereft', '3-game', 'blind', 'all-lesbian', 'interesting', 'seven-week', 'scarlet', 'bloody', 'bleacher-type', 'savage', 'throbbing', 'world-oriented', 'supervising', 'hedonistic', 'favorite', 'unexpected', 'harmless', 'hot-colored', 'Lifting', 'prepositional', 'acrobatic', 'shattering', 'low-down', 'Ripe', 'three-men-and-a-helper', 'ambidextrous', 'eighty-year-old', 'sweet-throated', 'ailing', 'Righteous', 'non-forthcoming', 'non-comparable', 'pitiless', 'inviting', 'seventy-five-foot', 'unalienable', 'bleeding', 'urban', 'humiliating', 'shrewd', 'polarizing', 'senior-graduate', 'Dancing', "candidates'", 'intolerant', 'oral', 'lurching', 'unproductive', 'more-than-average', 'species-dependent', 'teaching', 'high-set', 'nonagricultural', 'well-bred', 'salable', 'squat', 'far-famed', 'sullen', 'briefly-illumed', 'sensible', 'sober', 'elegiac', 'pinning', 'caving', 'Separate', 'calibrating', 'sleek', 'four-story', 'reproducing', 'spaniel-like', "prisoners'", 'Latin', 'immense', 'evaporative', '260-member', 'floundering', 'febrile', 'turquoise', 'alternate', 'half-standard', 'latent', 'depressing', 'light-reflecting', 'tapering', 'sore-ridden', "guy's", 'buxom', 'Orwellian', 'edematous', 'sunning', 'coercive', 'maverick', 'off-road', '10-yr.', 'desperate', 'mild-voiced', 'flattening', 'sly', 'cortical', 'designating', 'indubitable', 'mushrooming', 'uninjured', 'marketing', 'shopworn', 'essential', 'halfway', 'subject', 'following', 'squeezing', 'pausing', "trustees'", "travelin'", 'pre-French', 'conjugal', 'crushing', 'skiddy', 'semi-skilled', 'justifiable', 'razor-edged', 'sweet-smelling', 'panicky', 'supercilious', 'senseless', 'round', 'adding', 'unstaring', 'uninitiated', 'harrowing', 'tonal', 'sharing', 'unemployed', 'boxy', '50th', 'liable', 'Increasing', 'cooperative', 'separable', 'germinal', 'tuneful', 'grit-impregnated', 'cometary', 'pitching', 'Waiting', 'flat-footed', 'Sighing', 'convex', 'Statistical', 'patient', 'shantung-like', 'autonomic-somatic', 'pompous', 'Using', 'actuarial', 'slowly-mending', 'flourishing', 'associate', 'compiling', 'southern', 'top-heavy', 'starboard', "callin'", 'proportionate', 'Religious', 'clarifying', 'indefatigable', 'broad', 'sticking', 'erasing', 'responding', 'incidental', 'popping', 'benighted', 'swallowing', 'incestuous', 'eight-foot', 'fluid-filled', 'unmated', 'Separating', 'interference-like', 'browning', 'crestfallen', 'offensive', 'disgusting', 'half-conscious', 'open-mouthed', 'nesting', 'Philosophic', 'Discreet', 'impudent', 'twenty-nine-foot-wide', 'quadripartite', 'insoluble', 'rectangular', 'expelling', 'squealing', 'unglued', 'delving', 'age-old', 'mealynosed', 'dour', 'butting', 'angry', 'deserving', 'finding', 'adjoining', 'lax', 'Bible-emancipated', 'dust-settling', 'knee-type', 'intra-stellar', 'aerodynamic', 'guilty', 'jeopardizing', 'inventive', 'Big', 'fool', 'provocative', "Gre't", '22-year-old', 'cheating', 'Arranging', 'flexural', 'hearty', 'full-grown', 'husky-voiced', 'shading', 'Mad', 'model', 'Coupling', 'life-like', 'untouched', 'topsy-turvy', 'agleam', 'sideways', 'daring', 'snake-like', 'time-consuming', 'unhesitant', 'junketeering', 'coal-like', 'returning', 'manning', 'suing', 'squalid', 'submissive', 'Arbitrary', 'blaring', 'rawboned', 'off-key', '7-room', 'ferocious', 'livid', 'besmirching', 'Listening', 'medical', 'milling', 'literary', '6-foot', 'venomous', 'six-foot', 'Warmongering', 'puttering', 'personal', 'Protestant', 'divers', 'blocky', 'nubile', 'vehicular', 'unanimous', 'Growing', 'adjourning', 'roundabout', 'chiding', 'fevered', 'entry-limiting', 'indestructible', 'Moral', 'mid-twentieth', 'Excellent', 'prospering', 'osmotic', 'sallow', 'horn-rimmed', 'Haitian', 'well-modulated', 'statistical', 'redemptive', 'braiding', 'hanging', 'accusing', 'salivary', 'battering', 'deep-set', 'all-married', 'dissimilar', 'paranormal', 'moon-washed', 'Important', 'emblematic', 'tawdry', 'lapsing', 'moderating', 'affluent', 'indistinct', '33d', 'dream-ridden', 'thrumming', 'renting', 'executing', 'lowdown', 'jesting', 'Greek-speaking', 'resigning', 'aseptic', 'co-educational', 'cautious', 'Multiple', 'Northern', 'brazen', 'vocal', 'down-to-earth', 'colorless', "taxpayers'", 'slashing', 'geometric', 'hating', 'humane', 'easy-to-operate', 'gynecological', 'ohmic', 'embezzling', 'lush', 'orthopedic', 'violent', 'rattling', 'hunting', 'explosive', 'ecclesiastical', 'iodinating', 'exploding', 'Chinese-Soviet', 'identifying', 'Equal', 'racial', 'courting', 'porous', 'unpatriotic', 'spacious', 'projective', 'shaving', 'Green', 'young', 'flying', 'monoclinic', 'mutual', 'Acting', 'Molten', 'net-like', 'judge-made', 'cordial', 'unknowing', 'Hostile', 'segregating', 'six-dollar', 'confiscating', 'eye-filling', 'fielding', 'demoralizing', 'blinding', 'promotional', 'assertive', 'splashing', 'interaxial', 'prepubescent', 'federal', '6-ounce', 'hell-bound', 'Channel-type', 'frost-bitten', 'breathtaking', 'sleek-headed', 'divine', 'formative', 'wedge-shaped', 'gesticulating', 'sick', 'ball-hawking', 'lively', 'eighteenth-', "year-'round", 'unmixed', 'succumbing', 'Periclean', "longshoremen's", 'attesting', 'staunch', 'thefin', 'unbounded', 'knowing', 'changing', 'electrical', 'realistic', 'harassing', 'busier', 'climbing', 'sanding', 'cerulean', 'infuriating', 'benign', 'preferable', 'long-overdue', 'drafty', 'sq.', 'Anti-recession', 'neoliberal', 'crippling', 'dry', 'progressing', 'Springing', 'titian-haired', 'abstracting', 'relational', 'snug-fitting', 'carrying', 'ambling', 'exchanging', 'pursuant', 'nilpotent', 'bursting', 'asinine', 'conquering', 'condensing', 'medium', 'terror-stricken', 'paid-for', 'half-forgotten', 'beefy', 'well-trained', 'packaging', 'deputy', 'Ionizing', 'peaceable', 'dispatching', 'drab', 'Jeffersonian', 'action-oriented', '2nd', 'druncke', 'Run-down', 'horned', 'Alternate', 'raising', 'beloved', 'fast-spreading', 'assistant', 'staggering', 'eye-deceiving', 'well-cemented', "hens'", 'recreating', 'hefty', 'acknowledging', 'ineffable', 'digestible', 'inhaling', 'editing', 'bald', 'parsimonious', 'Naval', 'emptying', 'not-less-deadly', 'Studying', 'law-unto-itself', 'field-flattening', 'South-Asian', 'chilling', 'semipublic', 'English-born', 'rushing', 'gaging', 'underdeveloped', 'tantalizing', 'jeweled', 'eluding', 'optimal', 'yellowish', 'greater', 'gaping', 'excitatory', 'twisting', "a-stoopin'", 'interdependent', 'convicting', "capitalists'", 'Physiological', 'appetizing', 'unimpeachable', 'twenty-five-dollar', 'unconventional', 'Gloomy', 'qualitative', 'nonmythological', 'pinpointing', 'natty', 'ambitious', 'Syrian', 'sales-conscious', 'non-verbal', 'veridical', 'burrowing', 'pistol-packing', 'half-witted', 'sidelong', 'non-professional', 'tugging', 'sculptural', 'filing', 'nationalistic', '162-game', 'tuning', 'Vast', 'blue-eyed', 'disliking', 'obeying', 'overlapping', 'vulnerable', 'water-soluble', 'referring', 'varying', 'three-panel', 'unmolested', 'totaling', 'scandalizing', 'euphoric', 'hydroxyl-rich', 'consuming', 'built-in', 'swirling', 'nationalist', 'attaining', 'strong', 'ultra-fast', 'inviolable', "materials'", 'lenient', 'compositional', 'darling', 'premonitory', 'accountable', 'retiring', 'unspectacular', 'rigorous', 'acoustical', 'Late', 'non-systematic', 'friendly', 'tougher', 'Caucusing', 'spare', 'active', 'Solid', 'economic', "chousin'", 'senilis', 'Saudi-American', 'half-melted', 'tangible', 'optimum', 'biographical', 'southern-central', 'unquestionable', '50-year-old', 'emergent', 'regulating', 'rear-looking', 'Floating', 'gimbaled', 'empowering', 'Colorful', 'unshed', 'coding', 'cross-licensing', 'thirty-foot', 'gay', '200-megaton', 'yielding', 'swollen-looking', 'hallucinating', 'adaptable', 'lesser', 'too-shiny', 'sixty-day', 'pro-Communist', 'gripping', 'Net', 'impatient', 'seventh', 'senior', 'all-automatic', 'jealous', 'overseas', 'anti-slavery', 'micrometeoritic', 'shaping', 'Lutheran', 'microsomal', 'beat-up', 'unjacketed', 'Fascist', 'belligerent', 'ungratified', 'tottering', 'grateful', 'giving', 'nobler', 'Complete', 'dreamless', "fightin'", 'longing', 'two-fold', 'queer', 'chasing', 'toxic', 'angelic', 'high-priced', 'planar', 'hypoactive', 'decent', 'exhorting', 'citing', 'personally-owned', 'beef-hungry', 'felicitous', 'blood-chilling', 'professional', 'sorry', 'self-ordained', 'black', 'bull-like', '200-man', 'hastening', 'One-inch', 'Aristotelian', 'Spanish', 'foreseeable', 'Spherical', 'astonishing', 'systematically-simple', 'big-boned', 'evolving', 'developmental', 'iodide-concentrating', 'embryonic', 'self-content', 'fond', 'well-brushed', 'differential', 'animate', 'catastrophic', 'nice', 'associating', 'Foreign', 'two-game', 'wainscoted', 'unidirectional', 'forceful', 'Cultural', 'Slipping', 'pretentious', 'three-inning', 'narrower', 'amateurish', 'analyzing', 'heavy-armed', 'General', 'believable', 'colonial', 'uneducated', 'hostile', 'Philco-sponsored', 'abortive', 'unredeemed', 'manipulating', 'painted-in', 'nostalgic', "traders'", 'chattering', 'netting', 'fine-featured', 'trim', 'endothelial', 'thyroid-stimulating', 'dearer', 'sweeping', "darin'", 'upcoming', 'irrespective', 'better', 'weathering', 'gesturing', 'weatherproof', 'dynamical', 'uncivil', 'sweating', 'croakin', 'unguided', 'accounting', 'susceptible', 'upgrading', 'tongue-tied', "lovers'", 'shredding', 'frenzied', 'sluicing', 'U.S.-Soviet', "others'", 'subgross', 'redirecting', 'indwelling', 'well-administered', 'god-like', 'preceding', 'Emotional', 'five-member', 'wind-swept', 'right-angled', 'loving', 'puritan', 'salty', 'state-sponsored', 'unimportant', 'reviving', 'ladylike', 'encouraging', 'devout', 'imbruing', 'fundamentalist', 'flood-lighted', 'jabbing', 'peaky', 'jerky', 'aspiring', 'nailing', 'unsloped', 'arcaded', 'white-topped', 'pseudo-glamorous', 'releasing', 'music-loving', 'conclusive', 'Leading', 'syntactical', 'tall-masted', 'well-adjusted', 'overdriving', 'ballistic', '14-power', 'charging', "speakin'", 'coating', 'stilted', 'submarine', 'more', 'Multiplying', "owners'", 'analytical', 'clasping', 'lumbar', 'knotty', 'supranational', 'unstilted', 'dyeing', 'Old', 'unperceived', 'Literary', 'effeminate', 'Outstanding', 'cumbersome', 'S-11', 'glazing', 'Siamese', 'malnourished', 'blown-up', 'burlesque', 'anorthic', 'on-sure', 'exciting', 'demonstrating', 'relativistic', 'Orphic', 'unfixed', 'two-mile', 'snooping', 'romantick', 'Squat-style', 'null', 'red-haired', 'supplementing', 'squatting', 'subtler', 'setting', 'pre-nuptial', 'out-of-state', 'possible', 'round-the-clock', 'theistic', 'cackly', 'Sizable', 'frowzy', 'full-blown', 'lexicostatistic', 'vacationing', 'murky', 'Lying', '100-megaton', 'rudderless', 'unintelligible', 'batting', 'nonsingular', 'floor-to-ceiling', 'puckish', 'Lightweight', 'Greasy', 'marring', 'starving', 'antiquarian', 'Interesting', 'Carolingian', 'high-backed', 'wide-shouldered', 'denying', 'endothermic', '7th', 'manual', 'precious', 'higher-', 'craving', 'courageous', 'semisecret', 'trade-preparatory', 'descriptive', 'assembling', 'Sighting', 'Waldensian', 'caressing', 'Citing', 'nerve-shattering', 'okay', 'bed-type', 'osseous', 'Augustan', 'coughing', 'Tudor-style', 'gerundial', 'heroic', 'faier', 'notifying', 'free-blown', 'tryin', "Contractors'", 'now-misplaced', 'deficient', 'worthless', 'Bathyran', 'seventeenth', 'Misunderstanding', 'lodging', 'transient', 'upper-middle-', 'ever-expanding', 'noticing', 'National', 'offbeat', 'northwest', 'Roman-camp', 'grave', 'custodial', 'statutory', 'defining', 'rolled-up', 'rain-slick', 'feminine', 'semi-inflated', 'avid', 'unheard-of', 'Dark', 'chewing', 'vending', 'approving', 'heavenward', 'immature', 'malleable', 'textile-exporting', 'firing', 'super-high', 'navy-blue', 'Deciding', 'lucrative', 'Hiring', 'waning', 'Part-time', 'seismological', 'votive', 'single', 'Electrical', 'marshaling', 'flagrant', 'unpicturesque', 'infrequent', 'spray-dried', 'septic', 'binuclear', "swingin'", 'Traveling', 'mouthing', 'polishing', 'Private', 'Funny', 'restorative', 'non-competitive', 'blanching', 'desynchronizing', 'Verbal', 'unheeding', 'supernatural', 'curricular', 'Byronic', 'sickish', 'kinetic', 'patriotic', "clients'", 'overall', 'slipping', 'condemnatory', 'discontinuous', 'ice-filled', 'serious-minded', 'maddening', 'easy-to-reach', 'Hawaiian', 'unnatural', 'oceanographic', 'pointing', 'freezing', 'adjusting', 'remote', 'skating', 'two-system', 'phonic', 'half-mincing', 'mononuclear', 'warty', 'Marketing', 'unenvied', 'callous', 'protein-bound', 'wearying', 'Copernican', 'Temporary', 'defending', 'Commission-controlled', 'inter-plant', 'beat', 'Sturdy', 'coincidental', 'churchgoing', 'graven', 'current', 'work-weary', 'Younger', '1/20th', 'kittenish', 'breathless', 'wide-winged', 'training', 'administering', 'crisis-to-crisis', 'three-round', 'unclear', 'dusting', 'mythic', 'syrupy', 'tall', 'respecting', 'half-starved', 'semitropical', 'quick-handling', 'ultra-liberal', 'thirty-eighth', 'dawning', 'rewriting', 'gumming', 'romping', 'sure', 'twinkling', 'lavishing', 'freedom-conscious', 'laminating', 'interpersonal', 'doleful', 'life-death', 'fucken', 'longer-lived', 'Explicit', 'nude', 'undeveloped', 'expressionistic', 'massaging', 'respiratory', 'conventional', 'unskilled', 'tenable', 'judicious', 'five-ply', 'shedding', '100-ton', 'cryptic', 'admirable', 'ego-adaptive', 'wetting', 'Cromwellian', 'riddling', 'exporting', "twins'", 'russet', 'unshelled', 'showing', 'balding', 'three-room', 'available', 'concretistic-seeming', 'indeterminate', 'darker', "shores'", 'familistical', 'commendable', 'iron', 'humanist', 'wan', 'vaccinating', 'callable', 'abler', '5-foot', 'oil-bearing', 'incessant', 'metal-cleaning', 'various', 'future-day', 'African', 'advisable', 'rainbow-hued', 'titillating', 'hand-painted', 'Interlocking', 'mosaic-like', 'nondiscriminatory', 'representative', 'non-propagandistic', 'keeping', '450-mile-long', 'midwestern', "strangers'", 'merging', 'hard-to-please', 'accruing', 'intial', 'answerable', 'Aristotelean-Thomistic', 'Primary', 'Inheriting', 'Unwholesome', 'noisy', 'exercising', 'convenient', 'lovin', 'questionable', 'patting', 'efficacious', 'Replacing', 'scowling', 'temperate', 'Gaunt', 'barbaric', 'diaphanous', 'telling', 'head-in-the-clouds', 'canting', 'coiling', 'More', 'trichloroacetic', 'charcoal-broiled', 'assuring', 'colloquial', 'south-eastern', 'ghostlike', 'fulfilling', 'Damp', 'gainful', '19th', 'animal-like', 'thumbing', '8th', 'D.O.A.', 'marital', 'heterogeneous', 'heat-absorbing', 'debilitating', 'paramilitary', 'thriving', 'unconvincing', 'unrestricted', 'probing', 'sherbet-colored', 'officious', 'sickly-tolerant', 'Competitive', 'not-yet-married', 'cooperating', 'dwelling', 'two-bedroom', 'colicky', 'feeling', 'invigorating', 'Ashamed', 'unmanageable', 'cut-to-a-familiar-pattern', 'all-pervading', '64-cent', 'inundating', 'slanting', 'lanky', 'swingy', 'alike', 'disking', 'inexplicable', 'impervious', 'muscle-shaping', 'Lebanese', 'Pressure-happy', 'Relevant', 'massive', 'unnerving', 'Fresh', 'articulate', 'slow-firing', 'unfolding', 'sewing', 'Formosan', 'Analytical', "redeemin'", 'male', 'tacit', 'liberal-led', 'Unoccupied', 'galvanic', 'Capellan', 'sarcastic', 'tasty', 'selfish', 'three-wood', '56-yard', 'terse', 'Interim', 'tenting', 'melodious', 'rackety', 'twin', 'hyperfine', 'wasting', 'hard-hit', 'ruddy', 'expediting', 'admitting', 'proportional', 'capital', 'half-hearted', 'Eliminating', 'Absent-minded', 'intermittent', 'southeastern', 'hogging', 'uncomfortable', 'fitful', '2-run', 'vague', 'one-time', 'ceramic', 'flimsy', 'erect', 'scientific', 'impromptu', 'sunny', 'square-built', 'fine-looking', '70-year-old', 'hind', 'pulse-timing', 'Travelling', 'reliable', 'magical', 'tagging', 'frizzling', 'opposite', 'grazing', 'delighting', 'mettlesome', 'grizzled', 'instituting', 'bargaining', 'countrywide', 'uninominal', 'jiggling', 'grey-skied', 'stumpy', 'disastrous', 'sales-building', 'high-positive', 'bumping', 'Systemic', 'marvelous', 'swart', 'rose', 'viable', 'parochial', 'subcontracting', 'consoling', 'combat-inflicted', 'light', 'prolific', 'Long', 'investigative', "buildin'", 'Hydraulic', 'intimating', 'Wilsonian', 'inaccessible', 'craven', 'divisible', 'auditioning', "people's", 'drizzly', 'virulent', 'manure-scented', 'consisting', 'manic', 'Closer', 'Land-based', 'receiving', 'auxiliary', 'indulgent', 'traversing', 'little', 'anti-Rh', 'intractable', 'Necessary', 'equivocal', 'wont', 'Various', 'oblique', 'easygoing', 'unrecoverable', 'fuzzy', 'thorny', 'drugging', 'lucid', 'family-oriented', 'scot-free', 'buttery', 'Rich', 'moistening', 'sailorly', 'gentlemanly', 'penal', 'rubber-like', 'integrative', '5-mile', 'wry-faced', 'Despising', 'prepupal', 'foreign', 'dreadful', 'fast-closing', 'totemic', 'foaming', 'mustering', 'unclouded', 'rangy', 'boarding', 'rose-pink', 'slackening', 'curbside', 'soldering', 'genetic', 'governing', 'haunting', 'rehabilitating', 'jotting', 'prayerful', "leavin'", 'cracking', 'coexistent', "producers'", 'chugging', 'mortaring', 'thoughtful', 'vacant', 'backwater', 'psychiatric', 'blue-collar', 'ravenous', 'self-styled', 'reticulate', 'maladaptive', 'eight-week', 'razor-sharp', 'assessing', 'hatted', 'gassing', 'draughty', 'whizzing', 'general-purpose', 'obsequious', 'sinful', 'hemispherical', 'picturesque', 'revelatory', 'undependable', 'primary', 'attacking', 'evil', 'self-seeking', 'planoconcave', 'satisfactory', 'snug', 'Toying', 'taxable', 'shifting', 'undermining', 'best-selling', 'meaningful', 'implementing', 'heterogamous', 'manifesting', '5-game', 'healthy', 'light-hearted', 'orthodox', "drawin'", 'dimly-outlined', 'bantering', 'privileged', 'drumming', 'treble', 'glimmering', 'indicating', 'lawful', 'forlorn', 'water-filled', 'finer', 'Changing', 'sparing', 'Typical', 'cultural', 'all-over', 'zooming', 'blooming', 'co-occurring', 'ionizing', 'chaffing', 'luring', 'Viennese', 'Nearing', 'intuitive', 'jewelled', 'Bathing', 'unsmiling', 'certain', 'amiable', 'iron-shod', '11-year-old', 'aflame', 'limp', 'skirmishing', 'sneaky', 'probabilistic', 'Political', 'nine-state', 'exacting', 'uptown', 'vibrionic', 'fake', 'upward-mobile', 'nut-like', 'paleocortical', 'viewless', 'dark', 'antithetical', 'full-year', 'luminescent', 'haphazard', 'fit', 'longsuffering', 'flush', 'out-moded', 'indiscriminating', 'enigmatic', "soloists'", 'square', 'laborious', 'nominating', 'twenty-five-year-old', 'consenting', 'irate', 'materialistic', 'Aging', 'conversational', 'brown-edged', 'electronic', 'deterministic', 'rockbound', 'tomblike', 'descending', 'costive', '2-hour-and-27-minute', 'insidious', 'ragging', 'shuddering', 'motional', 'indispensable', '60-inch', 'smoking', 'programing', 'semi-independent', 'telephoning', 'Ptolemaic', 'jumpy', 'telegraphic', 'swamping', 'tax-aided', "steelmakers'", 'year-long', 'avaliable', 'Ciceronian', 'wallowing', 'worshiping', 'unilateral', 'perverse', 'near-at-hand', 'Attending', 'angular', 'strenuous', 'equipotent', 'eclectic', 'poignant', 'pre-eminent', 'phosphorescent', 'psychopharmacological', 'Shorter', 'prodigal', 'flashy', 'builder/active', 'realigning', 'invitational', 'preaching', 'ripping', 'all-American-boy', 'teen-age', 'out-of-school', 'scalding', 'incalculable', 'lordly', 'compulsive', 'unattached', 'seeping', 'non-profit', 'fallow', 'Jansenist', 'liturgical', 'unfelt', 'Outside', 'nutritive', 'affording', 'rowdy', 'waxy', 'unachieved', 'Cynical', 'unforgivable', 'unchanging', 'drying', 'infinitesimal', 'recent', 'case-to-case', 'mammoth', 'gas-fired', 'forecasting', 'quasi-mechanistic', 'flippant', 'secular', 'stagnant', 'worthwhile', 'Fourth', 'bureaucratic', 'different-color', 'sub-surface', 'compelling', 'padding', 'washed-out', 'contraceptive', 'yeller', 'antithyroid', 'prolonging', 'succeeding', 'ephemeral', 'deep-eyed', 'juridical', 'high-stepped', 'frictional', 'undemocratic', 'editorial', 'diehard', 'Faulknerian', 'Parisian', 'operational', 'takin', 'munching', 'European', 'arrogant', 'interested', 'preponderating', 'upstream', 'special', 'bewhiskered', 'leasing', 'molal', 'lying', 'vigilant', 'hulking', 'paradoxical', 'foreseen', 'Beaming', 'introductory', 'outputting', 'Hard-surface', 'delicate-beyond-description', 'virile', 'atheromatous', 'Watching', 'bravest-feathered', 'fictional', 'Intangible', 'reconditioning', 'ponderous', 'memorial', 'obsoleting', 'unfertile', 'stylistic', 'manufacturing', 'incomprehensible', 'serological', 'fleeing', 'hand-woven', 'piezoelectric', 'beheading', 'erotic', 'unclasping', "playin'", 'neurological', 'dusky', 'indebted', "bushwhackin'", 'rateable', 'Reluctant', 'spatial', 'profit-motivated', 'morocco-bound', 'eared', 'vindictive', 'classless', 'lazy', 'divergent', 'jittery', 'spineless', 'Nice', 'one-man', 'sterilizing', 'numbing', 'browny', 'silicate', 'turning', 'Like', 'ample', 'too-hearty', 'oaken', 'cosmical', 'necessary', 'nonexistent', 'wall-stabilized', 'large', 'opalescent', 'advising', 'blood-stained', 'politic', 'thirty-fourth', 'sensitive', 'tariff-free', 'Soignee', 'salvaging', 'Recent', 'slender-waisted', 'substitute', 'silencing', 'polyether-type', 'Visual', 'somersaulting', 'emphasizing', 'once-popular', 'nine-year', 'justifying', 'gardening', 'uncommunicative', 'six-inch', 'well-ruled', 'postponing', 'intelligible', 'antitrust', 'Major', 'unconstitutional', 'civilian', 'morphological', 'debuting', "peggin'", 'liberal-conservative', 'nice-looking', 'ridiculous', 'lumpish', 'neocortical-hypothalamic', 'morning-frightened', 'Soviet-Western', 'Shortening', 'insatiable', 'semidrying', 'reopening', 'whitening', 'miserable', 'univalent', 'murderous', 'appalling', 'chromium-substituted', 'pithy', 'pliable', 'conveying', 'irrigating', 'soft-headed', 'obscure', 'unfettered', 'reminding', 'hand-to-hand', 'nine-to-five', 'hydrophilic', 'unrifled', 'Dutch', 'Anglo-Saxon', 'Trichrome', 'photosensitive', 'cement-and-glass', 'care-free', 'remorseless', 'temporal', 'chromatic', "dryin'", 'unlocking', 'screaming', 'lustful', 'Technical', '52-year-old', 'six-man', 'resounding', 'wanting-to-be-alone', 'muddy', 'sprouting', 'soapy', 'pioneering', 'oath-taking', 'collapsible', 'preliterate', 'suspecting', 'Anticipating', 'anatomical', 'pulmonary', 'drive-yourself', 'constituting', 'Basic', 'resinlike', 'delegating', 'undifferentiated', 'mailed-fist-in-velvet-glove', 'subversive', 'Vigorous', 'slow-baked', 'Filipino', 'Spraying', 'cowardly', "Today's", 'image-provoking', 'claiming', 'metropolitan', 'irresistible', 'upholding', 'roaring', 'beguiling', 'unnumbered', 'carping', 'newly-emerging', 'cloudless']
-names=['installment', 'collie', 'poison', 'thwart', 'Grocery', 'relocation', 'imperative', 'investigator', 'fishing', 'soutane', 'antagonist', 'wake', 'greatness', 'pastime', 'metal-hydrido', 'coffee', 'detention', 'manure', 'scuffle', 'Graph', 'handkerchief', 'wing', 'horseback', 'ablation', 'glare', 'caterpillar', 'national', 'vice-president', 'amazement', 'dumbbell', 'eyepiece', 'firebug', 'pocket', 'B', 'deadweight', 'tab-lifter', 'mania', 'duct', 'belting', 'stump', 'while', 'anchoritism', 'hearing', 'ruckus', 'incantation', 'drummer', 'guilt', 'whit', 'epicure', 'objectivity', 'solder', 'revolt', 'Winter', 'tenancy', 'foothill', 'abstract', 'follower', 'cervelat', 'joy', 'velour', 'mackerel', 'creation', 'systemization', 'livestock', '**yb', 'armor', 'canvass', 'rarity', 'theorem', 'Section', 'aspect', 'coop', 'logging', 'holocaust', 'aggressiveness', 'Mouse', 'music', 'taste', 'organist', 'pen', 'informant', 'boat-yard', 'diagram', 'jersey', 'pleader', 'citizenry', 'RDW', 'proverb', 'gasket', 'geneticist', 'everywhere', 'vernacular', 'biz', 'theology', 'fork-lift', 'enigma', 'technology', 'bargain', 'switchboard', 'blacking', 'farce', 'thigh-bone', 'penchant', 'inevitability', '15%', 'interference', 'tower', 'duress', 'Yankee-hatred', 'bitch', 'filagree', 'dockside', 'cornmeal', 'combination', 'zeal', 'Sickness', 'measure', 'creator', 'Belt', 'tank', 'spring', 'dialect', 'hop', 'chow', 'apartment', 'microphoning', 'calfskin', 'runaway', 'happenstance', 'Class', 'assertion', 'lamp', 'ballet', 'zinc', 'debate', 'ex-convict', 'meat-wagon', 'campaigning', 'Beer', 'reorganization', 'grandeur', 'ESN', 'incorruptibility', 'razorback', 'bran', 'Sister', 'harbor', 'curry', 'ice-chest', 'dish', 'leaf', 'lumen/watt', 'rapprochement', 'solicitor', 'rightness', 'tact', 'self-satisfaction', 'play-off', 'hypocellularity', 'generation', 'major-market', 'influx', 'object', 'oblige', 'rebuttal', 'shopper', 'project', 'doctorate', 'dinghy', 'shortcut', 'multifigure', 'domesticity', 'musical', 'variable', 'agriculture', 'quatrain', 'Methyl', 'frontage', 'zoology', 'codfish', 'bellyfull', 'Liter', 'sloe', 'slyness', 'Aj', 'fennel', 'source', 'ancestry', 'entrepreneur', 'genus', 'lamplight', 'anti-Semitism', 'lyricism', 'USIS', 'flathead', 'noradrenalin', 'upheaval', 'orbit', 'sweet-clover', 'efficiency', 'air-conditioning', 'kindliness', 'cap', 'bastard', 'phantom', 'sawing', 'plaintiff', 'cocoa', 'classification-angle', 'Inside', 'dross', 'end', 'populace', 'decree', 'non-nonsense', 'curve', 'private-school', 'Chromium', 'supervision', 'glitter', 'cease-fire', 'bourgeois', 'Bologna', 'remembrance', 'alto', 'triangle', 'colloquy', 'escape', 'outbreak', 'hall', '2.295%', 'builder', 'holding', 'self-mastery', 'prepayment', 'gyro', 'upper-class', 'dilatation', 'prominence', 'derivation', 'superintendent', 'aisle', 'confidante', 'gunplay', 'permission', 'outline', "rustlin'", 'petroleum', 'right-hand', 'physics', 'reliving', 'rococo', 'ingenuity', 'hovel', 'carpentry', 'maw', 'rich', 'interviewer', 'shear', 'longhorn', 'argon', 'springtime', 'uranium', 'half-sister', 'bricklaying', 'accreditation', 'd-c', 'lingo', 'diversion', 'Neighbor', 'yearbook', 'spiral', 'draw', 'spate', 'insouciance', 'firepower', 'ballast', 'midstream', 'Morning', 'deathbed', 'baritone', 'secretary', 'barkeep', "l'", 'potboiler', 'decorator', 'limbo', 'building', 'combustion', '27-in.', 'metamorphosis', 'cubbyhole', 'extension', 'Sanitation', 'High-tension', 'badge', 'cousin-wife', 'actor', 'decision', 'hairpin', 'gallows', 'consequence', 'Appointment', 'dismay', 'schoolmate', 'void', 'corner-', 'cape', 'vacuolization', 'postscript', 'chumminess', 'retaliation', 'torment', 'monopolization', 'Exchange', 'caller', 'flutter', 'linoleum', 'feller', 'neo-dadaist', 'trilogy', 'tedium', '7%', 'weasel', 'poark', 'HBO', 'repainting', 'payday', 'sound-truck', 'company', 'idealism', 'watch', 'consulate', 'senate', 'AB', 'loft', 'judgment', 'planking', 'scarf', '3,000-foot', 'trot', 'arsenal', 'parallelism', 'pay', 'footpath', '**ye', 'default', 'pound-of-flesh', 'wrought-iron', 'treasurer', 'thermostat', 'insecticide', 'Y-Teen', 'embankment', 'zipper', "tailin'", 'rubric', 'radicalism', 'Co-optation', 'disharmony', 'insistence', 'pantomime', 'pigment', 'neocortex', 'dishonesty', 'glissade', 'verandah', 'closure', 'good-by', 'artist-nature', 'voluntary-control', 'preface', 'first-place', 'transit', 'medication', 'germ', 'stockholder', 'furor', 'shipmate', 'Ignorance', 'membership', 'division', 'insularity', 'Spirit', 'mV', 'interviewee', 'bliss', 'chaise', 'diction', 'sonny', 'laity', 'inactivation', 'hurricane', 'one-color', 'grassland', 'LITORIGIN', 'middle-age', 'fulfillment', 'overcast', 'propagandist', 'dilemma', 'self', "dry-gulchin'", 'ordinance', "countin'", 'headboard', 'gold', 'slogan', 'racing', 'intolerance', 'irritability', 'frosting', 'self-destruction', 'betrayer', 'gusher', 'violence', 'Father', 'snapback', 'thousand-fold', 'triple-crown', 'throw-rug', 'emotionalism', 'upbringing', 'dilution', 'despot', 'butter', 'anthology', 'airstrip', 'coiffure', 'travelogue', 'Lightning', 'paw', 'wage-price', 'Extrapolation', 'television', 'pouch', 'soft-shell', 'swing', 'hen', 'TSH', 'vitro', 'lighting', 'filly', 'breakfast', 'battlefront', 'indefinity', 'tableau', 'compliance', 'slide-lock', 'flail', 'riboflavin', 'vertical-takeoff-and-landing', 'abandon', 'standstill', 'shooting', 'restoring', 'inaugural', 'livery', 'serial', 'B-52', 'squire', 'coloring', 'solitude', 'tilt-top', 'letterman', 'arabesque', 'drilling', 'addition', 'kerosene', 'dun', 'finger-sucking', 'ice', 'abode', 'BOD/day/acre', 'Oyster', 'stamp', 'comma', 'barnyard', 'talker', 'cripple', 'endeavor', 'feare', 'b', 'typography', 'tornado', 'borrower', 'lethality', 'cockpit', 'paint', 'pig', 'gastrocnemius', 'Radiation', 'raft', 'assumption', 'wedlock', 'a.', 'scrubbing', 'WWRL', "no-man's-land", 'pinball', 'worthlessness', 'water-washed', 'pane', 'sarcasm', 'Baseball', 'currency', 'bolster', 'gambit', 'horseman', 'limelight', 'self-deprecation', 'timetable', 'evangelism', 'perimeter', 'freeze', 'seahorse', 'pressed-paper', 'wave-particle', 'stair', 'catalyst', 'marathon', 'good-news', 'outrigger', 'perspective', 'war', 'Family', 'naming', 'questioning', 'soy', 'encounter', 'high-end', 'trimester', 'blood-kinship', 'transparency', 'butterfly', 'anguish', 'contractor', 'last-minute', 'policeman-murderer', 'fame', 'heroine', 'plateau', 'sealing', 'luxury', 'score', 'porridge', 'astronaut', 'soybean', 'ill', 'jar', 'brindle', 'ml.', 'pattern', 'symbolism', 'audio', 'cargo', 'ration', 'saving', 'aplomb', 'day-watch', 'superstition', 'long-run', 'inadvertence', 'significance', 'action', 'House', 'Paperweight', 'spoon', 'climb', 'pendulum', 'faery', 'faro', 'mayor', 'auto-limitation', 'Foliage', 'bongo', 'emigration', '6%', 'self-image', 'wrapping', 'cork', 'medal', 'gathering-in', 'mph', 'showdown', 'brace', 'purification', 'Y-region', 'DA', 'trooper', 'expressway', 'limb', 'birdbath', 'SR', 'cliche', 'provocation', 'lavatory', 'divinity', 'humanity', 'declarative', 'stadium', 'marble', 'pulsation', 'tart', 'hot-water', 'Food', 'bedroom', 'volume', 'house-building', 'hurry', 'larder', 'smoke', 'bride-gift', 'impresser', 'dud', 'senator', 'suffrage', 'ground', 'pencil-and-sepia', 'record', 'daytime', 'subaltern', 'variance', 'Feedback', 'tempera', 'humming', 'comedian', 'bile', 'sip', 'broadening', 'salute', 'bunter', 'mirth', 'bait', 'duck', 'prescription', 'pedestal', 'libretto', 'fertilizer', 'minuet', 'assiduity', 'spade', 'overflow', 'cinch', 'Confusion', 'photoluminescence', 'lemon-meringue', 'solvent', 'cathedral', 'determination', 'approximation', 'adversity', 'encyclopedia', 'Metaphysics', 'harvesting', 'mutual-aid', 'turn-out', 'politico', 'excitement', "pushin'", 'resume', 'knackwurst', 'pseudo-patriotism', 'holdup', 'square-mile', 'pallor', 'burden', 'lift', 'automatic', 'postcard', 'madness', 'evocation', 'gun-shot', 'obsidian', 'phthalate', 'tragedy', 'Strength', 'protege', 'homemaker', 'grille', 'profet', 'coolant', 'suey', 'peace', 'offspring', 'extraneousness', 'nurture', 'purchase', 'long-time', 'Mileage', '30%', 'range', 'resolve', 'accordance', 'punditry', 'cosec', '1-1/2-story', 'punctuation', 'curd', 'multiversity', 'starting', 'pique', 'charge', 'agency', 'interpretation', 'stony-meteorite', 'maniac', 'plum', 'miscegenation', 'starlet', 'lard', 'lecher', 'veal', 'Woe', 'psychotherapy', 'It-wit', 'discretion', 'alternative', 'four-wheel-drive', 'split-bamboo', 'serenity', 'paramagnet', 'soldiery', '8-mm', 'footwear', 'tub', 'Chapel', 'fisherman', 'Mrs', 'preacher-singer', 'abduction', 'fractionation', 'one-plane', 'hoop', 'Substance', 'suffocating', 'machinery', 'abolitionist', 'evacuation', 'smokescreen', 'opportunism', 'scrape', 'bibliography', 'motherhood', 'patriarchy', 'life', 'switch', 'gourmet', 'functionary', 'electrophorus', 'ratio', 'front-page', 'DU', 'novel', 'culture', 'maleness', 'low-budget', 'gyration', 'plunder', 'Success', 'Z', 'lockup', 'enchantment', 'cafe', 'quietness', 'brand', 'Theocracy', 'obverse', 'omen', 'fifteenth-century', 'herringbone', 'enslaving', '**yr', 'Adoption', 'tenant', 'miracle', 'briefcase', 'form-dictionary', 'rhetoric', 'rate', 'means', 'predicament', 'ecliptic', 'instant', 'trigger', 'Destroyer', 'chestnut', 'believer', 'poet-painter', 'walkout', 'police-dodging', 'centimeter', 'wakefulness', 'protocol', 'Wage-price', 'first-order', 'chaperon', 'indolence', 'prophecy', 'saint', 'sustenance', 'ethicist', 'smoothbore', 'cooperation', 'underbracing', 'ballroom', 'towne', 'possessive', 'predisposition', 'genesis', 'pitchfork', 'signpost', 'quartz', 'buying', 'materialism', 'gourd', 'malnutrition', 'high-value', 'apparatus', 'intellectuality', 'Coroner', 'gun-slinger', 'rewrite', "10''", 'engraver', 'IND', 'chignon', 'apron', 'US', 'Death', 'kicking', 'beriberi', 'drug', 'similarity', 'vitriol', 'replenishment', 'arousal', 'consent', 'second-order', 'pill', 'mantlepiece', 'electorate', 'commission', 'Extension', 'perusal', 'beginning', 'imperfection', 'near-Balkanization', 'buff', 'tsunami', 'boiler', 'rookie', 'parlor', 'insight', 'maneuverability', 'soul', 'typhus', 'enervation', 'boundary', 'citron', 'wart-hog', 'sickroom', 'toxin', 'celery', 'specimentalia', 'accord', 'shaking', 'irony', 'clearing', 'vehemence', 'system', 'hare', 'well-wishing', 'convalescence', 'helium-4', 'steam', 'dame', 'hibachi', 'minority', 'collective', 'distaste', 'leash', 'Discourse', 'guinea', 'generosity', 'payment', 'prohibiton', 'enterotoxemia', 'duke', 'suite', 'aryl', 'facsiport', 'compartment', 'Exposure', 'Rodent', 'lifeboat', 'roach', 'veneer', 'cheesecloth', 'autoloader', 'floc', 'unnaturalness', 'bedstraw', 'planetarium', 'pickup', 'sprawl', 'namesake', 'enjoyment', 'aviation', 'terry-cloth', 'craze', 'gunslinger', 'gunner', 'stride', '1-ton', 'quirk', 'theft', 'thatched-roof', "RCA-Victor's", 'quarterback', 'realism', 'handling', 'outpatient', 'mediocrity', 'nudge', 'USP', 'benefactor', 'immodesty', 'comeback', 'birthday', 'pencil-pusher', 'contentment', 'lunation', 'morning', 'character-education', 'smirk', 'gardenia', 'teenager', 'wiring', 'crate', 'fluidity', 'mausoleum', 'puzzle', 'clash', 'indictment', 'header', 'syndicate', 'chancellor', 'laundering', 'Alloy', 'loyalty', 'fantasist', 'rectifier', '27%', "TCU's", 'ticket', 'double-meaning', 'amethystine', 'nuisance', 'writing', 'acquisitiveness', 'Evangelism', 'inwardness', 'whiff', 'waterline', 'lodge', 'run-up', 'spin', 'non-farm', 'feedback', 'acid', 'yielding-Mediterranian-woman-', "devil's-food", 'roleplaying', 'jolt', 'steam-generation', '$1.00', 'Palm', 'ski', 'insubordination', 'Life', 'checklist', 'rock-and-roll', 'gage', 'undertaking', 'nun', 'argumentation', 'core-jacket', 'monologue', 'Accident', 'basketball', 'buss', 'toll-road', 'startled-horse', 'screech', 'experience', 'movie', 'hardship', 'Livery', 'suppleness', 'criticism', 'tissue', 'hygiene', 'research-staff', 'talent', 'blank', 'cause', 'maiestie', 'second-half', 'patriot', 'Commodity', 'chunk', 'badminton', 'scene', 'embryo', 'fervor', 'Chin', 'activity', 'seamanship', 'place-name', 'heaven', 'kilometer', 'diabetes', 'label', 'retail', 'differentiation', 'athlete', 'bracket', 'Friend', 'fugitive', 'putout', 'receipt', 'diversity', 'endowment', 'calibre', 'throttle', 'infraction', 'convenience', 'growing', 'tentacle', 'patio', 'ecumenist', 'mother-in-law', 'hookworm', 'spot-news', 'night-coach', 'rider', 'report', 'infiltration', 'escapade', 'swearinge', 'warning', 'story', 'acceptance', 'man', 'dispatch', 'secretary-treasurer', 'rue', 'in-person', 'maple', 'author', 'bloc', 'thwump', 'seismograph', 'medicine', 'incapacity', 'rally', 'authority', 'probability', 'game-management', 'elegy', 'golf', 'composing', 'Chance', 'boy-name', 'polymerization', 'granting', 'acrobatics', 'parent', 'prize-fight', 'time-temperature', 'Production', 'basement', 'innovation', 'snuffer', 'mess', 'Center', 'trial-book', 'sleet', 'elephant', 'dressing', 'ideologist', 'release', 'initiator', 'zombie', 'julep', 'textbook', 'ml', 'humanitarian', 'Geology', 'colossus', 'yield', 'caviar', 'roast', 'utterance', 'dower', 'regret', 'mild-winter', 'calorimeter', 'quantum', 'membrane', 'wedge', 'fade', 'diffrunce', 'apathy', 'rooftree', 'future', 'modality', 'glimmer', 'decedent', 'arbiter', 'Boatel', 'parting', 'sedimentation', 'parquet', 'necessity', 'iodide', 'vibrancy', 'Mathematics', 'tabulation', 'tool-kit', 'notch', 'sap', 'waltz', 'once-over', 'friendship', 'suitcase', 'Leg', 'cinema', 'reapportionment', 'bid', 'celebration', 'x', 'half-gourd', 'borrowing', 'precondition', 'gamble', 'rough-housing', 'wildcatter', 'Progress', 'contradistinction', 'subjectivist', 'riot', 'croaking', 'polka', 'widow', 'claustrophobia', 'personage', 'boating', 'heptachlor', 'collage', 'meter', 'fumed-oak', 'virus', 'index', 'girth', 'bacon', 'washbasin', 'celerity', 'liberality', 'mercy', 'china', 'beau', 'coccidiosis', 'salutation', 'commodity', 'discourse', 'excavation', 'hothouse', 'cosmopolitanism', 'jewel', 'foundation', 'question', 'second-look', 'friction', 'relaxation', 'f', 'amplification', 'neurotic', 'match-width', 'kebob', 'self-completion', 'melon', 'gyro-platform-servo', 'bridgehead', 'contretemps', 'presenter', 'breakoff', 'omission', 'benediction', 'dumping', 'resort', 'introspection', 'sanitarium', 'denouement', 'Monogamy', 'Critic', 'telegraph', 'agreeableness', 'thud', 'corpuscular-radiation', 'mule', 'prime', 'coronary', 'spectacle', 'metrazol', 'convening', 'Water', 'cortege', 'sociology', '24-year-old', 'plush', 'intersection', 'sky', 'refurbishing', 'subordinate', 'U', 'brockle', 'creche', 'surface-analyzer', 'bumblebee', 'bureaucrat', 'hall-mark', 'ASW', 'loose-leaf', 'alien', 'rummy', 'phrase', 'gasser', 'tavern', 'pain', 'programmer', 'directivity', 'alderman', 'artery-pulmonary', 'hammer', 'anaplasmosis', 'majesty', 'goose', 'document', '84-foot', 'highball', 'Suspicion', 'Butter', 'assailant', 'stupidity', 'hands-off-all-sweets', 'home-office', 'neglect', 'Maintenance', 'Metabolite', 'policy', 'church-state', 'city-trading', 'cancer', 'migration', 'balcony', 'discomfort', 'depravity', 'torpedo', 'cave', 'ache', 'clove', 'deltoid', 'electrodynamics', 'Jazz', 'recluse', 'color-TV', 'fragmentation', 'morphophonemics', 'yank', 'handclasp', 'tear', 'carcass', 'scanning', 'slaughter', 'hyaline', 'column', 'masking', 'blueprint', 'pip', 'B-52s', 'lag', 'dill', 'middle', 'incentive', 'ellipsoid', 'social-register', 'mildew', 'acrylic', 'slugger', 'collaboration', 'mile', 'indoctrinating', 'indifference', 'individual', 'demage', 'Heart', 'LP', 'inspection', 'embouchure', 'alphabet', 'solo', 'guerrilla', 'callousness', 'remainder', 'salesmanship', 'river', 'smog', 'mantrap', 'quackery', 'accenting', 'crouch', 'skullcap', 'idiom', 'goal', 'Opportunity', 'cornerstone', 'Lack', 'rasp', 'Radiosterilization', 'leapfrog', 'spittle', 'bouquet', 'poultice', 'Locker-room', 'neo-stagnationist', 'redwood', 'outfit', 'Tobacco', 'speak-easy', 'repertory', 'toy', 'over-simplification', 'woodland', 'late-summer', 'colon', 'surcease', 'punctuality', 'searchlight', 'detail', 'clicking', 'School', 'central-city', 'eave', 'muttering', 'productivity-share', 'aircraft', 'lawman', 'deliverance', 'Implementation', 'atom', 'Unanimity', 'imposition', 'gradient', 'dollar-sign', 'role', 'unction', 'futility', 'salve', 'inflection', 'long-endurance', 'stipulation', 'cast', 'pollution', 'puncher', 'NS', 'rancho', 'agility', 'site', 'community', 'inflow', 'robe', 'bustle', 'lob-scuse', 'caste', 'evangelist', 'genius', 'DEAE-cellulose-treated', 'eyewitness', 'mg', 'stimulation', 'journalist', 'contempt', 'countenance', 'plan', 'non-service', 'chaperone', 'ingestion', 'powder', 'bar', 'statuette', 'foreleg', 'standby', 'nonsense', 'snail', 'newspaperman', 'transom', "what's-his-name", 'ownership', 'signing', 'barium', 'news', 'jigger', 'systematization', 'Hush', 'low-foam', 'gully', 'collagen', 'stone', 'package', 'scherzo', 'areosol', 'bus', 'compulsion', 'target-language', 'posture', 'concurrence', 'sorrel', 'gab', 'beckoning', 'colonialism', 'decking', 'owl', 'stagecoach', 'cynicism', 'speech-making', 'locality', 'sandwich', 'incidence', 'reconciliation', 'understructure', 'woman', 'snapping', 'invulnerability', 'demon', 'misconception', 'peroxide', 'solution', 'granite', 'exile', 'CTA', 'nitrogen', 'cast-iron', 'imagery', 'Shipbuilding', 'Violence', 'geometry', 'poor-white-trash', 'groove', 'hierarchy', 'SWC', 'mailing', 'View', 'shockwave', 'amount', 'grassfire', 'indefiniteness', 'thermoplastic', 'championship', 'nuclide', 'cholelithiasis', 'Serenity', 'novice', 'pimp', 'a', 'law-breaking', 'medley', 'Mold', 'navigator', 'scoring', 'Plot', 'calm', '11%', 'program', 'graveyard', 'lunch', 'Freedom', 'gauntlet', 'Human', 'committeewoman', 'non-party', 'History', 'longshot', 'checkbook', 'DRDW', 'adjustment', 'storeroom', 'boxer', 'Zinc', 'communicating', 'homeland', 'debut', 'birthcontrol', 'belligerence', 'virtuosity', 'psycho-physiology', 'chamois', 'step-cone', 'spectator', 'kelp', 'linkage', 'mono-iodotyrosine', 'higher-density', 'mosque', 'fraternisation', 'bracelet', 'Insurance', 'understatement', 'newsman', 'adage', 'sweetheart', 'WLIB', 'low-cost', 'battalion', 'credulity', 'lulu', '64%', 'sciatica', 'shrine', 'sister', 'surgery', 'pint', 'mechanization', 'publication', 'superiority', 'detective', 'necrosis', 'noontime', '0.85%', '19th-century', 'pike', 'platinum', 'policing', 'strophe', 'ugliness', 'blot-appearance', 'feature', 'compression', 'rattle', 'dell', 'impairment', 'half-hour', 'princesse', 'feast', 'subsoil', 'runabout', 'ferocity', 'resurgence', 'handstand', 'historian', 'Y', 'troup', 'triservice', 'eligibility', 'topgallant', 'snort', 'mistaking', 'O', 'female', 'fogy', 'catcher', 'intellect', 'oracle', 'AID', 'Pond', 'protest', 'coordinator', 'hash', 'politician', '3MM', 'lip', 'troop', 'malice', 'shank', 'documentation', 'graham', 'buildup', 'ground-truck', 'differentiability', 'privacy', 'lymph', 'thermocouple', 'circumcision', 'clincher', 'leaguer', 'undercurrent', 'COAHR', 'unfrocking', 'impotence', 'redneck', 'know', 'half-light', 'NAHB', 'junta', 'incompetence', 'zone', 'store', 'hobo', 'underworld', 'sifting', 'Shape', 'bending', 'galvanism', 'peg', 'Arrack', 'old-timer', 'stationmaster', 'ambulance', 'marine', 'foray', 'overhead', 'hostility', 'volley', 'designer', 'tee', 'whole', 'JEDEC', 'lure', '24-hour-day', 'innocence', 'flange', 'down', 'major', 'dependence', 'ranking', 'FBI', 'concession', 'not-knowing', 'bailing', 'impress', 'skyline', 'health', 'sculpture', 'store-front', 'cartridge', 'ceremony', 'observation', 'alloy', 'skull', 'IOCSIXF', 'regime', 'treaty-making', 'unity', 'light-duty', 'representation', 'blood', 'serloin', 'prelude', 'pansy', '35%', 'toleration', 'nest', 'Triamcinolone', 'Reflex', 'pantheist', '1-degree', 'vet', 'Pitch', 'survival', 'caramel', 'longrun', 'cabbage', 'headsman', 'casein', 'podium', 'cobalt', 'shred', 'electric-utility', 'safety', 'contingent-fee', 'bludgeon', 'guidebook', 'blastdown', 'mid-range', 'OME', 'stroking', 'independence', 'Boat', 'mucilage', 'mosaic', 'earl', 'retirement', 'depth', 'ailment', 'Response', 'one-iron', 'teen', 'performance-capacity', 'death-trap', 'mannequin', 'kedgeree', 'hydrogen', 'sling', 'colony', 'autofluorescence', 'kiosk', 'soup', 'Oilcloth', 'polonaise', 're-enactment', 'luck', 'RDF', 'chromatography', 'hitch', 'bowstring', 'cashmere', 'express', 'well', 'u', 'oyster', 'single-barrel', 'trapezoid', 'nose', 'subcommittee', "SR's", 'putter', 'ribcage', 'outpouring', 'selfishness', 'buyer', 'dia.', 'pedestrian', 'cab', 'impressionist', 'UK', 'mm.', 'layer', 'vessel', 'Industry', 'drafting', 'vuhranduh', 'sourdough', 'sort', 'hindsight', 'MS', '1-hp', 'magnolia', 'torture', 'yolk', 'elan', 'suck', 'soubriquet', 'track-signal', 'floorshow', 'R-Bergen', 'arthritis', 'epicycle', 'log', 'incident', 'Surface', 'invigoration', 'bastion', 'plaid', 'tax-freedom', 'drop-block', 'parliament', 'negative', 'monstrosity', 'contingency', 'neighbor', 'typhoon', 'old-line', 'entropy', 'cone-sphere', 'parsley', 'effect', 'prolixity', 'tongue', 'staginess', 'insurance', 'knob', 'guile', 'reconsideration', 'pace', 'narrator', 'biophysicist', 'taxpayer', 'piety', 'crib', '3-by-6-ft.', 'absentee', 'Grab', 'shrug', 'Legislation', 'clown', 'metre', 'shredder', 'evening', 'prostitute', 'falcon', 'fund-raising', 'observance', 'monacle', 'dodge', 'thing', 'reach', 'public-address', 'pistachio', 'fluorine', 'excellence', 'scrap', 'entrant', 'dabbler', 'sell', 'bedground', 'shrieking', 'noise', 'peptide', 'cleaner', 'slob', 'accelerator', 'academeh', 'dugout', 'Heaven', 'redcoat', 'math', 'taint', 'epic', 'Nostalgia', 'keeper', 'p(Q)', 'slaying', 'bolt', 'Removal', 'embassy', 'inset', 'badinage', 'witch', 'hymn', 'advice', 'scribe', 'hawk', 'ken', 'hoof', 'life-and-death', 'plodding', 'carousing', 'mill-wheel', 'commanding', 'replacement', 'landscape', 'obliteration', 'ATP', 'suffering', 'spirit', 'potential', 'complainant', 'lemon', 'neuritis', 'calico', 'gasoline', 'influent', 'concertmaster', 'Call', 'turbofan', 'citrus', 'customer-cost', 'SBA', 'plaster', 'entanglement', 'alternation', 'commons', 'opponent', 'handbook', 'grapefruit', 'phosphide', 'warhead', 'place-kicker', 'bondsman', 'stag', 'subjugation', 'suspect', 'Change', 'interrelationship', 'champagne', 'endurance', 'alleviation', 'ambassador', 'altercation', 'final', 'classic', 'broadcasting', 'echelon', 'ft', 'midday', 'bully', 'Allay', 'non-color', 'federal-question', 'exploding-wire', 'union', 'liberal', 'paralanguage', 'prognosis', 'pact', 'legume', 'redecoration', 'executor', 'Root', 'advertisement', 'Disapproval', 'coffin', 'tortoise', 'Figure', 'non-violence', 'oval', 'galaxy', 'fight', 'wallboard', 'driveway', 'wrist', 'annihilation', 'information', 'parentage', 'KC-135', 'sanctuary', 'workpiece', 'Mrads', 'clutch', 'Peace', 'Leasure', 'hydrolysis', 'hoof-and-mouth', 'excise', 'rattlesnake', 'Back', 'brinkmanship', 'syringa', 'sneer', 'wife', 'playmate', 'carbon-14', 'Temper', 'hopelessness', 'Spot', 'Destruction', 'silk', 'mainstream', 'gym', 'ledger', 'operand', 'diver', 'Propaganda', 'wickedness', 'lath', 'erosion', 'cuff', 'anvil', 'fair-weather', 'ease', 'exposure', 'highway', 'comprehension', 'prose', 'pump-action', 'Truck', 'outfielder', 'poetry', 'hunger', 'prestige', 'solid', 'highwayman', 'rabbi', 'half', 'OOH', 'eucalyptus', 'anti-intellectualism', 'rf', 'hillside', 'realist', 'howse', 'import', 'pride', 'utopia', 'S', 'pianist', 'tramway', 'line', 'excuse', 'magnate', 'body', 'albumin', 'tax-avoidance', 'offing', 'berry', 'paneling', 'palace', 'hack', 'ad-lib', 'non-time', 'nobleman', 'weeping', 'swallow', 'cordon', 'stealer', 'low-pass', 'strategy', 'super-condamine', 'empiricism', 'brown', 'expurgation', 'band', 'price-setting', 'Andrena', 'teammate', 'invocation', 'text-form', '1/8-inch', 'spur', 'pamphlet', 'metaphysic', 'iodoamino', 'spread', 'idyll', 'designate', "SBA's", 'new-house', '400-lb.', 'cadre', 'living', 'palsy', 'milligram', 'posse', 'CD', 'slanderer', 'advocate', 'porosity', 'eternity', 'sub-conscious-level', 'orthophosphate', 'parenthood', 'gunk', 'Battery', 'double-crosser', 'conservationist', 'staccato', 'finial', 'finishing', 'failure', 'enforcement', 'passion', 'consistence', 'substitution', 'xylem', 'regeneration', 'demonstration', 'repose', 'splurge', 'transaminase', 'gulp', 'dysplasia', 'impunity', 'aspen', "bar'l", 'naturalness', 'woodcarver', 'sexton', 'sforzando', 'spoof', 'handgun', 'submarine-ball', 'honoree', 'tooth-paste', 'emergency', 'share', 'nonconformist', 'address', 'hull', 'negotiation', 'temperament', 'simulation', 'haircut', 'gut', 'woodsmoke', 'lifer', 'large-scale', 'Context', 'ballad', 'esthetics', 'greenhouse', 'leakage', 'thimble', 'pickaxe', 'test', 'foreman', 'poignancy', 'recruit', 'teacher-employee', 'tutoring', 'impediment', 'intervention', 'tollgate', 'fraud', 'cube', 'motel-keeping', 'influence', 'stirring', 'blasphemy', 'woolen', 'trademark', 'morrow', 'hospital', 'panic', 'creed', 'bouncing', 'one-twentieth', 'self-congratulation', 'amorality', 'sluice', 'ally', '1-1/2-inch', 'rubdown', 'opera', 'cushion', 'tallyho', 'grudge', 'fury', 'grape-arbor', 'gambling', 'palladium', 'property', 'Liquid', 'smoothness', 'session', 'compost', 'stalemate', "50'", 'eccentric', 'hamper', 'shipping', 'honeymoon', 'repute', 'reconnaissanace', 'gilt', 'Street', 'clergy', 'MPH', 'appointee', 'fenugreek', 'counter-escalation', 'ex-gambler', 'fall', 'lawmaking', 'auditorium', 'bedtime', 'ensemble', 'toto', 'contrition', 'garland', 'diameter', 'bin', 'Experience', 'non-code', 'meditation', 'acting', 'servicing', 'AIChE', 'consummation', 'Fashion', 'narrowness', 'steadiness', 'pungency', 'liqueur', 'exhibit', 'cone', 'Mustard', 'asynchrony', 'bovine', 'administration', 'FHA', 'goitre', 'irresolution', 'safe-driving', 'reaction', 'presence', 'dept.', 'mutilation', 'grief', 'planning', 'magician', 'antithesis', 'elsewhere', 'pedigree', 'receptacle', 'glimpse', 'origination', 'fragrance', 'neutron', 'wanderer', 'inception', 'Tractor', 'level', 'apogee', 'switchgear', 'titration', 'home-blend', 'charity', 'belly', 'joust', 'silica', 'lotion', 'badge-toter', 'wax', 'pipe', 'flavoring', 'quarrel', 'interlocutor', 'helicopter', 'precedent', 'king', 'monster', 'centrist', 'disaffection', 'crater', 'chancel', 'full', 'newspaper', 'prepublication', 'airplane', 'davenport', 'pirouette', 'assesment', 'chess', 'food', 'nux', 'instancy', 'schedule', 'romance', 'lb-plus', 'cosmos', 'connoisseur', 'speculator', 'period', 'ligament', 'tertian', 'coverlet', 'commentator', 'depreciation', 'manumission', 'immunity', 'formalism', 'AH6', 'gateway', 'lark', 'deal', 'lawn', 'tabac', 'importation', 'randomization', 'heightening', 'equanimity', 'seaweed', 'comrade', 'Initiation', 'reformer', 'stickpin', 'buckle', 'malaise', 'durability', 'umber', 'forgery', 'balancing', 'short-contact', 'crap', 'X-rays', 'risk', 'phase', 'rye', 'father', 'Corruption', 'insulation', 'widower', 'customer', 'bidding', 'jealousy', 'dig', 'superior', 'porter', 'sponsorship', 'serving', 'odyssey', 'enactment', 'brother-in-law', 'ounce', 'halfback', 'gathering', 'hip', 'corne', 'liver', 'picture', 'Deity', 'correlation', 'flat', 'likeness', 'fellowship', 'vinegar', 'benefit', 'composer', 'erection', 'duffel', 'conduct', 'watermelon', 'alter-ego', 'chalk', 'hecatomb', 'aggregate', 'dearth', 'seam', 'passageway', 'clay', 'millennium', 'throat', 'precaution', 'dismemberment', 'wording', 'splash', 'pilot', 'rehearsal', 'outhouse', 'arch', 'writhing', 'acknowledgement', 'partner', 'punster', 'clannishness', 'ambiguity', 'path', 'leg-split', 'parable', 'furrow', 'involution', 'Faith', 'maelstrom', 'anesthetic', 'squad', 'supermachine', 'protuberance', 'confessional', 'uproar', 'honour', 'translation', 'parlance', 'Virus', 'injunction', 'Honey', 'deification', 'teaspoonful', 'tendency', 'foam', 'polynomial', 'orthography', 'settlement', 'tea', 'ground-level', 'memoir', 'depletion', 'bellboy', 'gross', 'stench', 'jewelry', 'ee-faket', 'PM', 'abjection', 'suburbanite', 'wildcat', 'ETV', 'rediscovery', 'founding', 'deadline', 'fleawort', 'Husbandry', 'dexamethasone', 'drama', 'pussycat', 'hesitation', 'roofing', 'nonism', 'Petitioner', 'pollen-and-nectar', 'pinto', 'top-priority', 'ring-around-the-rosie', 'pastor', 'propulsion', 'cubist', 'stableman', 'coffeepot', 'gratification', 'chamber', 'silicon', 'texture', 'blue', 'newsreel', 'sea-food', 'prerequisite', 'ginmill', 'grin', 'Favour', 'non-stop', 'stickler', 'bowing', 'romantic', 'Reality', 'concentration-camp', 'anti-freeze', 'vertex', 'stance', 'expediency', "SMU's", 'remorse', 'pacifism', 'group', 'windbag', 'pidgin', 'client', 'pretense', 'bluestocking', 'unreality', 'rounding', 'bearer', 'dialogue', 'Sleep', 'concessionaire', 'butternut', 'natural-law', 'shortness', 'jalopy', 'dictum', 'sending', 'mandamus', 'sense', 'Sp', 'self-certainty', 'winder', 'sieve', 'conspiracy', 'tangle', 'moire', 'protease', 'suspicion', 'gaiety', 'scattergun', 'face', 'gabble', 'judge', 'cool', 'prize', 'crankshaft', 'struggle', 'meadow', 'wallpaper', 'adherence', 'flaw', 'asset', 'ASDIC', 'circumstance', 'half-breed', 'luncheon-table', 'matrix', 'train', 'familiarness', 'orderliness', 'powderpuff', 'rationalist', 'tablespoon', 'Coverage', 'rebuff', 'foursome', 'pocketbook', 'spacecraft', 'monosyllable', 'highschool', 'terrace', 'Bitterness', 'asceticism', 'grunting', 'infringement', 'profitability', 'four-wood', 'law', 'information-cell', 'sabre-rattling', 'eqn.', 'neon', 'missile', 'fray', 'pressure', 'Plenty', 'Functionalism', 'belonging', 'fiefdom', 'self-interest', 'curtness', 'tapis', 'suit', 'dissimulation', 'viewpoint', 'sub-assembly', 'diphosphopyridine', 'trench', 'dehydration', 'eye-machine', 're-evaluation', 'swig', 'reform', 'script', 'sulfide', 'pectoralis', 'armload', 'Engine', 'spume', 'lobo', 'skillfulness', 'transshipment', 'frog-haiku', 'runway', 'caretaker', 'moderation', 'greenness', 'CONELRAD', 'Long-range', 'luminosity', 'centering', 'hood', 'robin', 'approval', 'arch-enemy', 'DC', 'title-holder', 'cable', 'choice', 'mammal', 'phenomenon', 'tuba', 'paste', 'jot', 'Salesmanship', 'living-room', 'saloon', 'lunchtime', 'beryllium', 'graining', 'translator', 'retching', 'humor', 'kindred', 'quickie', 'substructure', 'nester', 'outset', 'seven-iron', 'Son', 'blood-flow', 'froth', 'chump', 'ideal', 'enrage', 'Cr', 'break-through', 'AAb/', 'half-inch', 'hemoglobin', 'hollowware', 'deferment', 'freight', 'spaghetti', 'cornucopia', 'judgement', 'sharpness', 'army', 'End', 'yachtsman', 'plantain', 'mission', 'midpoint', 'cross-fertilization', 'corn', 'Complicity', 'lummox', 'justification', 'spark', 'design-side', 'Group', 'squirrel', 'capsicum', 'Pitcher', 'polyether', 'slug', 'mediaevalist', 'hypostatization', 'stool', 'count', '1.25-cm', 'fowl', 'canter', 'companion', 'pub', 'cylinder', 'print', 'cutoff', 'sabre', 'moral', 'frambesia', 'folk-music', 'sl', 'ban', 'Cell', 'help', 'galley', 'vocation', 'Serial', 'taxi', 'rage', 'fall-off', 'door', 'minister', 'insulator', 'flask', 'slump', 'satin', 'bystander', 'foreigner', 'fledgling', 'crimson', 'stereo', 'pomp', 'start', 'cellophane', 'mermaid', 'ineffectiveness', 'big-league', 'Pleasure', 'proviso', 'foreground', 'perfection', 'Religion', 'harrumphing', 'electroshock', 'lump', 'playing', 'scion', 'tribe', 'estrangement', 'gag', 'pounding', 'wash', 'CJS', 'refrain', 'grievance', 'underdog', 'verification', 'teetotaler', 'acquittal', 'return', 'socialist', 'velocity', 'autonomy', 'musicianship', 'Builder', 'renown', 'avail', 'ancestor', 'coccidioidomycosis', 'tongue-twister', 'affliction', 'percolator', 'maneuvering', 'constituency', 'origin', 'ferment', 'State', 'bluff', 'mobilization', 'worry', 'irrigation', 'stopping-point', 'courtship', 'planeload', 'foundling', 'office', 'phonetics', 'avalanche', 'entry', 'soloist', 'linguist', 'assist', 'sacker', 'modernizing', 'indirection', 'plasm', 'thumb', 'formulation', 'parish', 'warfront', 'driving', 'banana', 'inlet', 'fanning', 'Charcoal', 'conceptualization', 'frescoing', 'consternation', 'cure', 'cage', 'clairvoyance', 'canyonside', 'basin', 'nightingale', 'worth', 'tolerance', 'rambling', 'affection', 'crow', 'Excitement', 'budget', 'Convention', 'crusade', 'valley', 'mankind', 'parapsychology', 'burr', 'Sex', 'coup', 'coefficient', 'vintner', 'Ring', 'built-soap', 'loose', 'percentage', 'adoption', 'potentiometer', 'fiction-writing', 'exemplar', 'charter', "2''", 'immortality', 'expulsion', 'interpretor', 'participant', 'gullet', 'quartet', 'touchdown', 'relish', 'handicraftsman', 'estimate', 'youngster', 'recall', 'shimmer', 'rectangle', 'half-gainer', 'compromise', 'Music', 'queen', 'Airmail', 'spoke', 'waterside', 'treatise', 'silhouette', 'high-resolution', 'contrast', 'shotgun', 'mineral', 'manor', 'home-run', 'loot', 'compound-engine', 'preordainment', 'stud', 'pool-side', 'herring', 'country-squirehood', 'ticklebrush', 'wrongdoer', 'bankruptcy', 'advisability', 'pickle', 'stab', 'riddance', 'recollection', 'middle-school', 'booze', 'sworde', 'nullity', 'thyroglobulin', 'Paper', 'stickman', 'donation', 'Night', 'mistletoe', 'coward', 'checking', 'companionship', 'severing', 'wayside', 'jam', 'assortment', 'guitar', 'retrospective', 'eagerness', 'monotony', 'aloofness', 'surveillance', 'instrument', 'irradiation', 'clocking', 'cheer', 'antiserum', 'processor', 'flocculation', 'whine', 'surname', 'snake', 'bitterness', 'tip-toe', 'motherland', 'chandelier', 'splicing', 'lurch', 'pressure-cooker', 'rein', 'stamping', 'enormity', 'semi-circle', 'self-control', 'chemise', 'canvas', 'disparity', 'tension', 'brief', 'sill', 'discussant', 'BGS', 'nature', 'supernaturalism', 'garter', 'trap', 'spinnability', 'boy', 'C', 'rat', 'TR', 'under-achievement', 'testimonial', 'switchblade', 'pulse', 'punishment', 'vomica', 'anonymity', 'deceleration', 'low-power', 'dead', 'sonny-boy', 'Iodination', 'descent', 'murder', 'stoppage', 'boy-manager', 'apartheid', 'Consciousness', 'monarch', 'layout', "N'", 'Socialization', 'delay', 'derby', 'corpse', 'signaling', 'slight', 'coffee-house', 't-tau', 'brocade', 'data-processing', 'weight', 'Afternoon', 'staple', 'polarity', 'soundness', 'refuse', 'A-26', 'reserve', 'infinite', 'feather', 'yellow', 'imitation', 'Fog', 'repellent', 'cocopalm', 'shelf', 'trash', 'abbot', 'shunt', 'refocusing', 'seersucker', 'fanaticism', 'chartroom', 'foundation-stone', 'flouting', 'sojourn', 'bulge', 'know-how', 'coaching', 'trusteeship', 'size', 'fellowfeeling', 'ICBMs', '15,500-lb.', 'heredity', 'KQED', 'Vindication', '7', 'tumor', 'concept', 'ex-marine', 'trailer', 'communication', 'disappointment', 'reek', 'gumption', 'trachea', 'enlarging', 'B70', 'position', 'peak', 'window', 'assay', 'revery', 'convert', 'neighborliness', 'Displacement', 'Rh', 'tallow', '70%', "B-47's", 'totality', 'counterproposal', 'acknowledgment', 'remembering', 'small-boat', 'sec.', 'protection', 'explorer', 'frame', 'oneness', 'first-class', '**yg-globulin', 'drag', 'responsibility', 'conformity', 'pity', 'gland', '20th-Century', 'laboratory', 'overlay', 'breathing', 'capacity', 'utility', 'camp', 'environment', 'merriment', 'seminary', 'gadget', 'dispersion', 'completion', 'increase', 'PQ', 'disorder', 'Electronics', 'stairway', 'victory', 'drudgery', 'Dignity', 'endevor', 'vacationland', 'telescope', 'combatant', 'Vacuum-', 'paunch', 'orgasm', 'table', 'FM', 'putty', 'hostage', 'pacemaker', 'earnestness', 'great-grandfather', 'pin', 'Art', 'stucco', 'mother-of-pearl', 'polish', 'kinship', 'tidbit', 'Reference', 'fluke', 'SS', 'patron', 'falsity', 'damn', 'ramp', 'X', 'perseverance', 'Handle', 'fruition', 'conviction', 'idler', 'infighting', 'half-year', 'baseline', 'sidewalk', 'polysiloxanes', "CDC's", 'individualist', 'anticoagulation', 'greed', 'neighbourhood', 'examiantion', 'high-class', 'trend', 'S-D', 'deliberation', 'auction', 'fat', 'vivo', 'Anti-Americanism', 'vector', 'unpredictability', 'jiu-jitsu', 'Breath', 'hardness', 'pigen', 'ingredient', 'rotenone', 'adolescent', 'den', 'deodorant', 'chapel', 'reappearance', 'landing', 'psychopomp', 'custodian', 'gayety', 'draft', 'imperialist', 'motif', 'leafhopper', 'de-iodination', 'neutralization', 'debutante', 'consideration', 'dependent', 'folly', 'conjecture', 'crepe', 'actress', 'Coordination', 'virility', 'b-plane', 'agent', 'beaker', 'danger', 'curse', 'purgation', 'Pi', 'scramble', 'locus', 'entry-limit', 'virginity', '76-per-cent', 'shortstop', 'implement', 'twister', 'aorta', 'tack', 'sledding', 'basis', 'sole', 'divorcee', 'toll', 'Morale', 'inspiration', 'waist', 'acclamation', 'dash', 'disloyalty', 'reconstruction', 'gingham', 'vellum', 'pseudynom', 'inflammation', 'synchronism', 'orthicon', 'branch', 'potentiality', 'recitative', 'classroom', 'short-term', 'Beauty', 'toffee', 'tax-exemption', 'involvement', 'frieze', 'Sheeting', 'dung', 'inferno', 'distribution', 'separation', 'break', 'infirmity', 'sportswriter', 'synergism', 'organification', 'forgiveness', 'graph', 'subspace', 'proletariat', 'rancor', 'thruway', 'micrometer', 'bureaucracy', 'registrant', 'Ch.', 'mid-air', "1/4''", 'reversibility', 'equine', 'delinquent', 'bay', 'gallium', 'Stranger', 'delegate', 'tab', 'limousine', 'perpetration', 'cake', 'epiphany', 'gpd', 'wrangler', 'cantaloupe', 'dismissal', 'coastline', 'relevance', 'Productivity', 'stitch', 'philology', 'brushing', 'water-balance', 'doll', 'Metal', 'expertise', 'catkin', 'fluoride', 'F', 'Impartiality', 'defeat', 'bridgework', 'Hatred', 'wooooosh', 'mass', 'artificiality', 'exchequer', 'intrigue', 'fountain', 'Slogan', 'bag', 'cask', 'knuckle-duster', 'cattaloe', 'Council', 'volley-ball', 'rag', 'urn', 'watercolor', 'caper', 'TV', 'improvement', 'saw', 'fermentation', 'Darling', 'horseflesh', 'machine-family', 'doorman', 'harshness', 'counselor', 'chop', 'sir', 'demurrer', 'whisky-on-the-rocks', 'beggar', 'one-tenth', 'Pain', 'blazer', "P's", 'referee', 'grammar', 'diplomat', 'haggle', 'beauty-idiom', 'sagebrush', 'preacher', 'crystallite', 'pseudo-feeling', 'aspirant', 'plumb', 'equivalent', 'autopsy', 'blowup', 'chain', 'miscellany', 'determinant', 'saintliness', 'sleep-wakefulness', 'erysipelas', 'bich', 'ballyhooey', 'stumbling-block', 'permissibility', 'disdain', 'ague', 'taking', 'Mission', 'rim-fire', 'pawn', 'Elsewhere', 'haul', 'inconvenience', 'glint', 'desire', 'sham', 'tripolyphosphate', 'social-welfare', 'redemption', 'room', 'chicken', 'elution', 'urethra', 'furnishing', 'sovereign', 'connexion', 'co-ordination', 'mannerism', 'Dyerear', 'NE', 'shrapnel', 'hangman', 'navel', 'vocational', 'gauge', 'Proprietorship', 'anomaly', 'assemblage', 'interregnum', 'cord', 'musket', 'flier', 'leverage', 'conveyor', 'yawn', 'airline', 'awfulness', 'prolongation', 'CH', 'clique', 'vortex', 'propylthiouracil', 'class', 'madrigaling', 'track', 'carreer', 'Fence-line', 'lecture', 'positivist', 'figure', 'mudslinging', 'disarray', 'grace', 'jejunum', 'circuit', 'verdict', 'custom-design', 'sweetheart-secretary', 'Guest', 'algorithm', 'nourishment', 'snake-rail', 'biographer', 'banker', 'Negligence', 'respect', 'paragraph', 'page', 'Story', 'work', 'lover', 'erudition', 'corporal', '36-year-old', 'sighting', 'empire', 'unrealism', 'vapor', 'dissemination', 'litter', 'Turnover', 'decimeter-wave-length', 'world-at-large', 'marmalade', 'boast', 'Letter', 'mealtime', 'Geocentricism', 'torch', 'troubleshooter', 'rapidity', 'aeration', 'psalm', 'peer', 'bluntness', 'specimen', 'P-11', 'Sympathy', 'mana', 'competency', 'christening', 'coordinate', 'grenade', 'ex-Justice', 'decomposition', 'rotundity', 'master-race', '242%', 'exemption', 'rack', 'engine', 'secondhand', 'frolic', 'pursuit', 'flatland', 'truism', 'Welcome', 'brigade', 'gradualist', 'decline', 'squabbling', 'salt', 'arbitration', 'forge', 'steep', 'masculinity', 'diva', 'relative', 'purveyor', 'bullhide', 'deftness', 'query', 'guy', 'manila', '20-piece', 'treasury', 'pinch', 'kraut', 'dentist', 'sniper', 'yarn', 'literalness', 'frostbite', 'gallstone', 'pretence', 'peace-treaty', 'voyage', 'colt', 'Succession', 'soot', 'scheduling', 'tyranny', 'mat', 'prowess', 'nucleotide', 'archenemy', 'servant', 'treason', 'learning', 'diarrhoea', 'planet', 'gorge', 'radish', 'interchange', 'pagan', 'delectation', 'resource', 'pout', 'boucle', 'extent', 'fourth-century', 'codification', 'reportage', 'narrowing', 'kid', 'glen', 'Demand', 'major-league', 'casework', 'Ball', 'content', 'NRL', 'pram', 'paternalism', 'Integration', 'mom', 'freeway', 'cliff', 'beef', 'tandem', 'cash', 'divan', 'ma', 'irresponsibility', 'Jewishness', 'shell-psychology', 'altar', 'host', 'T', 'Housekeeping', 'expansion-contraction', 'lean-to', 'stoop', 'campfire', 'prognostication', 'anorexia', 'pragmatism', 'BMEWS', 'time-on-the-job', 'exploit', 'awakening', 'formation', 'wrack', 'partisan', 'eyeball', "bull's-eye", 'bickering', 'souvenir', 'tobacco-juice', 'helplessness', 'uniqueness', 'pal', 'Intelligence', 'garden', '5/8-inch', 'Dictionary', 'mount', 'quota', 'recreation', 'aerosol', 'network', 'doing', 'Drill', 'symmetry', 'carriage-step', 'flirtation', 'coupling', 'illustrator', 'sit-down', 'deterioration', 'low-water', 'interpreter', 'money-winner', 'ordnance', 'spotlight', 'earnest', 'pleasantness', 'rationing', 'exoneration', 'trifle', 'dentistry', 'pluck', 'gaggle', 'avant-garde', 'colchicum', 'Urbanization', 'boom', 'drier', 'ginger', 'prey', 'ochre', 'well-house', 'gist', 'blackening', 'lien', 'hearth', 'act', 'spear', 'Y-cells', 'gospel', 'soma', 'founder-originator', 'gentile', 'origin/destination', 'glisten', 'lodgment', 'absolution', 'supernatant', 'infinitive', 'cocao', 'crusader', 'second-story', 'lion', 'one-quarter', 'alert', 'potato', 'improvisation', 'arson', 'multipactor', 'stable-garage', 'Somewhere', 'key', 'Topography', 'mash', 'summary', 'bed', 'thermometer', 'crest', 'desecration', 'multiple-purpose', 'bayonet', 'Jump', 'sanhedrin', 'march', 'tilth', 'custody', 'mEq.', 'estate', 'yesteryear', 'stair-well', 'pleasure', 'hailstorm', 'mint', 'kit', 'aegis', 'dispersal', 'right-wing', 'neurasthenic', 'sailboat', 'realization', 'extreme', 'discovery', 'flatus', 'peddler', 'cookfire', 'syndication', 'contraction-extension', 'broker', 'spouse', 'moment', 'aviary', 'paucity', 'Craft', 'posterity', 'wiggle', 'bridal', 'prayer-time', 'saber', 'iodoprotein', 'long-life', 'goodness', 'inefficiency', 'caliper', 'outfield', 'ring-around-a-rosy', 'hysterectomy', 'Sparrow-size', 'Adult', 'three-dimensionality', 'colonnade', 'vocalization', 'integrity', 'shocker', 'cook', 'epitome', 'attorney', 'for', 'cure-all', 'palatability', 'wing-shooting', 'cadenza', 'femininity', 'unconscious', '1-inch', 'proscription', 'toad', 'radio', 'drop', 'mucus', 'ludicrousness', 'onrush', 'sparkle', 'dotting', 'flag-stick', 'analyst', 'nostril', 'Bisque', 'deck', 'gray', 'Abreaction', 'legation', 'lyriist', 'sawtimber', 'ambivalence', 'entrance', 'promenade', 'curiosity', 'brutality', 'free-drink', 'orphan', 'misinformation', 'ultracentrifuge', 'toast', '46%', 'billboard', 'B-70', 'tapestry', 'accomplice', 'Nigger', 'norethandrolone', 'coast', 'baldness', 'ratification', 'race-driver', 'collarbone', 'science', 'self-aggrandisement', 'rosebush', 'bale', 'dozen', 'chomp', 'guest', 'asbestos', "po'k", 'heavy-weight', 'turbine', 'third-story', 'elimination', 'squadron', 'glory', 'cadaver', 'duration', 'axle', 'attribute', 'rhinotracheitis', 'evasion', 'cheetal', 'finality', 'walkover', 'coexistence', 'theory', 'electron', 'Cardboard', 'Y-cell', 'magnum', 'sponging', 'additive', 'subsidiary', 'accuracy', 'mistrial', 'complexion', 'Continuation', 'redevelopment', 'pump-priming', 'rainfall', 'bluing', 'pianism', 'oiticica', 'rice', 'grazer', 'transversus', 'gloss', 'berth', 'announcer', 'slip', 'dizziness', 'sensing', 'calumny', 'bobby-soxer', 'philosophy', 'judging', 'A-Z', '$3', 'maximum', 'Off-flavor', 'navy', 'laxative', 'hangover', 'rainstorm', 'penance', 'garment', 'leap', 'stirrup-guard', 'need', 'slit', 'dinnerware', 'fund', 'tintype', 'jazz', 'putt', 'critter', 'nitrogen-mustard', 'astringency', 'state', 'rotunda', 'outlook', 'fiber-photocathode', 'bib', 'glee', 'democracy', 'disturber', 'drunkard', 'printing', 'mEq', 'sheen', 'command', 'solitary', 'turmoil', 'attic', 'G', 'shareholder', 'gallantry', 'word', 'doorway', 'devisee', 'mansion', 'fiddling', 'chairmanship', 'folk-dance', 'starre', 'prednisone', 'tug-of-war', 'reduction', 'thrower', 'healing', 'stop', 'CV', 'potency', 'sensor', 'equity', 'anteater', 'bow', 'leeway', 'brig', 'valewe', 'flood', 'proficiency', 'raggedness', 'terminology', 'bravado', 'conjugate', 'edition', 'green', 'syllable', 'identification', 'NBS', 'bureaucratization', 'coverage', 'Hypocrisy', 'musculature', 'consumer', 'sorghum', 'myth-making', 'bellow', 'cottage', 'brotherhood', 'frivolity', 'wondering', 'clergyman', "1/2''", 'carbohydrate', 'clean-up', 'run', 'AjA', 'tractor-trailer', '24%', 'Flaxseed', 'back', 'insect', 'occupation', 'instability', 'interlude', 'Interpretation', 'Mike', 'chutney', 'spot', 'BOD/day', 'bayly', 'beveling', 'misstep', 'dryness', 'herd-owner', 'wastewater', 'search', 'old-age', 'chisel', 'wink', 'educator', 'SAMOS', 'hatred', 'formability', 'it-wit', 'justness', 'escort', "1/8''", 'director', 'visibility', 'photo-offset', '21%', 'aluminum', 'squeaking', 'barber', 'polyphosphate', 'shoulder', 'militia', 'flesh', 'fear', 'coherence', 'self-sacrifice', 'discontinuity', 'concentrate', 'recognition', 'Ornament', 'marinade', 'warden', 'spangle', 'fund-raiser', 'anarchist', 'disfavor', 'retelling', 'little-girl', 'going-over', 'conquest', 'byinge', 'bursitis', 'indigation', 'cow-man', 'lighter', 'kick', 'barge', 'heap', 'platform-controller', 'triplet', 'treatment', 'beach-drift', 'Murder', 'wage-rate', 'stampede', 'tribunal', 'operator', 'milieu', 'nut-house', 'incipience', 'good', 'sewer', 'tangency', 'Producer', 'lie', 'desegregation-from-court-order', 'revisionist', 'harrassment', 'chloride', 'debility', 'mentor', 'inclusion', 'viscosity', 'triamcinolone', 'Spatiality', 'fumble', 'linking', 'clod', 'get-together', 'mortar', 'reproach', 'arm-levitation', 'sub-station', 'go-go-go', 'self-effacement', 'gangway', 'executive', 'miscount', '3/8-inch', 'retina', 'liter', 'Justice', 'bringing', 'cyclohexanol', 'goad', 'poem', 'filibuster', 'bit', 'self-criticism', 'worktable', 'remark', 'bereavement', 'excelsin', 'mall', 'probity', 'supranationalism', 'fellow', 'jacket', 'robot', 'pathogenesis', 'jail', 'Relativism', 'self-awareness', 'Exboyfriend', 'public', 'handful', 'intonation', 'Peanut', 'one-sixth', 'low-calorie', 'crescent', 'towel', 'barracks', 'scheme', 'domestic', 'microscope', 'accumulation', 'fox', 'novitiate', 'paragraphing', 'push', 'disrepute', 'adhesive', 'bower', 'tune-belly', 'watt', 'visit', 'perplexity', 'disengagement', 'side-rack', 'devastation', 'Widow', 'mixer', 'overrun', 'condescension', 'capitol', 'crux', 'GOP', 'Bet', 'subtype', 'dope', 'jumping', 'malaria', 'conditioning', 're-living', 'verse', 'persona', 'joke', 'century', 'uplift', 'washboard', 'rigger', 'prep', 'juju', 'delegation', 'assassin', 'mixture', 'woodshed', 'doctor', 'heir', 'liquidation', 'history', 'ultracentrifugation', 'grand-daughter', 'wide-grip', 'courtyard', 'JA', 'thickness', 'orchestration', 'Execution', 'clothier', 'emancipation', 'make-up', 'hr', 'non-identity', 'beehive', 'lid', 'finalist', 'Auto', 'thumping', 'preliminary', 'midway', 'switching', 'Radio', 'flare', 'folklore', 'speechlessness', 'jab', 'pagoda', 'ouster', 'subjectivity', 'excess', 'tempo', 'ale', 'marketability', 'caution', 'larceny', 'bartender', 'bio-assay', 'spite', 'plenty', 'mask', 'reparation', 'idol-worship', 'elder', 'joiner', 'balance-of-payments', 'storyteller', 'gas', 'horse-trading', 'thiamin', 'brush', 'scurvy', 'repeater', 'half-brother', 'styrene', 'anticipation', 'artfulness', 'swearing-in', 'meaning', 'secession', 'poplar', 'half-life', 're-sharpening', 'cultivation', 'Civilization', 'straight-line', 'Conservatism', 'chivalry', 'cps', 'employee', 'Humor', 'setup', 'story-book', 'scope', '29-Oct.', 'gasp', 'headquarters', 'basket', 'blandness', 'emphysema', 'Co', 'glover', 'trip', 'imminence', 'chemical', 'amassing', 'undertaker', 'build-up', 'sufferer', 'cyclorama', 'sedative', '0.025-in.', 'neo-classicism', 'caveat', 'grandma', 'freight-car', 'mast', 'cheerfulness', 'paymaster', 'calmness', 'Bed', 'street', 'relinquishing', 'one-fifth', 'zenith', 'Type', 'girl-san', 'aberration', 'melee', 'acreage', 'embrace', 'volleyball', 'price-consciousness', 'lope', 'mainland', 'anthropologist', 'toppling', 'sorption-desorption', 'error', 'antibiotic', "BOD's", 'clinic', 'experimenter', 'safeguard', 'ketchup', 'exaltation', 'fineness', 'diesel', 'womb', 'crocodile', 'plate', 'highboy', 'AIA', 'come-uppance', 'humility', 'Hope', 'wheat-germ', 'sanitation', 'isolationism', 'maintenance', 'bauble', 'gem', 'pastness', 'roofer', 'tracing', 'defense', 'emanation', "1-1/4''", 'similitude', 'assignment', 'banishment', 'income', 'masseur', 'choking', 'task', 'decay', 'farmhouse', 'diem', 'daylight', 'canon', 'Image', 'wonderfulness', 'sangaree', 'corridor', 'framing', 'amide', 'cabinet', 'congestion', 'poverty', 'obtrusiveness', 'rest', 'beacon', 'Science', 'soda', 'rator', 'scan', 'voltage', 'police', 'purse', 'CO', 'low-class', 'top-quality', 'humiliation', 'life-size', 'flat-bed', 'foreshortening', 'Place', 'cutthroat', 'memorization', 'consolation', 'mien', 'culmination', 'perfumery', 'nut', 'aura', 'ommission', 'justice', 'bloodshed', 'monograph', 'preposition', 'long-view', 'heade', 'expectation', '10.3-cm', 'fatigue', 'combine', 'ingratitude', 'dependency', 'overweight', 'wig', 'victor', 'chocolate', 'apprehension', 'maneuver', 'brunt', 'beast', 'charting', 'eight-inch', 'getting', 'high-wage', 'playtime', 'individuation', 'infusion', 'pink', 'vice', 'slum', 'cracker-box', 'yelp', 'impatience', 'Snow', 'martyrdom', 'mercer', 'regression', 'groan', 'arrangement', 'reassurance', 'frankfurter', 'pemmican', 'Act', 'explosion', 'catheter', 'indigestion', 'seacoast', 'idolatry', 'IOCS', 'Arm', 'storehouse', 'Physique', 'suzerainty', 'metropolis', 'aloneness', 'stiff', 'filling', 'florist', 'humanness', 'small-town', 'falling', 'pseudophloem', 'bodybuilding', 'split', 'honesty', 'boarder', 'creativeness', 'tenspot', 'deacon', 'Reactionary', 'retrovision', 'nickname', 'automaton', 'condition', 'single-step', 'specificity', 'citizenship', 'oilheating', 'continence', 'apothecary', 'Heat', 'glycol', 'siren', 'clump', 'founder-conductor', 'woomera', 'polypropylene', 'pro-ball', 'sausage-meat', 'disruption', 'menace', 'Board', 'AIMO', 'midst', 'pregnancy', 'multi-millionaire', 'library', 'couple', 'moon', 'patriotism', 'drain', 'columnist', 'growing-waiting', 'normalcy', 'brass', 'capacitor', 'high-cost', 'sitting', 'waving', 'whinny', 'fly-boy', 'seducer', 'thigh', 'Customer', 'press', 'min.', 'spacesuit', 'Community', 'custom', 'sentence-structure', 'bodybuilder', 'bigotry', 'musicality', 'blower', 'self-will', 'yuse', 'economy', 'light-year', 'fodder', 'set', 'sacredness', 'great-grandson', 'felicity', 'hardener', 'neutralist', 'repairing', 'diarrhea', 'brow', 'hilt', 'tool-and-die', 'gutter', 'robber', 'regulus', 'left', 'location', 'BW', 'bottom', 'fourth-down', 'promoter', 'wilt', 'steak', 'NAREB', 'indefinite', 'extinction', 'relentlessness', 'whiteness', 'lower-level', 'ditcher', 'uneasiness', 'fostering', 'septum', 'villain', 'saturation', 'residue', 'interlining', 'wheat', 'purgatory', 'securing', 'atomisation', 'recalling', 'sentinel', 'Enlargement', 'pan', 'dinnertime', 'householder', 'warfare', 'trinket', 'phosphorus', 'seed', 'enunciation', 'trickster', 'stigma', 'persistence', 'ussr', 'colonialist', 'folk-lore', 'blaze', 'circular', 'burial', '**ya', 'entity', 'resignation', 'bump', 'rodeo', 'F-108', 'lapse', 'bean', 'Libel', 'clotheshorse', 'corpsman', 'legato', 'Factory', 'force', 'upsurge', 'transformation', 'ketosis', 'thoroughfare', 'conversion', 'interval', 'roundness', 'side-arm', '{0,T}', 'transport', 'wick', "MP's", 'timber', 'axiom', 'protoplasm', 'head-cold', 'generalist', 'undergraduate', 'developer', 'puzzlement', 'third-grade', 'pinochle', 'kenning', 'apologetic', 'encroachment', 'endeavour', 'fair', 'white-collar', 'incitement', 'thermos', 'M', 'homogeneity', 'dancer', "sellin'", 'alligator', 'film', 'slicker', '20%', 'handle', 'communicator', 'leitmotiv', 'takeover', 'talking', 'mirror', 'hearer', 'repair', 'tractor', 'hande', '100%', 'mystic', 'picking', 'horizon', 'Dirt', 'histrionics', 'armoire', 'jurist', 'nil', 'tie-in', 'saxophonist', 'pork', 'fairy-tale', 'view', 'carbine', 'clay-mining', 'rigidity', 'ad', 'realty', 'tenderfoot', 'p', 'wail', 'parody', 'old-grad-type', 'launching', 'windshield', 'fierceness', 'U-2', 'stepson', 'phenothiazine', 'liberation', 'roadster', 'breaking-out', 'oversimplification', 'adult', "10-o'clock", 'storm', 'price-cutting', 'collector', 'redhead', 'hardtack', 'complication', 'interdependence', 'Blockade', 'kettle', 'By-word', 'bourbon', 'game', 'phosphor', 'ware', 'book', 'landslide', 'methodology', 'sacrament', 'teakwood', 'voltmeter', 'near-mutiny', 'primacy', 'apparition', 'plasterer', 'Wound-tumor', 'value-system', 'reissue', 'refrigeration', 'deception', 'aroma', 'inn', 'rung', 'parole', 'reformatory', 'lather', 'modern-dance', 'hp.', 'dime', 'reluctance', 'ignoramus', 'lingerie', 'kale', 'precinct', 'vividness', 'front', 'dissection', 'arnica', 'inquisitor', 'sovereignty', 'cricket', 'hyperbole', 'diary', 'decrement', 'grapevine', 'arc', 'cruiser', 'faculty', 'divider', 'thyratron', 'non-scientist', 'heaviness', 'suppression', 'Gas', 'sublimate', 'practitioner', 'betterment', 'candidate', 'impasse', 'seeker', 'nudist', 'understanding', 'charm', 'sub', 'chairing', 'block', 'heliotrope', 'felony', 'solar-corpuscular-radiation', 'Patrolman', 'treaty', 'appearance', 'smallness', 'simplicitude', 'raillery', 'water-ski', 'espousal', 'D', 'sharecrop', 'aesthetic', 'immunization', 'spray', 'brim', 'interest', 'separateness', 'pleasant', 'boat', 'veneration', 'Comic', 'rabbeting', 'protrusion', 'tempest', 'varnish', 'geochemistry', 'messhall', 'patchwork', 'trucking', 'doctrinaire', 'intimate', 'power', 'twilight', 'sheet-metal', 'boring', 'nod', 'knockdown', 'bandwidth', 'dreamer', 'officialdom', 'M-K', 'restudy', 'long-term', 'demolition', 'outlet', 'tubing', 'labour', 'phrasemaking', 'visage', 'distillation', 'amateur', 'north', 'lobster', 'harmony', 'conjugation', 'loveliness', 'Assistance', 'notched-stick', 'moustache', 'flying-mount', 'Correspondence', 'herpetologist', 'luster', 'soft-shoe', 'thumbnail', 'cowman', 'crispness', 'momentum', 'hike', 'naturalist', 'skeleton', 'runoff', 'sublime', 'saucepan', 'anaconda', 'waver', '60%', 'asymmetry', 'drift', 'race', 'logic-rhetoric', 'cacao', 'carbide', 'sketch', 'drainage', 'patroness', 'worksheet', 'bird-brain', 'SW', 'movie-goer', "O's", 'heartbeat', 'behind', 'amplifier', 'Fat', 'clearance', 'crucifix', 'insurgence', 'relativism', 'drunkenness', 'move', 'iridium', 'gravitation', 'mah-jongg', 'rattler', 'recurrence', 'disservice', 'decimal', 'surgeon', 'crabapple', '742C', 'reception', 'design', 'buckwheat', 'Information', 'relatedness', 'railway', 'Recognition', 'meal', 'intendant', 'allocation', 'apotheosis', 'legacy', 'predicator', 'post', 'professorship', 'sociologist', 'invention', 'gentry', 'unison', 'second-class', 'binge', 'place-kicking', 'telepathy', 'quarry', 'desuetude', 'legend', 'discontent', 'catastrophe', 'remnant', 'kilowatt-hour', 'dip', 'paean', 'social-role', 'promise', 'vegetation', 'matriarch', 'astronomy', 'patenting', 'commendation', 'assault', 'nervousness', 'fastening', 'sleepwalker', 'second-hand', 'Joviality', 'existent', 'gout', 'concealment', 'primitive-eclogue', 'nearness', 'valor', 'whole-house', 'geologist', 'Insomnia', 'sowing', 'three-dice', 'target', 'heel', 'solvency', 'rigging', 'electrophoresis', 'covering', 'quick', 'rusting', 'radioclast', 'bath', 'Chapter', 'person', 'soviet', 'ecstasy', 'inflation', 'flattery', 'schoolwork', 'logic', 'baying', 'irreverence', 'successorship', 'alkali', 'trio', 'explanation', 'severity', 'SNP', 'Sort', 'grant', 'atm', 'reprieve', 'route', 'refresher', 'opium', 'aquisition', 'sharpening', 'tycoon', 'luminescence', 'jeopardy', 'rainbow', 'B-47', 'confederation', 'storage', 'Multiplication', 'resale', 'tappet', 'vent', 'laying', 'premiere', 'dining-room', 'fast', 'frugality', 'showpiece', 'sit-in', 'Ultracentrifugation', 'echo', 'asthma', 'gulley', 'oxalate', 'fairing', 'bass', 'roadbuilding', 'haughtiness', 'faction', 'Clay', 'license', 'log-house', 'fitting', 'boatswain', 'top-level', 'pocket-size', 'encylopedia', 'topography', 'anastomosis', 'drunk', 'fernery', 'BG', 'pfennig', 'mazurka', 'affair', 'Threat', 'diversification', 'sawmill', 'referral', 'offense', 'midweek', 'Travel', 'fix', 'self-consciousness', 'loquacity', 'C-plane', 'trial', 'maladjustment', 'Pa', 'grape', 'second-stage', 'exhaust', 'AWOC', 'self-indulgence', 'archaeology', 'locker', 'workman', 'intensification', 'Youth', 'lapel', 'swiftness', 'Committee', 'spirituality', 'designation', 'chaulmoogra', 'transmutation', 'forgetfulness', 'leavening', 'second-place', 'usefulness', 'punch', 'ion', 'hipline', 'moderate-income', 'dissolve', 'buffet', 'Grandma', 'signboard', 'intelligence', "B's", 'appreciation', 'nonoccurrence', 'crush', 'double', 'sediment', 'dispenser', 'Part', 'lineup', 'neatness', 'accretion', 'padlock', 'drawl', 'deceased', 'patronage', 'aftermath', 'black-body', 'planetoid', 'maturation', 'DLINE', 'debris', 'traditionalist', 'midair', 'voume', 'levee', 'tooth-straightening', 'shipwreck', 'numbering', 'Marriage', 'exhusband', 'cluster', 'grandfather', 'embracing', 'acceptability', 'low', 'aerator', 'squeeze', 'creak', 'canopy', 'traffic', 'puppy', 'leave', 'moralist', 'commonplace', 'surface', 'hairtonic', 'composure', 'confidant', 'dustbin', 'overthrow', 'I-E', 'gulf', 'cost-plus', 'reminder', 'shape', 'vengeance', 'weekday', 'clothesline', 'armament', 'appeal', 'stockroom', 'trucker', 'alum', 'sanatorium', 'ammunition', 'shop', 'pessimism', 'Range', 'Question', 'semitrance', 'threshold', 'kwhr', 'adrenal', 'immensity', 'trade', 'lagoon', 'Concrete', 'magnitude', 'leveling', 'Burial', 'pressure-volume-temperature', 're-export', 'counter-attack', 'complection', 'merger', 'grant-in-aid', 'Wheat-germ', 'vice-chancellor', 'asbestos-cement', 'mezzo', 'motet', 'head-tossing', 'sauerkraut', 'time-span', 'expedition', 'reservation', 'aleck', 'supremacy', 'plowing', 'music-hall', 'writer-turned-painter', 'outreach', 'listener', 'lucidity', 'cell', 'gram', 'pussy', 'dosage', 'cleat', 'resorcinol', 'hypothalamus', 'courage', 'persiflage', 'stirrup', 'non-dealer', 'antecedent', 'unification', 'trough', 'lightness', 'peacetime', 'subway', 'scarcity', 'granddaughter', 'scent', 'toll-rate', 'empathy', 'ash', 'flexibility', 'indulgence', 'stenography', 'drought', 'seedcoat', 'Therapy', 'nonce', 'belief', 'fly', 'equilibrium', 'reckoning', 'wolf', 'ceiling', 'postmark', 'liniment', 'grove', 'BSN', 'oscillator', 'detonation', 'bucket-shop', 'disgust', 'unambiguity', 'utility-cost', 'oratory', 'gala', 'armistice', 'entirety', 'hose', 'retention', 'oak', 'Castor', 'telephone', 'trade-mark', 'turkey', 'bombing', 'shovel', 'advance', 'bottle', 'readjustment', 'incursion', 'equation', 'contagion', 'term', 'revelation', 'farming', 'tetrasodium', 'elucidation', 'courthouse', 'Provision', 'bestowal', 'Summertime', 'wood-oil', 'canvassing', 'advocacy', 'hitter', 'haulage', 'shrinkage', 'corral', 'crunch', 'warmup', 'crackle', 'upright', 'illustration', 'repeal', 'census', 'burley', 'reading', 'theater-going', 'tapdance', 'auditor', 'close', 'leadsman', 'radius', 'wastebasket', 'ex-musician', 'heck', 'loneliness', 'esplanade', 'Oval', 'omelet', 'overheating', 'Tide', 'self-discipline', 'caraway', 'civility', 'breakaway', 'coachman', 'overture', 'tide', 'Skill', 'reward', 'needle', "0.002''", 'timing', 'globulin', 'cutting', 'bat', 'prince', 'filtering', 'St-story', 'horsewoman', 'parallel', 'tidiness', 'Plate', 'regimen', 'sin', 'widegrip', 'mob', 'bounce', 'reprobate', 'electrocardiograph', 'triphenylphosphine', 'X-gyro', 'swoop', 'gate', 'absolute', 'apex', 'knuckleball', 'guidance', 'dullness', 'phosphate', 'reviewer', 'athletics', 'nail', 'noblesse', 'streamliner', 'hurt', 'curettage', 'tunefulness', 'pennant', 'kindergarten', 'IRSAC', '340-blast', 'octopus', 'dingo', 'chassis', 'hour', 'upset', 'stealing', 'roar', 'countian', 'pre-planning', 'synthesis', 'manse', 'cloth', 'pandemic', 'in-group', 'shish', 'course', 'imbecile', 'extremity', 'gardener', 'hub', 'exodus', 'preview', 'accessory', 'flavor', 'wrath', 'socialization', 'co-star', 'contracting', 'judgeship', 'negativism', 'morphine', 'appetite', 'gymnast', 'lounge', 'alias', 'Faculty', 'preradiation', 'wood', 'subdivision', 'upper-middle-class', 'pyrophosphate', 'zero-magnitude', 'parapet', 'sun-suit', 'blackjack', 'scar', 'tunnel', 'remuda', 'log-jam', 'hum', 'dog-pin', 'Lung', 'bard', 'cost-of-living', 'apologist', 'dynamite', 'TNT', 'distraction', 'psychiatrist', 'companionway', 'drib-drool', 'pen-and-ink', 'underarm', 'Land', 'hell-fire', 'deposit', 'beating', 'procurer', 'tyme', 'Memory', 'corpus', 'striptease', 'realm', 'self-sufficiency', 'dystrophy', 'soil-removal', 'pair', 'racketeer', 'discrepancy', 'Car', '340TR', 'wine-', 'picture-palace', 'Cylinder', 'headroom', 'linden', 'murmur', 'shout', 'construction', 'Business', 'bundle', 'Math', 'Cigarette', 'acidity', 'headache', 'fracture', 'adapting', 'panelization', 'Silence', 'tyrant', 'persuading', 'Voter', 'divestiture', 'retentiveness', 'nerve', 'poppy', 'Temperature', 'desperation', 'SRELEASE', 'geography', 'shea', 'hackwork', 'infection', 'alabaster', 'hardtack-box', 'self-pacification', 'refinement', 'bonus', 'resentment', 'Sameness', 'pearl', 'pedal', 'fondness', 'Everywhere', 'chronicle', 'bunch', 'adagio', 'cowardice', 'road-circuit', 'bookcase', 'feed', 'loin', 'nuance', 'teamster', 'edging', 'Victory', 'fraternity', 'costume', 'check-out', 'pre-history', 'Health', 'profession', 'grasp', 'muse', 'mishap', 'bootlegger', 'departure', 'plaster-of-Paris', 'foyer', 'RCA', 'slipper', 'technician', 'dilettante', 'Wingman', 'digit', 'one-third', 'backside', 'leitmotif', 'stiletto', 'Labor', 'seal', 'toughness', 'mauler', 'area', '10%', 'last', 'horse', 'Nonsense', 'VTOL', 'godhead', 'blob', 'belfry', 'smell', 'extermination', 'artistry', 'communion', 'Publisher', 'fine-tooth', 'slumber', 'heart', 'melancholy', 'telephone-booth', 'dent', 'Prince', 'moving', 'ethic', 'median', 'fox-terrier', 'deluge', 'filigree', 'tarpon', 'heaving', 'vibration', 'Plane', 'horse-radish', 'ventricle', 'salt-fractionation', 'indicator', 'job-', 'assessor', 'port', 'decorum', 'misinterpretation', 'philanthropist', 'cellist', 'fishing-boat', 'argument', 'Eighteenth-century', 'husband-stealer', 'heroin', 'Bedtime', 'expiation', 'sonofabitch', 'Aircraft', 'attacker', 'demoralization', 'bone', 'inaccuracy', 'blot', 'spout', 'cap-and-ball', 'cemetery', 'mariner', 'interim', 'love-in-action', 'mystique', 'militant', 'myrrh', 'soft-drink', 'gust', 'spraying', 'underpinning', 'world', 'expressiveness', 'murderer', 'trace', 'bathos', 'prejudice', 'warp', 'restorability', 'coachwork', 'recontamination', 'Soil', 'heiress', 'tilling', 'drive-in', 'advisor', 'printmaking', 'pail', 'Passage', 'stranger', 'thrusting', 'lightning', 'Mystery', 'Earth', 'rime', 'discharge', 'villager', 'sommelier', 'imperialism', 'deprivation', 'autocollimator', 'wine', 'volcano', 'follow-through', 'constancy', 'moth', 'headmaster', 'making', 'adventure', 'strait', 'supporter', 'primitivism', 'affront', 'juvenile', '1/2-inch', 'anatomy', 'madman', 'democratization', 'antiredeposition', 'bubble', 'shin', 'shore', 'infirmary', 'fielder', 'dauphin', 'mistress', 'narcotic', 'commander', 'home-for-the-night', 'will', 'elementary-school', 'curtain', 'stack', 'Carrier', 'interviewing', 'crowing', 'armadillo', "marchin'", 'directness', 'holder', 'Beneficiary', 'forepart', 'gazer', 'official', 'appropriateness', 'raid', 'vulture', 'gall', 'saga', 'n', 'exit', 'affluence', '$1', 'UGF', 'directorate', '$.50', 'mouthful', 'occupancy', 'practicing', 'shoestring', 'antiseptic', 'AIEE', 'signal', 'pottery', 'Leadership', 'ocarina', '25%', 'folk', 'gallery', 'hero', 'Lovie', 'A-bombs', 'warm-up', 'unconcern', 'roughness', 'stock-market', 'Man', 'performance', 'liability', 'baby-sitter', 'birdie', 'proprieter', 'penman', 'viciousness', 'out-group', 'static', 'accusation', 'carrier', 'Trial', 'sequestration', 'skiing', 'capitalist', 'helm', '-ism', 'concierge', 'booster', 'scaffold', 'demanding', 'demarcation', 'darbuka', 'FLN', 'radar-type', 'expiration', 'legatee', 'battle-ax', 'individualism', 'wingman', 'stub', 'taboo', 'recording', 'Folklore', 'shawl', 'Prestige', 'serpent', 'cleavage', 'tularemia', 'absoluteness', 'Acreage', 'inversion', 'courtesy', 'figment', 'undoing', 'non-skid', 'outsider', 'haste', 'inconsistency', 'nip', 'cur', 'uptrend', 'fable', 'fibrin', 'revolver', 'elevation', 'mudwagon', 'Sashimi', 'suffix', 'chrome', 'shaft', 'hurley', 'somersault', 'Messrs', 'scavenger', 'counseling', 'filler', 'pineapple', 'roadhouse', 'garb', 'lasso', 'going', 'velours', 'loudspeaker', 'ballerina', 'pantheon', 'broom', 'immigrant', 'Number', 'mustiness', 'playroom', 'clemency', 'declivity', 'guar', 'journey', 'conciseness', 'rodder', 'quality', 'substantiation', 'auctioneer', 'belt', 'upkeep', 'pothole', 'arteriosclerosis', 'self-dictate', 'opportunity', 'USOM', 'summarization', 'cartoon', 'hooliganism', 'ordeal', 'belching', 'Promotion', 'hubbub', 'Rector', 'restoration', 'speedboat', 'fallacy', 'bear', 'vogue', 'Readiness', 'crosswalk', '25.1%', 'corduroy', 'functional', 'Anniversary', 'rock', 'secret', 'nihilist', 'aggregation', 'inscrutability', 'reserpine', 'beep', 'loan', 'ruddiness', 'heading', 'fencing', 'decoration', 'sea-village', 'weariness', 'positivism', 'thiihng', 'response', 'lustre', 'ritual', 'postgraduate', 'tooth', 'deduction', 'quintet', 'self-government', 'whispering', 'Prosperity', 'flux', 'caucus', 'mouse', 'passenger', 'mood', 'thinking', 'knoll', 'discord', 'regiment', 'booker', 'competitor', 'tease', 'infancy', 'angel', 'indignation', 'oxygen', 'Government', 'work-satisfaction', 'sunspot', 'clout', 'surrender', 'temper', 'XRESERVE', 'cumulus', 'dance', 'ASME', 'Intermarriage', 'reactivity', 'pa', 'lats', 'saxophone', 'tranquilizer', 'romanticism', 'breakwater', 'nozzle', 'bypass', 'sinus', 'luncheon', 'rocket-bomb', 'jowl', 'hermeneutics', 'two-thirds', 'ellipsis', 'bop', 'textile', 'postponement', 'governess', 'complacency', 'spike', 'thanksgiving', 'grillework', 'landlord', 'exec', 'possibility', 'barn', 'childhood', 'capstan', 'veranda', 'fuss', 'R-Warren', 'hillbilly', 'necropsy', 'Respect', 'scouring', 'blueberry', 'legitimacy', 'waterproofing', 'designing', 'antibody', 'pose', 'sportsmanship', 'menu', 'pause', 'painting', 'hoste', 'brightness', 'mail', 'willow', 'Adherence', 'roundhead', 'video', 'renunciation', 'influenza-pneumonia', "han'", 'half-intensity', 'Af-fold', 'vista', 'whiteface', 'par-5', 'loading', 'contribution', 'shoe', 'original', 'criminal', 'horde', 'haberdashery', 'sobriety', 'curvature', 'punchbowl', 'undercut', 'interne', 'counter-offensive', 'patrician', 'fluting', 'seedbed', 'corona', 'Tact', 'extern', 'parking', 'commander-in-chief', 'implementation', 'counsel', 'miniature', 'nowhere', 'barking', 'novelist', 'particle', '12-gauge', 'chance', 'decision-making', 'balance', 'gunpowder', 'vice-regent', 'one-horse', 'baseballight', 'cessation', 'ambition', 'stylemark', 'incompleteness', 'bison', 'bonanza', 'saw-horse', 'slowing', 'residence', 'hansom', 'catalogue', 'endorsement', 'pi', 'poise', 'vaporization', 'emerald', 'manufacturer', 'calcium', 'slop', 'wildness', 'pyre', 'escheat', 'agglutinin', 'escapist', 'patrolman', 'outdoors', 'graduation', 'microchemistry', 'paper', 'land', 'walk-up', 'civilization', 'crupper', 'photograph', 'reaffirmation', 'salad', 'ear', 'flowering', 'agrarian', 'bivouac', 'self-rule', 'dose', 'showmanship', 'tt', 'EDMOV', 'billing', 'elevator', '1-degree-C', 'epitaph', 'insult', 'narrative', 'scorecard', 'melioration', 'taxation', 'trance', 'connection', 'non-wage', 'slant', 'split-level', 'Nosebleed', 'tossing', 'Charity', 'sesame', 'irritant', 'resemblance', 'human', 'talk', 'memory', 'pine', 'extrovert', 'folder', 'coal-railroad', 'Literature', 'pistol', 'red-light', 'actuality', 'anode', 'Muscle', 'Cancer', 'chartist', 'singleness', 'variant', 'reverse', "NRLDA's", 'family-welfare', 'counter', 'shuffle', 'Adaptation', 'bevy', 'questionnaire', 'long-hair', 'solid-state', 'ocelot', 'notebook', 'squeal', 'buoyancy', 'periodicity', 'Europeanization', 'beaver', 'round-table', 'ball', 'raiser', 'gentility', 'egotist', 'not-ace', 'holiday', 'gun', 'teardrop', 'booby-trap', 'prank', 'transmission', 'magnanimity', 'wrong', 'Open-flame', 'strain', 'segregationist', 'territory', 'electric', 'work-out', 'cavity', 'solicitude', 'proclamation', 'modicum', 'umbrella', 'multistage', 'plume', 'single-dose', 'breast', 'cowpony', 'timbre', 'sod', 'cytolysis', 'access', 'crown', 'sociality', 'duty', 'remuneration', 'sun', 'scoffing', 'foal', 'stabilization', 'poseur', 'eyesight', 'thermopile', 'jungle', '25-footer', 'kick-up', 'bisque', 'cistern', 'excursion', 'chasm', 'librarian-board', 'feminist', 'accomplishment', 'boomtown', 'groundwave', 'version', 'Carbon', 'PBS', 'serge', 'perfume', 'thumb-', 'half-a-dozen', 'teen-ager', 'fleck', 'thinker', 'red-tile', 'head', 'shed', 'center', 'governor', 'rise', 'combat', 'playboy', 't', 'shirt', 'newel', 'Style', 'club', 'statute', 'demand', 'reproducibility', 'Atonement', 'outpost', 'tint', 'x-ray', 'finder', 'withdrawal', 'sailor', 'Motion', 'incredulity', 'blackmail', 'postman', 'tableland', 'dream', 'continuum', 'cyclist', 'visitor', 'wound', 'forethought', 'editorship', 'verisimilitude', 'betting', 'boatman', 'cavorting', 'ancient', 'restaurateur', 'self-protection', 'lesson', 'hydrido', 'seminar', 'importance', 'Whiskey', 'L-P', 'finite', 'smithy', 'Farm', 'schoolboy', 'biennium', 'suggestibility', 'tariff', 'high-energy', 'Week', 'underclassman', 'self-righteousness', 'footstool', 'verve', 'thrill', 'appraisal', 'teamwork', 'method', 'orgone', 'benzene', 'Sea-road', 'vineyard', 'boy-furiendo', 'flock', 'high-water', 'fright', 'shift', 'adroitness', 'pillar', 'chief', 'diet', 'knot', 'Prairie', 'Total', 'accountant', 'wastrel', 'functionalism', 'intuition', 'layette', 'bark', 'mathematics', 'refrigerator', 'provenance', 'intent', 'plank', 'vanity', 'Daughter', 'low-tension', 'baker', 'historiography', 'burglar', 'NLRB', 'nemesis', 'horsemanship', 'pricing', 'crassness', 'sellout', 'population', 'Nitrogen', 'GA', 'gladiator', 'multimillionaire', 'pasture', 'industrialist', 'handhold', 'infarction', 'enterprise', 'apple-tree', 'bun', 'agenda', 'wicket', 'invasion', '65%', 'tactic', 'scratchiness', 'streak', 'cesium-137', 'Merchant', 'bloom', 'disability', 'azalea', 'conceptuality', 'industrialism', 'vaginal', 'submucosa', 'cholinesterase', 'proportionality', 'stray', 'Span', 'plain', 'vein', 'hypertrophy', 'colleague', 'dial', 'infinity', 'girdle', 'heavy-duty', 'i-th', 'gratitude', 'ornament', 'repentance', 'baron', 'determinism', 'ESP', 'grower', 'yyyy', 'newcomer', 'beard', 'brewery', 'thrombosis', 'vow', 'Location', 'twinge', 'thong', 'simpleton', 'Vice-president', 'massage', 'constriction', 'FELA', 'clothing', 'inheritance', 'bushel', 'animation', 'juxtaposition', 'episode', 'sport', 'instrumentation', 'trek', 'peculiarity', 'live-oak', 'hurdle', 'alchemy', 'pre-selling', 'legislator', 'plastering', 'incarnation', 'fuel', 'photography', 'farmland', 'businessman', 'barbecue', 'museum', 'phonology', 'wildlife', 'sociability', 'ex-truck', 'fancy', 'stress', 'offal', 'chef', 'fieldwork', 'taskmaster', 'Display', 'floor-length', "rep'tation", 'recovery', 'loon', 'kill', 'delineation', 'assignee', 'nymphomaniac', 'Training', 'creeper', 'bungalow', 'savior', 'don', 'dawn', 'cold-war', 'retriever', 'muff', 'blend', 'intrusion', 'siege', 'base', 'encampment', 'wasteland', 'recompence', 'outflow', 'trader', 'liquor', 'motive', 'primitive', 'volunteer', 'conference', 'imbalance', 'godsend', 'badness', 'compiler', 'predictability', 'random-storage', 'discontinuance', 'booty', 'evaluation', 'coldness', 'riverbank', 'bumper', 'resolution', 'hostess', 'extrapolation', 'snick', 'protagonist', 'alteration', 'breaker', '0.5-mv./m.', 'ruthlessness', 're-introduction', 'precedence', 'LSO', 'shelter', 'cochannel', 'slick', 'perpetuation', 'spinneret', 'frangipani', 'respiration', 'ruler', 'Fame', 'successor', 'rustle', 'abuse', 'geeing', 'rig', 'wreckage', 'cunning', 'rank', 'Autosuggestibility', 'descendant', 'homogenate', 'gas-glass', 'producing', 'bulkhead', 'click', 'ridge', 'Rain', 'fanfare', 'smear', 'playwright-director', 'deference', 'levitation', 'chart', 'chase', 'sunlight', 'loaf', 'writ', 'sub-interval', 'coat', 'jubilation', 'scale', 'chore', 'hodge-podge', 'delivery', 'grader', 'photo-montage', 'Belief', 'glamor', 'Weight', 'pick', 'clapping', 'practicality', 'drawing', 'whodunnit', 'Secretary', 'Tradition', 'leftist', 'waiter', 'acumen', 'cat', 'discernment', 'violet', 'juncture', 'censorship', 'equating', 'ventilation', 'beef-fat', 'emptiness', 'melody', '**yj', 'forefinger', 'rationalism', 'give', 'boxcar', 'lawsuit', 'copy', 'fighting', 'modernism', 'chain-reaction', 'skillet', 'pastry', 'sleep', 'scream', 'persecution', 'theme', 'co-extinction', 'instruction', 'linguistics', 'device', 'cabaret', 'typicality', 'audition', 'lettering', 'staining', 'quart', 'cadence', 'Codification', 'digger', 'sentry', '85%', 'cove', 'luxuriance', 'substratum', 'trumpeter', 'succession', 'village', 'footing', 'Branch', 'moldboard', 'craftsmanship', 'booby', 'salesman', 'syringe', 'enumeration', 'left-hand', 'smallpox', 'detractor', 'somnolence', 'wasp', 'eclipse', 'inadequacy', 'otter', 'Constitution', 'engineering', 'organ', 'plane', 'Exhibition', 'ankle', 'beech', 'recruiter', 'taunt', 'feed-lot', 'fee', 'mine', 'drugstore', 'one-thousand-zloty', 'flop', 'hog', 'War', 'planner', 'peninsula', 'Procaine', 'purging', 'septation', 'weaponry', 'book-selection', 'obstacle', 'ex-prize', 'skill', 'display', 'optimality', 'clamshell', "seven-o'clock", 'foe', 'River', 'dead-end', 'inoculation', 'splice', 'priest', 'whisky', 'summit', 'high-level', 'inventory', 'coming', 'lunatic-fringe', 'townsman', 'sucess', 'ward', 'incline', 'engineer', 'ministry', '158-pounder', 'streetlight', 'presupposition', 'menarche', 'detestation', 'knife/coating', 'psychoanalyst', 'whole-word', 'flautist', 'beefsteak', 'description', 'psychologist', 'hospitalization', 'kiss', 'inertia', 'topsoil', 'editor', 'parent-child', 'fiend', 'modification', 'pilgrim', 'shock', 'yelling', 'eruption', 'pensioner', 'al', 'smaller-size', 'fontanel', 'circumspection', 'externalization', 'ramification', 'apology', 'paraphernalia', 'blitz', 'earthmoving', 'loblolly', 'fishpond', 'semi-city', 'bulb', 'yearning', 'broil', 'depot', 'single-shot', 'soccer', 'poodle', 'southpaw', 'welcome', 'authorship', 'pantry', 'nightmare', 'incubation', 'bedpost', 'pigskin', 'gown', 'selection-rejection', 'tally', 'sojourner', 'half-mile', 'brother', 'rocking', 'misunderstanding', 'triple-tank', 'pepper', 'pool', 'rapport', 'pardon', 'phenonenon', 'desolation', 'covenant', 'premonition', 'degradation', 'credit', 'arithmetic', 'fence', 'bruise', 'headquarter', 'lumber', 'mealynose', 'co-op', 'bloke', 'reagent', 'spoonful', 'Mc/sec', 'tip', 'wavelength', 'paddock', 'perfusion', 'issuance', 'chaw', 'vp', 'LD060', 'newlywed', 'Ruthlessness', 'home', 'Drug', 'undershirt', 'diffidence', 'di-iodotyrosine', 'Distribution', 'untidiness', 'fallout', 'Tenure', 'impact', 'oratorio', 'closeness', 'dislike', 'demi-monde', 'buckboard', 'deficiency', 'underside', 'Work', 'feud', 'freshness', 'bogey', 'industrialization', 'Rank', 'chancery', 'mid-twentieth-century', 'circumlocution', 'twitch', 'chastisement', 'attire', 'fiasco', 'tourist', 'Capital', 'arch-opponent', 'Service', 'simile', 'injection', 'nonfiction', 'cohesiveness', 'scout', 'pentagon', 'kerchief', 'imbroglio', 'penny', 'refusal', 'byproduct', 'deductibility', 'equality', 'shouting', 'breach', 'halt', 'cooking', 'trollop', 'inside', 'determinability', 'Pm', 'long-haul', 'mastiff', 'contraception', 'circularity', 'waiting', 'great-grandmother', 'produce', 'rifle', 'clarinet', 'Selection', 'pall', 'expenditure', 'drinking', 'shipboard', 'enemy-Jew', 'low-duty', 'hate', 'obstructionist', 'destiny', 'artisan', 'vault', 'container', 'toolmaker', '45%', 'ribbon', 'Day', 'antidote', 'bathrobe', 'martingale', 'resilience', 'ruling', 'gig', 'long-range', 'nugget', 'name-dropper', 'insignificance', 'crowbait', 'clatter', 'propionate', 'Prevention', 'acculturation', 'bristle', 'cue-phrase', 'vest', 'advertising', 'relationship', 'dissatisfaction', 'DIOCS', 'commandment', 'crasher', 'sea-damp', 'onslaught', 'downtrend', 'l', 'thiouracil', 'pastel', 'food-preservation', '2.325%', 'swearing', 'hex', 'wreath', 'craftsman', 'screening', 'highlight', 'compulsivity', 'bric-a-brac', 'squall', 'privilege', 'centenary', 'ransom', 'hypervelocity', 'brood', 'campmate', 'batten', 'syllabicity', 'one-reel', 'practice', 'pumpkin', 'citizen', 'equator', 'abbey', 'mantel', 'duel', 'Stand', 'metaphysics', 'facet', 'principal', 'expedient', 'flatness', 'radiance', 'R-stage', 'fern', 'Shade', 'husbun', 'claim', 'last-round', 'psalmist', 'night', 'opening-day', 'appointment', 'Candy', 'l.', 'clowning', 'anti-semite', 'artifice', 'vice-chairman', 'lyricist', 'self-serve', 'baroness', 'do-gooder', 'Oil-field', 'logistics', 'Preparation', 'firm', 'roemer', 'starch', 'temperance', 'smile', 'pin-curl', 'dissociation', 'lesion', 'claw', 'brigadier', 'dazzler', 'Sweat', 'carpenter', 'jiffy', 'throughput', 'lapidary', 'octahedron', 'Transportation', 'architecture', 'bluster', 'poncho', '10-M-diameter', 'observer', 'ROK', 'hearse', 'limit', 'hug', 'keno', 'bumble-bee', 'illusion', 'stroll', 'special-interest', 'cleric', 'gunfire', 'swivel', 'gaze', 'application', 'depersonalization', 'tansy', 'corporation', 'recompense', 'second-echelon', 'seller', 'passiveness', 'refuge', 'wintertime', '86%', 'solenoid', 'mentality', 'V-shaped', 'frank', 'link', 'maiden', 'sinfulness', 'cream', 'gelding', 'hypocrite', 'phonemics', 'poppyseed', 'imaging', 'butchery', 'confinement', 'dramatics', 'caliber', 'embargo', 'pleasure-boat', 'axis', 'airmail', 'railroading', 'enlargement', 'shit', 'letting', 'kickoff', 'seepage', 'greeting', 'memorizing', 'mucosa', 'prognosticator', 'art-shop', 'allurement', 'dinner', 'dirt-catcher', 'past-fantasy', 'wreck', 'two-by-four', 'moratorium', 'orthodontist', 'muffler', 'multiple-choice', 'match', 'freight-jumper', 'sex', 'gangplank', 'TEA', 'Engrg', 'prosperity', 'physicist', 'sweep', 'swan', 'Flatness', 'tract', 'timepiece', 'w', 'hoot', 'long-distance', 'discredit', 'turnover', 'keelson', 'sheep', 'leader', 'princess', 'curator', 'garishness', 'particular', 'hob', 'hissing', 'gloom', 'imprisonment', 'stainless-steel', 'sassing', 'superposition', 'babyhood', 'singer', 'style', 'ammonium', 'venture', 'hinge', 'Dance', 'judiciary', 'easel', 'mealie-meal', 'bull', 'gypsum', 'revolutionary', 'file', 'Arrangement', 'jackass', 'gunbarrel', 'Coffee', 'admirer', 'Alcohol', 'isolation', 'Flash', 'procession', 'urbanism', 'softwood', 'radiography', 'ossification', 'matron', 'lament', 'rogue', 'eve', 'phosphor-screen', 'sheet', 'deposition', 'handicap', 'bonnet', 'apprentice', 'turtle', 'one-sixteenth', 'scoop', 'Economy', 'molasses', 'gale', 'Poverty', 'tour', 'micro-microcurie', 'week', 'pile', 'greatcoat', 'swimsuit', 'milliliter', 'chambermaid', 'matrimony', 'impresario', 'radiocarbon', "A's", 'outburst', 'lignite', 'revenge', 'verge', 'archtype', 'epigraph', 'transfer', 'enzyme', 'blight', 'tennis', 'inch', 'absurdity', 'nation-state', 'narration', 'immunoelectrophoresis', 'litterbug', 'P-20', 'ham', 'Home', 'lucy', 'Average', 'preservation', 'loom', 'build', 'workout', 'battle', 'wristwatch', 'quotation', 'cotter', 'disappearance', 'corruption', 'activation', 'sterility', 'idleness', 'disk', '8.6-mm', 'currant', 'floe', 'expressionism', 'transaction', 'ordering', 'Secrecy', 'double-wall', 'Test', 'airfield', 'modernization', 'Uncertainty', 'thyronine', "1''", 'applicability', 'adolescence', 'resident', 'bureau', 'bridge', 'abdomen', 'Hip-pocket', 'chouise', 'marijuana', 'maximization', 'still', 'delicacy', 'Motive', 'cobra', 'brute', 'disc', 'stethoscope', "3''", 'derangement', 'facility', 'plugugly', 'applause', 'hook', 'valve', 'recipient', 'neurosis', 'hiding', 'reader', 'watch-spring', 'retraction', 'turtle-neck', 'privet', 'affect', 'pop', 'stevedore', 'congressman', 'snowfall', 'hamming', 'engagement', 'mispronunciation', 'minimum', 'metaphor', 'dexterity', 'woodwind', 'twirler', 'lightweight', 'castle', 'screw', 'hopper', 'short-run', 'war-time', 'heating', 'acrobacy', 'afternoon', 'airflow', 'message', 'attempt', 'pun', 'compatriot', 'near-absence', 'sofa', 'disorderliness', 'threesome', 'SbCs-type', 'fascination', 'notoriety', 'pulp', 'S-s-sahjunt', 'Debutante', 'transferral', 'willingness', 'disciple', 'virtue', 'Pre-decoration', 'scrutiny', 'car', 'rating', 'unpleasantness', 'vaulting', 'liar', 'launcher', 'large-area', 'title', 'suavity', 'applejack', 'restatement', 'Index', 'peril', 'low-grade', 'mountainside', 'IOCSIXG', 'competence', 'flooring', 'schnapps', 'neuropathology', 'nutshell', "NAREB's", 'pupil', 'journalese', 'treat', 'harness', 'withholding', 'automobile', 'road-show', 'hospitality', 'blood-lust', 'defensiveness', 'semester', 'junction', 'treasure', 'requirement', 'chromium', 'closing', 'idiot', 'Barrel', 'soprano', 'Walnut', 'innuendo', 'jeep', 'chimney', 'hotbed', 'quick-kill', 'compromising', 'duplication', 'fig.', 'swell', 'yeah', 'oboist', 'FITC', 'poll', 'apostle', 'confidence', '14%', 'bracing', 'NAEBM', 'NAIRO', 'phrasing', 'predecessor', 'trouble', 'payoff', 'cupboard', 'slice', 'Wall', 'defacing', 'legislature', 'laugh', 'sun-tan', 'radiosterilization', 'alliance', 'platter', 'precept', 'rattail', 'longtime', '0.080-in.', 'terrier', 'transportation', 'blow', 'Interest', 'fortune', 'hijacking', 'motto', 'rank-and-file', 'Alley', 'Slice', 'happiness', 'neo-swing', 'hope', 'sacrifice', 'giant', 'herd', 'beginner', 'probe', 'stockbroker', 'Currency', 'relativity', 'typhoid', 'teacher', 'Analysis', 'captain', 'sedition', 'contributor', 'tale', 'Treatment', 'widowhood', 'aeon', 'centimeter-', 'examiner', 'disease', 'stained-glass', 'dew', 'secretion', 'swim', 'tailor', 'dairy', 'air', 'tango', 'conjunction', 'pope', 'feat', 'delusion', 'mahua', 'subparagraph', '**yt', 'impotency', 'nomenclature', 'campaign', 'silver', 'composite', 'bride', 'jargon', 'animism', '280-yard', '10-year-old', 'table-tennis', 'compassion', 'side', 'breaking', 'brazil', 'rapping', 'grandson', 'savor', 'Chicken', '50-percent', 'succor', 'salmon', 'teasing', 'Cereal', 'subhumanity', 'mistake', 'R', 'quickness', 'monolith', 'wandering', 'golfer', 'hoss', 'urge', 'biopsy', 'red', 'structure', 'SWAO', 'proto-senility', 'disorganization', 'asteroid', 'dive', 'housework', '5-percent', 'psychiatry', 'millivoltmeter', 'forearm', 'showman', 'dam', 'implant', 'money-making', 'quirt', 'hive', 'cm.', 'stability', 'betrayal', 'wigmaker', 'intelligentsia', 'statuary', 'flaxseed', 'thug', 'middle-class', 'infrared', 'News', 'Organ', 'trouble-shooter', 'fourth-class', 'moisture', 'rifling', 'barbed-wire', 'conniver', 'cocoon', 'PTC', 'heroism', 'vise', 'composer-pianist-conductor', "D'", 'revolution', 'confession', 'butler', 'snare', 'SETSW', 'Powder', 'Page', 'salesgirl', 'goldsmith', 'junior', 'danseur', 'orderly', 'piston', 'hit', 'status', 'redefinition', 'execution', 'soft-heartedness', 'dandelion', 'copra', 'bailiff', 'lance', 'low-speed', 'accordion', 'railroader', 'sister-in-law', 'thesaurus', "AEC's", 'hawing', 'dancing', 'big-stage', 'carport', 'self-examination', 'Love', 'liquidity', 'brink', 'Feeding', 'overcoat', 'stylist', '10.8%', 'draining', 'tug', 'rads', 'pale', 'NC', 'self-respect', 'storefront', 'Nationalism', 'matching-fund', 'choir', 'toweling', 'Bull', 'countryside', 'conservatism', 'breakfast-table', 'problem', 'dominance', 'authoritarianism', 'harvest', 'replica', 'de-iodinase', 'form', 'beadsman', 'smash', 'emotion', 'academy', 'sixth-sense', 'season', 'crossing', 'planting', 'coroner', 'unawareness', '/l/', 'cover', 'franchise', 'jockey', "B-52's", 'to-do', 'Fig.', 'cortex', 'self-analysis', 'fueloil', 'yardage', 'priming', 'pick-up', 'fibrosis', 'violinist', 'baking', 'spokesman', 'finger', 'coverall', 'operation', 'washing', 'mid-shimmy', 'foreign-entry-limit', '5%', 'schoolhouse', 'bum', 'KARL', 'congratulation', 'rancidity', 'aesthetics', 'sadist', 'brazier', 'favoritism', 'reason', 'fealty', 'coupon', 'rhyme', 'constrictor', 'stripe', 'parent-teacher', 'spider', "ICBM's", 'competition', 'typewriting', 'process', 'entranceway', 'desertion', 'criss-crossing', 'crash', 'mode', 'fish', 'anti-Catholicism', '**yc', 'burning', 'pursuer', 'polo', 'amendment', 'bush', 'regularity', 'yore', 'abreaction', 'Fruit', 'no-back', 'oblivion', 'encouragement', 'travel', 'pyschiatrist', 'hardboard', 'hand', 'foreknowledge', 'Chlorothiazide', 'declaration', 'yip', 'gull', 'glorification', 'mailman', 'fouling', 'fever', 'Gentleman', 'powerfulness', 'artist', 'Retrace', 'polecat', 'quarter', 'variable-speed', 'astonishment', 'pickoff', 'metronome', 'lifetime', 'player', 'headdress', 'creek', 'anchorage', 'flagellation', 'graduate', 'truck', 'X-ray', 'misanthrope', 'ante', 'ape', 'roadblock', 'irreproducibility', 'tris(hydroxymethyl)-aminometha', 'boiler-burner', 'wart', 'skylight', 'genii', 'restlessness', 'repartee', 'viscoelasticity', 'welding', 'reinvestigation', 'abyss', 'enthusiasm', 'material', 'propagation', 'lint', 'sphere', 'prettiness', 'gentian', 'centre', 'by-pass', 'hay-wagon', 'fence-line', 'drapery', 'Sensibility', 'bronze', 'dreariness', 'twinkle', 'tonic', 'Confidence', 'broccoli', 'symposium', 'resurrection', 'make', 'pound', 'hand-blower', 'ICC', 'richness', 'lookout', 'expert', 'staff', 'sprinkle', 'random', 'buzz', 'blade', 'rendering', 'variety', 'yeast', 'scrupulosity', 'voting', 'alley', 'tailgate', 'souffle', 'bulletin', 'sleeping', 'circle', 'bolt-action', 'coupler', 'snoring', 'alcoholism', 'babel', 'servo', 'diathesis', 'Membership', 'spindle', 'analyticity', 'chord', 'sallying', 'sand', 'hacksaw', 'nosebleed', 'channel', 'flashback', 'conversation', 'zebra', 'misery', 'obesity', 'adjunct', 'elation', 'elasticity', 'confrontation', 'buckskin', 'majority', 'lead', 'sabotage', 'temerity', 'Entrance', 'secrecy', 'emphasis', 'researcher', 'oxidation', 'go', 'distortion', 'parsimony', 'pseudo-emotion', 'senora', 'tangent', 'adjective', 'progandist', 'inspector', 'blame', 'diffusion', 'backyard', 'immersion', 'y', 'extraction', 'scenario', 'photomicrography', 'liner', 'calorie', 'shine', 'deployment', 'laminate', 'sago', 'terminal', 'antagonism', 'boomerang', 'indivisibility', 'bucking-up', 'gantlet', 'barrier', 'siesta', 'open-meeting', 'Impact', 'improviser', 'hard-sell', 'gagline', 'lip-sucking', 'headlinese', 'brilliance', 'borax', 'shadowing', 'nonreactivity', 'sermon', 'liberty', 'microwave', 'misuse', 'shinbone', 'laissez-faire', 'pre-emption', 'Funeral', 'feudalism', 'fairness', 'iodination', 'setback', 'well-being', 'X-ray-proof', 'gangland', 'Childhood', 'havoc', 'downfall', 'dormitory', 'heresy', 'relict', 'machinegun', 'sample', 'clause', 'habitat', 'Soup', 'sandalwood', 'counterbalance', 'small-game', 'fog', 'infamy', 'appropriation', 'comment', 'astrophysics', 'steeple', 'fusion', 'unreliability', 'base-runner', 'pledge', 'Prednisone', 'fantasia', 'temple', 'rear-guard', 'citation', 'coalescence', 'noncompliance', 'melodrama', 'bore', 'straw', 'light-mindedness', 'bench', 'bodyguard', 'leprosy', 'wartime', 'Horse', 'rouge', 'outside', 'disgrace', 's-values', 'perfectability', 'irrationality', 'picturing', 'A/3', 'fighter', 'downpayment', 'upstairs', 'arrival', 'comportment', 'fawn', 'representational', 'plasticity', 'eventuality', 'Knowledge', 'directive', 'floater', 'High-gain', 'thermostatics', 'rampart', 'blonde', 'financing', 'fluency', 'aged-care', 'epilogue', 'clang', 'huddle', 'gm', 'Assistant', 'redundancy', 'lever', 'shampoo', 'vocalist', 'fadeout', 'penury', 'premium', 'party-line', 'redeposition', 'sword', 'hedge', 'puke', 'proposition', 'escutcheon', 'hatchet', 'copper', 'averaging', 'onset', 'spacing', 'gin', 'twenty-first-century', 'accommodation', 'low-frequency', 'chirping', 'SiH', 'abeyance', 'web', 'termination', 'spice', 'first-level', 'reflection', 'insinuation', 'blanket', 'questionaire', 'rail', 'Soybean', 'wardroom', 'acquiesence', 'Hymen', 'hunch', 'conformance', 'corrupter', '21-cm', 'sampling', 'substrate', 'chuckle', 'personality', 'by-product', 'raisin', 'diorah', 'casualty', 'Cholesterol', 'diagnostic', 'Stoneware', 'laurel', 'double-stage', 'squash', 'marker', 'nationalism', 'sowbelly', 'hepatitis', 'disadvantage', 'Specialty', 'pH', 'equivalent-choice', 'triplication', 'cookie', 'gargle', 'alienation', 'dispensary', 'corrupting', 'tense', '20-inch-barrel', 'f{t}', 'Eternity', 'interceptor', 'oxytetracycline', 'interaction', 'ebony', 'shallowness', 'Corporation', 'decorativeness', 'bowl', 'disaster', 'trotter', 'bilharziasis', 'fiance', 'rite', 'forthrightness', 'thinness', 'snakestrike', 'self-portrait', 'gastronomy', 'effluent', 'carload', 'millenarianism', 'rust', 'capitulation', 'acquiescence', 'note', 'prechlorination', 'airport', 'allure', 'procreation', 'deadliness', 'Over-chilling', 'reflector', 'stereotype', 'reorientation', 'speaking', 'evolution', 'Privacy', 'chastity', 'parameter', 'dimension', 'blemish', 'backlog', 'cooling', 'probation', 'Opera', 'unhappiness', 'hamlet', 'suicide', 'hydroxylation', '**yp', 'comet', 'hick-self', 'rain', 'Rabies', 'thumb-sucking', 'immobility', 'recklessness', 'forestry', 'reputation', 'bookshelf', 'diffraction', 'typesetting', 'pre-vision', 'user', 'rehash', 'longevity', 'naturalism', 'musician', 'NYU', '2-year-old', 'doomsday', 'keening', 'surprise', 'mascara', 'rush', 'stratum', 'culprit', 'chamfer', 'Frontage', 'Tragedy', 'computer', 'pacer', 'factory', 'mink', 'stain', 'robotism', 'plant-location', 'jump', 'pertinence', 'reflex', 'causing', 'box', 'ending', 'sorority', 'diminution', 'outgrowth', 'countryman', '20-megaton', 'Sulfaquinoxaline', 'electrolysis', 'vestibule', 'grounding', 'u.', 'dust', 'continuation', 'poster', 'hangar', 'joss', 'mystification', 'millenium', 'lore', 'bell', 'stratagem', 'hypoadrenocorticism', 'supermarket', 'free-lance', 'fella', 'selling', 'rupee', 'thankfulness', 'impurity', 'gate-post', 'bonfire', 'accessibility', 'electricity', 'S-20', 'turpentine', 'chiefdom', 'nausea', 'USO', 'vaccine', 'invitation', 'grain-storage', 'hay', 'possessor', 'spectrophotometer', 'speculation', 'watchmaker', 'photorealism', 'minute', 'Plaster', 'thought', 'duffer', 'resistor', "5/16''", 'cholesterol', 'liquid', 'hand-level', 'big-town', 'coercion', 'cereal', 'sculptor', 'envelope', 'grocery', "Tailin'", 'trumpet', 'Recapitulation', 'chromatogram', 'Presentation', 'NW', 'strychnine', 'ab', 'Welfare', 'Transmission', 'clue', 'Vent', 'foamed-core', 'polyisocyanate', 'Z-gyro', 'X-region', 'generality', 'restitution', 'Fly', 'Slab', 'butane', 'Opinion', 'axe', 'disassembly', 'bolo', 'Diethylstilbestrol', 'Tranquility', 'steelmaker', 'royalty', 'space', 'exchange', 'exuberance', 'flatiron', 'KSAN', 'Sir', 'parisology', 'Evaluation', 'sea', 'oven', 'CuK**ya', 'varmint', 'commonwealth', 'round-bottom', 'girlie', 'hollyhock', 'coyote', 'argot', 'transmitting', 'flint', 'DEAE', 'goodbye', 'petulance', 'percussion', 'election', 'marginality', 'jug', 'abstraction', 'Fall', 'ex-schoolteacher', 'masonry', 'emperor', 'gallonage', 'polyethylene', 'airframe', 'joyride', 'Boredom', 'retinue', 'convexity', 'intransigence', 'sauce', 'specter', 'pseudo-thinking', 'Doctrine', 'Willingness', 'invite', 'disturbance', 'flag', 'tricolor', 'serum', 'manhood', 'Speed', 'qualification', 'familarity', 'one-two-three', 'oppression', 'milquetoast', 'fender', 'experimentalism', 'mutuality', 'Tax', 'psi', 'Desegregation', 'interior', 'discouragement', 'gadgetry', 'Abolition', 'thwack', 'function', 'screenplay', 'gamebird', 'compact', 'vitality', 'halo', 'phraseology', 'knuckle', 'barrack', 'expense', 'disintegration', 'slippage', 'malingering', 'trophy', 'inter-relation', 'answer', 'rhenium', 'doc', 'density', 'morass', 'packing', 'dissension', 'despairing', 'holster', 'hockey', 'flax', 'roll', 'moonlight', 'hydrophobia', 'lattice', 'niece', 'recipe', 'Communication', 'cross-examination', 'nonogenarian', 'federalism', 'candy', 'disregard', 'testament', 'epidemic', 'experimentation', 'fur', 'publisher', 'gable', 'guardedness', 'henchman', 'gentleness', 'kava', 'image', 'newt', 'nitrate', 'lobule', 'steady-state', 'magnificence', 'bedlam', 'Luck', 'loathing', 'sidewinder', 'non-fiction', 'tribulation', 'mantle', 'vocational-advancement', 'width', 'grandfather-father-to-son', 'convention', 'invalidism', 'traitor', 'vicar', 'absenteeism', 'crewel', 'hardbake', 'concrete', 'booking', 'backing', 'divorce', 'evensong', 'sang-froid', 'fission', 'catechism', '1/4-inch', 'certificate', 'realness', 'fleet', 'district', 'floor', 'surge', 'cession', 'ity', 'summertime', 'propeller', 'Deal', 'toothbrush', 'honeysuckle', 'starter', 'nonpayment', 'weakening', 'Fellowship', 'double-step', 'gibe', 'rehabilitation', 'purpose', 'solidity', 'jay', 'hypothesis', 'masterpiece', 'saline', 'summitry', 'emissary', 'disenfranchisement', 'veto', 'interrogator', 'Rifle', 'anti-Communism', 'cut-glass', 'rescue', 'cloak', 'redress', 'tablet', 'ADC', 'fiction', 'craft', 'die-up', 'claret', 'kazoo', 'Text', 'Nickel-iron', 'imagination', 'native', 'double-crossing', 'romp', 'autograph', 'mullah', 'fluff', 'subsection', "comin'", 'dungeon', '$2', 'milk', 'most-valuable-player', 'scenery', 'show-down', 'oration', 'blast', 'polyisobutylene', 'overpressure', 'ambiance', 'jade', 'historicism', 'tombstone', 'bomber', 'prostitution', 'lithograph', 'hiss', 'animal', 'give-and-take', 'take-off', "meanin'", 'safari', 'urbanization', 'swastika', 'vinyl', 'fortitude', 'Gasoline', 'yell', 'short-barrel', '20th-century', 'feint', 'rooftop', 'resin', 'Furniture', 'donor', 'vestige', 'turn', 'stomack', 'misbehavior', 'adaptation', 'insemination', 'Contact', 'commitment', 'politics', 'antifundamentalist', 'canker', 'horse-trail', 'hr.', 'death', "1/16''", 'curb', '36-in.', 'half-century', 'kitchen', 'foolishness', 'giddiness', 'Notice', 'quake', 'lending', 'cow', 'nationhood', 'hint', 'SE', 'monumentality', 'tiller', 'unease', 'concentration', 'element', 'grip', 'debunking', 'familiarity', 'footbridge', 'vitamin-and-iron', 'untrustworthiness', 'attendance', 'co-operation', 'diamond', 'day', 'first-floor', 'compass', 'Chlortetracycline', 'involuntary-control', 'diagnosing', 'gel', 'climax', 'inverse', 'patrol', 'boil', 'hyperplasia', 'tone', 'son-in-law', 'hotel-motel', 'Level', 'inceptor', 'highroad', 'clover', 'validation', 'tulle', 'wholeness', 'windfall', 'canyon', 'series', 'pageantry', 'yokel', 'croupier', 'aku', 'tick', 'filth', 'grumble', 'hollow', 'E', 'imitation-caning', 'portrait', 'grandstand', 'oleomargarine', 'vagueness', 'top-tang', 'Society', 'directory', 'densitometry', 'skin-perceptiveness', 'wetness', 'mumble', '1', 'slab', 'delinquency', 'romanticizing', 'seizure', 'strangeness', 'queasiness', 'high-interest', 'housing', 'penetration', 'Nervousness', 'rot', 'hush', 'Efficiency', 'find', 'Failure', 'respite', 'lexicon', 'overprotection', 'Lullaby', 'nirvana', 'rift', 'boulevard', 'father-brother', 'sinuousness', 'stupor', 'conformational', 'growl', 'notation', 'drawback', 'Length', 'paranoiac', 'connotation', 'butt', 'placing', 'expectancy', 'doorstep', 'adjournment', 'vowel', 'review', 'vendor', 'latitude', 'sophomore', 'tinning', 'O-B', 'grokking', 'spa', 'wonder', 'Procreation', 'miner', 'grille-route', 'softening', 'mayorship', 'vigilantism', 'perpetrator', 'can', 'comradeship', 'skywave', 'son', 'lineback', 'push-up', 'enlightenment', 'camel', 'Mankind', 'arcus', 'glamour', 'megawatt', 'biplane', 'manpower', 'thunder', 'scholar', 'Emcee', 'single-lane', 'plasma', 'Lousiness', 'corps', 'skeet', 'mortgage', 'bicep', 'transition', 'alizarin', 'Cowbird', 'breeze', 'KKK', 'incongruity', 'cytoplasm', 'polity', 'open-air', 'elongation', 'trouser', 'gainer', 'perspiration', 'demography', 'Booty', 'monkey-gland', 'trisodium', 'barbell', 'bluebook', 'Cocoa', 'leather', "7/16''", 'profusion', 'dipper', 'raving', 'mastoideus', 'reproof', 'tumble', 'door-to-door', 'cost-billing', 'accident', 'tiredness', 'no-hit', 'foliage', 'Office', 'paganism', 'thermometry', 'ground-swell', 'Design', 'searching', 'work-success', 'private', 'stew', "one-o'clock", 'Thyroid', 'subsistence', 'decency', 'lullaby', 'icebox', 'aptitude', 'card', 'milestone', 'ornamentation', 'brown-paper', 'affectation', 'rent', 'usage', 'professor', 'boogie', 'conformation', 'counterman', 'platform', 'truthfulness', 'heat', 'millimeter', 'contraband', "P'", 'switch-hitter', 'Marine', 'marriage', 'mandrel', 'reminiscence', "t's", 'ax', 'mate', 'latex', 'Anglophobia', 'repository', 'full-dress', 'horse-chestnut', 'luggage', 'electrotherapist', 'reimbursement', 'ballplayer', 'open-end', 'attendant', 'sextet', 'symbol', 'pluralism', 'compensation', 'sanction', 'self-defeat', 'bedspread', 'caricature', 'downpour', 'resource-use', 'laudanum', 'crawl', 'factor', 'taper', 'grey', 'cult', 'hail', 'writer', 'nakedness', 'sailing', 'bite', 'drawing-room', 'cryostat', 'scandal', 'boulder', 'kimono', 'prison', 'dinosaur', 'chatter', 'tapping', 'kite', 'millidegree', 'matter-of-factness', 'ivory-inlay', 'careerism', 'mid-week', 'autism', 'break-away', 'floodlight', 'clap', 'employ', '90%', 'puddle', 'wisdom', 'Criticism', 'zealot', 'cowling', 'fuse', 'noose', 'baroreceptor', 'carefulness', 'wind-and-water', 'longer-term', 'crystal', 'Baileefe', 'encephalitis', 'partaker', "AID's", 'triol', 'lime', 're-vision', 'weakness', 'biologist', 'trill', 'percent', 'hawker', 'spirit-gum', 'euphoria', 'anachronism', 'integration', 'egghead', 'short-range', 'puzzler', 'soreness', 'tranquillity', 'safe', 'leaflet', 'Intuition', 'aristocracy', 'interplay', 'grad', 'button', 'ex-jazz', 'picker', 'tumbler', 'Refrigeration', 'rinse', 'infant', 'stick', 'rug', 'fps', 'agony', 'localization', 'past', 'sundown', 'procurement', 'railing', 'bawh', 'mutineer', 'conduction', 'constraint', 'frankness', 'Scarcity', 'refraction', 'Propriety', 'drinker', 'endearment', 'tenderness', 'output-axis', 'Mortar', 'tightening', 'weekend', 'skirt', 'exaggeration', 'colonel', 'Electron', 'insert', 'imagnation', 'tollhouse', 'reunion', 'downturn', 'digitalis', 'horn', 'precipitate', 'comic', 'allotment', 'beach', 'music-making', 'registry', 'fault', 'cruise', 'divination', 'teakettle', 'cushioning', 'goat', 'wallop', 'PHS', 'manipulation', 'short-story', 'grate', 'rivalry', 'amulet', 'launch', 'register', 'solace', 'toe', 'field', 'triptych', 'heave', 'well-baby', 'turf', 'Cotton', 'hemorrhage', 'leave-taking', 'wrinkle', 'employment', 'agitator', 'dryer', 'tongue-thrusting', 'surveyor', 'quarter-inch', 'sturgeon', 'yodel', 'strip', 'shrimp', 'wear', 'calamity', 'utopian', 'faithful', 'pest', 'battle-cry', 'favorer', 'poisoning', 'Disagreement', 'reharmonization', 'ditty', 'adherent', 'vertigo', 'horse-blanket', 'weighting', 'disposition', 'quote', 'intercourse', 'respectability', 'strut', 'rodding', 'interface', 'dichondra', 'planter', 'sigh', 'sweat', 'clothesbrush', 'private-eye', 'walnut', 'cocaine', 'sprig', 'challenger', 'self-betrayal', 'apportionment', 'objectification', 'carpet', 'coil', 'jitterbug', 'map', 'cloudburst', 'distance', 'submitting', 'ordinary', 'emission', 'kidding', 'province', 'shade', 'sickness', 'Drought', 'myth', 'Folk-lore', 'dogmatism', 'drive', 'mother', 'fuzz', 'overexploitation', 'palm', 'revision', 'ambuscade', 'Spoilage', 'crevice', 'g{t}-axis', 'bent', 'exogamy', 'water', 'knowledge', 'therapy', 'pacing', 'list', 'rhododendron', 'swerve', 'diethylaminoethyl', 'gibbet', 'fullback', 'ray', 'co-ordinator', 'downstairs', 'tungsten', 'chick', 'essence', 'nutmeg', 'economist', 'paleness', 'umpire', 'city', 'scare', 'pettiness', 'physiognomy', 'meddling', 'ex-Gov.', 'celebrity', 'high-quality', 'instillation', 'hero-worship', 'stock', 'referent', 'mid-flight', 'alundum', 'microanalysis', 'fact', 'week-end', 'wharf', 'capitalism', 'department', 'housekeeping', 'doctrine', 'subscription', 'rubble', 'sax', 'catch', 'bluebush', 'supplement', 'progression', 'plot', 'barricade', 'manuscript', 'dilation', 'daybreak', 'dynasty', 'IBM', 'Liberty', 'chairman', 'headland', 'overtime', 'chair', 'repetition', 'sladang', 'backstitch', '2.5%', 'satiety', 'category', 'DSM', 'precipice', 'trolley', 'veil', 'Care', 'occupant', 'broiler', 'scripture', 'faker', 'coral', 'stream', 'acquaintance', 'muster', 'gadfly', 'calibration', 'weir', 'monasticism', 'chicanery', 'libertine', 'Bicycle', 'Student', 'approach', 'archdiocese', 'stopover', 'injustice', 'reactionary', 'fiber', 'flurry', 'upswing', 'Ice', 'sine', 'antipathy', 'glue', 'gain', 'H', 'balloon', 'thunk', 'repulsion', 'dogwood', 'countriman', 'rightist', 'adversary', 'rallying', 'bounty', 'assertiveness', 'lookup', 'underwriting', 'merchandise', 'appeasement', 'ghost', 'variation', 'wire', 'embodiment', 'eyebrow', 'odd-lot', 'stimulus', 'rebuilding', 'municipality', 'resuspension', 'digest', 'torrent', 'marvel', 'mound', 'back-yard', 'nutrition', 'dioxalate', 'locomotive', 'follow-up', 'instructor', 'cadmium', 'drone', 'bridle', 'cannon', 'jakes', 'amity', 'amplitude', 'glance', 'lessening', 'college', 'house', 'Sample', 'crafter', 'brew', 'flashlight', 'borderline', 'mid-section', 'chive', 'hotel', 'introject', 'packet', 'funnel', 'perception', '3-to-o', 'chuck', 'half-darkness', 'seniority', 'operetta', 'brevity', 'railhead', 'self-redefinition', 'con', 'crypt', 'enslavement', 'cafeteria', 'busy-work', 'carryover', 'parachute', 'Definition', 'hamburger', 'savagery', 'Mortality', 'cement', 'contract', 'knight-errantry', 'glee-club', 'computation', 'non-poetry', 'vigilance', 'sound', 'fillip', 'awkwardness', 'Editor', 'hearing-aid', 'vacuum', 'gauze', 'home-city', 'availability', 'collision', 'pirate', 'resonance', 'dragon', 'net', 'Bulletin', 'suspension', 'slouch', 'blunder', 'Mrad', 'sunshine', 'partnership', 'fruitfulness', 'bookkeeping', 'Escalation', 'e', 'pebble', 'applicant', 'punched-card', 'machine', 'fabric', 'behalf', 'labyrinth', 'dress', 'AEC', 'tinkering', 'big-daddy', 'elite', 'standard', 'lieu', 'politicking', 'ballot', 'cost', 'morning-glory', 'facsimile', 'honor', 'raise', 'killer', 'hon', 'slam', 'phonograph', 'Avant-garde', 'antique', 'Gallium', 'hubby', 'vulnerability', 'tight-turn', 'glaze', 'station', 'open', 'reverse-surface', 'hysteria', 'battleground', 'spectre', 'debt', 'Almond', 'frost', 'psyllium', 'surfactant', 'Refund', 'knack', 'feler', 'gnome', 'rumble', 'constant', 'mid-century', 'windstorm', 'histology', 'beauty', 'proteolysis', 'cud', 'assassination', 'tinder', 'playwriting', 'bayleefe', 'child-face', 'Yachtel', 'doubte', 'bequest', 'rebound', 'tutor', 'cutting-edge', 'obelisk', 'type', 'malocclusion', 'melting', 'homage', 'homer', 'bloat', 'self-deception', 'rawhide', 'nebula', 'prop', 'R-Cape', 'soil', 'correspondence', 'turnpike', 'damnation', 'invasion-theory', 'bellicosity', 'eighteen-year-old', 'portion', 'lens', 'kaleidescope', 'might', 'outrage', 'DUF', 'memento', 'nondriver', 'excerpt', 'daydreaming', 'pigeonhole', 'jumper', 'producer-hubby', 'discipleship', 'in', 'distrust', 'beebread', 'broadside', 'keyhole', 'tree', 'hospital-care', 'philharmonic', 'trust', 'runner', 'finale', 'low-wage', 'spatter', 'tending', 'bhoy', 'fuchsia', 'Deputy', 'art', 'furlough', 'jeweler', 'topnotch', 'crossover', 'ace', 'identity', 'manslaughter', 'khan', 'sunbonnet', 'cleaning', 'wohd', 'victim', 'beneficiary', 'avenue', 'orb', 'killing', 'duplicate', 'jag', 'oversight', 'oath', 'reinforcement', 'martyr', 'placement', 'block-buster', 'overpopulation', 'cannery', 'length', 'sting', 'GE', 'metropolitanization', 'sputnik', 'weightlessness', 'orthodontics', 'shower', 'mean-square', 'grinding', 'nurse', 'measles', 'functioning', 'ICA', 'vagina', "6'.7", 'Height', '**yg', 'fashion', 'hasher', 'ire', 'clot', 'misogynist', 'dystopia', 'pranha', 'grade-equivalent', 'upper-level', 'Contract', 'gallbladder', 'freezer', 'turtleneck', 'locale', 'countrey', 'commercialization', 'busyness', 'self-acceptance', 'hideaway', 'scepticism', 'amino', 'yacht', 'ivory', 'establishing', 'SD', 'toilet', 'inscription', 'grabbing', 'schizophrenic', 'grub', 'bazaar', 'reliance', 'self-preservation', 'curriculum', 'cramp', 'carborundum', 'fore-play', 'asparagus', 'federation', 'takeoff', 'spelling', 'historicity', 'potpourri', 'hulk', 'lull', 'coin', 'one-kiloton', 'R-6th', 'oathe', 'throng', 'mechanics', 'vivacity', 'edema', 'dysentery', 'disclosure', 'Livestock', 'cooler', 'metabolism', 'thinning', 'rustler', 'retribution', 'repudiation', 'proceeding', 'shooter', 'publicity', 'low-level', 'ex-fighter', 'spy', 'yardstick', 'in.', 'Squire', 'rejoinder', 'bicarbonate', 'transcription', 'peer-group', 'sidelight', 'witness', 'egg', 'demander', 'Peak', 'makeup', 'egalitarianism', 'fan', 'high-density', 'modernity', 'retailing', 'fluorescence', 'threat', 'concerto', 'elegance', 'perturbation', 'hesitancy', 'jury', 'Import', 'bunker', 'lecturer', 'dealer', 'fatality', 'industralization', 'seduction', 'charcoal', 'awareness', '3.5%', 'traveller', 'striking', 'sheath', 'right-angle', 'someplace', 'handyman', 'uttermost', 'pull', 'blessing', 'minter', 'fresco', 'canister', 'W', 'Inability', 'point', 'will-to-power', 'hydrochloride', 'mid-continent', 'bad', 'dollar', 'Attorney', 'price-level', 'schoolgirl', 'subordinator', 'taffy', 'schema', 'frequency', 'expose', 'dramatization', 'rpm', 'homerun', 'ripening', 'scatter', 'dimensioning', 'egotism', 'town', 'magic', 'good-will', 'thief', 'bravery', '**ymg', 'Injury', 'locust', 'cuckoo-bumblebee', 'dampness', 'whirl', 'afghan', 'legislation', 'emergence', 'oilman-rancher', 'Construction', 'trans-illumination', 'articulation', 'preferment', 'miscreant', 'casebook', 'homogenization', 'offender', 'cigarette', 'nagging', 'pith', 'wellbeing', 'batch', 'FFA', 'Consultation', 'Electromyography', 'Bar', 'desert', 'AAA', 'maker', 'Sedimentation', 'binder', 'leftfield', 'preference', 'question-and-answer', 'insulin', 'counterpoint', 'rapid-fire', 'softness', 'concertina', 'love', 'Promazine', 'Hell', 'transferee', 'society', 'bucket', 'stockade', 'gob', 'Thinking', 'barbital', 'nightshirt', 'prodigy', 'intern', 'supply', 'compressor', 'Rumor', 'fireman', 'jurisdiction', 'steward', 'case', 'instance', 'courtesan', 'removal', 'righthander', 'prosecutor', 'pellagra', 'modulation', 'M-4', 'lavender', 'one-eighth', 'unanimity', 'thyroid', 'Black', 'quetzal', 'aversion', 'sludge', 'bandwagon', 'dowry', 'old-style', 'gristmill', 'epsom', 'parasite', 'discussion', 'endosperm', 'wall', 'shipbuilding', 'nadir', 'fairy', 'hearsay', 'conscript', 'castigation', 'common', 'stardom', 'die', 'art-historian', 'proprietorship', 'fabrication', 'woodwork', 'statue', 'van', 'kick-off', 'in-fighting', 'anniversary', 'enlistment', 'cleverness', 'Shock', 'ghoul', 'bodyweight', 'overseer', "sayin'", 'hydrocarbon', 'fine-point', 'cock', 'XRELEASE', 'completeness', 'Author', 'impetus', 'listing', 'sop', 'bulwark', 'sequel', 'limitation', 'transgression', 'exclusion', 'steamer', 'chuck-a-luck', 'wind-velocity', 'drill', 'close-up', 'Chromatography', 'baby', 'coarseness', 'infatuation', 'rental', 'Rookie', 'bleat', 'laureate', 'liaison', 'uranyl', 'hybrid', 'monument', 'sawdust', 'carrot', 'Resentment', 'DTF', 'kind', 'squeak', 'archery', 'nylon', 'distributor', 'fine', 'decompression', 'arrest', 'pulpit', 'contrabass', 'cobblestone', 'letterhead', 'bloodlust', 'throw', 'organization-position', 'tomb', 'test-run', 'winter', 'k', 'beachhead', 'amortization', 'wooden-leg', 'dread', 'forerunner', 'vaccination', 'Attendance', 'one-stroke', 'amphitheater', 'terrain', 'full-of-the-moon', 'true', 'reproduction', 'mahogany', 'becoming', 'hide-out', 'ignorance', 'coke', 'last-ditch', 'muscle', 'sketchbook', 'attrition', 'BOD', 'parkway', 'ferry', 'unfortunate', 'background', 'inappropriateness', 'chill', 'sonata', 'battery', 'firelight', 'spaciousness', 'taxicab', 'executioner', 'providence', 'beam', 'stretcher', 'playback', 'Technique', 'manifold', 'depiction', '8-oz.', 'ham-radio', 'abasement', 'cloture', 'covetousness', 'ft.', 'mastic', 'Telephone', 'fur-piece', 'sail', 'flu', 'collar', 'ascent', 'load', 'subtlety', 'forklift', 'tuition', 'pathos', 'dispensation', 'carver', 'TSH-treated', "5/64''", 'peach', 'rejoicing', 'sadness', 'inexperience', 'trickle', 'muck', 'Emancipation', 'din', 'nickel-iron', 'profit', 'space-time', 'courtier', 'calf', 'focus', 'total-cost', 'fist-fighting', 'over-achievement', 'one-year', 'co-author', 'defect', 'procreativity', 'memory-picture', '1.0-mg.', 'notice', 'allegory', 'Island', 'earthquake', 'optimism', 'Absolution', 'mg.', 'cerebellum', 'zest', 'Workshop', 'thermistor', '33-1/3%', 'mechanic', 'Time', 'wealth', 'topic', '400-kc.', 'precision', 'sock', 'forecast', 'excursus', 'Basement', 'cold', 'absorber', 'one-act-play', 'revelry', 'one-dumbbell', 'owner', 'Nature', 'apocalypse', 'adultery', 'fixing', 'horsepower', 'suggestion', 'torque', 'tray', 'subconscious', 'complaint', 'BOD/day/1,000', 'frontier', 'highland', 'battlefield', 'stewardship', 'vernier', 'iota', 'ritiuality', 'saffron', 'Self-criticism', 'summer', 'son-of-a-bitch', 'stake', 'second-floor', 'incipiency', 'prohibition', 'mist', 'interrogation', 'tyrosine', 'marketplace', 'sainthood', 'coed', 'pervaporation', 'affinity', 'COLH', 'ileum', 'temperature', 'contamination', 'welter', 'Gossip', 'contortion', 'matter', 'agglomeration', 'orchestra', 'avocation', 'line-density', 'physician', 'seventeenth-century', 'centennial', 'Park', 'groping', 'gypsy', 'international', 'hiking', 'fortress', 'insolence', 'half-acre', 'canine', 'let', 'eyelid', 'aqua-lung', 'Q3', 'fraction', 'trail', 'dear', 'investigation', 'grimace', 'relation', 'gnomon', 'inviolability', 'merit', 'rheum', 'rape', 'outcast', 'officer', 'blubber', 'muskadell', 'progressivism', 'coconut', 'theatre', 'domain', 'specialization', 'Age', 'wielder', 'critique', 'courtliness', 'swamp', 'average', 'sonar', 'statement', 'forte', 'hot-honey', 'arm', 'rebel', 'Reliance', 'lyric', 'lute', 'drip', 'inning', "ma'am", 'disrespect', 'interposition', 'roundup', 'top-drawer', 'whip', 'technical-ladder', 'husband', 'Institutionalization', 'valet', 'lordship', 'dining', 'paging', 'archipelago', 'spoilage', 'corn-belt', 'remoteness', 'myocardium', 'Doubt', 'motorist', 'squaw', 'preparedness', 'sherry', 'intercept', 'eye-strain', 'sacrilege', 'adulthood', 'longhand', 'penicillin', 'kaleidoscope', 'effluvium', 'congruence', 'integer', 'attainment', 'Gospel-singer', 'anthropology', 'itemization', 'being', 'navigation', 'steamship', 'shame', 'generator', 'biology', "herdin'", 'parcel', 'recruitment', 'errand', 'monkey', 'outback', 'dispute', 'trick', 'plumbing', 'stay', 'loophole', 'dictatorship', 'martini', 'camera', 'spasm', 'opprobrium', 'oil-bath', 'sub-zero', 'sinking', 'storyline', 'rundown', 'creep', 'try', 'Need', 'Guar', 'desirability', 'face-lifting', 'plumber', 'briefing', 'robbery', 'spending', 'Evidence', 'addiction', 'retort', 'misdemeanor', 'decentralization', 'groundwork', 'Newspaper', 'limited-time', 'self-delusion', 'testing', 'footwork', 'core', 'crisis', 'junk', 'wager', 'vapor-pressure', 'botany', 'authenticator', 'documentary', 'leprae', 'actinometer', 'sulfur', 'validity', 'soaking', 'SEATO', 'vanguard', 'singularity', 'centerline', 'Reliability', 'leafmold', 'thread', 'announcement', 'cathode', 'troupe', 'Salvation', '1000-m-diameter', 'complicity', 'pulse-jet', 'solar-wind', 'necktie', 'input', 'shriek', 'crucifixion', 'brandy', 'hatching', 'liquid-glass', 'capture', 'pony', 'cycle', 'Mine', 'noon', 'reservoir', 'Conveyance', 'piezoelectricity', 'production', 'cosmology', 'I', 'objective', 'enrollment', 'cleansing', 'song', 'noun', 'Corn', 'pronoun', 'CBS', 'mention', 'equipping', 'pyrometer', 'Captain', 'reelection', 'white', 'plantation', 'owning', 'sportsman', 'consultation', 'market-place', 'investment', 'dialectic', 'signal-intensity', 'indenture', 'pyramid', 'immaturity', 'yen', 'tri-motor', 'Camp', 'Tooth', 'second', 'arroyo', 'chanter', 'money-maker', 'sneaker', 'bud', 'communist', 'commune', 'hookup', 'captivity', '450', 'dying', 'AF', 'prolusion', 'Starch', 'acolyte', 'g{t}', 'megalomania', 'headline', 'overload', 'gait', 'slovenliness', 'rearguard', 'layman', 'Paprika', 'fire', 'sash', 'paradise', 'maid', 'tomato', 'darn', 'detergent', 'half-man', 'runner-up', 'microorganism', 'favor', 'Conscience', 'Principal', 'sophistication', 'foraging', 'carbonyl', 'substance', 'receptionist', 'annual', 'Veronica', 'toasted-nut', 'bust', 'couch', 'behavior', 'higher-quality', 'styryl-lithium', 'Lot', 'revival', 'case-history', 'tincture', 'penalty', 'self-esteem', 'slingshot', 'immorality', 'demeanor', 'charge-a-plate', 'planer', 'contact', '13%', 'deviation', 'eccentricity', 'heyday', 'bar-buddy', 'mounting', 'saltbush', 'truce', 'spreading', 'THC', 'Bead', 'plundering', 'chlorpromazine', 'establishment', 'string', 'wife-to-be', 'FDA', 'creativity', 'commissioner', 'guiltiness', 'crack', 'sprinkling', 'genie', 'say-so', 'naivete', 'guarantee', 'disguise', 'credibility', 'centralization', 'methacrylate', 'sclerosis', 'shoot', 'coquette', 'gaucherie', 'optics', 'guru', 'passage', 'theatergoer', 'shirtsleeve', 'love-making', 'Object', 'Reply', 'matchmaker', 'large-package', 'offering', 'footfall', 'rooster', 'self-dramatization', "3/16''", 'neuralgia', 'antigen', 'clan', 'cohesion', 'roundhouse', 'Shelter', 'touch', 'teahouse', 'Use', 'Strategy', 'squirt', 'orange', 'bug', 'example', 'commercial', 'short-time', 'World', 'stapling', 'antenna', 'Bunch', 'glass-bottom', 'make-believe', 'Roleplaying', 'resultant', 'lifeblood', 'dichotomy', 'brushwork', 'immigration', 'dioxide', 'alliteration', 'utmost', 'reasoning', 'window-washing', 'fauteuil', 'wave', 'producer', 'toothpaste', 'blister', 'contemporary', 'fecundity', 'Supper', 'uppercut', 'expressionist', 'physiotherapist', 'NOP', 'Argon', 'Mmes', 'glacier', 'Taxation', 'portfolio', 'adulation', 'awarding', 'prod', 'tweed', 'thiocyanate-perchlorate-fluoro', 'existence', 'typewriter', 'worsted', 'acetate', 'lash', 'troubie', 'exacerbation', "6'", 'tea-leaf', 'windup', 'diving', 'var.', 'frog', 'conditioner', 'bagpipe', 'detente', 'FDR', 'footstep', 'equalization', 'maget', 'legibility', 'neck', 'agitation', 'nigger', 'anarchy', 'taffeta', 'change-over', 'arsenic', 'grade', 'arak', 'Prohibition', 'oilcloth', 'nitroglycerine', 'sage', 'calling', 'underwear', 'earned-run', 'jest', 'rival', 'clockwork', 'grillwork', 'sanctity', 'housewife', 'outlawry', 'informality', 'infantry', 'high-gain', 'arcade', 'boarding-home', 'pacifist', 'fist', 'mixing', 'sideboard', 'commissary', 'annoyance', 'belaboring', 'Reduction', 'Y-regions', 'draught', 'cupful', 'institution', 'lieutenant', 'catalog', 'investor', 'shoji', 'eradication', "NATO's", 'linen', 'ed.', 'constant-temperature', 'Library', 'butyrate', 'steer', 'whim', 'boss', 'curio', 'picnic', 'rationalization', 'brucellosis', 'simplicity', 'maxim', 'tobacco', 'inmate', 'productivity', 'fringe', 'pro', 'butyl-lithium', 'tramp', 'beer-runner', 'forage', 'common-sense', 'paragon', 'union-industry', 'shopping-center', 'piping', 'groin', 'fitness', 'tilt', 'cabdriver', 'text-lookup', 'strike', 'wahtahm', 'invalid', 'aggressor', '**yl', 'plagiarism', 'handiwork', 'High-level', 'massuh', 'athleticism', 'sorption', 'quickstep', 'reverie', 'presentation', 'Pattern', 'synonymy', 'hi-fi', 'suction', 'winehead', 'hooch', 'splinter', 'beer', 'whitetail', 'electronography', 'standpoint', 'credo', 'grease', 'first-degree', 'Light', 'indication', 'eating', 'psyche', 'fun', 'embroidery', 'fullness', 'sienna', 'Scholarship', 'characteristic', 'hypercellularity', 'masquerade', 'A40-AjK', 'Color', 'stage', 'labor-management', 'account', 'granary', 'small', 'counterpart', 'looking', 'alibi', 'periodical', 'wisp', '12%', 'built-detergent', 'consistency', 'forthcoming', 'stewardess', 'racket', 'letter', 'winner', 'leisure', 'skimming', 'walrus', 'rutabaga', 'passing', 'clock', 'engraving', 'difference', 'controversy', 'stern', 'hyalinization', 'stasis', 'churning', 'profanity', 'stoker', 'phloem', 'manikin', 'third-inning', 'clientele', 'lipstick', 'Sanity', 'voter', 'popularity', '**zg', 'restriction', 'piracy', 'predomination', 'armful', 'sternum', 'handmaiden', 'yucca', 'plaque', 'brashness', 'seat', 'abandonment', 'perjury', 'churchyard', 'largesse', 'debauchery', 'skiff', 'correctness', 'nursery', 'aggression', 'pajama', 'sufficiency', 'Shore', 'aptness', 'globetrotter', 'stylization', 'WBAI', 'peltry', 'big-game', 'ingratitoode', 'confessor', 'printer', 'violation', 'weather', 'phony', 'cane', 'open-work', 'teleology', 'K', 'grand-slam', 'overcrowding', 'quarter-century', 'brushfire', 'circus', 'segregation', 'Lunch', 'coloration', 'monologist', 'desk', 'self-determination', 'defender', 'U-I', 'supper', 'bio-medicine', '7.6%', 'sadism', 'silence', 'foreign-policy', 'shrillness', 'Picture', 'jelly', 'Locust', 'malignancy', 'blowing', 'settler', 'cutback', 'virtuoso', 'ride', 'hyperemia', 'manzanita', 'candle', 'self-defense', 'Contempt', 'AM', 'scissoring', 'squadroom', "12''", 'sunrise', 'school', 'creaking', 'outcry', 'mean', 'studio', 'rubbish', 'regulation', 'spacer', 'mustard', 'gapt', 'hairshirt', 'blacksmith', 'calculation', 'contemplation', 'Shoulder', 'hunter-killer', 'fore', 'inventor', 'intention', 'impulse', 'fluorescein', 'chip', 'edifice', 'jet', 'honey', 'pre-existence', 'inferiority', 'schooner', 'university', 'debacle', 'untruth', 'ex-singer', 'patina', 'vocalism', 'sudden', 'kegful', 'screenland', 'incompatibility', 'streamer', 'framer', 'stable', 'order', 'contender', 'mining', 'shanty', 'mutiny', 'distension', 'anxiety', 'keyboarding', 'continent', 'salvation', 'synonym', 'director-general', 'meteor', 'crystallography', 'Activity', 'compound', 'lb/day', 'amp', 'notion', 'accompaniment', 'total', 'Socialism', 'pavilion', 'tablespoonful', 'rope', 'cart', 'memorandum', 'underground', 'reporting', 'plow', 'plug', 'mudguard', 'conservative', 'insanity', 'detection', 'friendliness', 'hypnosis', 'underhandedness', 'intellectual', 'trainman', 'lever-action', 'gabardine', 'hydride', 'satisfaction', 'wilderness', 'Vermouth', 'waitress', 'one-minute', 'shaker', 'swath', 'dereliction', 'ringing', 'avoidance', 'insurrection', 'reclassification', 'susceptibility', 'idol', 'photomicrograph', 'nephew', 'Motion-picture', 'certiorari', 'trapper', 'instinct', 'T-34', 'league', 'slate', 'canoe', 'breather', 'gunflint', 'hickory', 'deformity', 'term-end', 'dollarette', 'implication', 'Amp', 'one-act', 'stealth', 'tang', 'suddenness', 'totalitarianism', 'mailbox', 'bed-time', 'bulk', 'crackpot', 'lathe', 'hideout', 'adjudication', 'legion', 'televison-record', 'discount', 'gallop', 'plight', 'conservatory', 'monk', 'upturn', 'etiquette', 'rupture', 'bomb', 'likelihood', 'aborigine', 'apparency', 'skin', 'saloonkeeper', 'scimitar', 'section', 'clustering', 'banker-editor', 'Planning', 'time', 'M-1', 'Baldness', "BTU's", 'falloff', 'radiopasteurization', 'despair', 'miss', 'crackling', 'jet-black', 'devotion', 'bachelor', 'bias', 'gossamer', 'diam', 'mind', 'Mail', 'pegboard', 'prediction', 'number', 'OH', 'wedding', 'publishing', 'pseudo-capitalism', 'gladness', 'suntan', 'vioiln', 'stiffening', '320TR', 'tektite', 'brothel', 'cornstarch', 'gravy', 'manufacture', 'envy', 'opener', 'lightning-occurrence', 'eloquence', 'authenticity', 'mercury', 'offer', 'nominee', 'make-ready', 'catching', 'sitter', 'pipeline', "n'th", 'locker-room', 'carnival', 'lit', 'Road', 'tamale', 'mapping', 'yoke', 'proxy', 'RA', 'cancellation', 'instigator', 'expressivness', 'essay', 'cottonseed', 'antiquity', 'boatload', 'lethargy', 'rectitude', 'Omission', 'real-life', 'crewcut', 'crusher', 'min', 'harpsichord', 'Af-inch', 'interferometer', 'Superstition', 'ruse', '1.25%', 'conversion-by-renovation', 'eggshell', 'ardor', 'breed', 'SAC', 'meanness', 'statesman', 'Kidnaper', 'Survivability', 'gunfighter', 'cannonball', 'allegiance', 'licensing', 'student', 'leadership', 'manager', 'Toll', 'bandage', 'V-1', 'habit', 'pterygia', 'siding', 'dais', 'seaquake', '8%', 'time-delay', 'batterie', 'foregoing', 'intercrisis', 'exploitation', 'socket', 'stoneware', 'conformist', 'fertility', 'feasibility', 'avidity', 'zero', 'flyer', 'herpetology', 'cartoonist', 'mountain', 'spider-leg', 'fig', 'oxcart', 'transmitter', 'bookseller', 'thermodynamics', 'annum', 'lack', 'pollen', 'patent', 'pseudo-happiness', 'washbowl', 'one-fourth', 'notification', 'survivor', 'bearing', 'elm', 'radiator', 'financier', 'questioner', 'OWI', 'Circuit', 'anion', 'candour', 'dowel', 'virulence', 'symphony', '22%', 'feeding', 'carcinoma', 'reel', 'slitter', 'dogma', 'twist', 'possession', 'elaboration', 'Comedy', 'vine', 'shoot-down', 'collection', 'out-of-mind', 'Platform', 'lifting', 'demagnification', 'Overriding', 'third', 'confirmation', 'propriety', 'costing', 'portraiture', 'crook', 'Roll', 'reign', 'cache', 'buffalo', 'sterno-cleido', 'velvet', 'newsstand', 'chauffeur', 'fluid', 'left-centerfield', 'dram', 'daybed', 'snow-fence', 'severalty', 'chin', 'supervisor', 'vicinity', 'USGA', 'policeman', 'marksmanship', 'drizzle', 'Sonar', 'uncle', 'clubhouse', 'weight-height', 'output', 'exclusive', 'six-shooter', 'right', 'subtraction', 'constatation', 'consul', 'Malocclusion', 'safe-conduct', 'workmanship', 'abolition', 'opinion', 'technique', 'vegetable', 'double-header', 'alcohol', 'imputation', 'wage', 'blackout', 'minor', 'corollary', 'stiffness', 'shoe-string', 'bindle', 'Boundary', 'sprue', 'radiochlorine', 'deactivation', 'proprietor', 'osteoporosis', 'Dollar', 'D8', 'Discovery', 'patience', 'inhabitation', 'Additive', 'Point', 'visa', 'due', 'council', 'thoughtfulness', 'sonnet', 'Boy', 'Mother', 'stubbornness', 'polybutene', 'provision', 'tremor', 'Diversity', 'Ballet', 'cloud', 'meet', 'chorus', 'payroll', 'charge-excess', 'germanium', 'arside', 'shrubbery', 'levy', 'polio', 'efficacy', 'magazine', "rock'n'roll", 'disrepair', 'flame', 'ground-glass', 'republic', 'psychopath', 'charisma', 'cumara', 'morgue', 'UCLA', 'razor', 'statesmanship', 'saver', 'obscurity', 'disapprobation', 'infestation', 'general', 'freeze-out', 'air-frame', 'waterway', 'megaton', 'chin-up', '$25-a-plate', 'bind', 'cheetah', 'obscenity', 'out-of-sight', 'vertebrate', 'Professor', 'cottonmouth', 'cleft', 'Ambiguity', 'recital', 'sinkhole', 'niche', 'rumdum', 'fifth-century', 'co-operative', 'shell', 'Wine', 'briskness', 'swirl', 'sheik', 'rocket', 'survey', 'dedication', 'super-city', 'proof', 'Tolerance', 'contrary', 'gravestone', 'pseudo-willing', 'bee', 'frustration', 'caricaturist', 'greensward', 'roughneck', 'uniform', 'market', 'chap.', 'aim', 'toil', 'motion-picture', 'vitamin', 'gaming-card', 'certainty', 'birth', 'monei', 'nnuolapertar-it-vuh-karti-birifw-', 'small-car', 'capacitance', 'Position', 'Honor', 'Acceptance', 'CODE,DTF', 'buggy', 'congeniality', 'country', 'cotillion', 'passport', 'epicenter', 'defiance', 'Wonder', 'regrouping', 'mushroom', 'configuration', 'derivative', 'correction', 'electrocardiogram', 'pulley', 'N/g', 'ladder', 'road', 'Ant', 'double-entendre', 'inhalation', 'forcefulness', 'wrong-o', 'oscillation', 'carbon-halogen', 'weapon', 'amusement', 'pleura', 'control', 'jaw', 'proctor', 'dad', 'bravura', 'vintage', 'employe', 'N', 'tranquility', 'low-temperature', 'verb', 'ejection', 'present', 'supplier', 'footman', 'Idea', 'teletype', 'gamut', 'improvising', 'Guidance', 'huskiness', 'sander', 'scorcher', 'Form', 'sign', 'programming', 'labor', '960-mc', 'boot', 'ooze', 'tire', 'warrant', 'positive', 'budgeting', 'shipment', 'deer', 'scaffolding', 'anchovy', 'felon', 'Harmony', 'Terror', 'righteousness', 'law-enforcement', 'Volume', 'consonant', 'beer-running', 'dessert', 'louse', 'component', 'disquiet', 'strap', 'panjandrum', 'high', 'retrospect', 'processing', 'transcendence', 'glycerin', 'valuation', 'overemphasis', 'Comment', 'seaman', 'mass-production', 'decolletage', 'epiphysis', 'serratus', 'thyroxine', 'persistent', 'java', 'kiloton', 'piloting', 'discursiveness', 'authorization', 'Y-gyro', 'husbandry', 'conciliator', "comet's-tail", 'sedan', 'abstractedness', 'runt', 'mythology', 'preserve', 'booklet', 'breakup', 'calinda', 'schooling', 'syrup', 'intensity', 'Anglophilia', 'imprimatur', 'pier-table', 'rifleman', 'microscopy', 'alarm', 'heather', 'rumen', 'circumference', 'detachment', 'falsehood', 'onus', 'absorption', 'revaluation', 'Research', 'spreader', 'claimant', 'stramonium', 'napkin', 'AjB', 'Right', 'gangster', 'absentia', 'infield', '57%', 'Catcher', 'tulip', 'joint', 'quiet', 'narcosis', 'commencement', 'mough', 'helpmate', 'alertness', 'Agriculture', 'football', 'slope', 'distributorship', 'shutter', 'wit', 'extract', 'janitor', 'modifier', 'pilgrimage', 'skit', 'sweater', 'ineptness', 'light-headedness', 'part', 'classmate', 'scop', 'harping', '/r/', 'finance', 'opening', 'malevolence', 'expansiveness', 'Holiness', 'dead-weight', 'gurgle', 'journalism', 'plea', 'brawl', 'unbalance', 'P', 'incisiveness', 'Neglect', 'trait', 'spruce', 'little-town', 'magnet', 'urban-fringe', 'continuity', 'sulphur', 'pass', 'enemy', 'silke', 'laxness', 'peacock', 'libel', 'cowboy', 'panorama', 'composition', 'osmium', 'quasi-performer', 'stress-temperature', 'helper', 'Competition', 'proponent', 'silica-glass', 'sideline', 'rim', 'chap', 'byline', 'shill', 'roomful', 'exploration', 'renaturation', 'Language', 'paycheck', 'Cost', 'daggerman', 'lamb', 'non-com', 'intemperance', 'constitution', 'sari', 'bumming', 'pageant', 'balletomane', 'public-opinion', 'Writing', 'redactor', 'prop.', 'mortification', 'Urethane', 'harp', "l's", 'rub', 'watching', 'versatility', 'parson', 'hunk', 'dump', 'camouflage', 'freeman', 'self-discovery', 'peanut', 'broth', 'shag', 'staircase', 'uncertainty', 'blouse', 'pond', 'humanism', 'whiz', 'fad', 'monastery', 'organism', 'anomie', 'sterilization', 'Anti-Semite', 'carnality', 'tenure', 'cadet', 'photographer', 'Body', 'bd/ft', 'balm-of-Gilead', 'banjo', 'marking', 'gambler-politician', 'pseudo-sophistication', 'satellite', 'hallmark', 'non-college', 'intima', 'Price', 'tolylene', 'incubus', 'TUC', 'campground', '0.1-mv./m.', 'sentimentality', 'contour', 'rib', 'exquisiteness', 'Ventilation', 'Fragment', 'tarpaulin', 'pitch', 'pate', 'Trouble', 'complex', 'tournament', 'ceramics', 'crime', 'lineage', 'banging', 'gullibility', 'highboard', 'NATO', "colorin'", 'ductwork', 'hilarity', 'consonance', 'virgin', 'skewer', 'sentiment', 'back-issue', 'pack', 'punching', 'wide-door', 'oxide', 'marshal', 'titanium', 'wardrobe', 'morality', 'ladle', 'clarification', 'premier', 'welfare', 'restaurant', 'synthesizine', 'uptake', 'seclusion', 'grandmother', 'swipe', 'dough', 'one-digit', '**yf', 'mg/l/hr', 'songbook', 'metal', 'client-service', 'collaborator', 'detergency', 'missionary', 'stead', 'driver', 'jig', 'salami', 'campus', 'glaucoma', 'exclamation', 'Data', 'keyboard', 'roommate', 'usher', 'surplus', 'quenching', 'cruising', 'Shell', 'bail', 'deviance', 'midnight', 'fiesta', 'thorn', 'displacement', 'J', 'xenophobia', 'regimentation', '3%', 'pizzicato', 'blizzard', 'handshake', 'misconstruction', 'monitoring', 'dispossession', 'convertible', 'public-limit', 'brake', "four-o'clock", 'doorknob', 'choring', 'fortnight', 'criterion', 'prospect', 'Safety', 'buckshot', 'klaxon', 'underbelly', 'government', 'mix', 'bill', 'beadle', 'request', 'secularism', 'weekly', 'orientation', 'cu', 'child-cloud', 'balustrade', 'whisper', 'stretch', 'incest', 'sea-beach', 'wretchedness', 'stretching', 'one-over-par', 'flutist', 'induction', 'melange', 'stroke', 'speaker', 'freshman', 'snowstorm', 'adequacy', 'family-community', 'pat', 'ego', 'debating', 'selection', 'lexicostatistics', 'Reason', 'aconte', 'liberalism', 'railroad', 'prune', 'chagrin', 'duet', 'constituent', 'backbend', 'relevancy', 'equal', 'praise', 'contest', 'hut', 'thick', 'violin', 'cowhide', 'Advice', 'bosom', 'nestling', 'starvation', 'choreography', 'dignity', 'business', 'five-home', 'bronc', 'cardinal', 'veteran', 'olive', 'fathuh', 'nomination', 'Participation', 'vaudeville', "SAC's", 'activism', 'team-mate', 'chat', 'orator', 'choreographer', 'fold', 'assembly', 'rationale', 'librarian', 'saddle', 'rustling', 'matchmaking', '155-yarder', 'reporter', 'isocyanate', 'bedding', 'idiot-grin', 'boredom', 'manservant', 'infliction', 'chant', 'W-2', 'urea', 'disparagement', 'exterior', 'guess', 'characterization', 'doorkeeper', 'bake-oven', 'petitioner', 'conflict', 'wholewheat', 'croak', 'solemnity', 'ogress', 'inactivity', 'eminence', 'Tension', 'gear', 'damsel', 'terminus', 'villa', 'conscience', 'viscometer', 'expression', 'knife-edge', 'molding', 'barrage', 'conductivity', 'allowance', 'sumac', 'gynecologist', 'finger-post', 'crutch', 'fuselage', 'mungus', 'gaining', 'decadence', 'maturity', 'slot', 'social', 'greenware', 'pneumonia', 'sub-chiefdom', 'lobscouse', 'therapist', 'correspondent', 'itch', 'sloop', 'beverage', 'gobbledygook', 'coast-to-coast', 'breakdown', 'triumph', 'metalworking', 'family', 'collective-bargaining', 'contralto', '4-1/2%', 'non-discrimination', 'skepticism', 'microphone', 'non-interference', 'garnet', 'analogy', 'Bombus', 'i', 'radio-TV', 'clarity', 'difficulty', 'pseudonym', 'begging', 'indium', 'tool', 'knocking', 'Incest', 'strengthening', 'catsup', 'saying', 'barony', 'gamma', 'illumination', 'plenipotentiary', 'stator', 'spurt', 'warranty', 'agglutination', 'Result', 'corner', 'Unit', 'profoundity', 'fantasy', 'voodoo', 'suburbia', 'Rhinoceros', 'profile', 'ostracism', 'derriere', 'bobby', 'micrometeorite', 'giblet', 'bang', 'ribbing', 'PTA', 'microcytochemistry', 'loop', 'ruefulness', 'dashboard', 'anchor', 'helium', 'shutdown', 'committment', 'oil', 'trout', 'breakthrough', 'proportion', 'quince', 'telegrapher', 'mechanism', 'defendant', 'shake', 'fetish', 'monsoon', 'repression', 'registrar', 'impersonation', 'cardamom', 'YMCA', 'pool-equipment', 'prevalence', 'dogleg', 'chemistry', 'groom', 'biter', 'whiskey', 'foil', 'uncircumcision', 'ink', 'depression', 'hammock', 'result', 'tidewater', 'triple', 'quarter-mile', 'amorist', 'tannin', 'defeatism', 'platoon', 'event', 'vindication', 'benevolence', 'unit', 'marksman', 'redheader', 'hexameter', 'black-market', 'shopping', 'ethics', 'cross', 'EQU', 'borough', 'social-class', 'formed-tooth', 'animosity', 'mentioning', 'denunciation', 'caravan', 'time-&-motion', 'viability', 'revel', 'slipstream', 'Indigestion', 'hegemony', '**zq', 'reality', 'genre', 'pinhead', 'brawle', 'pretext', 'Lumber', 'Hospital', 'soldier', 'Control', 'anaprapath', 'adviser', 'mosquito', 'drawer', 'gal', 'mimesis', 'squeamishness', 'relativist', 'roughcast', 'guise', 'gunman', 'township', 'Purpose', 're', 'formula', 'cacophony', '1.8%', 'midmorning', 'cruelty', 'batter', 'mark', 'convent', 'shortsightedness', 'scoundrel', 'mother-introject', 'typescript', 'despotism', 'flower', 'pap', 'interruption', 'pinnacle', 'kraft', 'grizzly', 'Mass', 'moss', 'Feed', 'dock', 'exertion', 'double-talk', 'cross-writing', 'unreason', 'deep-tendon', 'escritoire', 'Deactivation', 'shot', 'item', 'matt', 'flair', 'cowhand', "C'", 'article', 'transference', 'circulation', 'happening', 'rearing', 'quadric', 'EEAE-cellulose', 'state-law', 'poetry-and-jazz', 'cocktail', 'connivance', 'bout', 'wretch', 'illegitimacy', 'acre', 'chi-chi', 'roulette', 'fairway', 'wash-up', 'roller', 'wisenheimer', "9/32''", 'interpolation', 'lebensraum', 'gentleman', 'pariah', 'pre-primary', 'rapture', 'rampage', 'candidacy', 'plastic', 'rhu-beb', 'hubris', 'NBC', 'Placement', 'commutation', 'trapdoor', 'fork', 'pore', 'affirmation', 'butterfat', 'oversoftness', 'polarization', 'house-cleaning', 'sheaf', 'comparison', 'disposal', 'pedagogue', 'Line', 'reply', 'interconnectedness', 'adverb', 'missive', 'schoolmaster', 'goddess', 'air-cell', 'plague', 'standing', 'personification', 'wish', 'epistemology', 'lilt', 'pituitary', 'dissolution', 'prior-year', 'role-experimentation', 'destruction', 'pit', 'papier-mache', 'adhesion', 'suitability', 'shorthand', 'indexing', 'digitalization', 'mg/l', 'spontaneity', 'satirist', 'phosgene', 'clam', 'workbench', 'salamander', 'drawbridge', 'glass-fiber', '129%', 'pynte', 'collapse', 'shadow', 'anger', 'boon', 'ex-mayor', 'array', 'epidermis', 'mistrust', 'calcification', 'banister', 'insecurity', 'want', 'MLSS', 'arylesterase', 'potassium', 'logger', 'n-trial', 'tri-iodothyronine', 'sweatband', 'jerk', 'tactlessness', 'advisory', 'bedazzlement', 'butcher', 'referendum', 'institute', 'self-crimination', 'arena', 'decade', 'Contrast', 'subrogation', 'vase', 'island', 'must', 'disillusionment', 'screen', 'honky-tonk', 'sonority', 'fare', 'movement', 'physiology', 'g', 'feeding-pain', 'overhauling', 'dislocation', 'theorizing', 'emulsion', 'broadcast', 'cellulose', 'door-frame', 'demythologization', 'master', 'Cacophonist', 'terry', 'wallet', 'multiplicity', 'guard', 'Traffic', 'criminality', 'shamrock', 'tung', 'assent', 'detector', 'particularity', 'aspiration', 'grappling', 'ton-mile', 'fin', 'hypocrisy', 'godliness', 'individuality', 'alfresco', 'parasol', 'predominance', 'fidelity', 'epoch', 'wt', 'crisp', 'hormone', 'o', 'brazenness', 'lefthander', 'Discussion', 'Tooth-hurty', 'topcoat', 'Journalism', 'self-pity', 'routine', 'garlic', 'candlewick', 'palette', 'wall-switch', 'kin', 'ascendancy', 'solstice', 'stationery', 'menstruation', 'brain', 'helmet', 'libertie', 'nobility', 'hold-back', 'possum-hunting', 'hold', 'foreboding', 'stove', 'prowl', 'rumpus', 'domination', 'subversion', 'microcosm', 'phalanx', 'data-handling', 'felt', 'periphery', 'nonequivalence', 'inclination', 'promotion', 'admission', 'non-success', 'shrub', 'blackberry', 'rookie-of-the-year', 'fairy-land', 'tattle-tale', 'Brain', 'retardation', 'discrimination', 're-creation', 'par', 'cattle-car', 'impudence', 'mug', 'KV', 'effort', 'profundity', 'top-notch', 'urethane', 'lad', 'Gyrocompass', 'hobby', 'eyeful', 'lubricant', 'crank', 'slack', 'blockade', 'CTCA', 'horseplay', 'buddy', 'recitation', 'leukemia', 'tardiness', 'local', 'self-exile', 'lace', 'casting', 'famine', 'evidence', 'carte', 'hoarseness', 'deceit', 'whirlwind', 'serenade', 'helmsman', 'subservience', 'calendar', 'merry-go-round', 'brook', 'ell', 'omnipotence', 'underwriter', 'barley', 'bilge', 'condemnation', 'neuron', 'chlorine', 'WTV', 'Rock', 'play', 'adobe', 'centrifugation', 'cut-off', 'death-wish', 'mathematician', 'subsystem', 'peasant', 'whiplash', 'litigant', 'low-key', 'month', 'touchstone', 'dean', 'Emission', 'waterfall', 'corkscrew', 'traveler', 'bloodstream', 'corsage', 'dirt', 'consolidation', 'Jew-baiter', 'self-assertion', 'kilowatt', 'orgy', 'doghouse', 'renewal', 'threshhold', 'Poetry', 'tenement', 'mystery-story', '20-mm', 'joblot', 'bet', 'moontrack', 'wind', 'infarct', 'centum', 'starlight', 'contention', 'perfectibility', 'icicle', 'lb.', 'poker', 'city-dweller', 'heed', 'wrongdoing', 'early-season', 'myelofibrosis', 'favour', 'repertoire', 'lake', 'konga', 'boa', 'Rhu-beb-ni-ice', 'explicitness', 'nihilism', 'onlooker', 'Jew-as-enemy', 'forma', 'theaf', 'cusp', 'figuring', 'ant', 'unselfconsciousness', 'scourge', 'malediction', 'tube', 'hatch', 'backbone', 'sassafras', 'admiration', 'scalp', "3/64''", 'cost-data', 'inculcation', 'patriarch', 'High-speed', 'transcript', 'tail', 'delight', 'ascetic', 'co-existence', 'pillage', 'relief', 'rake', 'singing', 'marina', 'pawnshop', 'pecs', 'zoning', 'malfunctioning', 'sixth-grade', 'birthright', 'polyester', 'equipment', 'baggage', 'hot-shot', 'subroutine', 'forum', 'r', '3-hitter', 'Posterity', 'out-of-doors', 'racetrack', 'chili', 'plumpness', 'commentary', 'ledge', 'cross-section', 'universality', 'rose-of-Sharon', 'co-optation', 'retreat', 'sweatshirt', 'stake-out', 'dynamic', 'boldness', 'Anger', 'reinvigoration', '12a', 'GNP', 'non-police', 'Saliva', 'myopia', 'look-see', 'cayenne', 'spectroscopy', 'elk', 'arteriolosclerosis', 'running', 'exclusiveness', 'elusiveness', 'unfoldment', 'advisement', '4-H', 'sortie', '10.6%', 'avarice', '80%', 'Jury', 'burglary', 'truth', 'blindness', 'urgency', 'hobbing', 'energy', 'mockery', 'affiliation', 'Cook', 'TCU', 'missing', 'look', 'ex-President', 'faucet', 'top-grade', 'lease', 'relay', 'vassal', 'throne', 'military', 'kitchenette', 'millinery', 'peasanthood', "R's", 'combo', 'border', 'president', 'entertainment', 'small-scale', 'vantage', 'diligence', 'President', 'minstrel', 'loyalist', 'doom', 'transferor', 'child', 'tiger', 'fragment', 'defection', 'cherry', 'styling', 'bossman', 'practicability', 'Loneliness', 'healer', 'optimization', 'hard-liquor', 'post-mortem', 'Irradiation', 'prototype', 'purism', 'conventionality', 'bassinet', 'blur', 'funeral', 'Feeder', 'sergeant', 'bromphenol', 'species', 'sniping', 'tow', 'motor', 'reappraisal', 'rhinoceros', 'alignment', 'myriad', 'issue', 'deterrent', 'distress', 'overnight', 'bottleneck', 'girl-friend', 'enclosure', 'grindstone', 'schoolroom', 'lumen', 'reconvention', 'floating-load', 'chum', 'Visibility', 'center-fire', 'overpayment', 'pad', 'brag', 'paraoxon', 'objectiveness', 'effectiveness', "tug-o'-war", 'reverberation', 'seashore', 'symptom', 'one-night', 'armhole', 'cinder', 'solicitousness', 'denomination', 'thrust', 'flatulence', 'table-top', 'tan', 'booth', 'hill', 'spleen', 'braggadocio', 'DEAE-cellulose', 'streamside', 'hotrod', 'public-school', 'trawler', 'salon', 'hazard', 'Layout', 'indisposition', 'privy', 'knee', 'sponsor', 'chest', 'slave', '49%', 'passivity', 'guide', 'enmity', 'board', 'legality', 'connective', 'cm', 'academic', 'prevision', 'advantage', 'john', 'mayhem', 'arm-elevation', 'Victim', 'premix', '1%', 'dusk', 'tetrachloride', 'resumption', 'radical', 'service', 'Serum', 'frequency-modulation', 'riding', 'suffocation', 'sect', 'beer-cooling', 'root', 'context', 'Space', 'ginkgo', 'yellow-dwarf', 'capability', 'guardian', 'ripple', 'accelerometer', 'Examination', 'Sacrifice', 'crop', 'nineteenth-century', 'intereference', 'disquietude', 'nursery-', 'burrow', 'play-girl', 'dishwater', 'halvah', 'palazzo', 'auto', 'work-study', 'artillerist', 'exposure-time', 'looseness', 'Humiliation', 'carriage', 'gush', 'oilseed', 'self-help', 'NBC-TV', 'Ace', 'kinesics', 'hide', 'tag', 'parade', 'thirst', 'anemia', 'achievement', 'student-loan', 'stream-of-consciousness', 'negligence', 'DES', 'blossom', 'literalism', 'white-stucco', 'p.', 'decrease', 'pier', 'bombardment', 'diocese', 'blackness', 'darkness', 'cornfield', 'reactor', 'sway', 'delirium', 'Wingback', 'stamina', 'lb', 'Close', 'binding', 'veterinarian', 'hallway', 'universe', 'limber', 'mobility', 'dishonor', 'howl', 'monopoly', 'Addition', 'rheumatism', 'toss', 'mustache', 'inference', 'tread', 'high-velocity', 'Week-end', 'emotionality', 'intimacy', 'slang', 'RDWS', 'recess', 'editorialist', 'diethylstilbestrol', 'call', 'stoicism', 'castorbean', 'rewt', 'guitarist', 'hydraulics', 'soap', 'whirling', 'airspeed', 'penthouse', 'cognizance', 'torso', 'Lobularity', 'rector', 'knock', 'rhythm', 'arch-heretic', 'Action', 'off-Broadway', 'religiousness', 'dwarf', 'ultimatum', 'fixture', 'rule', 'orchard', 'poplin', 'pioneer', 'climate', 'agreement', '58.8%', 'desegregation', 'screwball', 'cigaret', 'invader', 'spring-training', 'disapproval', 'xenon', 'recession', 'cobalt-60', 'fountainhead', 'rear', 'irredentism', 'posseman', 'whole-wheat', 'ocher', 'conductor', 'psychology', 'expansionist', 'cheap-money', 'pharmacist', 'fooling', 'outlay', 'chaplain', 'treadmill', 'conception', 'growth', 'incomprehension', 'ligand', 'tune', 'helpfulness', 'knott', 'low-voltage', 'saliva', 'cent', 'flash', 'impartiality', 'compressibility', 'audit', 'picket', 'humilation', 'ringside', 'Calcium', 'slowness', 'censure', "calf's-foot", 'occlusion', 'scrub', 'scapegoat', 'swelling', 'wicker', 'eagle', 'corticotropin', 'stronghold', 'artery', 'bullet', 'nonfood', 'syndrome', 'convection', 'Odd-lot', 'progress', 'theater', 'scrimmage', 'filbert', 'dragger', 'chieftain', 'pointer', 'lotus', 'chowder', "tam-o'-shanter", 'Spring', 'lot', 'Philosophy', 'self-restraint', 'lap', 'electronics', 'prevention', 'liking', 'hander', 'puppet', 'hilum', 'Mough', 'monitor', 'pear', 'W-region', 'madam', 'captive', 'specialist', 'name', 'revenue', 'wait', 'pronouncement', 'inability', 'purple', 'Salt', 'sodium', 'spell', 'meeting', 'ex-prison', 'overestimation', 'pleading', 'ring', 'keep', 'lowering', 'aid', 'nation', "FDA's", 'paradigm', 'NLRDA', 'Help', 'nationality', 'Square', 'socialism', 'flank', 'translucence', 'long-line', 'brainwashing', 'trimming', 'token', 'matting', 'inauguration', 'checker', 'gender', 'knight', 'Quality', 'audience', 'haven', 'hymen', 'merchant', 'homestead', 'poet', 'concern', 'influenza', 'thicket', 'tigress', 'eclat', 'rumor', 'graduating', 'candor', 'direction', 'bunk', 'apprenticeship', 'boycott', 'sequence', 'Artificer', 'Consumer', 'lubrication', 'rationality', 'espionage', 'midwife', 'foresight', 'unrest', 'cognac', 'sensitivity', 'dry-dock', 'cant', 'telegram', 'abscissa', 'buffer', 'deferent', 'wage-setter', 'pole', '**b', 'expanse', 'airlock', 'bronchus', 'i.d.', 'concert', 'patch', 'pleasance', 'restraint', 'housekeeper', 'assurance', 'variability', 'punk', 'ridicule', 'coalition', 'dog', 'tinsel', 'Quince', 'meantime', 'guanidine', 'unknown', 'octoroon', 'format', 'voice', 'reconnaissance', 'waterfront', 'nectar', 'counterattack', 'derision', 'striving', 'prestidigitator', 'audacity', 'tribute', 'definition-specialization', 'thaw', 'Dash', 'hipster', 'mg/lBOD', 'Television', 'mural', 'easement', 'direct-sum', 'half-smile', 'stager', 'mischief', 'rejection', 'nucleus', 'Cold', 'bullshit', 'linguist-anthropologist', 'trip-hammer', 'rightfield', 'earth', 'neutrality', 'third-dimensionality', 'Artillery', 'accent', 'turnery', 'nymph', 'focusing', 'piece', 'smalltime', 'preparation', 'dissenter', 'purchasing', 'sleuthing', 'Photograph', 'snapper', 'prosecution', 'speck', 'belch', 'impression', 'margin', 'bondage', 'monomer', 'firmness', 'half-acceptance', 'breadth', 're-election', 'Seashore', 'Publicity', 'Nineteenth-century', 'obedience', 'DSW', 'blind', 'abortion', 'esteem', 'oatmeal', 'strand', 'roster', 'denial', 'salvo', 'draper', 'occurrence', 'nosebag', 'savage', 'girl', 'petition', 'throbbing', 'spaceship', 'favorite', 'n-dimensional', 'homesickness', 'molar', 'indecisiveness', 'nothingness', 'logarithm', 'portal', 'philantrophy', 'repeat', 'dualism', 'Power', 'Lime', 'cavern', 'camper', 'self-aggrandizement', 'neighborhood', 'low-down', 'initiative', 'bunt', 'huckster', 'haystack', 'Department', 'Paint', 'stubble', 'bleeding', 'daughter', 'procedure', 'neurologist', 'brad', 'infantryman', 'pathology', 'derelict', 'algaecide', 'teaching', 'mama', 'compilation', 'Delinquency', 'expunging', 'shirtfront', 'chariot', 'squat', 'nostalgia', 'hesitance', 'straw-hat', 'morphology', 'doubloon', 'mitre', 'diathermy', 'fir', 'degeneration', 'expansion', 'snobbery', 'mesh', 'lawyer', 'leg', 'lobby', 'deluxer', 'autonavigator', 'Background', 'aloes', 'vocabulary', 'angle', 'grist', 'condenser', 'yawl', 'humour', 'psychoanalysis', 'turquoise', 'star', 'alternate', 'half-dozen', 'chute', 'POW', 'ovation', 'quadrupling', 'impossibility', 'resourcefulness', 'one-half', 'farewell', 'transvestitism', 'Movement', '2-baser', 'committee', 'smokehouse', 'timidity', 'misnomer', 'consultant', 'PFC', 'maverick', 'reexamination', 'domicile', 'geology', 'CDC', 'rancher', 'end-product', 'archfool', 'surfaceness', 'abstractionism', 'asphalt', 'Q', 'slapstick', 'signature', 'worker', 'gymnastics', 'enthusiast', 'deadness', 'front-line', 'majuh', 'Court-packing', 'shoreline', 'transposition', 'tole', 'mud', 'recapitulation', 'farm', 'color', 'triphenylarsine', 'rustler-hunter', 'spit', 'booboo', 'guild', 'springboard', 'hutment', 'pallet', 'analogue', 'shield', 'adminstration', 'marketing', 'childbirth', 'airlift', 'gazelle', 'conclave', 'horsedom', 'Duty', 'decisiveness', 'essential', 'subject', 'following', 'sale', 'Equipment', 'magnification', 'temptation', 'sub-group', 'inkling', 'Headquarters', 'crushing', 'preoccupation', 'necklace', 'pool-care', 'divertimento', 'edge', 'getaway', 'testimony', 'rum', 'grimness', 'Union', 'hypothyroidism', 'jurisprudence', 'dot', 'hemisphere', 'warrior', 'vermilion', 'chlorothiazide', 'accompanist', 'round', 'adding', 'age-and-sex', 'ox', 'mulling', 'comfort', 'study', 'quaver', 'courtroom', 'destination', 'allergy', 'copywriter', 'corpulence', 'Counsel', 'sharing', 'acetonemia', 'instigation', 'registration', 'lemonade', 'banquet', 'photo', 'bishopry', 'flight', 'Education', 'incinerator', 'care', 'spinach', 'loincloth', 'cooperative', 'assimilation', 'pie', 'pitching', 'banter', 'shielding', 'frock', 'viewer', 'phone', 'armpit', 'estimation', 'patient', 'toadyism', 'water-line', 'fiat', 'portrayal', 'associate', 'hair', 'seafood', 'Seed', 'burn', 'situs', 'Oxytetracycline', 'OAS', 'rabbit', 'lava', 'puberty', 'abaringe', 'tie', 'ASPR', 'rostrum', 'prairie', 'vacation', 'knight-errant', 'blatancy', 'dictionary', 'demise', 'presentness', 'backpack', 'religiosity', 'tenacity', 'tent', 'half-city', 'success', 'boar', 'playwright', 'suzerain', 'enamel', 'walk-way', 'anagram', 'Party', 'steel', 'castor', 'Table', 'baton', 'subsidy', 'evaporation', 'one-thousandth', 'secessionist', 'suitor', 'orphanage', 'crawlspace', 'mm', 'selflessness', 'revulsion', 'fireplace', 'outing', 'quack', 'emasculation', 'lady', 'aspirin', 'malt', 'obsession', 'place', 'polemic', 'drouth', 'standard-weight', 'messenger', 'SH', 'member', 'dance-theatre', 'porcelain', 'oak-log', 'hair-trigger', 'sinner', 'framework', 'journal', 'quantity', 'sonogram', 'altruism', 'finding', 'deformation', 'vandalism', 'rotor', 'deterrence', 'feeling-state', 'machine-gun', 'clerk', 'high-current', 'Moisture', 'fool', 'whoop', 'exposition', 'pot', 'organization', 'wastage', 'enjoinder', 'jawbone', 'disobedience', 'radiation', 'phantasy', 'veldt', 'Stock', 'replication', 'use', 'shading', 'glass', 'scrapbook', 'model', 'chantey', 'disbelief', 'VA', 'franc', 'quagmire', 'single-crystal', 'applicator', '3-cm', 'haddock', 'daring', 'astuteness', 'career', 'inquest', 'portfolio-maker', 'Phenothiazine', 'scabbard', 'reflectance', 'manner', 'garage', 'toner', 'ram', 'Fear', 'cough', 'childishness', 'underbrush', 'pathologist', 'shortage', 'security', 'bodice', 'intimidation', "state's-responsibility", 'lug', 'age', 'milling', 'feel', 'self-reliance', 'transducer', 'credulousness', 'champion', 'disinclination', 'gravity', 'sunburn', 'change', 'turbulence', 'Expansion', 'youth', 'Assassination', 'objection', 'permit', 'muzzle', 'federal-right', 'father-murder', 'team', 'p-aminobenzoic', 'Improvement', 'roost', 'reversal', 'warren', 'biceps', 'Resolution', 'lanthanum', 'visualization', 'skipper', 'Bandstand', 'sensuality', 'Milk', 'sight', 'dialysis', 'paintbrush', 'triphosphopyridine', 'cosmetic', 'hanging', 'ghetto', 'vanilla', 'memo', 'Af', 'modesty', 'City', 'administrator', 'initiation', 'aniline', 'speed', 'commando', 'diety', 'barbarian', 'tradition', 'guardhouse', 'tax', 'say', 'rodent', 'sake', 'chopper', 'sector', 'quiz', 'hatchway', 'hysteron-proteron', 'album', 'mediumship', 'imitation-woodgrain', 'motivation', 'beatification', 'savings', 'clip', 'reevaluation', 'footage', 'motion-pattern', 'isle', 'passer-by', 'licensee', 'inaction', 'architect', 'conic', 'Law', 'excelsior', 'coupe', 'SMU', 'Division', 'manometer', 'pet', 'retrieval', 'watershed', 'coffeecup', 'lymphoma', 'skirmish', 'trundle', 'amanuensis', 'specialty', 'pinch-hitter', 'Trachea', 'kola', 'litigation', 'rattling', 'hunting', 'explosive', 'housebreaking', 'derrick', 'pitcher', 'cost-accounting', 'captaincy', 'manliness', 'brochure', 'drywall', 'party', 'courting', 'polymyositis', 'festival', 'hustler', 'mackinaw', 'entourage', 'young', 'rapier', 'corporeality', 'occasion', 'ton', 'flying', 'python', 'aid-to-education', 'PABA', 'B-52H', 'hand-holding', 'recourse', 'nap', 'idea', 'tall-tale', 'silicone', 'ionosphere', 'wool', 'non-English', 'tunic', 'mystery', 'fielding', 'acceleration', 'billiard', 'aunt', 'pin-point', 'examination', 'polystyrene', 'banner', 'moderator', 'laborer', 'Mlle', 'fungus', 'ruin', 'price', 'Drunkenness', 'divine', 'reliability', 'Purchase', 'hole', 'disclaimer', 'formative', 'watchdog', 'MF', 'carpeting', 'preponderance', 'hemosiderin', 'child-rearing', 'industry', 'numbness', 'Frostbite', 'horoscope', 'ozone', 'grain', 'congregation', 'perilla', 'drumlin', 'motel', 'obviousness', 'export', 'mill', 'twentieth-century', 'dweller', 'changing', 'titer', 'Bridge', 'climbing', 'overhaul', 'consciousness', 'ruling-class', 'immediacy', 'collation', 'contract-negotiation', 'compliment', 'assistance', 'oz.', 'lower-class', 'alimony', 'analysis', 'L', 'giveaway', 'backlash', 'Tea', 'Tire', 'bewilderment', 'livability', 'segment', 'purge', 'artist-author', 'carrying', 'infidelity', 'antelope', 'guerilla', 'cardboard', 'rabble', 'tape', 'datum', 'challenge', 'teddy', 'medium', 'eraser', 'possum', 'transistor', '47.1%', 'vote', 'NORAD', 'span', 'giver', 'Apple', 'deputy', 'no-goal', 'cod', 'aridity', 'walk', 'sink', 'commotion', 'work-paralysis', 'bloodroot', 'drove', 'contraction', 'best-seller', 'palate', 'paralysis', 'bridegroom', 'Danger', 'raising', 'capercailzie', 'long-cruise', 'assistant', 'hue', 'Couple', 'rekindling', 'stein', 'pinpoint', 'editing', 'giggle', 'Intensification', 'ABO', 'bank', 'prophet', 'grab', 'proliferation', 'tenor', 'exhaustion', 'extruder', 'banshee', 'givenness', 'person-to-person', 'lobe', 'glow', 'mortality', 'bakery', 'experiment', 'quadriceps', 'newsboy', 'least', 'sensitive-area', 'five-and-dime', 'peck', 'hellfire', 'grease-removal', 'low-moisture', 'prick', 'blackmailer', 'parsonage', 'distiller', 'ICBM', 'canteen', 'product', '$5', 'softener', 'Hotel', 'twisting', 'park', 'polymer', 'literature', "ICA's", 'intruder', 'take', 'undertow', 'Fella', 'beneficence', 'magistrate', 'hat', 'porch', 'flourish', 'flex', '237%', 'indoctrination', 'Dawn', 'misfortune', 'obligation', 'BTU', 'barnstormer', 'tuning', 'crone', 'proximity', 'One-day', 'snowball', 'diisocyanate', 'no-nonsense', "'?'", 'Teacher', 'scoreboard', 'knife', 'checkup', 'bond', 'gash', 'award', 'coach', 'carbon', 'f-plane', 'epoxy', 'circuitry', 'eleventh-floor', 'freighter', 'sanipractor', 'fullbacking', 'manganese', 'flour', 'aficionado', 'mole', 'nationalist', 'cutlass', 'Traitor', 'facade', 'bidder', 'consanguinity', 'Visa', 'Dinner', 'Article', 'brushcut', 'dome', 'conservation', 'abruptness', 'dejection', 'darling', 'grill', 'sameness', 'abridgment', 'College', 'kindness', 'professionalism', 'itinerary', 'summation', 'roadside', 'impiety', 'half-time', 'Program', 'exultation', 'worm', 'active', 'cheek', 'Assonance', 'USSR', 'processional', 'optimum', 'footnote', 'Money', 'paperback', 'pace-setter', 'drum', 'vasorum', 'father-confessor', 'shipper', 'streetcar', 'protein', 'aviator', 'beach-head', 'morsel', 'showerhead', 'finish', 'parchment', 'shibboleth', 'lovering', 'yielding', 'herb', 'sheriff', 'comb', 'illness', 'Net', 'seaside', 'grass', 'draftee', 'senior', 'splendor', 'birth-control', 'waistcoat', 'overseas', 'court', 'utopianism', 'shaping', 'wheel', 'conqueror', 'bishop', 'uniformity', 'colloquium', 'giving', 'research', 'realtor', 'trampling', 'originality', 'hick', 'FN', 'vision', 'vacancy', 'inhibition', 'longing', 'apple', 'deed', 'chasing', 'faith', 'resettlement', 'kernel', 'deepening', 'dimethylglyoxime', 'prepolymer', 'sugar', 'telegraphy', 'hazel', 'farmer', 'Thrush', 'science-fiction', 'MGM', 'stagnation', 'paleoexplosion', 'cluck', 'garrison', 'lieutenant-governor', 'exhibition', 'haunt', 'formality', 'utilization', 'bicycle', 'mold', 'solar-radiation', 'nondefeatist', 'professional', 'banning', 'cabin', 'syntax', 'whir', 'black', 'homicide', 'Hydrogen', 'bugler', 'moulding', 'Phrase', 'b{t}', 'entomologist', 'birefringence', 'principle', 'apricot', 'h', 'equalizing', 'amphibology', 'russe', 'machinist', 'NCTA', '7-day-week', 'Magazine', 'Enemy', 'mare', 'differential', 'clamor', 'roof', 'glossary', 'laundry', 'high-speed', 'reprisal', 'reverence', 'NAB', 'os', 'sandpaper', 'harpsichordist', 'baptism', 'epithet', 'pup', 'zoologist', 'microfilm', 'non-church', 'byword', 'irritation', 'electric-sewer-water', 'entertainer', 'unwillingness', 'Debate', 'hedonism', 'V', 'naturopath', 'job', 'underling', 'recommendation', 'effectinge', 'relic', 'spectrum', 'LSU', 'turnout', 'halter', 'kingdom', 'bend', 'mollycoddle', 'biography', 'road-crossing', 'neckline', 'morale', 'coco', 'arm-rise', 'horsehair', 'watercolorist', 'rendezvous', 'playground', 'ROTC', 'despondency', 'chattering', 'par-3', 'juror', 'Past', 'converse', 'mandate', 'nonstop', 'god', 'aperture', 'trim', 'atmosphere', 'complement', 'mucker', 'ammo', 'hollowness', 'dresser', 'radar', 'turret', 'cigar', 'goal-line', 'excitability', 'whore', 'sublease', 'once-over-lightly', 'reinstitution', 'madhouse', 'cauliflower', 'lactate', 'Pool', 'barbiturate', 'barrel', 'mutton', 'sensation', 'accounting', 'Breakfast', 'upgrading', 're-emergence', 'ranch', 'convoy', 'torsion', 'cloddishness', 'silo', 'stratification', 'spree', 'wizard', 'measurement', 'nickel', 'millionaire', 'snout', 'boy-meets-girl', 'Punishment', 'preceding', 'strangulation', 'friend', 'controller', 'fingerprint', 'right-of-entry', 'intake', 'fundamentalist', 'harmonization', 'pocketful', 'lung', 'left-front', 'calypso', 'inhibitor', 'libido', 'birth-prevention', 'northerner', 'parenchyma', 'surtout', 'humidity', 'refugee', 'stateroom', 'Colonialism', 'capillary', 'paradox', 'RPM', 'transpiration', 'Af-stage', 'woe', 'arrogance', 'tropocollagen', 'disunity', 'attraction', 'no.', 'scrivener', 'kitten', 'coating', 'classification', 'submarine', 'hoodlum', 'EEG', 'deficit', 'rose-tea', 'Z-axis', 'wave-length', 'Sesame', 'guard-room', 'finisher', 'indemnity', 'catharsis', 'wrapper', 'walker', 'artillery', 'capsule', 'repugnance', 'armchair', 'venom', 'levity', 'stint', 'step', 'stepmother', 'S-11', 'mite-box', 'self-observation', 'atonement', 'discoverer', 'undergirding', 'alveolus', 'persuasion', 'birthplace', 'bathroom', 'furnace', 'burlesque', 'charlotte', 'automation', 'mycology', 'stimulant', 'null', 'Attention', 'lacquer', 'commuter', 'Astronomy', 'rendition', 'cowpuncher', 'rotation', 'setting', 'angelica', 'cup', 'disarmament', 'dragnet', 'lass', 'abundance', 'ballyhoo', 'cantonment', 'high-power', 'rod', 'federal-state', 'sensationalism', 'code', 'missy', 'Practice', 'stallion', 'fort', 'Mimesis', 'projectile', 'high-protein', 'cheese', 'sweet-shrub', '20-gauge', 'multitude', 'presumption', 'anecdote', 'Ronnel', 'synchrony', 'Weakness', 'Continuity', 'introduction', 'lower-middle-class', 'foot', 'high-voltage', 'vegetarian', 'working-class', 'crowd', 'passerby', 'warmth', 'date', 'homecoming', 'sorrow', 'bedside', 'suburb', 'crescendo', 'inquiry', 'denying', 'Sulphur', 'readiness', 'filter', 'balkiness', 'flicker', 'contingent', 'livelihood', 'manual', 'red-clay', 'craving', 'character', 'prerogative', 'Tetanus', 'precipitin', 'verity', 'bathtub', 'convict', 'disbursement', 'myrtle', 'bread', 'Sandwich', 'grounder', 'accolade', 'earthenware', 'objector', 'schism', 'roadbed', 'bebop', 'hexagon', 'fountain-head', 'm**ym', 'fieldstone', 'coughing', 'cheekbone', 'probate', 'sluicehouse', 'oats', 'militarism', 'thump', 'mass-distribution', 'suability', 'indecision', 'mumbo-jumbo', 'austerity', 'Existence', 'bound', 'propaganda', 'rapid-transit', 'fiddle', 'Tailback', 'confederacy', 'uremia', 'lodging', 'theatregoer', 'firsthand', 'refund', 'helion', 'algebra', 'Thunder', 'creamer', 'guaranty', 'ditch', 'gift', 'interview', 'projection', 'mulch', 'awe', 'boyhood', 'Sodium', 'harm', 'grade-A', 'pelvis', 'snow', 'dune', 'grave', 'procrastination', 'catchup', 'brokerage', 'pork-barrel', 'landmark', 'liveliness', 'permanence', 'pacifier', 'uselessness', 'pavement', 'truculence', 'mill-pond', 'pencil', 'school-age', 'chewing', 'bird', '4-', 'recrimination', 'superstructure', 'cardiomegaly', 'mica', 'sambur', 'book-review', 'gesture', 'heater', 'fate', 'firing', 'trestle', 'salary', 'Physiologist', 'roadway', 'worship', 'plunge', 'gravel', 'voyager', 'advent', 'rudeness', 'busboy', 'graybeard', 'single', 'motion', 'jumble', 'early-morning', 'twosome', 'ideology', 'consumption', 'novelty', 'turnaround', 'OEP', 'cut', 'sensibility', 'exception', 'altitude', 'carelessness', 'long-chain', 'haze', 'reformation', 'misalignment', 'turban', 'fishery', 'princess-in-a-carriage', 'cutter', 'pigeon', 'frenzy', 'swami', '40%', 'snorkle', 'amalgamation', 'brick', 'quill', 'supernatural', 'allusion', 'miscalculation', 'chaos', 'sepia', 'check', 'commonness', 'communism', 'ethos', 'comer', 'sideshow', 'overall', 'Softness', 'summons', 'filament', 'interment', 'brassiere', 'crudity', 'sanity', 'maze', '20-cps', 'latch', 'somewhere', 'speedometer', 'money', 'dove', 'Blood', 'provincialism', 'malady', 'Employer', 'dictator', 'grunt', 'abbreviation', 'flannel', 'appanage', 'scratch', 'chapter', 'astronomer', 'testicle', 'certification', 'lineman', 'mark-up', 'text', 'inclusiveness', 'comedy', 'jinx', 'riddle', 'adapter', 'show', 'electrode', 'meteorite', 'attitude', 'trombonist', 'trajectory', 'outlaw', 'proton', 'beat', 'glove', 'sympathy', 'swarm', 'churchgoing', 'template', 'advancement', 'admittance', 'proneness', 'current', 'buffoon', 'vehicle', 'timeliness', 'lower-status', 'landau', 'ventilator', 'Convenience', 'Reaction', 'installation', 'deadlock', 'loser', 'training', 'takeing', 'vociferousness', 'Farmer', 'compote', 'garbage', 'dusting', 'iconoclasm', 'attack', "denyin'", 'daddy', 'ability', 'upholstery', 'birch', 'admonition', 'generalization', 'grocer', 'materiel', 'teaspoon', 'bronchiole', 'Word', 'torquer', 'lantern', 'resistance', 'Confabulation', 'reference', 'pillow', 'insertion', 'reformism', 'bough', 'dolphin', 'micelle', 'satire', 'beavertail', 'iodine', 'buy', 'globe', 'nightclub', 'ocean', 'Hand', 'madrigal', 'B-58', 'force-rate', 'shoelace', 'beggary', 'enrichment', 'gap', 'semblance', 'acquisition', 'containment', 'distinction', 'speech', 'traditionalism', 'wetting', 'weirdy', 'freedom', 'diaphragm', 'Forgiveness', 'collusion', 'goldfish', 'commercialism', 'yard', 'showing', 'participation', 'transience', 'MPl', 'tackle', 'pyorrhea', 'stepchild', 'misrepresentation', 'acacia', 'shepherd', 'washer', 'sausage', 'pump', 'rocker', 'Kerosene', 'shiver', 'iron', 'second-degree', 'corrosion', 'humanist', 'superego', 'suspense', 'county', 'forest', 'lab', 'stomach', 'LOC', 'sunshield', 'partition', 'ship', 'gold-wire', 'theologian', 'Latter-day', 'hound', 'rechartering', 'trauma', 'nightfall', 'Halfback', 'mayonnaise', 'baptistery', 'snack', 'coolness', 'Cause', 'representative', 'idealization', 'process-server', 'keeping', 'fourth-flight', 'Cellulose', 'opposition', 'marimba', 'betrothal', 'merging', 'steamboat', 'congress', 'flick', 'arrow', 'stature', 'Insect', 'quicksilver', 'perfectionism', 'BBB', 'mackintosh', 'carboxymethyl', 'boot-wearer', 'abdominis', 'anti-clericalism', 'neutralism', 'exercising', 'idealist', 'intestine', 'borer', 'hydrochemistry', 'loss', 'bateau', 'responsiveness', 'malfeasant', 'intermission', 'fellow-countryman', 'management', 'intensifier', 'telling', '4%', 'continuance', 'piano', 'spat', 'transformer', 'diagnometer', 'TASS', 'SCR', 'lioness', 'flapper', 'scorn', 'recusant', 'Tone', 'let-down', 'volatilization', 'multiplication', 'bourgeoisie', 'open-face', 'chronology', 'demineralization', 'dynamo', 'self-insurance', 'autobiography', 'gauss', 'disunion', 'sum', 'unconvincing', 'kidnapper', 'bandit', 'cypress', "cap'n", 'lunchroom', 'Hay', 'sunset', 'cumin', 'flow', 'panel', 'dwelling', 'dispersement', 'Key', 'feeling', 'premise', 'Spontaneity', 'overhang', 'zoo', 'language', 'attention', 'Politics', 'pandanus', 'handbag', 'terror', 'hell-raising', 'ruthenium', 'refreshment', 'submission', 'launch-control', 'horror', 'trustee', 'Hyena', 'robustness', 'vagabond', 'whistle', 'Profile', 'stem', 'Defence', 'insomnia', 'ignition', 'glottochronology', 'BMT', 'employer', 'volition', 'pitfall', 'vigor', 'buck', 'steprelationship', 'mid-watch', 'numerology', 'existentialist', 'bestseller', 'workday', 'male', 'womanhood', 'stall', 'household', 'self-flagellation', 'apparel', 'woodpecker', 'education', 'furniture', 'yoga', 'pasteurization', 'burl', 'mitigation', 'Election', 'Hunter', 'ulcer', 'slavery', 'situation', 'vigil', 'twin', 'onion', 'appliance', 'plywood', 'baseman', 'donkey', 'coloratura', 'hopscotch', 'cousin', 'capital', 'selectivity', 'spine', 'Attack', 'tagua', 'sponge', 'infuriation', 'fill-in', 'scrim', 'renovation', 'steroid', 'tar', 'foreign-aid', 'fedora', 'sack', 'stillness', 'politeness', 'undergrowth', 'triviality', 'one-time', 'unemployment', 'jury-tampering', 'imperfectability', 'A', 'breakage', 'impromptu', 'Directionality', 'oil-well', 'creature', 'oceanography', 'sobriquet', 'sweetness', 'photocathode', 'crystallization', 'stratosphere', 'bunkmate', 'Inventory', 'mastery', 'rebirth', '75%', 'cider', 'Maple', 'opposite', 'tonsil', 'pension', 'founder', 'bargaining', 'accountability', 'handyman-carpenter', 'waste', 'sewage', 'preamble', 'crust', 'centrifuge', 'third-shift', 'divergence', 'performer', 'conscription', 'rose', 'keel', 'data', 'underbedding', 'flute', 'UN', 'rajah', 'light', 'super-experiment', 'skyscraper', 'association', 'renaissance', 'degree', 'condensation', 'sneak', 'conflagration', '+', 'hardware', 'complexity', 'autumn', 'coordination', 'prudence', 'coriander', 'Responsibility', 'auxiliary', 'fundamentalism', 'glycerol', 'big-business', 'meat', 'triphenylstibine', 'bandstand', 'sing-song', 'absorbency', 'marrow', 'idea-exchange', 'second-level', 'translucency', 'EWC', 'bogy', 'precocity', 'stuff', 'clearness', 'kneecap', 'SAAMI', 'philosopher', 'flageolet', 'absinthe', 'devil', 'body-tissue', 'retailer', 'whack', 'recorder', 'dividend', 'sapling', 'coyness', 'tripod', 'foaming', 'cockatoo', 'recalculation', 'biscuit', 'rap', 'nudity', 'retouching', 'consensus', 'mileage', 'steed', 'doorbell', 'boarding', 'option', 'physicalness', 'cabana', 'curbside', 'destroyer', 'equivalence', 'atrophy', 'inducement', 'night-sight', 'repayment', 'poultry', 'Pity', 'priority', 'hunt', 'scours', 'two-year-old', 'cop', 'receiver', 'Admiralty', 'william', 'complaisance', 'warehouse', 'revivalism', 'dirge', 'ass', 'stumpage', 'paraphrase', 'quest', 'workshop', 'regard', 'pectoral-ribcage', 'casino', 'saleslady', 'p(T)', 'portico', 'conclusion', 'abstinence', 'eutectic', 'lust', 'contradiction', 'mechanist', 'piazza', '**ym', 'cartilage', 'hostler', 'Indication', 'wand', 'primary', 'Plastic', 'truckdriver', 'secant', 'evil', 'mettle', 'heritage', 'sexuality', 'ethanol', 'big-ticket', 'calligraphy', 'paprika', 'leak', 'housepaint', 'absence', 'stare', 'progeny', 'dissent', 'salvage', 'whereabouts', 'muezzin', 'blockhouse', 'treble', 'cellar', 'skid', 'dramatist', 'coahse', 'County', 'drink', 'fruit', 'magnetism', 'rascal', 'MVP', 'concussion', 'commerce', 'blooming', 'era', 'talk-aboutiveness', 'uninitiate', 'NAIR', 'rebellion', 'minus', 'Proof', 'lord', 'hel', 'pizza', 'gusto', 'laughter', 'first-run', 'yachtel', 'incense', 'scholar-businessman', 'self-confidence', 'odor', 'pecan', 'pivot', 'icing', 'limp', 'radioactivity', 'acetone', 'SRESERVE', 'region', 'sheepskin', 'gallon', 'skirmishing', 'dogtrot', 'stephanotis', 'uptown', 'fake', 'value', 'eye', 'organdy', 'authentication', 'archbishop', 'AFL-CIO', 'triad', 'vaquero', 'excretion', 'dark', 'opus', 'cavalry', 'halftime', 'fit', 'mouthpiece', 'kerygma', 'flush', 'larkspur', 'amateurishness', 'chiropractor', 'DPW', 'mop', 'square', 'tuberculosis', 'free-world', 'firecracker', 'scholarship', 'injury', 'Radiopasteurization', 'Splenomegaly', 'mysticism', 'pharmacy', 'glum', 'flowerpot', 'night-watchman', 'rubber', 'seriousness', 'disagreement', 'thirteenth-century', 'requisition', 'curtain-raiser', 'headstand', 'sheathing', 'kingpin', 'money-handling', 'stopper', 'norm', 'exasperation', 'religion', 'programing', 'telephoning', 'remedy', 'directorship', 'freak', 'vignette', 'cultist', 'coal', 'thoroughness', 'Long-term', 'Tropidoclonion', 'surf', 'gang', 'beatnik', 'bugle', 'showcase', 'nudism', 'recoil', 'backdrop', 'harem', 'windmill', 'rest-room', 'carloading', "SAAMI's", 'forehead', 'pine-knot', 'gleam', 'engineering-management', 'prostate', 'endogamy', 'preaching', 'tap', 'avocado', 'troopship', 'high-school', 'gossip', 'juke', 'appestat', 'turntable', 'metabolite', 'cloth-of-gold', 'enthalpy', 'cry', 'billet', 'superficiality', 'grating', 'Outside', 'rowdy', 'cotton', 'Police', 'blackboard', 'suspensor', 'midsummer', 'drying', 'doubleheader', 'samovar', 'euphemism', 'abstention', 'Core', 'purity', 'kidney', 'cornbread', 'bronchiolitis', 'playoff', 'forecasting', 'upshot', 'projector', 'folk-tale', 'secular', 'trunk', 'one-way', 'longitude', 'padding', 'diplomacy', 'synagogue', 'economics', 'snap', 'gum', 'manifestation', 'rudder', 'definition', 'compatability', 'editorial', 'methyl', 'support', 'boost', 'height', 'displeasure', 'militarist', 'tin', 'electromagnet', 'detriment', 'stair-step', 'painter', 'embarrassment', 'plenitude', 'urine', 'year', 'ivy', '2%', 'ambush', 'special', 'anise', 'solipsism', 'torpor', 'ointment', 'lane', '61.2%', 'spire', 'graphite', 'fiberglas', 'hoosegow', 'myosin', 'motor-car', 'lock', 'showroom', 'malapropism', 'camaraderie', 'hodgepodge', 'confabulation', 'slat', 'rifle-shotgun', 'elbow', 'Show', 'memorial', 'tile', 'wave-travel', 'manufacturing', 'Gun', 'seasoning', 'woodgraining', 'ethyl', 'stink', 'top', 'surrealism', 'hurler', 'first-aid', 'inequality', 'attachment', 'acclaim', 'mine-safety', 'breath', 'subcontinent', 'juice', 'doubt', 'glycerine', 'Inflow', '1-ml', 'typology', 'crease', 'hunter', 'church', 'consecration', 'main', 'middle-range', 'xxxx', 'spectrometer', 'exercise', 'baseball', 'Gloom', 'sophisticate', 'shack', 'Worry', 'burst', 'honeybee', 'rut', 'movie-to-be', 'sincerity', 'physique', 'thesis', 'plant', 'agnomen', 'Support', 'handwriting', 'coincidence', 'strength', 'newsletter', 'turning', 'decor', 'highpoint', 'confidentiality', 'disinterest', 'stand', 'inpost', 'straightaway', 'vibrato', 'Oneupmanship', 'large', 'sleeve', 'way', 'Field', 'prisoner', 'hem', 'prow', 'chlorine-carbon', 'shewe', 'row', 'damage', 'eluate', 'closet', 'diagnosis', 'regulator', 'arms-making', 'goitrogen', 'stockpiling', 'substitute', 'pepperoni', 'dominion', 'presidency', 'keg', 'high-temperature', 'molecule', 'Slavery', 'anaesthesia', 'gardening', 'assessment', 'teacart', 'solidarity', '50%', 'survivalist', 'sable', 'development', 'strife', 'compendium', 'civilian', 'interrelation', 'wagon', 'scientist', 'specification', 'one-arm', 'veracity', 'frau', 'Hair', 'slide', 'escalation', 'heartbreak', 'twice-around', 'negation', 'venison', 'patter', 'proposal', 'allusiveness', 'hell', 'nightdress', 'mouth', 'non-representation', 'embezzlement', 'eel', 'tantrum', 'tambourine', 'cholera', 'ruffian', 'Me-210', 'earthworm', 'Hydroxazine', 'archaism', 'bogey-symbol', 'sentence', 'crew', 'impropriety', 'behaviour', 'rump', 'patsy', 'commandant', 'discipline', 'loader', 'screaming', 'Wait', 'anisotropy', 'incorporation', 'vasa', 'sprouting', 'irregularity', 'grit', 'stanza-form', 'outcome', 'home-building', 'anatomical', 'mineralogy', 'respondent', 'Earth-week', 'prayer', 'cross-top', 'set-up', 'confusion', 'aide', 'Company', 'bas-relief', 'pompousness', 'R-5th', 'critic', 'turnoff', 'cradle', 'keynote', 'roaring', 'carping', 'weave', 'meaningfulness', 'Graft']
-appraisals=['confounded', 'tough', 'awarded', 'confronted', 'roaringest', 'photoelectronic', 'queerer', 'repudiated', 'imperative', 'chest-back-lat-shoulder', 'stanch', '17-1/2-inch', 'bedraggled', 'presentational', 'appeared', 'adamant', 'national', 'vulgar', 'twelve-year', 'desultory', 'disreputable', 'ambivalent', 'garish', 'cleaned', 'Designed', 'inharmonious', 'Thankful', 'anti-Soviet', 'supine', 'overtaken', 'beardown', 'dusty', 'papery', 'preconceived', 'epiphyseal-diaphyseal', 'Available', 'alleged', 'non-service-connected', 'unbeknownst', 'alive', 'abstract', 'Divided', 'sluiced', 'deeper', 'pro-Castro', 'burned-out', 'Convinced', 'backward', 'thirsty', 'assaulted', 'upheld', 'inviolate', 'Actual', 'placid', 'grandiloquent', 'even-handed', 'fundamental', 'safe-cracking', 'Published', 'wed', 'deactivated', 'implanted', 'noncommittal', 'expandable', 'surrounded', 'stirred', 'rubbed', 'bordered', 'fuller', 'Top', 'commoner', 'ironed', 'timid', 'stained', 'shaded', 'dope-ridden', 'yellow-brown', 'viscous', 'surfaced', 'preparatory', 'Zaporogian', 'coconut-containing', 'vernacular', 'left-of-center', 'playful', 'industrial', 'run-of-the-mine', 'laundered', 'cross-sectional', 'denounced', 'executed', 'darned', 'nonliterary', 'womanly', 'two-season', 'busted', 'Current', 'unfunny', 'public-spirited', 'indomitable', 'semi-literate', 'bachelor-type', 'fast-firing', 'calmed', 'Inter-American', 'Decorated', 'fanciful', 'stepped', 'Consitutional', 'sportiest', 'Brown', 'recouped', 'harmed', 'Racial', 'akin', 'parked', 'shaggy', 'pastry-lined', 'shod', 'semi-autonomous', 'enrolled', 'anatomic', 'low-ceilinged', 'anti-submarine', 'documentary-type', 'many-sided', 'land-locked', 'maladjusted', 'neon-lighted', 'anti-Negro', 'imputed', 'neat', 'runaway', 'university-trained', 'hydrolyzed', 'superseded', 'shiny', 'smoke-stained', 'Miscellaneous', 'interred', 'epicyclical', 'poverty-stricken', 'graver', 'thermostated', 'non-intellectual', 'sibilant', 'hundred-yen', 'tode', 'suburbanized', 'unsprayed', 'Publick', 'sub-Christian', 'seditious', 'cat-like', 'restructured', 'neuromuscular', 'covered', 'ignored', 'ergotropic', 'Irish', 'polemical', 'serviceable', 'muscle-bound', 'Notable', 'catalogued', 'Missionary', 'hurled', 'fussy', 'neuronal', 'late', 'started', 'musical', 'variable', 'hypophyseal', 'canceled', 'passionate', 'Goddamn', 'aforesaid', 'all-consuming', 'scabrous', 'super', 'obedience-trained', 'sacred', 'attacked', 'awash', 'quarter-century-old', 'rebuilt', 'jammed-together', 'accentuated', 'resented', 'pathologic', 'suspected', 'effectual', '600-mile', 'overestimated', 'Regional', 'belated', 'conquered', 'quit', 'Pensive', 'friable', 'beauteous', 'unventilated', 'archaic', 'camouflaged', 'gothic', 'crummy', 'directional', 'Effective', 'preconditioned', 'medium-sized', 'housebroken', 'conjugated', 'mowed', 'w-i-d-e', 'waxed', 'decorative', 'retinal', 'refreshing', 'Lousy', 'conversant', 'rustic', 'self-extinguishing', 'prescribed', 'Gratified', 'Neutral', 'burned', 'bucolic', 'barred', 'newly-plowed', 'Gentile-Jewish', 'prohibitive', 'surface-active', 'barbed', 'warned', 'rococo', 'demographic', 'stringy', 'hydrous', 'too-naked', 'distressed', 'furloughed', 'rich', 'brushy', 'printable', 'wintered', 'Adjusted', 'explanatory', 'native-born', 'unready', 'reddish', 'Suggested', 'ornraier', 'wild', 'inscribed', 'insane', 'policy-making', 'juxtaposed', 'large-enough', 'intrepid', 'pro-Hearst', 'blanketed', 'dilute', 'readjusted', 'German-language', 'sharp-limbed', 'apocryphal', 'Islamic', 'Wet', 'automotive', 'replanted', 'impressionistic', 'occasioned', 'strangled', 'curved', 'disobedient', 'repentant', 'pinched', 'void', 'ciliated', 'graced', 'scrapped', 'lightest', 'collar-to-collar', 'Afro-Cuban', 'dietary', 'stylized', 'butchered', 'thinner', 'equalled', 'alarmed', 'endless', 'impurity-doped', 'overcome', 'soldierly', 'posted', 'sublimed', 'willful', 'metabolic', '3,000-foot', 'ineligible', 'unnamed', 'gathered', 'Rococo', 'exotic', 'rat-a-tat-tatty', 'hypothetical', 'American', 'cost-finding', 'inattentive', 'loose-jointed', 'Personal', 'crocked', 'forwarded', 'unchanged', 'stanchest', 'triple-checked', 'suspicious', 'diatomic', 'swarthy', 'hinged', 'insolent', 'parrot-like', 'happy', 'titanic', 'lower', 'minded', 'surly', 'beardless', 'enterprising', 'grass-green', 'Perfect', 'spine-chilling', 'intercollegiate', 'subsistent', 'Moroccan', 'Gallant', 'redeemed', 'iniquitous', 'Pyhrric', 'tantamount', 'versatile', 'graphed', 'survey-type', 'cheery', 'oxaloacetic', 'woolly-headed', 'Bad', 'besieged', 'screwed', 'bull-roaring', 'overcast', 'gregarious', 'Independent', 'oft-repeated', 'powdered', 'crassest', 'poked', 'realest', 'incipient', 'completed', 'well-prepared', 'gold', 'tranquil', 'scary', 'magenta', 'nourished', 'socialized', 'impelled', 'noncombatant', 'lean', 'debt-free', 'east-west', 'aimed', 'loath', 'flattened', 'two-week', 'Active', 'capacious', 'illustrious', 'frailest', 'submachine', 'coerced', 'blustery', 'papillary', 'earthly', 'wiry', 'taxed', 'distinguishable', 'uncertain', 'Sophoclean', 'medieval', 'inaugural', 'serial', 'shaky', 'needle-sharp', 'reassuring', '60-city', 'unliterary', 'fog-enshrouded', 'multivalent', 'classificatory', 'histochemical', 'beset', 'Dangerous', 'squealed', 'charted', 'coolest', 'post-operative', 'strict', 'embedded', 'oldest', 'Declarative', 'costlier', 'confirmed', 'notorious', 'disappeared', 'mineralogical', 'erroneous', 'downwind', 'televised', 'unpaid', 'battle-shattered', 'envenomed', 'typewritten', 'acknowledged', 'a.', 'inspiring', 'skyjacked', 'powerless', '35-foot', 'imitated', 'spread-out', 'inconvenient', 'able', 'pearl-gray', 'elaborate', 'blackest', 'white-dominated', 'outmoded', 'autonomic', 'evocative', 'ionic', 'feather-like', 'saucy', 'decisional', 'moneyed', 'all-woman', 'hottest', 'overburdened', 'boundless', 'essayed', 'clubbed', 'blest', 'bribed', 'weaker', 'chromed', 'single-spaced', 'clear-channel', 'shivery', 'posed', 'foppish', 'nucleic', 'planned', 'diversified', 'swooped', 'geered', 'Platonic', 'milder', 'conventional-type', 'eerie', 'straight-backed', 'nearer', 'rolled', 'followed', 'pulled', 'shrill', 'consolidated', 'tomato-red', 'surfeited', 'ill', 'cell-free', 'neon-lit', 'unrelenting', 'unbroken', 'audio', 'uprooted', 'Bully', 'adept', 'harvested', 'inured', 'hexagonal', 'misunderstood', 'eventual', 'Public', 'assented', 'accidental', 'fatal', 'considerable', 'well-educated', 'aboriginal', 'new', 'closer', 'brimful', 'screw-loose', 'fonder', 'restricting', 'Jungian', 'kindly', 'yanked', 'charmed', 'merriest', 'led', 'unimpassioned', 'Melodious', 'reduced', 'marginal', 'double-strength', 'erythroid', 'telomeric', 'entrusted', 'only', 'wealthiest', 'nebulous', 'hand-in-glove', 'closest', 'Free', 'felonious', 'elated', 'Preliminary', 'perplexed', 'infallible', 'declarative', 'Shy', 'tart', 'Rhythmic', 'multimegaton', 'lowest', 'wild-eyed', 'vicious', 'hatchet-faced', 'longer', 'all-American', 'unchristian', 'resistant', 'tasteless', 'irregular', 'ground', 'daytime', 'illegitimate', 'lagged', 'detrimental', 'service-connected', 'adored', 'uncomforted', 'facial', 'declamatory', 'profit-maximizing', 'skillful', 'dissociated', 'straight-A', 'permanent', 'averted', 'wartorn', '12-year-old', 'silent', 'post-World', 'thunder-purple', 'gnarled', 'pedagogical', 'child-bearing', 'anti-Semitic', 'bottom-living', 'premature', 'schoolgirlish', 'feeble', 'intermediate', 'all-powerful', 'nodded', 'modernistic', 'peacemaking', 'pseudo-anthropological', 'brilliant', 'automatic', 'five-days-a-week', 'consented', 'advocated', 'presidential', 'notarized', 'inescapable', 'Unruly', 'resiny', 'Impressive', 'linked', 'well-known', 'interned', 'seventeen-year-old', 'over/under', 'responsive', 'homely', 'merrymaking', 'walked', 'slowest', 'gubernatorial', 'Periodic', 'baggy', 'swept', 'nation-wide', 'Elementary', 'Considerable', 'pre-Anglo-Saxon', 'erased', 'coddled', 'capitalist-democratic', 'introspective', 'galling', 'unwitting', 'Impossible', 'still-building', 'button-down', '240-grain', 'channeled', 'familiar', 'expansive', 'expropriated', 'Residential', 'uniformed', 'unnourished', 'reinforced', 'three-part', 'Sudanese', 'alternative', 'debated', 'cancer-ridden', 'Lawmaking', 'Pakistani', 'truculent', 'faulty', 'greatest', 'Dead', 'chimera-chasing', 'hard-fought', 'afire', 'palm-studded', 'tragic', 'False', 'choppy', 'nothing-down', 'less-hurried', 'honoured', 'belonged', 'physiological', 'novel', 'startling', 'outstate', 'deserved', 'situated', 'solid-fueled', 'exposed', 'screechy', 'extra-thick', 'grief-stricken', 'vulpine', 'untraditional', 'livable', '30-inch', 'putty-like', 'suitably-loaded', 'canonist', 'erupted', 'bloodless', 'illegal', 'anastomotic', 'post-war', 'instant', 'neonatal', 'unerring', 'anti-polio', 'yeard', '508-yard', 'subtle', 'unendurable', 'summer-winter', 'missed', 'smoother', 'possessive', 'selected', 'recessed', 'fourteen-nation', 'Fearful', 'molecular', 'excruciating', 'featureless', 'surface-declaring', 'lower-middle', 're-run', 'uninhibited', 'fell', 'locked', 'imaginary', 'captivating', 'chipped', '400-pound', 'antisocial', 'secured', 'cupped', 'digital', 'phonologic', 'wandered', 'buff', 'bottled', 'outer', 'foolproof', 'competent', 'Unique', 'frequent', 'stateless', 'shriveled', 'dromozootic', 'dashed', 'dormant', 'abrasion-resistant', 'front-back', 'instrumental-reward', 'transluscent', 'compensatory', 'pasted', 'pro-U.N.F.P.', 'spurned', 'wry', 'well-made', 'travelled', 'Linked', 'pantomimic', '25-year-old', 'Florentine', 'inlaid', 'collective', 'neuropsychiatric', 'Yellow', 'introduced', 'sanitary', 'remunerative', 'unlawful', 'immemorial', 'puerile', 'mighty', 'unfair', 'injured', 'naturalistic', 'destructive', 'quieter', 'interfered', 'somber', 'ol', 'admixed', 'germane', 'birch-paneled', 'commit', 'stony', 'fresh-ground', "p'lite", 'Good', 'centuries-old', 'distraught', 'decreased', 'German', 'inclusive', 'red-faced', 'slim-waisted', 'four-hour', 'red-and-yellow', 'out-of-town', 'thirty-year', 'broadened', 'austere', 'pleasing', 'cooled', '100-million-lb.', 'spongy', 'unrecognizable', 'over-emphasized', 'cut-down', 'unblushing', 'olivefaced', 'relegated', 'feigned', 'gulled', 'jailed', 'misrelated', "ever-lovin'", 'whopping', 'nonequivalent', 'truthful', 'host-specific', '72-hole', 'stout', 'inarticulate', 'hypnotic', 'Unusual', 'pre-drilled', 'slippery', 'unique', 'bodied', 'wildest', 'impressed', 'run-up', 'handsome', 'American-trained', 'acid', 'three-sectioned', 'incomplete', 'served', 'ski', 'Fixed', 'monolithic', 'Regarded', 'impaired', 'abysmal', 'unseemly', 'heavy-faced', 'Cleaned', 'atmospheric', 'multicolor', 'pre-cooled', 'salaried', 'Scandinavian', 'blank', 'shifted', 'Present', 'cockeyed', 'whitened', 'unarmed', 'skinny', 'countless', 'inter-species', 'treated', 'retail', 'predictive', 'resonant', 'corded', 'fugitive', 'interclass', 'granular-type', 'reloaded', 'relentless', 'gleaned', 'empirical', 'across-the-board', 'ruled', 'foamed-in-place', 'inert', 'offended', 'sane', 'high-pitched', 'wedded', 'synchronous', '25,000-man', 'curtained', 'used', 'hydrophobic', 'traumatic', 'propped', 'quantitative', 'opinionated', 'Chinese-inspired', 'undetected', 'deformational', 'undeserved', 'Metropolitan', 'wanton', 'calamitous', 'mesmerized', 'harbored', 'engulfed', 'follicular', 'paternalistic', 'all-knowing', 'far-away', 'paled', 'farther', 'passable', 'embellished', 'Married', 'injection-molded', 'indifferent', 'short-skirted', 'leagued', 'redder', 'pleural', 'rotund', 'Done', 'year-round', '900-calorie', 'Ithacan', 'maximal', 'fastidious', 'unmagnified', 'priced', 'overdeveloped', 'impeded', 'humanitarian', 'shrunken', 'roast', 'stone-blind', 'Certain', 'thunderous', 'implied', 'gut-flattening', 'abstractive', 'stamped', 'disordered', 'deathward', 'future', 'created', 'Developed', 'aberrant', 'Glazed', 'overlapped', 'feudal', 'exasperating', 'shut', 'reapportioned', 'taller', 'noticed', 'difficult', 'symptomatic', 'impassive', 'carefree', 'heartiest', 'modular', 'hungrier', 'blamed', 'deceived', 'Glorious', 'unthematic', 'buckle-on', 'unintended', 'egged', 'weighted', 'multilateral', 'unwise', 'adipic', 'self-centered', 'imperfect', 'cluttered', 'voluminous', 'infected', 'talented', 'Savory', 'Single-seeded', 'bid', 'professed', 'long-familiar', 'mammalian', 'anti-B', 'pre-1960', 'expeditious', 'mendacious', 'Pretty', 'unrepentant', 'offhand', 'flawless', 'copious', 'British', 'refracted', 'reversed', 'interposed', 'unremarkable', 'misplaced', '25-liter', 'Limited', 'Whole', 'bestubbled', 'unfriendly', 'flashed', 'brotherly', 'transcendant', '645-acre', 'mid', 'half-closed', 'civilized', 'batted', 'refrigerated', 'neurotic', 'outclassed', 'hand-covered', 'negligent', 'bluish', 'crazy', 'silken', 'holier-than-thou', 'squeamish', 'misty-eyed', 'monitored', 'darkhaired', 'wind-blown', 'penetrating', 'bangish', 'super-imposed', 'semi-catatonic', 'business-like', 'orthodontic', 'thwarted', 'indisposed', 'Unconcerned', 'barbarous', 'charitable', 'insufficient', 'vehement', 'unsupported', 'enraptured', 'prime', 'amalgamated', 'coronary', 'pubescent', 'designated', 'White-shirted', 'floated', 'sequenced', 'over-the-counter', 'evident', 'plush', 'photographed', 'horizontal', 'subordinate', 'phrased', 'polymeric', 'idolized', 'Specific', 'alien', 'Anglo-Jewish', 'smug', 'unlimited', 'artery-pulmonary', 'prim', 'hypocritical', 'grown', 'clicked', 'multi-valued', 'deliberate', 'holy', 'stimulatory', 'Gradual', 'Steady', 'obscene', 'petered', 'two-burner', 'warmhearted', 'undaunted', 'two-nosed', 'interminable', 'Capable', 'sweet-sounding', 'slumped', 'fun-filled', 'Duplicate', 'college-oriented', 'Southern', '4-month', 'sued', 'Pale', 'spavined', '16-year-old', 'prompt', 'polarized', 'explicit', 'ould', 'costly', '6-foot-10', 'insubordinate', 'Russian-dominated', 'lacy', 'perpetual', 'Erected', 'ionized', '2-liter', 'unrealistic', 'extraterrestrial', 'acculturated', 'tilled', 'unworkable', 'field-sequential', 'brand-new', 'junior-senior', 'dissatisfied', '4-year', 'coy', 'clonic', 'expressed', 'preferential', 'replaced', 'photochemical', 'Conventional', 'loudest', 'anionic', 'incompatible', 'uncovered', 'death-like', 'isotopic', 'showed', 'junior-philosophical', 'above-mentioned', 'middle', 'unpublished', 'tardy', 'high-legged', 'bitten', 'extrapolated', 'audible', 'Britannic', 'break-neck', 'pinkish-white', 'individual', 'plausible', 'lonesome', 'relied', 'puissant', 'stepped-up', 'affixed', 'roughest', 'vertebral', 'remained', 'Unlimited', 'peridontal', 'incompetent', 'affected', 'face-saving', 'possessed', 'many-faced', 'devoid', 'Constitutional', 'broken', 'geographical', 'concurrent', 'transmissible', 'Handsomest', 'supported', 'depraved', 'ludicrous', 'very', 'axiomatic', 'neatest', 'little-known', 'ultramodern', 'forborne', 'picked', 'progressive', 'edible', 'gradient', 'discrete', 're-created', 'palletized', 'dearest', 'equidistant', 'adroit', 'intermediary', 'cast', 'experimental', 'signified', 'unaffected', 'bullish', 'improbable', 'Red-prone', 'sinned', 'displayed', 'panelized', 'glad', 'kosher', 'air-to-surface', 'Yankee', 'Diocesan', 'foreign-sounding', 'Blessed', 'Ardent', 'carven', 'glossy', 'sweet', 'standby', 'lacquered', 'harmonic', 'Spenglerian', 'non-Catholic', 'beneficient', 'much-craved', 'unaccountable', 'bicycle-auto', 'southeast', 'pessimistic', 'calcified', 'motionless', 'truer', 'free-buying', 'prosperous', 'surmounted', 'unitized', 'profitable', 'threatening', 'integral', 'buckled', 'congratulated', 'resistive', 'select', 'stalked', 'Greek', 'sorrel', 'staged', 'stuffy', 'Nostalgic', 'higher-priced', 'crumbled', 'titular', 'one-room', 'five-round', 'happened', 'beef-feeding', 'graduated', 'geo-political', '600-yard', 'flattered', 'merged', 'tumultuous', 'world-famous', 'childless', 'intrusive', 'off-beat', 'intradepartmental', 'ten-concert', 'rough-sanded', 'improper', 'loveliest', 'exhaustible', 'anguished', 'maladroit', 'untracked', 'programed', 'dusted', 'blonde-haired', 'Slackened', 'pert', 'ivy-covered', 'bruised', 'saluted', 'anti-infective', 'vernal', 'attested', 'auburn', 'terrorized', 'discredited', 'black-and-yellow', 'supplied', 'inefficient', '22-day', 'proximate', 'anthropological-religious', 'calm', 'Retired', 'exhaustive', 'Slender', 'undermined', 'absorptive', 'invoked', 'prophetic', 'mounted', 'Surrounded', 'chopped', 'perfected', 'Human', 'emerged', 'Choreographed', 'base-stealing', 'instinctual', 'developed', 'scalded', 'pre-Fair', 'streamlined', 'perverted', 'freshborn', 'floppy', 'exonerated', 'accorded', 'Christ-like', 'inhibitory', 'barren', 'patent-sharing', 'lithe', 'proximal', 'Bitter', 'distracted', 'alveolar', 'self-consuming', 'per-day', 'axial', 'Sociological', 'resurrected', 'procreative', 'frescoed', 'moneymaking', 'Founded', 'uphill', 'incubated', 'superb', 'concave', 'non-linear', 'clenched', 'three-day', 'uncombable', 'unequalled', 'resublimed', 'ill-equipped', 'incandescent', 'world-renowned', 'contagious', 'anecdotal', 'franker', 'instituted', 'conceived', 'debonair', 'infectious', 'proved', 'oversubscribed', 'reassembled', 'so-so', 'song-writing', 'crooked', 'well-developed', 'rational', 'Tibetan-like', 'overlaid', 'overridden', 'flintless', 'sheltered', 'spoken', 'female', 'penurious', 'cathodophoretic', 'branched', 'interdenominational', 'bullet-riddled', 'ascertained', 'judicial', 'geocentric', 'newly', 'blue-draped', 'inextricable', 'fictive', 'casual', 'feasible', 'octagonal', 'necessitated', 'libelous', 'dramatical', 'disintegrative', 'Scottish', 'multichannel', 'cockier', 'Seated', 'frigid', 'step-by-step', 'ingratiating', 'companionable', 'produced', 'foamy-necked', 'preserved', 'unsurpassed', 'workmanlike', 'pre-war', 'clothed', 'marine', 'overhead', 'funny', 'wholesome', 'whole', 'incomparable', '160-ml.', 'polytonal', 'ancestral', 'shade-darkened', 'down', 'major', 'three-man', 'amputated', 'pre-Revolutionary', 'played-out', 'chinless', 'Left', '16-hour', 'juicy', 'unrelated', 'seceded', 'foisted', 'usable', 'confidential', 'interstate', 'portrayed', 'blood-thirsty', 'entranced', 'olive-green', 'half-swimming', 'tweedy', 'shark-infested', 'predisposed', 'less-dramatic', 'given', 'combat-tested', 'pointed', 'accurate', 'hard-nosed', 'well-informed', 'disowned', 'repeated', '24-in.', 'clearer', 'undisturbed', 'Spencerian', 'fragile', 'graceful', 'unscrupulous', 'Broiled', 'rancorous', 'majored', 'pretended', 'synthesised', 'mosaic', 'disinterred', 'desirable', 'pyknotic', 'supervened', 'avaricious', 'Cuban', 'retentive', 'war-dirty', 'Palladian', 'massed', 'meager', 'Simple', 'keenest', 'express', 'remedial', 'well', 'matching', 'gentler', 'force-fear', 'quicker', 'poured-in-place', 'sewed', 'rampant', 'swollen', 'conjured', 'called', 'all-time', 'thermal', 'Got', 'Australian', 'bizarre', 'flamboyant', 'heliocentric', 'corrupted', 'fatherly', 'pedestrian', 'unruffled', 'Etruscan', 'ranged', 'wrongful', 'imperial', 'purest', 'ice-feeling', 'lonely', 'terrific', 'well-meaning', 'flagellated', 'consisted', 'generated', 'pre-academic', 'concocted', 'unimpaired', 'horrifying', 'two-disc', 'heavier', 'downright', 'cooked', 'fruitful', 'Low-flying', 'incident', 'Varian', 'greedy', 'Unfriendly', 'negative', 'folklike', 'theatergoing', 'biennial', 'unimpressed', 'warmer', 'socio-political', 'brainy', 'Hanoverian', 'precut', 'Royal', 'Significant', 'sapped', 'vicelike', 'Reeves-type', 'periphrastic', 'Uninhibited', 'pontifical', '3-year-old', 'fractious', 'stalwart', 'layered', 'captious', 'heat-denatured', 'slaughtered', 'fast-frozen', 'frustrating', 'nicknamed', 'bigoted', 'behavioral', 'everlasting', 'steely', 'feverish', 'Capitalist', 'unnecessary', 'discriminatory', 'western-style', 'Welsh', 'Further', 'publicized', 'granulocytic', 'ten-hour', 'contractual', 'no-valued', 'high-up', 'divisive', 'wraith-like', 'university-wide', 'white-clad', 'paranoid', 'cleaner', 'relevant', 'slammed', 'epic', 'spring-back', 'dismal', 'Helpless', 'contained', 'caliche-topped', 'replete', 'sacrosanct', 'chipper', 'Serbantian', 'demonstrable', 'Historical', 'forsaken', 'insecure', 'nuclear', 'pre-empting', 'nonverbal', 'sheer', 'bland', 'Educational', 'administrative', 'caved', 'slivery', 'potential', 'Taught', 'interviewed', 'purified', 'cross-fertilized', 'Asteroidal', 'influent', 'easy', 'downward', 'sappy', '6-foot-3-inch', 'unkempt', 'unsolved', 'needy', 'knot-tying', 'denied', 'Wised', 'smudged', '2-over-par', 'crystalline', 'cinematic', 'rushed', 'inferior', 'wedged', 'concise', 'suspect', 'stated', 'sold-out', 'lifelike', 'Content', 'indivisible', 'greenest', 'pint-sized', '21-inch', 'sampled', 'less-traveled', 'tintable', 'final', 'classic', 'long-keeping', 'live', 'half-cocked', 'cost-raising', 'doped', 'non-academic', 'antihistorical', 'illogical', 'shared', 'indecisive', 'invisible', 'satisfying', 'downtalking', 'soulful', 'defended', 'inexcusable', 'ultimate', 'sinister', 'exported', 'hedged', 'liberal', 'forged', 'stronger', 'diagrammed', 'biophysical', 'phoned', 'much-copied', 'oval', 'ominous', 'wispy', 'prolonged', 'Holy', 'persecutory', 'peered', 'accounted', 'erected', 'seafaring', 'wasteful', 'fortunate', 'faintest', '8-year-old', 'fusty', 'orthographic', 'yellowed', 'snubbed', 'ill-prepared', 'dotted', 'far-reaching', 'postal', 'simpler', 'warmed-over', 'sentient', 'present-time', 'bulky', 'unresolved', 'resifted', 'Exclusive', 'three-dimensional', 'nondrying', 'Binomial', 'Judeo-Christian', 'wee', 'monotone', 'onrushing', 'ever-growing', 'retired', 'obligational', 'fruitless', 'fleeting', 'red-bellied', 'demarcated', 'Georgian', 'terrified', 'glowered', 'intra-company', 'Included', 'cloudy', 'north-bound', 'calmest', 'solid', 'tropho-', 'pardoned', '21-year', 'Economic', 'non-supervisory', 'epoch-making', 'inconsiderable', 'week-old', 'Philippine', 'renovated', 'socio-structural', 'ornate', 'maroon', 'corniest', 'fiber-coupled', 'Deemed', 'elegant', 'oftener', 'bilingual', 'diminished', 'devotional', 'ebullient', 'unobtainable', 'consanguineous', 'brown', 'treasonous', 'filled', 'tidal', 'American-Jewish', 'valiant', 'greate', 'esoteric', 'pursued', 'trustworthy', 'personified', 'wished', 'pre-cast', 'spread', 'ingested', 'unauthentic', 'menaced', 'Straightened', 'granted', 'prepared', 'Unanalyzed', 'illustrative', 'obsolete', 'five-volume', 'predigested', 'apportioned', 'predestined', 'Apropos', 'sizable', 'simultaneous', 'unsurmountable', 'sexy', 'coup-proof', 'unattractive', 'engendered', 'well-equipped', 'challenging', 'exogamous', 'balmy', 'bucked', 'unstructured', 'curtailed', 'eye-gouging', 'inferred', 'Drafted', 'textured', 'handmade', 'clasped', 'much-needed', 'visceral', 'built', 'gray-haired', '100-brick', 'south-central', 'unleashed', 'Contemporary', 'lilac', 'alarmist', 'unacceptable', 'action-packed', 'emptier', 'repealed', '10-team', 'parceled', 'vibrant', 'Freudian', 'uninterrupted', 'entry-limited', 'pending', 'every-day', 'outspread', 'heart-warming', 'untrammeled', 'subsided', 'stirring', 'rootless', 'woolen', 'Staged', 'southward', 'peripheral', 'invaded', 'French-born', 'blown', 'motley', 'recreated', 'retarded', "hifalutin'", 'Ordinary', 'Pre-shaped', 'upper-lower', 'devious', 'passed', 'blotted', 'occupational', 'materialized', 'roughish', 'unable', 'makeshift', 'unsuccessful', 'eccentric', 'experiential', 'self-employed', 'put', 'comprehended', 'all-round', 'clothbound', 'multi-family', 'honorary', 'gilt', 'colloidal', 'Expressed', 'vied', 'undisrupted', 'differed', 'outdoor', 'inflated', 'flood-ravaged', 'Secret', 'annoying', 'backwoods-and-sand-hill', 'lawmaking', 'Stuart-family', 'angered', 'world-shattering', 'transcendental', 'Drenched', 'shocking', 'mattered', 'modish', 'accentual', 'profuse', 'handiest', 'limbic', 'enhanced', 'staffed', 'Social', 'normalized', 'goddam', 'emaciated', 'Manual', 'subpenaed', 'decided', 'Drunken', 'semi-abstract', 'bovine', 'state-owned', 'unexpended', 'denuded', 'constructive', 'desensitized', 'stricken', 'Hellenic', 'danged', 'dignified', 'hypothalamic-cortical', 'interspersed', 'diocesan', 'overpowered', 'taped', 'structured', 'prejudged', 'level', 'colorful', 'Treasonable', 'inclement', 'corked', 'unprocurable', 'divorced', 'reported', 'spell-binding', 'multi-purpose', 'understood', 'sympathetic', 'historic', 'make-work', 'unclenched', 'up-jutting', 'secularized', 'useless', 'considerate', 'intactible', 'Frog-marched', 'full', 'vaguest', 'unmarried', 'Middle', 'humanistic', 'vivacious', 'won', 'residual', 'dual-channel', 'immanent', 'nonsystematic', 'neutral', 'enlisted', 'Orange', 'christened', 'antisubmarine', 'tolerable', 'Hatless', 'Charming', 'larger', 'natal', 'duplex', 'purled', 'ecumenical', 'maturational', 'spectrometric', 'favorable', 'rehearsed', 'prudent', 'reckoned', 'authoritarian', 'grimed', 'superior', 'fetching', 'bilked', 'portentous', 'five-a-week', 'superstitious', 'monthly', 'pitiable', 'hip', 'armored', 'ocean-going', 'myeloid', 'demolished', 'shy', 'flat', 'selfeffacing', 'parliamentary', 'macabre', 'thermonuclear', 'flat-bottomed', 'flyaway', 'narrowed', 'shapeless', 'gentle', 'aggregate', 'symbolical', 'keyed', 'weird', 'long-sought', 'studded', 'Herculean', 'veterinary', 'Direct', 'anthropological', 'observational', 'circuitous', 'Prompted', 'polygynous', 'guttural', 'Minoan-Mycenaean', 'pitiful', 'recondite', 'idealistic', 'idle', 'Operational', 'non-taxable', 'lasting', 'oratorical', 'compromised', 'duller', 'carved-out-of-solid', 'polynomial', 'Female', 'insulting', 'gross', 'sedimentary', 'French', 'tossed', 'lurid', 'crazy-wonderful', 'damed', 'suburbanite', 'jackbooted', '2-inch', 'abetted', 'Portuguese', '16-page', 'Superior', 'sharper', 'hateful', 'thermoformed', 'recurrent', 'irremediable', 'well-read', 'dazed', 'unstapled', 'Nuclear', 'grandiose', '6-hr.', 'tapered', 'regular', 'guaranteed', 'loosely-taped', 'burnished', 'air-conditioned', 'cubist', 'prossed', 'pigmented', 'hard-boiled', 'steepest', 'misquoted', 'survived', 'blue', 'mechanical', 'two-colored', 'uneconomic', 'upland', 'grounded', 'Thermogravimetric', 'fifteen-minute', 'vacuous', 'Extraordinary', 'purported', 'sentimental', 'capable', 'proudest', 'Burgundian', 'scored', 'over-spent', 'aromatick', 'Sorry', 'romantic', 'sectarian', 'optimistic', 'emeritus', 'written', 'choked', 'statesmanlike', 'religious', 'chiseled', 'reedy', 'operable', 'thorough', 'shredded', 'estimated', 'much-discussed', 'headless', 'anti-Colmer', 'Jewish', 'scurrilous', 'paneled', 'superfluous', 'tepid', 'sprinkled', 'youthful', 'contemptuous', 'lifted', 'insuperable', 'recreational', 'controversial', 'uncluttered', 'post-attack', 'dosed', 'roughened', 'case-by-case', 'critical', 'fatuous', 'Heavy-coated', 'proscribed', 'attractive', 'cool', 'nervous', 'patterned', 'sculptured', 'overcrowded', 'long-acting', 'Thermal', 'Yiddish', 'Mono-unsaturated', 'lobular', 'scientifically-trained', 'Jutish', 'Hebrew', 'internal-external', 'honeycombed', 'rationalist', 'slightly-smoking', 'unchecked', 'idiomatic', 'unlikely', 'ungrateful', 'alienated', 'edgy', 'compressed', 'muted', 'incapable', 'clear-cut', 'cranelike', 'food-processing', 'policed', 'scimitar-wielding', 'responded', 'sweet-sour', 'miscellaneous', 'newly-created', 'homebound', 'stopped', 'tight', 'cypress-like', 'dental', 'Little', 'Heavenly', 'harnessed', 'corresponding', 'filthy', 'topographic', 'blanche', 'Flemish', 'thirty-mile', 'worded', 'unbelieving', 'awry', 'wholesale', 'bespectacled', 'reportorial', 'extramarital', 'immaterial', 'five-minute', 'gun-slinging', 'honey-in-the-sun', 'partial', 'budget-altering', 'well-stocked', 'sprung', 'worn-faced', 'legitimized', 'Federal', 'unquiet', 'excited', 'laden', 'choice', 'meted', 'hit-and-run', 'ripped', 'dazzled', 'adverbial', 'tricky', 'four-letter', 'terrifying', 'worthy', 'gruesome', 'once-in-a-lifetime', 'levi-clad', 'Central', 'famed', 'absent-minded', 'ideal', 'tarnished', 'relaxed', 'operative', 'amatory', 'dined', 'gripped', 'unoccupied', 'moved', 'inflicted', 'gangling', '8-1/2-foot', 'self-evident', 'courted', 'dipole', 'misjudged', 'lower-priced', 'won-lost', 'unwed', 'quarterly', 'shape-up', 'anticipatory', 'boyish', 'phonemic', 'unreleased', 'swallowed', 'Sufficient', 'parsympathetic', 'prior', 'isotonic', 'roomy', 'dual-road-up', 'resuspended', 'Native', 'luminous', 'colonnaded', 'moral', 'phosphate-buffered', 'pee-wee', 'exact', 'Happened', 'rimless', 'blithe', 'translated', 'geopolitical', 'warlike', 'well-fleshed', 'Individual', 'not-quite-perfect', 'preparative', 'bright', 'homemade', 're-incorporated', 'Grumbled', 'insensitive', 'responsible', 'rosy', 'Looked', 'unpretentious', 'hypothalamic', 'arresting', 'chatty', 'ankle-deep', 'crimson', 'stereo', 'lacey', 'general-appeal', 'comprehensive', 'Queried', 'abnormal', 'adhered', 'injunctive', 'galloped', 'trivial', 'unrewarding', 'outspoken', 'builtin', 'Public-spirited', 'traditionalistic', 'relieved', 'repetitious', 'associated', 'Powerful', 'world-wide', 'esteemed', 'sclerotic', 'partnered', 'rubbery', 'indispensible', 'return', 'Joined', 'socialist', 'tactical', 'two-family', 'Spatial', '10-year', 'stringed', 'self-proclaimed', 'gassy', 'coastal', 'de-iodinated', 'adjudged', 'resin-saturated', 'mediumistic', 'well-written', 'unenforcible', 'self-reliant', 'bluff', 'polished', 'Government-owned', 'filde', 'helicopter-borne', 'excellent', 'mountainous', 'doctored', 'two-timed', 'incensed', 'pro-neutralist', 'exploited', 'unhappiest', 'ultra-modern', 'unsatisfactory', 'pug-nosed', 'pre-school', 'preached', 'numerical', 'Blasphemous', 'illuminating', 'antic', 'unfired', 'evolutionary', 'oppressive', 'subscribed', 'salient', 'worth', 'craggy', 'transported', 'unshielded', 'autistic', 'invulnerable', 'plugged', 'emboldened', 'sheeted', 'deposed', 'grubby', 'unsteady', 'definitive', 'monodisperse', 'non-instinctive', 'loose', 'psychotic', 'panicked', 'after-hours', 'diverse', 'looked', 'immutable', 'scatterbrained', 'dextrous-fingered', 'half-understood', 'unauthorized', 'bleak', 'disarranged', 'heightened', 'languid', 'rewritten', 'oversize', 'reckless', 'later', 'florid', 'blessed', 'agitated', 'lethal', 'filed', 'outward', 'unromantic', 'nucleated', 'gonne', 'tough-looking', 'Careful', 'degassed', 'prevalent', 'comprised', 'Episcopal', 'caused', 'non-job-connected', 'gum-chewing', 'Clean', 'three-night', 'Geatish', 'stormy', 'off-the-cuff', 'poly-unsaturated', 'retreated', 'sulphured', 'uncalled', 'bloodstained', 'hastily-summoned', 'best-tempered', 'sunbaked', 'landed', 'Reduced', 'dripped', 'clear-headed', 'intoxicated', '14-term', 'one-story', 'Slight', 'animated', 'leaderless', 'two-and-a-half-mile', 'sky-reaching', 'coated', 'ill-starred', 'bridged-T', 'bronchiolar', 'brief', 'furthered', 'clerical-lay', 'muttered', 'housed', 'hydrated', 'enmeshed', 'roughed', 'all-female', 'specialized', 'correct', 'stately', 'pillared', 'omitted', 'Democratic-endorsed', 'infertile', 'woeful', 'testimonial', 'myocardial', 'dead', 'affectionate', 'infamous', 'wordy', 'nettled', 'vivid', 'four-jet', 'consultative', 'happier', 'slight', 'tiled', 'extirpated', 'vertical', 'data-processing', 'unheated', 'bio-medical', 'full-sized', 'all-Negro', 'basic', 'two-year', 'nimbler', 'intelligent', 'sun-inflamed', 'yellow', 'Advance', 'infinite', 'Devoted', 'disdainful', 'low-priced', 'red-tailed', 'disputable', 'agricultural', 'dreamy', 'meditative', 'pitched', 'lugged', 'stimulated', 'logical', 'smuggled', '3-foot', 'out-dated', 'climaxed', 'exhilarated', 'off-duty', 'alphabetized', 'home-bound', 'One-armed', 'environmental', 'bewildered', 'five-coordinate', 'tagged', 'correlated', 'art-filled', 'plus-one', 'indignant', 'attributable', 'burglarproof', 'unadjusted', 'sun-browned', 'Rear', 'scanty', 'crazed', 'half-drunk', 'semi-serious', 'Theoretical', 'inaugurated', 'weasel-worded', 'cooperated', 'paralinguistic', 'amenable', 'skilled', 'bubbly', 'hindered', 'binomial', 'deflated', 'first-class', 'protested', 'equated', 'parkish', 'marched', 'astonished', 'structural', 'interdepartmental', 'fifty-dollar', 'uncorked', 'knowledgeable', 'post-census', 'self-locking', 'seven-stories', 'middle-sized', 'exhibited', 'scorched', 'politico-sociological', 'otherworldly', 'halcyon', 'unalloyed', 'readable', 'diminutive', 'alliterative', 'widthwise', 'succeeded', 'long-awaited', 'unbelievable', 'conditional', 'determinable', 'discussed', 'cited', 'Democratic', 'tempted', 'combatant', 'case-hardened', 'higher', 'abused', 'Honest', 'metaphysical', 'different', 'magnified', 'Aroused', 'snippy', 'regrettable', 'electoral', 'divided', 'Janus-faced', 'demanded', 'damn', 'mud-sweat-and-tears', 'non-Federal', 'Poor', 'glottochronological', 'gret', 'business-minded', 'Ukrainian', 'non-social', 'sincerest', 'shallower', 'mass-building', 'dehumanised', 'lent', 'peeked', 'unmalicious', 'thrilling', 'water-holding', 'benevolent', 'bestowed', 'Trinitarian', 'heated', 'misfired', 'fat', 'camp-made', 'Precise', 'wacky', 'deprecatory', 'expressionless', 'explained', 'indistinguishable', 'resolved', 'ever-changing', 'adolescent', 'modest', 'grisly', 'toughest', 'frightened', 'commutator-like', 'overtaxed', 'spic', 'unnameable', 'three-hour', 'womb-to-tomb', 'discouraged', 'dishonest', 'dependent', 'Burmese', 'unscientific', 'delegated', 'calumniated', 'traitorous', 'contemptible', 'filial', 'pulverized', 'slenderer', 'ageless', 'Algerian', 'dialed', 'three-masted', 'Pentecostal', 'prevented', 'Exhibited', 'definite', 'anti-aircraft', 'Tunisian', 'Italian', 'smashed', 'diagonal', 'ordered', 'cotton-growing', 'sylvan', 'sole', 'enlightening', 'debatable', 'corruptible', 'status-conscious', 'mineral-rich', 'sopping', 'equitable', 'diabolical', 'prospective', 'old-fashioned', 'inexhaustible', 'revolved', 'protective', 'sun-tanned', 'internationalized', 'underrated', 'trusting', 'aeronautical', 'even', 'imperceptible', 'Interfaith', 'reciprocal', 'isolated', 'inhuman', 'skilful', 'endured', 'rebellious', 'outlandish', 'cathodoluminescent', 'sparked', 'awkward', 'hauled', 'Similar', 'faulted', 'garrisoned', '24-sheet', 'appreciative', 'snow-covered', 'glimpsed', 'worst', 'six-point', 'delinquent', 'totalistic', 'verdant', 'faced', 'bio-', 'sweeter', 'coolheaded', 'unjustifiable', 'balanced', 'substantial', 'piled', 'embarked', 'pleased', 'amused', 'concerted', 'regimented', 'Slavic', 'compressive', 'pertinent', 'manumitted', 'creased', 'filtered', 'gastrointestinal', 'thoroughgoing', 'mass', 'blinded', 'honest', 'Brahmsian', 'exploratory', 'shapely', 'radar-controlled', 'appended', 'institution-wide', 'drowned', 'resentful', 'liberated', 'acquiesced', 'continuous', 'striven', 'disaffiliated', 'incorrigible', 'Overwhelmed', 'crippled', 'Sunday-school', 'bedridden', 'irreversible', 'sticky-fingered', '10-milligram', 'placeless', 'offshore', 'abject', 'administered', 'quarter-to-quarter', 'infested', 'over-', 'arable', 'homicidal', 'equivalent', 'encyclopedic', '2-score-year', 'Middle-Eastern', 'hidden', 'leaden', 'unamused', 'russet-colored', 'labeled', 'Upper', 'disconcerting', 'depersonalized', 'Glad', 'brisk', 'unpremeditated', 'circulated', 'immodest', 'shipshape', 'fought', '70-mile-long', 'sovereign', 'endeared', 'tedious', 'nonpoisonous', 'vocational', 'greatcoated', 'shadowed', 'two-day', 'crammed', 'vaguely-imagined', 'Larger', 'adjustable', 're-elected', 'earliest', 'disciplined', 'post-independence', 'symbolized', 'chronological', 'pondered', 'lukewarm', 'newfound', 'full-scale', 'Transparent', 'ringed', 'labor-based', 'unlovely', 'unheeded', 'cycled', 'roughshod', 'obsessive-compulsive', 'tolled', 'untimely', 'frenetic', 'harrowed', 'discharged', 'cut-and-dried', 'architectonic', 'undivided', 'identifiable', 'upriver', 'blue-green', 'mischievous', 'Fooled', 'measured', 'cropped', 'touchy', 'death-locked', 'Benched', 'waned', 'cocky', 'allegorical', 'bronzy-green-gold', 'diagnosable', 'gratified', '90-degree', 'socio-economic', 'gorgeous', 'dated', 'autopsied', 'pungent', 'Faustian', 'hazardous', 'self-critical', 'arterial', 'untenanted', 'exacerbated', 'Main', 'exhilarating', 'coordinate', 'soluble', 'riotous', 'unwanted', 'glib', 'half-grown', 'steep', 'relative', 'urgent', '15-year-old', 'equatorial', 'budgetary', 'lovelorn', 'lifelong', 'self-effacing', 'pushing', 'nationwide', 'rebelled', 'endogamous', 'neutralized', 'ambrosial', 'antislavery', '30-year', 'state-administered', 'unfrozen', 'pernicious', 'tethered', 'indicative', 'bravest', 'Soviet-Chinese', 'sizeable', 'unpleased', 'hampered', 'verbal', 'Government-blessed', 'mild', 'power-starved', 'interspecies', 'unidentified', 'dystopian', 'Denver-area', 'individual-contributor', 'ministerial', 'alerted', 'melodic', 'periodic', 'larval', 'hermetic', '24-inch', 'authorized', 'content', 'progressed', 'prescriptive', 'joyful', 'deducted', 'purposeless', 'distressing', 'cosmic', 'encountered', 'Pink', 'time-honored', 'collectible', 'English-dialogue', 'tax-paying', 'inopportune', 'childish', 'partisan', 'Hired', 'methodological', 'Fine', 'populous', 'fluorescein-labeled', 'toneless', 'ten-foot', 'nation-building', 'heavenly', 'sparkling', 'hardboiled', 'tarpapered', 'pale-blue', 'deranged', 'inanimate', 'long-stemmed', 'manufactured', '165-unit', 'causal', 'limitless', 'big', 'galactic', 'defenseless', 'strangest', 'Different', 'skimmed', 'Evangelical', 'hot', 'artless', 'earnest', 'imcomparable', 'prosaic', 'sleepless', 'jarred', 'avant-garde', 'consumed', 'evacuated', 'transmuted', 'oiled', 'drier', 'overaggressive', 'impersonal', 'evaluative', 'down-and-out', 'practiced', 'Meinckian', 'objected', 'tyrannical', 'Well-stretched', 'comparative', 'foulest', 'undersea', 'suggestive', 'give-away', 'chillier', 'gentile', 'Arabian', 'overdue', 'undertaken', 'Anglican', 'neural', 'chased', 'anesthetized', 'lawless', 'Angry', 'traversed', '1M', 'first-rate', 'lesser-known', 'alert', 'senile', 'five-foot', 'prayed', 'legitimate', 'supportive', 'effusive', 'warmed', 'Made', 'key', 'adorned', 'singled', 'snared', 'French-Canadian', 'rained', 'Extreme', 'blatant', 'unstable', 'Added', 'longest', 'too-expensive', 'inexpensive', 'needless', 'self-assertive', 'Routine', 'sucked', 'merciless', 'intensive', 'Administrative', 'extreme', 'ten-year', 'enumerated', 'Vivacious', 'included', 'scholastic', 'precedent-based', 'distal', 'Used', 'blood-soaked', 'dedicated', 'lumpy', 'kinesthetic', 'middle-aged', 'new-spilled', 'unhappy', 'Olympian', 'underestimated', 'hand-made', 'heathen', 'bridal', 'profound', 'located', 'wooden', 'cleaved', 'zeroed', '8-channel', 'green-brown', 'stereophonic', 'deplorable', 'bumptious', 'hair-raising', 'coarsened', 'memorable', 'philosophical', 'acclimatized', 'nailed', 'convoluted', 'patrolled', 'supercritical', 'unconscious', 'splotched', 'solicitous', 'drop', 'unforseen', 'scaled', 'frustrated', 'ineffective', 'unsure', 'unbound', 'flecked', 'information-seeking', 'rested', 'gray', 'altitude-azimuth-mounted', 'ghastly', 'lamechian', 'Sent', 'fluorinated', 'narrow', 'multi-phase', 'three-fold', 'installed', 'reputed', 'mystical', 'allowable', 'rapt', 'undisciplined', 'signal-to-noise', 'bright-eyed', 'grooved', 'rough-hewn', 'Afro-Asian', 'graded', 'ultrasonic', 'stumped', 'like', 'crucial', 'participated', 'unhealthy', 'anti-Catholic', 'ardent', 'tragi-comic', 'solicited', 'stiffer', 'box-sized', 'Local', 'undeclared', 'atavistic', 'pastoral', 'priestly', 'short', 'overexploited', 'ultra-efficient', 'unchangeable', 'Newtonian', 'morale-enhancing', 'six-gallon', 'successive', 'subsidiary', 'frivolous', 'rugged', 'leaky', 'inadvertent', 'unrevealing', 'out-of-step', 'arbitrated', 'shambled', 'tarred', 'maximum', 'splattered', 'navy', 'smoothed', 'sandwich-type', 'elemental', 'long-known', 'arduous', 'mile-long', 'slit', 'shirt-sleeved', 'crumpled', 'quieted', 'rotary', 'instructed', 'wall-to-wall', 'three-way', 'pierced', 'outrageous', 'intruded', 'occidental', 'refunded', 'irresolute', 'scarred', 'challenged', 'gilded', 'clung', 'crumbly', 'solitary', 'skinless', 'draped', 'wonder-working', 'unfaithful', 'part-time', 'Isolated', 'sacral', 'matriarchal', 'assorted', 'sedate', '7-passenger', 'nine-chambered', 'Dazed', 'trackless', 'provided', 'optical', 'Rooseveltian', 'agreed-on', 'sultry', 'longstanding', 'globe-girdling', 'Seasonal', 'older', 'horrible', 'egg-hatching', 'formidable', 'penny-wise', 'impacted', 'hoydenish', 'uncompromising', 'fuzzed', 'green', 'recaptured', 'bony', 'aristocratic', 'peace-loving', 'wakened', 'Kohnstamm-negative', 'alight', 'toilsome', 'sundry', 'unstressed', 'run', 'True', 'suffused', 'disruptive', 'timed', 'secondary', 'back', 'unplumbed', 'hectic', 'drab-haired', 'hitless', 'contended', 'notified', 'hundred-leaf', 'influential', 'Youngish', 'indiscriminate', 'acceded', 'geographic', 'off-color', 'tolerant', 'nonchurchgoing', 'detailed', 'unflagging', 'vivified', 'substantive', 'smart', 'articulated', 'barrel-vaulted', 'bandaged', 'windless', 'unsettled', 'shaved', 'baptismal', 'affiliated', 'capped', 'confined', 'rockstrewn', 'concerned', 'indefinable', 'intimal', 'equipped', 'detectable', 'perennial', 'unjustified', 'impotent', 'disgusted', 'preprepared', 'lighter', 'timely', 'promising', 'occasional', 'cedar-roofed', 'irritated', 'dry-eyed', 'semi-public', 'hundred-and-eighty-degree', 'compleated', 'golden-crusted', 'loose-loaded', 'good', 'tax-free', 'sustained', 'bogus', 'airborne', 'pacifistic', 'bouffant', 'sectionalized', 'Cursed', '26-year-old', 'unbidden', 'doubled', 'crass', 'executive', 'blooded', 'buried', 'provdied', 'reformulated', 'figurative', 'orney', 'banned', 'definable', 'defaulted', '4-day', 'all-out', 'bit', 'seasonal', 'dissident', 'unstrung', 'fellow', "rockin'", 'societal', 'world-ignoring', 'astounding', 'un-American', 'intermolecular', 'punished', 'over-subscribed', 'moistened', 'abusive', 'spirited', 'public', 'wus', 'Lovely', 'slim', 'giddy', 'eloquent', 'rock-steady', 'counteracted', '12-oz.', 'Catholic', 'unconditional', 'domestic', 'unpopular', 'foot-high', 'blissful', 'adhesive', 'unsympathetic', 'four-fold', 'blonde-headed', 'Water-soluble', 'citywide', 'gauche', 'overhand', 'single-handed', 'overrun', 'pre-literate', 'Such', 'useful', 'state-local', 'Permian', 'Competent', 'inquisitive', 'borrowed', 'innermost', 'birdlike', 'overwhelming', 'scoured', 'cremated', 'full-bodied', 'classiest', 'tuxedoed', 'glycerolized', 'stocky', 'appreciated', 'tortured', 'obscured', 'vacuolated', 'tilted', 'evicted', 'heaviest', 'sour', 'soft-looking', 'straightened', 'resealed', 'sneezed', 'usurious', 'bicameral', 'seated', 'miniscule', 'naval', 'tactful', 'metamorphic', 'preliminary', 'forgiving', 'unmethodical', 'fragmentary', 'drunken', 'excess', 'Anxious', 'Abstract', 'confided', 'unfulfilled', 'singular', 'Closed', 'fooled', 'elder', 'deferred', 'frowned', 'evaporated', 'reputable', 'ruptured', 'fair-looking', 'fire-fighting', 'glacier-like', 'Final', 'distrusted', 'thrust-to-weight', 'protected', 'wavy-haired', '5000-word', 'non-political', 'chemical', 'swanlike', 'weighed', 'entertained', 'paved', 'workable', 'wishful', 'snap-in', 'arrowed', 'renamed', 'populated', 'off-farm', 'congestive', 'abstracted', 'shortened', 'projected', 'precipice-walled', 'yelled', 'Classic', 'sculpted', 'worrisome', 'spattered', 'black-clad', 'wiser', 'sterling', 'glandular', 'recurred', 'golden', 'chanced', 'heavy', 'black-eyed', 'Shotgun-type', 'archeological', 'long-sleeved', 'disappointing', 'inconspicuous', 'stainless', 'fluorescent', 'Bolshevistic', 'squashed-looking', 'unthinkable', 'Bengali', 'gray-thatched', 'Chinese', 'synthesized', 'dammed-up', 'water-cooled', 'stark', 'misty', '44-year-old', 'uncommon', 'speedy', 'theological', 'two-part', 'surprising', 'genial', 'gloved', 'non-Western', 'non-enzymatic', 'therapeutic', 'supreme', '34-hour', 'smiled', 'implicit', 'sad', 'exorbitant', 'cortico-fugal', 'collosal', 'unwarrantable', 'floundered', 'Fed', 'gold-phone', 'canny', 'approachable', 'defective', '23-year-old', 'tribal', 'vacuumed', 'proud', 'propeller-driven', 'listless', '900-student', 'spherical', 'ghostly', 'smaller', 'tsunami-warning', 'risky', 'typed', 'enlargd', 'junior-grade', 'respectable', 'Lilliputian', 'overweight', 'ceaseless', 'Cartesian', 'unservile', 'reborn', 'intentioned', 'boorish', 'eight-inch', 'sloppy', 'nasty', 'meek-mannered', 'Said', '42-inch', 'fee-per-day', 'surrealist', 'pink', 'hesitated', 'frozen', 'jolly', 'geriatric', 'spectacular', 'tear-soaked', 'productive', 'shoveled', 'veiled', 'irreparable', "let's-make-your-house-our-club", 'goal-oriented', 'maniacal', 'unequaled', 'Heretic', 'frosty', 'Furiouser', 'reoriented', 'cultivated', 'cancelled', 'grated', 'duplicated', 'patronized', 'stiff', 'scratchy', 'grass-fed', 'meekest', 'split', 'disoriented', 'dark-brown', 'simple-minded', 'side-looking', 'searched', 'forgotten', '30-piece', 'Reactionary', 'paide', '220-yard', 'lined', 'prefab', 'overheated', 'anxious', 'empowered', 'goggle-eyed', 'sweat-saturated', 'ready', 'pronounced', 'contaminated', 'unco-operative', 'artistic', 'third-dimensional', 'uncommitted', 'well-armed', 'dancelike', 'end-use', '4-under-par', 'figural', 'ornery', 'Mexican', 'mono-unsaturated', 'double-valued', 'literal', 'ancillary', 'insistent', 'Nearby', 'exponential', 'misgauged', 'political', 'like-minded', 'supposed', 'provincial', 'cause-and-effect', 'rationed', 'pictorial', 'postage-prepaid', 'commensurate', 'drawn-back', 'rapped', 'pre-employment', 'custom', 'unprofessional', 'Suitable', 'strained', 'frightful', 'emulated', 'alma', 'blacked', 'economy', 'extended', 'set', 'two-record', 'foul', 'papal', 'bred', '139-foot', 'neutralist', 'budget-wise', 'scrawled', 'unharmonious', 'trigger-happy', 'unseasonable', 'fainted', 'battered', 'distinct', 'maintained', 'left', 'alcoholic', 'bottom', 'rearmed', 'rural', 'unmarked', 'chilly', 'Scrupulous', 'unfinished', 'chargeable', 'problematical', 'dense', 'warped', 'interstellar', 'Theodosian', 'hackneyed', 'antiphonal', 'bifocal', 'bare-footed', 'fanatical', 'cruel', 'rated', 'psychological-intellectual', 'cholesterol-rich', 'seed', 'Germano-Slavic', 'elongated', 'Hurt', 'afraid', 'corrosive', 'counterbalanced', 'lessened', 'Located', 'circular', 'uncanny', 'Roman', 'hebephrenic', 'consecutive', 'resumed', 'Frail', 'reinterpreted', 'pomaded', 'shit-sick', 'enormous', 'three-inch', 'cultured', 'external', 'ten-by-ten-mile', 'semantic', 'non-institutionalized', 'assassinated', 'affirmed', 'monkish', 'half-dressed', 'anti-Christian', 'undergraduate', 'diurnal', 'desegregated', 'waterproof', 'half-reluctant', 'eatable', 'waffle-pattern', 'apologetic', 'spotless', 'fair', 'drawn-out', 'nettlesome', 'deductable', 'negligible', 'arranged', 'Later', 'municipal', 'informational', 'stubby', 'constrained', 'additional', 'forward', 'mystic', 'frequency-independent', 'warm', 'Fair', 'venereal', 'excommunicated', 'Easy', 'misinterpreted', 'apartment-building', 'pound-foolish', 'disposed', 'forced', 'Twentieth-Century', 'blackened', 'incoming', 'slatted', 'watchful', 'yellerish', 'adult', 'soldered', 'shady', 'unavoidable', 'under', 'Nonmagical', 'wrought', 'facilitated', 'vine-crisscrossed', 'jurisdictional', 'unproved', 'Ridiculous', 'mottled', 'cried', 'curious', 'sunshiny', 'Germanic', 'supervised', 'attentive', 'riven', 'Afraid', '208-pound', 're-assumed', 'systematized', 'nonobservant', '60-month', 'rung', 'slovenly', 'impoverished', 'Sincere', 'despondent', 'super-charged', 'regular-featured', 'open-handed', 'U.N.-chartered', 'Linguistic', 'migratory', 'pharmacological', 'ruffled', 'bolted', 'grassroots-fueled', 'polycrystalline', 'front', 'derived', 'conservatively-cravated', 'Anticipated', 'subliterary', 'unlined', 'anti-liquor', 'overblown', 'moon-splashed', 'lived', 'radial', 'Moderate', 'stodgy', 'cradled', 'two-digit', 'iced', 'shacked', 'newer', 'issued', 'unsightly', 'Happy', 'dispensed', 'icy', 'unreliable', 'defecated', 'understanding', 'nighttime', 'non-Communist', 'trans-Atlantic', 'dauntless', 'unasterisked', 'dreamlike', 'outlawed', 'long-lived', 'paradigmatic', 'magnetic', 'aesthetic', 'coaxed', 'OK', 'lain', 'pleasant', 'windowless', 'year-end', 'reprehensible', 'well-wedged', 'whipsawed', 'beefed', 'disproportionate', 'intimate', 'doctrinaire', 'biracial', 'Attic', 'so-called', 'double-breasted', 'stayed', 'foamy', 'prouder', '15-degree', 'useable', 'inaccurate', 'Sheer', 'thrifty', 'grabbed', 'forbidden', 'Negroid', 'slated', 'architectural', 'refractive', 'fringed', 'by-gone', 'glorified', 'hyperemic', 'Better', 'amateur', 'scenic', 'undercover', 'unimaginable', 'strewn', 'idealized', 'immoral', 'yearly', 'fallen', 'oppressed', 'hotter', 'Three-day', 'war-ridden', 'discreet', 'monopolistic', 'vascular', 'immoderate', 'physiologic', 'unstuck', 'longed-for', 'divan-like', 'backwoods', 'overcurious', 'strategic', 'self-judging', 'hunched-up', 'sublime', 'pathetic', 'yellow-green', 'Indian', '24-hour', 'pegged', 'unthinking', 'succumbed', 'lay', 'monogamous', 'pluralistic', 'strange', 'maimed', 'Mellow', 'worthiest', 'Charitable', 'mindless', 'nascent', 'Fat', 'aromatic', 'obtainable', 'mere', 'inglorious', 'two-dimensional', 'Screwed', 'crystallographic', 'passive', 'exact-size', 'non-negative', 'predictable', 'Faint', 'chapel-like', 'pricked', 'Classified', 'Zodiacal', 'bombproof', 'persecuted', 'focussed', 'Greek-born', 'comico-romantico', 'brought', 'beady', '50-year', 'auspicious', 'declined', 'pointless', 'Proposed', '90-day', '62-year-old', 'invited', 'actual', 'brass-bound', 'unopened', 'churchly', 'now-famous', 'rhythmical', 'immaculate', 'craved', 'extensive', 'coherent', 'queried', 'nocturnal', 'Homemade', 'nerveless', 'college-educated', 'expressible', 'allocable', 'remorseful', 'movable', 'uninvolved', 'Annual', 'existent', 'engraved', 'mute', 'incoherent', 'Given', 'pressure-formed', 'unremitting', 'perilous', 'wheeled', 'Satisfied', 'aggressive', 'prostrate', 'nastiest', 'applied', 'modeled', 'Sad', 'quick', 'disputed', 'twenty-page', 'astral', 'imperilled', 'pivotal', 'antiquated', 'well-rounded', 'venerable', 'by-passed', 'deglycerolized', 'masculine', 'high-topped', 'loathsome', 'suffered', 'dextrous', 'helped', 'recruited', 'man-made', 'gravitational', 'spice-laden', 'polite', 'to-the-death', 'researchable', 'pre-legislative', 'helluva', 'advised', 'steeled', 'sun-warmed', 'conferred', 'disquieting', 'fast', 'oncoming', 'identical', 'prototypical', '4-year-old', 'committed', 'bass', 'laid', 'employed', 'diverted', 'Moslem', 'crucified', 'rapidly-diminishing', 'fitting', 'anarchic', 'delayed', 'over-large', 'drunk', 'implicated', 'Peruvian', 'platted', 'nectareous', 'parklike', 'fastest', 'bare-armed', 'unpadded', 'halfhearted', 'hit-and-miss', 'Smaller', 'numenous', 'Common', 'volunteered', 'imbibed', 'Called', 'experienced', 'faster', 'black-crowned', 'brighter', 'published', 'funniest', 'five-gallon', 'accented', 'spotted', '7-day', 'intolerable', 'hable', 'cu.', 'half-murmured', 'tentative', 'unbalanced', 'inalienable', 'closed-door', 'military-medical', 'glutinous', 'deadened', 'crossed', 'double', 'ham-like', 'Swiss-born', 'befuddled', 'big-chested', 'technical', 'English', 'absorbed', 'emotional', 'ironical', 'malicious', 'Perennian', 'half-blood', 'presumptuous', 'deceased', 'undisguised', 'arbitrary', 'intended', 'irrelevant', 'unlicensed', 'inseparable', 'compatible', 'Europeanish', 'peerless', 'undedicated', 'nociceptive', 'festive', 'assuaged', 'Gram-negative', 'resonable', 'cooked-over', 'feathery', 'spectator-type', 'well-bound', 'collaborated', 'Faced', 'asleep', 'low', 'admired', 'light-flared', 'expectant', 'winsome', 'inter-town', 'chest-back-shoulder', 'blond', 'commonplace', 'shaken', 'rationalistic', 'thick-skulled', 'overage', 'surface', 'maligned', 'Blistered', 'Communist-led', 'knitted', 'compulsory', 'Undismayed', 'all-inclusive', 'Troubled', 'experimented', 'boisterous', 'Adequate', 'statewide', 'unwarranted', 'Presbyterian', 'lone', 'autocratic', 'propositioned', 'bolstered', 'unimposing', 'nonsensical', 'expensive', 'state-supported', 'self-sacrificing', 'cracked', 'paramount', 'scarecrowish', 'censorial', 'adrenal', 'philosophic', 'calorimetric', 'tricked', 'sardonic', 'impaled', 'steel-edged', 'self-appointed', 'triangular', 'pyramidal', 'inhabited', 'non-scientific', 'pre-Punic', '4-inch', 'impossible', 'camped', 'enthusiastic', 'braced', 'mono-', 'tightest', 'redressed', 'submitted', 'subdued', '5-run', 'mothered', 'conducive', 'gallant', 'presentable', 'recalculated', 'incertain', 'accompanied', 'empty', 'bounded', 'younger', 'trained', 'degraded', 'cheaper', 'Anglo-American', 'Democratic-sponsored', 'civilizational', 'propitious', 'deep-sounding', 'ridiculed', 'eidetic', 'three-axis', 'off-level', 'Sintered', 'straw-colored', 'brisker', 'brown-black', 'goddamned', 'warm-toned', 'straight-haired', 'informative', 'intraepithelial', 'Jacksonian', 'eldest', 'graphical', 'mustachioed', 'Beloved', 'transverse', 'overcerebral', 'company-wide', 'glutamic', 'skeptical', 'gala', 'radioed', 'quick-drying', 'querulous', '4-passenger', 'anemic', 'utter', 'marbleized', 'creditable', 'earth-bound', 'hard-come-by', 'spectrophotometric', 'slackened', 'travelogue-like', 'examined', 'pearly', 'enjoyable', 'scheduled', 'unmeritorious', 'nameless', 'eastern', 'hilar', 'narrow-minded', 'Shylockian', 'Military', 'poisonous', 'horselike', 'collegiate', 'dyspeptic', 'reorganized', 'tiniest', 'guessed', 'full-clad', 'nullified', 'nestled', 'piecemeal', 'super-empirical', 'trespassed', 'upright', 'repugnant', 'interfaith', 'subsequent', 'broad-nibbed', 'close', 'pressed', 'innocent', 'more-than-ordinary', 'stunning', 'pioneered', 'combed', 'pre-Civil', 'programmed', 'arty', 'criss-cross', 'thyrotrophic', 'jewel-bright', 'preemployment', 'semi-ambiguous', 'spellbound', 'tangy', 'selective', 'powered', 'embroidered', 'discouraging', 'succinct', 'parallel', 'stretched', 'physical', 'non-figurative', 'termed', '16-mesh', 'revamped', 'unsuited', 'consular', 'lower-paid', 'retrieved', 'undone', 'Stern-faced', 'well-stuffed', 'absolute', 'desired', 'cranky', 'ever-existent', 'overexcited', 'reaped', 'speckled', 'unavailable', 'hurt', 'educated', 'black-bearded', 'handed', 'wider', 'dust-swirling', 'upset', 'unimpressive', 'necromantic', 'tensionless', 'Presupposed', 'non-productive', 'column-shaped', 'three-body', 'Inorganic', 'begotten', 'piped', 'endowed', 'perched', 'mathematical', 'no-trading', 'consummated', 'adverse', 'approximate', 'denoted', 'carried', 'noble', 'tormented', 'lunar', 'circulatory', 'insipid', 'hairless', 'recovered', 'noticeable', 'quasi-folk', 'Dramatic', 'woolly-minded', 'monaural', 'rock-ribbed', 'optional', 'practised', 'ungainly', 'subtitled', 'seven-hit', 'stylish', 'variegated', 'mid-Victorian', 'bimonthly', 'luxuriosly-upholstered', 'Congressional', 'sleepy', '4-cell', 'protracted', 'negotiated', 'Held', 'excusable', 'vain', 'heedless', 'marked', 'unrehearsed', 'enamelled', '85-piece', 'petrified', 'alligatored', 'seemed', 'fearless', 'low-sudsing', 'photographic', 'rebutted', 'lousy', 'woolly', 'triggered', 'mechanistic', 'high-ceilinged', 'bugged', 'apparent', 'accused', 'student-directed', 'Sonic', 'Bogartian', '100-yard', 'embodied', 'molded', 'outsmarted', 'questioned', 'canned', 'anti-party', 'uninjectable', 'Lighted', 'cognizant', 'prompted', 'pinned', 'indelible', 'Smarter', 'baneful', 'unconditioned', 'perished', 'preceded', 'Merited', 'loyal', 'last-named', 'busy', 'internationalist', 'landscaped', 'caricatured', 'overthrown', 'anti-Nazi', 'astronomical', 'walk-to', 'dull-gray', 'camping-out', 'phobic-like', 'unyielding', 'miswritten', 'Andean', 'Movable', 'emphatic', 'Outboard', 'brutal', 'awaited', 'emulsified', '187-mile', 'scared', 'Bedridden', 'mashed', 'Booby', '10-foot', 'long-', 'credited', 'amazed', 'gray-looking', 'intellectual-literary', 'exempt', 'impracticable', 'two-line', 'clutched', 'slower', 'hanged', 'dusty-slippered', 'authoritative', 'melancholy', 'conscientious', 'troublesome', 'moving', 'embroiled', 'kingdom-wide', 'irreverent', 'revolutionized', 'open-minded', 'overcooled', 'involutorial', 'predominant', '8-inch', 'ranked', 'supernormal', 'port', 'deemed', 'uneconomical', 'nearsighted', 'governmental', 'multi-', 'Cooked', 'well-established', 'offset', 'serious', 'tinplated', 'Twenty-one-year-old', 'reunited', 'above-noted', 'bathed', 'untreated', 'pressing', 'half-million', 'unfavorable', 'interim', 'salted', 'terrestial', 'militant', 'contrasted', 'rusted', 'trace', 'adequate', 'hairy', 'invariant', 'iron-poor', 'distributed', 'Avowed', 'banded', 'flushed', 'severe', 'strapped', 'Quiet', 'astringent', 'tendered', 'just', 'drive-in', 'ideational', 'splendid', 'congratulatory', 'fabulous', 'unasked', 'egocentric', 'sordid', 'Paced', 'serenaded', 'budget-making', 'svelte', 'holstered', 'wine', 'obsessed', 'overloaded', 'synergistic', 'aerial', 'reminded', 'Doric', 'propagandistic', 'unfounded', 'unmurmuring', 'careful', 'Ceramic', 'moored', 'juvenile', 'hallowed', 'abdominal', 'calibrated', 'poshest', 'perky', 'unsafe', 'vulture-like', 'valuable', 'delivered', 'squandered', 'narcotic', 'enchanted', 'Performed', 'delightful', 'cryptographic', 'management-trained', 'faultless', 'hard-surface', 'Damned', 'four-year', 'spleen-crushing', 'scoped', 'newest', 'enjoined', 'official', 'Accidental', 'ironic', 'airy', 'crabbed', 'governed', 'quashed', 'conveyed', 'unallocable', 'jobless', 'ultramarine', 'antiseptic', 'ocular', 'well-understood', 'Biological', 'permissive', 'old-time', 'breath-taking', 'roofed', 'Naive', 'refuse-littered', 'medicinal', 'tightest-fitting', 'inconclusive', 'devised', 'deduced', 'metallic', 'planted', 'indescribable', 'Seen', 'sub-human', 'impersonated', 'rigid', 'coppery', 'dire', 'tenacious', 'unconnected', 'anti-Castro', 'effective', 'bounced', 'static', 'knee-length', 'brittle', 'meteorological', 'brimmed', 'Needless', 'capitalist', 'Modern', 'watery', 'reproductive', 'mosquito-plagued', 'demanding', 'rightful', 'oversoft', 'obliged', 'unforeseen', 'whitewashed', 'worked', 'taboo', 'mercurial', 'lifeless', 'sociological', 'Circular', 'Byzantine', 'puffed', 'treacherous', 'persisted', 'sub-freezing', 'show-offy', 'primal', 'deft', 'timeless', 'intrinsic', 'oblivious', 'single-minded', 'seventy-foot', 'sponsored', 'buccolic', 'splintered', 'honored', 'stiff-backed', 'satirical', 'mobilized', 'departed', 'disenfranchised', 'reread', 'buffered', 'Undertaken', 'consoled', 'undetectable', 'feted', 'greased', 'slothful', 'atune', '689-page', 'semi-precious', 'baffled', 'moon-drenched', 'shortest', 'reached', 'marketable', 'well-worn', 'eight-and-a-half-foot', 'Great', 'profane', 'agile', 'near', 'untold', 'digestive', '60-day', 'Thursday-night', 'spooky', 'expected', 'profit-sharing', 'embattled', 'pre-assault', 'elfin', 'Squeezed', 'functional', 'Tall', 'freer', 'tawny', 'unadulterated', 'secret', 'amorphous', 'defunct', 'chromatographic', 'proteolytic', '3-hp.', 'Glycerinated', 'Unstained', 'clipped', 'harsh', 'informal', 'preposterous', 'snobbish', 'starchy', 'jaunty', 'sacrificial', 'imposed', 'ritual', 'postgraduate', 'assimilated', 'spun', 'enforced', 'dynamited', 'nearest', 'choosy', 'newly-scrubbed', 'unwomanly', 'anonymous', 'weary', 'near-blind', 'Prettier', 'unsaturated', 'semiempirical', 'throaty', 'decorous', 'supplanted', 'leveled', 'deceitful', 'vast', 'genteel', 'inferential', 'corpuscular', 'fast-grossing', 'gained', 'nominal', 'richest', 'oblong', 'erratic', 'textile', 'three-story', 'extruded', 'enacted', 'free-for-all', 'wide-awake', 'sonic', 'senatorial', 'Strange', 'Worn', 'semi-private', 'ten-day', 'Antisubmarine', 'hunkered', 'fourteen-year-old', 'dubbed', 'beguiled', '3-inch', 'overlooked', 'Laotian', 'creativity-oriented', 'wearisome', 'Petite', 'interfacial', 'gargantuan', 'historical', 'hyped-up', 'purposive', 'well-defined', 'incorrect', 'proposed', 'quasi-governmental', '12-inch', 'blot-like', 'Hebraic', 'epistolatory', 'original', 'shackled', 'criminal', 'nicotine-choked', 'needed', 'witty', 'perfect', 'disrupted', 'bought', 'multi-state', 'recalled', 'undercut', 'Burly', 'sprouted', 'harsher', 'record-high', 'meaty', 'analyzable', 'miniature', 'unconquerable', 'huddled', 'puppyish', 'contrary-to-reality', 'signed', 'chance', 'autobiographical', 'mangled', 'twenty-dollar', 'outlived', 'undigested', 'puffy', 'evasive', 'three-bedroom', 'rock-carved', 'heartless', 'moon-round', 'flower-scented', 'eluted', 'stacked', 'teleological', 'genuine', 'irritating', 'banal', 'glazed', 'initial', 'multidimensional', 'impressive', 'horse-playing', 'literate', 'exquisite', 'wintry', 'disqualified', 'convenient-type', 'eighteenth-century', 'Latest', 'unripe', 'Oriental', 'stabilizing-conserving', 'mule-drawn', 'fabled', 'regulatory', 'portly', 'new-rich', 'disgraced', 'A-1', 'creepy', 'denominational', 'Conservative', 'self-pitying', 'loaned', 'aloof', 'intricate', 'agrarian', 'extinct', 'rhythmic', 'brushed', 'preventive', 'rowed', 'arclike', 'shipwrecked', 'powdery', 'nondescript', 'once-dry', 'inadvisable', 'narrative', 'hard-bitten', 'undergone', 'unhurt', 'inveterate', 'Montenegrin', 'heathenish', 'courteous', 'internal', 'timbered', 'socioeconomic', 'told', 'prudential', 'clammy', 'knocked', 'fair-sized', 'undue', 'inquired', 'tighter', 'sweaty', 'jaded', 'human', 'rabid', 'missile-type', 'habitual', 'formulaic', 'exploded', 'distinctive', 'coupled', 'puritanical', 'durable', 'clattery', 'quiescent', 'nicer', 'obsolescent', 'respected', 'reverse', 'metal-tasting', 'corrected', 'clandestine', 'idiotic', 'Taoist', 'thrashed', 'blood-bought', 'Franciscan', 'awed', 'confused', 'improvised', 'inter-tribal', 'boasted', 'two-inch', 'beautifully-built', 'concluded', 'wrong', 'collected', 'self-perceived', 'reimburseable', 'drugged', 'stranded', 'vicarious', 'transferred', 'electric', 'jocose', 'Vague', 'uni-directional', 'friction-free', 'extra-sensory', 'uncertified', 'insurgent', 'prominent', 'heavily-upholstered', 'presented', 'Chief', 'detached', 'stowed', 'Utopian', 'Synthetic', 'waist-length', 'glamorous', 'anti-French', 'complete', 'Sharp', 'royal', 'psychopathic', 'posterior', 'over-simple', 'victorious', 'retracted', 'interwoven', 'clever', 'inculcated', 'steoreotyped', 'paid', 'broached', 'many-bodied', 'paired', 'rocky', 'dusty-green', 'Petrarchan', 'psychically-blind', 'myopic', 'impolitic', 'profoundest', 'Persianesque', 'head', 'shed', 'center', 'secreted', 'Ratified', 'tortuous', 'electrifying', 'Quietist', 'irresolvable', 'spiritual', 'Shakespearian', 'unsupportable', 'slowed', 'Oversized', 'foamed', 'wide-cut', 'five-cent', 'latched', 'sexual', 'insisted', 'reactivated', 'Einsteinian', 'present-day', 'jocund', 'Middle-South', 'Napoleonic', 'Huge', 'inconsequential', 'painted', 'duped', 'procedural', 'meterological', 'dingy', 'oversized', 'disillusioned', 'pectoral-front', 'unpredictable', 'dried-out', 'dulcet', 'raw', 'Completed', 'chalky', 'referred', 'all-white', 'unborn', 'symmetric', 'plodded', 'unearned', 'wound', 'endurable', 'prefaced', 'awful', 'Laodicean', 'chauffeur-driven', 'disguised', 'stationary', 'strung', 'pegged-down', 'bonded', 'ancient', '75-minute', 'ideological', 'Told', 'constructed', 'thin-lipped', 'sarcolemmal', 'finite', 'wide-eyed', 'flaky', 'citrated', 'compassionate', 'multicolored', 'kinder', 'fewer', 'homozygous', 'worn-out', 'forfeited', 'uncooperative', 'parametric', 'satin-covered', 'hypodermic', 'tensional', 'lewd', 'inspirational', 'faded', 'plaintive', 'chief', 'detested', 'shiftless', 'trenchant', 'clannish', 'non-military', 'etched', 'removable', 'Infectious', 'proper', 'veined', 'deadly', 'close-in', 'intent', 'reminiscent', 'thicker', 'dispatched', 'Regulative', 'organic', 'Airy', 'sifted', 'dampened', 'bothered', 'swiftest', 'inhumane', 'light-weight', 'unfolded', 'materials-handling', 'posthumous', 'Meaningful', 'confabulated', 'Famed', 'ceremonial', 'Detached', 'resorted', 'hideous', 'fiscal', '10-hour', 'combined', 'quarrelsome', 'heartfelt', 'unplowed', 'unwrinkled', 'real', 'sky-tapping', 'unpleasant', 'unassisted', 'English-Dutch', 'anterior', 'intentional', 'jagged', 'untidy', 'ruined', 'Airless', 'devilish', 'mouth-watering', 'nodular', 'orthorhombic', 'omniscient', 'labored', 'Lower', 'vaginal', 'seismic', 'Eldest', 'swift', 'biblical', 'glued', 'wifely', 'hard', 'stray', 'nonfunctional', 'plain', 'merry', 'shortsighted', 'harder', 'vaster', 'wooed', 'unstained', 'explicable', 'confiscated', 'authentic', 'drilled', 'bookish', 'wornout', 'all-important', 'migrant', 'diagonalizable', 'founded', 'anaerobic', 'noteworthy', 'five-month', 'diseased', 'selfless', 'red-turbaned', 'feudalistic', 'dissolved', 'deductible', 'untenable', 'convivial', 'implemented', 'undereducated', 'restrained', 'Austrian', 'rheumatic', 'spectral', 'distant', 'Inflammatory', 'spurious', 'enlarged', 'abolished', 'numbered', 'fancy', 'inverted', 'metropolitian', 'threes-fulfilled', 'anticipated', 'basophilic', 'all-weather', 'Methodist', 'recovery', 'contiguous', 'retained', 'bearded', 'youngest', 'unvarying', 'overprotective', 'extinguished', 'base', 'rankest', 'bunched', 'salubrious', 'reconstructed', 'slanted', 'un-English', 'motive', 'non-artistic', 'scoreless', 'primitive', 'one-shot', 'duplicable', 'axiological', 'subtracted', 'portable', 'restful', 'rustled', 'shabby', 'illustrated', 'unresponsive', 'noncommissioned', 'documented', 'quaint', 'Electron-microscopical', 'slick', 'concealed', 'tapped', 'prepackaged', 'Guttman-type', 'rail-mobile', 'realer', 'proficient', 'beautifully-tapered', '50-foot', 'grievous', 'overwritten', 'cunning', 'rank', 'blended', 'lovely', 'Intelligent', 'sealed', 'verified', 'acid-fast', 'insured', 'court-appointed', 'four-syllable', 'Mediumistic', 'enjoyed', 'cubic', 'two-valued', 'writ', 'freakish', 'vexatious', 'erudite', 'applauded', 'tender', 'glass-like', 'lidless', '18-month', 'grammatical', 'freehand', 'chockfull', 'paleo-', 'robbed', 'nonacid', 'textual', 'deuterated', 'Splendid', 'messy', 'Incumbent', 'attributed', 'scarce', 'elaborated', 'dozed', 'requisitioned', 'assailed', 'sired', 'socal', 'colored', 'remitted', 'redundant', 'stale', 'incumbent', 'reclaimed', 'undefined', 'Hidden', 'disgraceful', 'unusual', 'Differential', 'hyphenated', 'nabbed', 'crocketed', 'itemized', 'careworn', 'wondered', 'quadrennial', 'raftered', 'disclosed', 'complacent', 'mitral', 'collimated', 'reassured', 'target-hunting', 'Mobile', 'interplanetary', 'coltish', 'deaf', 'scrawny', 'royalty-free', 'abrogated', 'booby', 'hard-to-get', 'prosecuted', 'crystallized', 'dim', 'asymptotic', 'mentioned', 'accredited', 'Calloused', 'linguistic', 'all-college', 'pig-infested', 'matrimonial', 'northeast', 'beckoned', 'Albanian', 'Puzzled', 'facaded', 'starved', 'thin', 'hoppled', 'grotesque', 'consequential', 'success-oriented', 'microscopical', 'pestilent', 'intrigued', 'acrid', 'tenuous', 'above-ground', 'frontal', 'canted', 'unambiguous', 'lofty', 'stereotyped', 'observant', 'evermounting', 'handsomer', 'Satisfactory', 'damp', 'rimmed', 'biologic', 'rough', 'whipped', 'interlayer', 'opened', 'all-something-or-the-other', 'prejudiced', 'grander', 'Hoped-for', 'outsized', 'Asked', 'municipally-sponsored', 'household-type', 'nonwhite', 'morphophonemic', 'totalitarian', 'girlish', 'withdrawn', 'valued', 'government-supported', 'booted', 'conpired', 'lightened', 'elusive', 'angriest', 'sided', 'coldest', 'year-to-year', 'Schnabelian', 'fast-opening', 'psychosomatic', 'ruthless', 'barefoot', 'ungracious', 'well-organized', 'crept', 'bomb-proof', 'enzymatic', 'perfunctory', 'fittest', 'dressy', 'convicted', 'intimidated', 'unworthy', 'design-conscious', 'charming', 'improved', 'cross-cultural', 'eight-bar', 'internalized', 'Associated', 'unlinked', 'curled', 'Spectacular', 'moonlit', 'coral-colored', 'thoriated', 'vesicular', 'forthright', 'breezy', 'purloined', 'light-colored', 'meritorious', 'aforementioned', 'triumphant', 'warm-blooded', 'Romantic', 'Professional', 'separate', 'assumed', 'welcome', 'tainted', 'perceptible', 'stirling', 'nebular', 'chronic', 'fateful', 'odds-on', 'shouted', 'sounder', 'perfumed', 'darkling', 'city-wide', 'extravagant', 'wave-setting', 'sun-baked', 'non-objective', 'conditioned', 'adulterous', 'class-biased', 'Accompanied', 'integrated', 'numb', 'topped', 'French-polished', 'gummy', 'unleveled', 'Open', 'unwaivering', 'helpful', 'subtended', 'non-exempt', 'industry-wide', 'intriguing', 'understandable', 'prettier', 'feared', 'unbent', 'hammerless', 'Devout', 'inappropriate', 'Saturated', 'tensile', 'gullible', 'fitted', 'steeper', 'Put', 'vanished', 'solution-type', 'anxiety-released', '64-page', 'unadorned', 'sensory', 'Moravian', 'unreal', 'nasal', 'broken-backed', 'jumbled', 'Informed', 'inside', 'suhthuhn', 'sounding', 'jade-handled', 'shifty', 'comfortable', 'conceded', 'Strenuous', 'drought-seared', 'plentiful', 'emphysematous', 'ten-gallon', 'commended', 'autobiographic', 'hatched', 'hemmed', 'non-pathogenic', 'mistaken', 'demoralized', 'monic', 'Internal', 'greeted', 'Early', 'merest', 'stuck', 'mental', 'fined', 'Fantastic', 'contorted', 'photon-counting', 'phenomenal', 'thankful', 'farthest', 'enlivened', 'end-to-end', 'dumb', 'knit', 'comely', 'high-powered', 'sanguineous', 'shatterproof', 'airless', 'way-out', 'vacuum-formed', 'revered', 'career-bound', 'itinerant', 'treelike', 'turbulent', 'green-tinted', 'hand-me-down', 'Indefinite', 'all-county', 'vitiated', 'tear-filled', 'sparse', 'ash-blonde', 'multi-million-dollar', 'energized', 'cozier', 'tripled', 'tuned', 'disturbing', 'immortal', 'Facilitatory', 'direct', 'liquor-crazed', 'browny-haired', 'colder', 'favored', 'Psychical', 'principal', 'expedient', 'outfought', 'basketball-playing', 'intergovernmental', 'lucky', 'storied', 'reconsidered', 'scriptural', 'reared', 'diplomatic', 'activated', 'doomed', 'picayune', 'congested', 'estranged', 'one-week-old', 'acoustic', 'tickled', 'firm', 'inexperienced', 'civil', 'Extensive', 'raffish', 'superhuman', 'two-color', 'Marvelous', 'fallacious', 'mother-naked', 'capitalistic', 'Physicochemical', 'apologized', 'decked', 'meanest', 'money-hungry', 'endeavored', 'godless', 'polka-dotted', 'armed', 'placed', 'untrained', 'numinous', 'instantaneous', 'swivel', 'fashionable', 'widest', 'English-Scottish-French', 'frank', 'touching', 'skimpy', 'snatched', 'V-shaped', 'dubious', 'pre-packed', 'supplemental', 'cream', 'mindful', 'limp-looking', 'pharmaceutical', 'Apollonian', 'top-ranking', 'gowned', 'ribald', 'deep-seated', 'cardiac', 'pro-Trujillo', 'hated', 'observed', 'curly', 'wretched', 'handless', 'shrouded', 'raked', 'typified', 'metabolized', 'far-sighted', 'clean', 'sprayed', 'quilted', 'theoretical', 'Worst', 'meticulous', 'contributory', 'whispered', 'chaotic', 'five-hundred-year-old', 'beige', 'unmotivated', 'inspired', 'foggy', 'pains-taking', 'bittersweet', 'expendable', 'ten-month', 'purchased', 'homesick', 'unclean', 'unafraid', 'closed-circuit', 'road-shy', 'frankest', 'silly', 'pre-Han', 'piteous', 'nonprofit', 'shrub-covered', 'geological', 'ruinous', 'specious', 'unreflective', 'garbed', 'Selective', 'allergic', 'sinewy', 'scarcely-tapped', 'unrelieved', 'Taken', 'Mythological', 'So-called', 'non-absorbent', 'particular', 'low-boiling', 'two-run', 'penetrated', 'blood-flecked', 'infidel', 'groundless', 'innate', 'delicate', 'well-kept', 'acidulous', 'rock-strewn', 'revolutionary', 'rudimentary', 'foiled', 'Waited', 'aerosolized', 'pinioned', 'paralyzed', 'profited', 'crude', 'social-economic', 'terra-cotta-colored', 'totaled', 'ultravehement', 'admissible', 'inserted', 'apt', 'richer', 'cumulative', 'Newest', 'chromic', 'seven-inch', 'escaped', 'taffycolored', 'important-looking', 'Gone', 'unfailing', 'morbid', 'unbreakable', 'fine-boned', 'completely-restored', 'financial', 'non', 'wide', 'eaten', 'centralized', 'seductive', 'defied', 'Discussed', 'oriental', 'summarized', 'spicy', 'Exceptional', 'palatable', 'unified', 'ever-tightening', 'garrulous', 'driven', 'bit-like', 'puckered', 'parasitic', 'algebraic', 'resident', 'bilinear', 'supplementary', 'still', 'pseudo-symmetric', 'over-arranged', 'brute', 'Hegelian', 'conservative-liberal', 'half-swamped', 'eugenic', 'recipient', 'Overwhelming', 'invariable', 'blurred', 'barbecued', 'velvety', 'constricting', 'met', 'remanded', 'farfetched', 'dewy-eyed', 'applause-happy', 'minimum', 'pimplike', 'forensic', 'flustered', 'stormbound', 'ostensible', 'outright', 'lightweight', 'talismanic', 'foregone', 'darkened', 'disturbed', 'departmental', 'inhomogeneous', 'scairt', "'48", 'eulogized', 'synthetic', 'grimmer', 'incontrovertible', 'promised', 'congressional', 'own', 'soaked', 'kindest', 'undersize', '12-1/2-inch', 'such', 'clamped', 'interchangeable', 'anhydrous', 'beaded', 'Bizarre', 'Communist-type', 'slugged', 'super-secret', 'obsessive', 'Intense', 'nonsegregated', 'Fiscal', 'attained', 'northerly', 'harmonious', 'lulled', 'faint', 'born', 'flaxen', 'befouled', 'swift-striding', 'prize-winning', 'somnolent', 'mirrored', 'excluded', 'restless', '85-student', 'stimulating', 'encircled', 'elementary', 'enterteyned', 'Blind', 'corrugated', 'Infamous', 'thyrotoxic', 'imaginative', 'fat-soluble', 'purple-black', 'reiterated', 'fractionated', 'non-repetitious', 'occluded', 'scuttled', 'biconcave', 'wide-sweeping', 'Microscopic', 'disapproved', 'mythological', 'audited', 'restricted', 'Unconscionable', 'jotted', 'loose-knit', 'swell', 'ultra-violet', 'unloaded', 'disagreeable', 'Benedictine', 'surpassed', 'cylindrical', 'pristine', 'excused', 'alphabetical', 'blunt', 'usual', '5-day', 'Turbulent', 'unquenched', 'low-pitched', 'stressed', 'one-inch', 'plowed', 'rarified', 'stupidest', 'Heavy', 'stressful', 'unspecified', 'riddled', 'buttoned', 'Artistic', 'clustered', 'sweet-faced', 'giant', 'red-rimmed', 'phosphorus-bridged', 'arithmetical', 'bearish', 'unenthusiastic', 'requested', 'transfered', 'continental', 'unshakeable', 'unwholesome', 'previous', 'baptized', 'mapped', 'precooked', 'God-curst', 'palm-lined', 'Surprised', 'densest', 'four-lane', 'Sore', 'unmoved', 'renewable', 'bright-looking', 'mutational', 'manmade', 'filmed', 'Additional', 'fascinating', 'Uniform', 'silver', 'composite', 'terrible', '25-ft.', 'flour-milling', 'pure', 'astounded', '10-year-old', 'forty-year', 'faked', 'white-suited', 'side', 'realized', 'specified', 'seized', 'long-shanked', 'saturated', 'Babylonian', 'braver', 'Republican-controlled', 'parched', 'naive', 'meek', 'atomic', 'ubiquitous', 'all-victorious', 'dollar-and-cents', 'Yeller', 'underprivileged', 'extra', 'twisty', 'self-contained', 'red', 'homogeneous', 'sighted', 'atrophic', 'individualized', 'pokerfaced', 'best-hearted', 'slept', 'sluggish', 'undying', 'Rugged', 'sceptical', 'dam', 'briefer', 'symphonic', 'Neapolitan', 'desirous', 'irradiated', 'accepted', 'prone', 'spoiled', 'fatty', 'immersed', 'beautiful', 'guitar-strumming', 'infrared', 'trail-worn', 'morose', 'crisscrossed', 'Stated', 'unabated', 'intergroup', 'gritty-eyed', 'self-correcting', 'solved', 'cerebral', 'strange-sounding', 'Venetian', 'bubbled', 'intratissue', 'fifteen-mile', 'broken-down', 'sky-carving', 'gradual', 'unhurried', 'Turkish', 'conceivable', 'Harassed', 'overbearing', 'post-Inaugural', 'junior', 'cheered', 'understated', 'orderly', 'hit', 'loud', 'self-sufficient', 'intranasal', 'giggled', 'lower-cut', 'imported', 'indolent', 'autumn-touched', 'Long-lived', 'dislocated', 'livelier', 'Comprehensive', 'Wild', 'leaded', 'staked', 'pregnant', 'recopied', 'beatific', 'Occasional', 'on-the-scene', 'gooey', 'unenviable', 'dark-skinned', 'clinical', 'styled', 'sponged', 'petty', 'berated', 'pale', 'cocked', 'badly-needed', 'over-all', 'discorporated', 'waylaid', 'Fierce', 'remoter', 'unforgettable', 'boxed-in', 'unlocked', 'bled', 'unreconstructed', 'Hot', 'Katangan', 'syndicated', 'objectionable', 'interpretative', 'scrutinized', 'unceasing', 'gone', 'wobbly', 'rapid', 'read', "asham'd", 'characterized', 'pornographic', 'forked', 'volatile', 'hit-run', 'pick-up', 'lighthearted', 'Shakespearean', 'scorned', 'perforated', 'bum', 'Dominant', 'tongue-in-cheek', 'telescopic', 'pledged', 'destined', 'elderly', 'generous', 'shrubbery-lined', 'repulsed', 'Shrewd', 'pre-conscious', 'hooked', 'humiliated', 'playable', 'intra-city', 'revivified', 'priceless', 'Electrostatic', 'scant', 'crash', 'hypo-', '500-mile', 'patched', 'renowned', 'epigenetic', 'rubicund', 'systematic', 'Frozen', 'shrewish', 'appealing', 'epitomized', 'tabulated', 'county-wide', 'catapulted', 'Icelandic-speaking', '37-year-old', 'substitutionary', 'sodden', 'radiation-produced', 'habitable', 'cheap', 'sinless', 'lobbied', 'jubilant', 'pretrial', 'chunky', 'traveled', 'graduate', 'unpaintable', 'trigonal', 'unfrosted', 'full-fledged', 'Difficult', 'glassy', 'buffeted', 'Earlier', '24-hr.', 'eminent', 'unsung', 'primed', 'court-length', 'persuasive', 'dependable', 'slighter', 'misguided', 'seminal', 'bantered', 'grovelike', 'simplistic', 'wouldbe', 'material', 'father-and-son', 'queued', 'appropriate', 'initialed', 'whisked', 'luscious', 'Argive', 'furiouser', 'closeup', 'bronze', 'anti-American', 'grayed', 'naturalized', 'carboxy-labeled', 'superlative', 'semi-minor', 'up-to-date', 'textile-importing', 'Rarer', 'random', 'expert', 'dapper', 'salt-edged', 'tax-exempt', 'slow-bouncing', 'sway-backed', 'relented', 'dominant', 'delighted', 'economical', 'insincere', 'Texan', 'returned', 'tasted', 'guiltless', 'indoctrinated', 'autumnal', 'differentiated', 'happiest', 'either-or', 'scornful', 'modulated', 'catchy', 'heard', 'orgiastic', 'inactive', 'inexpressible', 'rip-roaring', 'metrical', 'desecrated', 'Teutonic', 'foolish', 'rousing', 'unexamined', 'sacrificed', 'Naked', 'avowed', 'flown', 'floured', '19-foot', 'Crooked', 'temporary', 'scratched', 'mawkish', 'tangent', 'enviable', 'bewitched', 'ammoniac', 'textile-producing', 'parental', 'satiric', 'toppled', 'Split', 'reflected', 'garaged', 'yearned', 'Russian', 'sadistic', 'bone-weary', 'Dallas-headquartered', 'undetermined', 'non-freezing', 'differentiable', 'steady', 'doltish', 'logistic', 'fixed', 'terminal', 'freedom-loving', 'above', 'pro-tem', 'on-the-job', 'Celtic', 'unannounced', 'cured', 'Saturday-night', 'swung', 'brave', 'Influential', 'packed', 'fail-safe', 'bugeyed', 'overloud', 'emitted', 'open-collared', 'self-defeating', 'modernized', 'disembodied', 'downcast', 'disinterested', 'dared', 'laissez-faire', 'wily', 'fertile', 'uncounted', 'inertial', 'foul-smelling', 'Continuous', 'Arabic', 'semi-special', 'ungodly', 'supra-personal', '205-pound', 'silvery', 'ventured', 'four-sided', 'Vocational', 'charred', 'Beautiful', 'flammable', 'false-fronted', 'well-oriented', 'unparalleled', 'Eager', 'anti-discrimination', 'undeniable', 'leggy', 'tubular', 'longitudinal', 'sandy', 'sadder', 'refilled', 'bi-monthly', 'ill-fated', 'Rousseauan', 'Belgian', 'lacked', 'unflattering', 'prejudicial', 'outside', 'perfidious', 'discolored', 'upstairs', 'allegoric', 'distasteful', 'owed', 'blonde', 'unpunished', 'elected', 'cosy', 'downhill', 'friendlier', 'conformed', 'hardworking', 'twelve-year-old', 'Assistant', '22-acre', 'stored', 'crowded', 'sweet-tongued', 'fused', 'complained', 'parasympathetic', 'Venezuelan', 'lionized', 'reproducible', 'allowed', 'unfit', '20-year-old', 'deployed', 'copper', 'non-thermal', 'up-and-coming', 'wholly-owned', 'revolting', 'Christian', 'Colored', 'dimesize', 'choreographed', 'Narrow', 'mud-beplastered', 'dull', 'well-planned', 'gloomy', 'aged', 'exasperated', 'wasted', 'Germanized', 'Numerous', 'telescoped', 'clotted', 'frantic', 'unqualified', 'branded', 'liveried', 'contemplated', 'Spurred', 'restive', 'diagnostic', 'unprotected', 'instructive', 'territorial', 'disseminated', 'invincible', 'slow-moving', 'oedipal', 'intact', 'shrewdest', 'illicit', 'gymnastic', 'daily', 'self-imposed', 'Future', 'transmittable', 'Ten-year-old', 'iron-clad', 'non-violent', 'gracious', 'complementary', 'aboveground', 'multipurpose', '40-year-old', 'tense', 'non-Greek', 'lunatic', 'exothermic', 'Athenian', 'day-to-day', 'egg-sized', 'irrevocable', 'seedless', 'weeded', 'Firm', 'woebegone', 'low-lying', 'spear-throwing', 'evoked', 'misnamed', 'baser', 'categorized', 'done', 'grasped', 'tended', 'knightly', 'height-to-diameter', 'peopled', 'swampy', 'real-analytic', 'payable', 'bare', 'four-element', '45-passenger', 'problematic', 'revealing', 'adjusted', 'transcendent', 'aimless', 'confluent', '2-week', 'switched', 'Unpublished', 'domiciled', 'nicest', 'deprived', 'unheard', 'safekeeping', 'meteoric', 'sufficient', 'Canadian', 'Moon-faced', 'rounded', 'thawed', 'yielded', 'overdone', 'criss-crossed', 'blood-filled', 'hilarious', 'speculative', 'Side', 'trucked', 'dark-gray', 'Subsequent', 'uncharted', 'covert', 'sounded', 'leather-bound', 'blasted', 'sweetest', 'outraged', 'truest', 'nonspecific', '2-year-old', 'anemated', 'surprise', 'incautious', 'irreconcilable', 'ragged', 'outgoing', 'climactic', 'fly-dotted', 'precise', 'futile', 'twisted', 'Prussian', 'regulative', 'Maltese', 'foreknown', 'caked', 'social-political-economical', 'oriented', 'sticky', 'fleshy', 'haggard', 'hasty', 'inundated', 'limpid', 'Depicted', 'fostered', 'complimentary', 'interlibrary', 'tattered', 'uneven', 'conspiratorial', 'burr-headed', 'charcoaled', 'furtive', 'unseen', 'magnetized', 'ethnic', '11-inch', 'non-existent', 'selling', 'ignited', 'shoddy', 'approached', 'apostolic', 'External', 'double-', 'merciful', 'broody', 'Asiatic', 'break-even', 'similar', 'amazing', 'fibrocalcific', 'squashy', 'memorized', 'Ironic', 'minute', 'thought', 'long-established', 'London-bred', 'liquid', 'unsharpened', 'semi-rigid', 'brushlike', 'suable', 'demure', 'pallid', 'viewed', 'intense', 'rocked', 'particularistic', 'Dried', 'repulsive', 'lobster-backed', 'tacked', 'volumetric', 'aerobic', 'out-of-the-way', 'atheistic', 'familar', 'week-long', 'incorporated', 'purged', 'indefinite', 'creamy', 'three-front', 'coloured', 'hairier', 'cognate', 'weak', 'growth-stunting', 'banished', 'battery-powered', 'predicted', 'long-settled', 'unreasonable', 'Dallas-based', 'Southwestern', 'drunker', 'carted', 'unneeded', 'heart-stopping', 'innumerable', 'ungallant', 'mysterious', 'Stacked', 'repetitive', 'existential', 'Purified', 'expository', 'unglamorous', 'wept', 'junior-year-abroad', 'hoped', 'subverted', 'shuttered', 'Gaussian', 'absurd', 'unalterable', 'bestial', 'carrier-current', 'builder-dealer', 'Home-made', 'Castro-held', 'oleophobic', 'key-punched', 'High', 'irrational', 'changeable', 'mobile', 'ferried', 'awakened', 'masonry', 'epigrammatic', 'non-contributory', 'arisen', 'sycophantic', 'entire', 'crushed', 'cherished', 'sporadic', 'reconvened', 'Threaded', 'crotchety', 'irredeemable', 'dropped', 'revealed', 'mortared', 'atom-like', 'circumspect', 'Vietnamese', 'ugly', 'interior', 'chic', 'Congregational-Baptist', 'self-realized', 'rebuffed', 'sworn', 'cadaverous', 'wary', 'on-again-off-again', 'compact', 'regal', 'largely-silent', 'snapped', 'regained', 'non-partisan', 'dressed', 'Laurentian', 'Warm', 'discriminating', 'magic-practicing', 'paramagnetic', 'Olympic', 'determinative', 'astute', 'microbial', 'pit-run', 'sun-bleached', 'discourteous', 'perplexing', 'devoured', 'henpecked', 'Curious', 'northern', 'symbolic-sounding', 'condensed', 'self-deceiving', 'semi-nude', 'handier', 'global', 'gusty', 'build-better-for-less', 'humorous', 'unmanaged', 'organizational', 'isotropic', 'nonpartisan', 'Stimulating', 'cosmopolitan', 'smitten', 'mutilated', 'supersensitive', 'impassioned', 'foot-loose', 'communicated', 'water-proof', 'unmeshed', 'frilly', 'soil-bearing', 'year-earlier', 'Sure', 'owne', 'near-by', 'best', 'chosen', 'Egyptian', 'adulterated', 'equilibrated', 'Mauve-colored', 'fifty-year', 'Dependent', 'concrete', 'outweighed', 'subservient', 'saner', 'unplagued', 'flouted', 'loosened', 'woven-root', 'idyllic', 'agonizing', 'fleet', 'mad', 'rectilinear', 'easiest', 'hyperbolic', 'reacquainted', 'unwounded', 'truncated', 'fearful', 'black-balled', 'grayer', "pop'lar", 'comforted', 'unaccustomed', 'perceived', 'exercised', 'new-found', 'maternal', 'shallow', 'arabic', 'Brazilian', 'allegro', 'Cool', 'upward', 'punishable', 'saline', 'cagey', 'smelled', 'clairvoyant', 'illusive', 'naughty', 'lengthened', 'decanted', 'outstanding', 'wide-open', 'subjective', 'cohesive', 'galled', 'fed', 'incisive', 'two-step', 'claret', 'straddled', 'technological', 'slimed', 'undecorated', 'Normal', 'native', 'Diametric', 'bedded', 'aroused', 'homosexual', 'book-lined', 'regarded', 'Proximate', 'achieved', 'pastel-like', 'severed', 'unequal', 'regulated', 'well-received', 'plump', 'removed', 'third-rate', 'high-', 'beribboned', 'befogged', 'underlined', 'glottal', 'warmish', 'subjected', 'unmistakable', 'invested', 'reflectance-measuring', 'translucent', 'mended', 'bygone', 'villainous', 'abhorrent', 'rash', 'constructional', 'occurred', 'bossed', 'record-tying', 'miasmal', 'ikey-kikey', 'unwilling', 'unofficial', 'enchanting', 'Hopkinsian', 'overworked', 'soft-', 'self-confident', 'sorbed', 'moonlike', 'extralegal', 'flotation-type', 'pasty', 'Crystallographic', 'repayable', 'unbridled', 'denominated', 'Blue', 'amounted', 'attired', 'initiated', 'plainest', 'inverse', 'overgrown', 'clarified', 'semicircular', 'first-hand', 'fertilized', 'thermometric', 'wrinkled', 'industrious', 'Gorgeous', 'manifest', 'folded', 'incited', 'torso-defining', 'non-bearing', 'obliterated', 'foreshortened', 'leaked', 'money-saving', 'all-purpose', 'muscular', 'hollow', 'New', 'brutalized', 'red-necked', 'low-heeled', 'pre-World-War-', 'potent', 'unbearable', 'university-educated', 'energetic', 'voltaic', 'stingy', 'seven-word', 'smoke-filled', 'libertarian', 'sent', 'pathological', 'longed', '4-homer', 'grand-looking', 'big-shouldered', 'photogenic', 'vindicated', 'stood', 'compelled', 'Rare', 'malted', 'Cruel', 'anchorite', 'pari-mutuel', 'Carried', 'unpatronizing', 'conformational', 'too-simple-to-be-true', 'undrinkable', 'trotted', 'thermodynamic', 'unshaven', 'fungal', 'walled', 'stupendous', 'blue-uniformed', '35-mm.-wide', 'megakaryocytic', 'wood-grained', 'logistical', 'bothersome', 'wonder', 'half-turned', 'compensated', 'strictest', 'incorruptible', 'slash-mouthed', 'invented', 'crested', 'palpable', 'convincing', 'gratuitous', 'interpretable', 'lexical', 'lengthy', 'monstrous', 'Indonesian', 'Tonal', 'enthralling', 'two-tail', 'determinate', 'haughty', 'annoyed', 'Communistic', 'not-strictly-practical', 'obedient', 'aqueous', 'peppered', 'pre-Easter', 'damaged', 'added', 'fire-colored', 'wondrous', 'consummate', 'conjoined', 'withered', 'wounded', 'baited', 'punctuated', 'underpaid', 'splintery', 'consistent', 'Particular', 'teenage', 'traded', 'anti-authoritarian', 'occlusive', 'puzzled', 'enslaved', 'hand-crafted', 'songful', 'calculable', 'poetic', '12-shot', 'private', 'anomic', 'clogged', 'transplanted', 'jazzy', 'collated', 'forward-moving', 'citybred', 'focal', 'instrument-jammed', 'convulsive', 'Dominican', 'solar-electromagnetic-', 'dialyzed', 'Nonresidential', 'arteriolar-pulmonary', 'obvious', 'revived', 'Spare', 'fervent', 'half-clad', 'rent', 'discovered', 'three-inch-wide', 'torn', 'inboard', 'blunted', 'idiosyncratic', 'blurted', 'transoceanic', 'Marine', 'fringed-wrapped', 'Sick', 'fired', 'Approached', 'slavish', 'freshened', 'wheedled', 'Presidential', 'attendant', 'unpaved', 'underwater', 'replied', 'malign', 'Hard', 'high-sudsing', 'overwhelmed', 'gaited', 'grey', 'exceptional', 'communistic', 'anti-organization', 'introverted', 'Clever', 'permissible', 'elliptical', 'anti-secrecy', 'complimented', 'quiet-spoken', 'grey-haired', 'crouched', 'imminent', 'funnier', 'brewed', 'Negro-appeal', 'recoilless', 'filmy', 'company-paid', 'heartbreaking', 'York-born', 'counterflow', 'moot', 'Infinite', 'polar', 'undepicted', 'sucker-rolling', 'lowered', 'burly', 'typical', 'pre-penicillin', 'bold', 'ingenious', 'finicky', 'maniclike', 'inane', 'best-preserved', 'visible', 'swum', 'entombed', 'instructional', 'involved', '25-minute', 'combinable', 'Calm', 'bowed', 'unenunciated', 'monophonic', 'drugless', 'heavy-handed', 'sociable', 'self-conceited', 'launched', 'safe', 'government-to-government', 'Orthodontic', 'ripe', 'Wider', 'modern', 'straight', 'unprepared', 'Occupational', 'Prickly', 'updated', 'forgetful', 'Swiss', 'infant', 'formalized', 'Written', 'assured', 'dynastic', 'past', 'corporeal', 'broader', 'inshore', 'eosinophilic', 'contour-obliterating', 'Communist', 'smothered', 'arrayed', 'narrated', 'distorted', 'credible', 'Nazi-minded', 'dark-green', 'meal-to-meal', 'sailed', 'Diplomatic', 'maryed', 'tame', 'indecent', 'gnomelike', 'upbeat', 'slapped', 'comic', 'recognized', 'unsophisticated', 'undreamt', 'Dionysian', 'scrambled', 'moody', 'barometric', 'transatlantic', "smash-'em-down", 'exceeded', 'above-water', 'Shot', 'fine-grained', 'convinced', 'metal-working', 'unsuspecting', 'uttered', 'outnumbered', 'Driven', 'leafy', 'insignificant', 'mimetic', 'Successful', 'punitive', 'mauve', 'palest', 'Merciful', 'igneous', 'aghast', 'machinelike', 'bogged', 'poised', 'miffed', 'faithful', 'Rhenish', 'utopian', 'Hamilton-oriented', 'ambulatory', '12-passenger', 'quickest', 'Literal', 'single-valued', 'macropathological', 'couched', '6-passenger', 'measurable', 'self-deluded', 'unrecognized', 'rare', 'extraordinary', 'shameful', 'moderate', 'adherent', 'dried', 'seen', '21-year-old', 'thick-walled', 'gingerly', 'descended', 'remembered', 'underhanded', 'dumped', 'risked', 'tasteful', 'gifted', 'reviled', 'Fit', 'unappeasable', '6-inch', 'three-power', 'quizzical', 'calmer', 'capricious', 'Raw', 'grassy', 'ordinary', 'surmised', 'virtual', 'natural', 'blue-black', 'aft', 'melon-like', 'blurry', 'moist', 'antagonised', 'tragicomic', 'newly-appointed', 'flavored', 'perceptive', 'classed', 'quadratic', 'relinquished', 'semiarid', 'multi-year', 'lapsed', 'excessive', 'kapok-filled', 'anomalous', 'ultra-high-speed', '127-mile', 'bent', 'psychic', 'adventurous', 'slanderous', 'overrated', 'well-dressed', 'over-night', 'choreographic', 'Persian', 'spidery', 'vexed', 'poultry-loving', 'wayward', 'doubtful', 'butted', 'Initial', 'gritty', 'deteriorated', 'calloused', 'Popish', 'criticized', 'rosy-fingered', 'refreshed', 'emphasized', 'isolationistic', 'stolen', 'suppressed', 'grown-up', 'sown', 'motional-modified', 'nightmarish', 'barefooted', '380-foot', 'under-developed', 'acquainted', 'canonized', 'cherry-flavored', 'withstood', 'illuminated', 'reground', 'life-supporting', 'arteriolar', 'unattended', 'interpreted', 'pro-Yankee', 'squared', 'mature', 'lighted', 'healthiest', 'fled', 'Unitarian', 'segregated', 'uncousinly', 'coined', 'anti-Communist', 'incontestable', 'trouble-free', 'guided', 'loquacious', 'Istiqlal-sponsored', 'received', 'face-to-face', 'hourly', 'onetime', 'ecological', 'scraggly', 'chivalrous', 'postponed', '4,000-foot', 'reactionary', 'effete', 'customary', 'thoughtless', 'post-Civil', 'pathogenic', 'ignorant', 'shadowy', 'insubstantial', 'pocketed', 'enciphered', 'discontented', 'Hamiltonian', 'white-columned', 'waged', 'bleary', 'multitudinous', 'bad-fitting', 'barest', 'unexplained', 'twelve-hour', 'digested', 'indigenous', 'prefabricated', 'Elemental', 'resigned', 'ice-cold', 'creative', 'semiquantitative', 'soundproof', 'earth-touching', 'patriarchal', 'follow-up', 'beveled', 'licensed', 'agonized', 'flocculated', 'broke', 'mild-mannered', 'asymmetric', 'self-consistent', 'bestselling', 'assessed', 'hand-screened', 'potted', 'Unglazed', 'tailor-made', "ol'", 'revenge-seeking', 'fine-feathered', 'medico-military', 'taut', 'con', 'inapplicable', 'proven', 'maggoty', 'tanned', 'women-trodden', 'Detailed', 'sound', 'early', 'analysed', 'lackadaisical', 'masterly', 'secure', 'fast-moving', 'uninteresting', 'meretricious', 'risen', 'slashed', 'net', 'envisioned', 'animized', 'carnal', 'dismayed', 'wrapped', 'detoured', 'far', '11-month-old', 'edited', 'unformed', 'uncolored', 'diabetic', 'promulgated', 'redheaded', 'elite', 'standard', 'appareled', 'Nonresident', 'cost', '520-acre', '225/hp', 'heavy-framed', 'lasted', 'varicolored', 'alluded', 'indoor', 'adorable', 'amphibious', 'antique', 'adapted', 'purposeful', 'open', 'dust-thick', 'Directed', 'fifty-fifty', 'out-of-door', 'bombastic', 'sanctimonious', 'vigorous', 'Freed', 'constant', 'Reared', 'well-regulated', 'horn-rim', 'underplayed', 'upper-', 'physiochemical', 'indicted', 'electrostatic', 'inept', 'queerest', 'Adverbial', 'dreary', 'three-month', 'Provided', 'out-of-pocket', 'bacterial', 'heartening', 'weatherbeaten', 'Cheerful', 'pious', 'melting', 'cosmological', 'Led', 'captivated', 'imitative', 'tireless', 'hard-earned', 'sweetish', 'opportune', 'clad', 'sumptuous', 'breathy', 'wooded', 'accidental-war', 'matured', 'unclaimed', 'bone-deep', 'constricted', 'less-than-carload', 'fancy-free', 'untoward', 'heaped', 'unique-ingrown-screwedup', 'Evil', 'broadside', 'light-transmitting', 'Handmade', 'mundane', 'thrown', 'showy', 'upstanding', 'chambered', 'gaudy', 'waived', 'unexplored', 'fine-chiseled', 'half-way', 'fortified', 'Stupid', 'dragged', 'self-destructive', 'upraised', 'dainty', 'wet', 'respectful', 'cleared', 'hesitant', 'refined', 'clean-top', 'duplicate', 'Small', 'closed', 'suggested', 'captured', 'approximated', 'talky', 'bibliographical', 'turned', 'wistful', 'sicker', 'cooling-heating', 'Creative', '53-year-old', 'shipped', 'Wavy', 'ungoverned', 'Hungarian-born', 'concentric', 'mopped', 'typographic', 'adjectival', 'shoulder-high', 'sawed-off', 'inclosed', 'respective', 'plastic-covered', 'latest', 'exposited', 'sensational', 'sophisticated', 'gigantic', 'discretionary', 'non-romantic', 'similarly', 'Forced', 'famous', 'ivory', 'botanical', 'reluctant', 'leaned', 'opaque', 'onward-driving', 'schizophrenic', 'non-Soviet', 'impetuous', 'much-thumbed', 'Cheap', 'snowy', 'liquidated', 'conscious', 'interrelated', 'inhospitable', 'threatened', 'anti-assignment', 'Strict', 'receptive', 'Guatemalan', 'three-week', 'baroque', 'cooler', 'Definite', 'hurried', 'tops', 'Unemployed', 'unmasked', 'hot-blooded', 'retaliatory', 'revoked', 'sweat-soaked', 'Smug', 'entwined', 'ship-to-surface', 'creedal', 'legalized', 'Flat', 'softer', 'waxen', 'Softer', 'indirect', 'victimized', 'recalcitrant', 'baseless', 'segmental', 'go-it-alone', 'existed', 'worst-marked', 'regional', 'winless', 'outlined', 'lovable', 'striking', 'God-forsaken', 'Siberian', 'witnessed', 'evidential', 'solemn', 'vine-embowered', 'bankrupt', 'adsorbed', 'humid', 'functioned', 'outworn', 'vented', 'hysterical', 'plebeian', 'Franco-German', 'nonviolent', 'disparate', 'asocial', 'terraced', 'bad', 'discarded', 'pedigreed', '3-run', 'providential', 'ribonucleic', 'quixotic', 'anti-intellectual', 'smarter', 'magic', 'made', 'belt-driven', 'rickety', 'International', 'unshaved', 'metaphorical', 'nuts', 'fullest', 'uppermost', 'fenced', 'biosynthesized', 'Dirty', 'conscripted', 'disunited', 'disobeyed', 'symmetrical', 'successful', 'seven-shot', 'unsold', 'luckier', 'put-upon', 'despised', 'miraculous', 'nominated', 'glomerular', 'imperishable', 'navigable', 'ante-bellum', 'cave-like', 'lavender', 'wise', 'nise', 'creek-filled', 'implacable', 'transpired', 'British-born', 'Black', 'mailed', 'discontinued', 'heralded', 'rotten', 'prurient', 'monsoon-shrouded', 'Prolonged', 'Kind', 'dismounted', 'highest-paid', 'amoral', 'bronchial', 'blackmailed', 'excised', 'disheveled', 'noisier', 'noblest', 'easy-going', 'roasted', 'shielded', 'ascertainable', 'common', 'hastened', 'isocyanate-labeled', 'winked', 'dirty', 'thousand-legged', 'Cherokee', 'hawk-faced', 'bloodiest', 'dehydrated', 'hapless', 'gaseous', 'tempered', 'serene', 'espoused', 'masterful', 'repaid', 'healthful', 'long', 'non-white', 'Special', 'self-victimized', 'crafty', 'vociferous', 'surgical', 'unacquainted', 'celestial', 'important', 'reprimanded', 'inconsistent', 'dual-ladder', 'frenzy-free', 'perpetrated', 'unaggressive', 'doctrinal', 'London-based', 'kidnapped', 'rental', 'laureate', 'Appropriate', 'amicable', 'earlier', 'Solar', 'Red', 'supervisory', 'anti-monopoly', 'kind', 'owned', 'imperturbable', 'Flanked', 'Polish', 'book-burning', 'immeasurable', 'embarrassed', 'Cautious', 'old', 'fine', 'sewn', 'dogmatic', 'computational', 'grazed', 'carved', 'discernable', 'three-building', 'engrossing', 'on-the-spot', 'wealthy', 'dark-blue', 'trend-following', 'hypnotized', 'amber', 'universal', 'stuck-up', 'conjectured', 'dread', 'Churchillian', 'downtrodden', 'thyroidal', 'true', 'two-room', 'ferromagnetic', 'exemplified', 'nonlinguistic', 'unaided', 'tired', 'compiled', 'preschool', 'Muslim', 'hoarse', 'unfortunate', 'compared', 'stationed', 'chill', 'mantic', 'commemorated', 'coveted', 'malformed', 'radionic', 'apocalyptic', 'sickly', 'considered', 'discorporate', 'eased', 'bimolecular', 'quarreled', 'manifold', 'undisputed', 'indefensible', 'life-long', 'vagrant', 'rocklike', 'collar', 'Ceartaine', 'sneaked', 'sprawled', 'snazzy', 'diagnosed', 'unachievable', 'unselfish', 'mounded', 'greenish', 'loosest', 'widened', 'fatter', 'Inter-american', 'entropy-increasing', 'gaunt', 'radiosterilized', 'Brief', 'two-component', 'relayed', 'become', 'sanest', 'multiplied', 'tolerated', 'organized', 'strongest', 'mixed', 'theatrical', 'anti-Newtonian', 'after-duty', 'government-controlled', 'rotated', 'traceable', 'nine-game', 'grouped', 'damned', 'composed', 'blindfolded', 'disbursed', 'Fortunate', 'uneasy', 'fluent', 'city-owned', 'non-commissioned', 'proclaimed', 'paraxial', 'jumped', 'three-year', 'huge', 'black-tipped', 'well-publicized', 'choicest', 'Chicago-style', 'precision', 'forecast', 'western', 'Traditional', 'weakest', 'aggravated', 'abrupt', 'cold', 'popular', 'rewarded', 'anti-trust', 'Supplemental', 'consequent', 'provisional', 'perpendicular', 'settled', 'testified', '45-degree', 'unaccompanied', 'adventitious', 'subconscious', 'ambushed', 'uninvited', 'outgeneraled', 'practical', 'voluptuous', 'upper', 'scraped', 'drifted', 'Corinthian', 'racy', 'unearthed', 'viselike', 'Strong', 'would-be', 'Compulsory', 'swift-footed', 'urinary', 'chubby', 'clumsy', 'illusionary', 'eight-year', 'semi-isolated', 'Dry', 'infantile', 'home-bred', 'unreasoning', 'inflexible', 'Deductible', 'stone-still', 'Authenticated', 'straightforward', 'All-weather', 'hand-hewn', 'cyclical', 'facile', 'three-family', 'international', 'glorious', 'stared', 'multi-product', 'surprised', 'let', 'unattainable', 'broad-scale', 'incarnate', 'reopened', 'dear', 'discoid', 'factual', 'eligible', 'Composite', 'abundant', 'incarcerated', 'olive-flushed', 'viscoelastic', 'varitinted', 'social-climbing', 'tumbled', 'high-spirited', 'incremental', 'wage-earning', 'protoplasmic', 'retrogressive', 'novelized', '50-inch', 'bilateral', 'inherited', 'momentous', 'God-given', 'good-natured', 'average', 'intrapulmonary', 'three-hundred-foot', 'ready-made', 'lyric', 'frothy', 'five-hundred-dollar', '390-foot', 'ontological', 'reimbursed', 'ostentatious', "darlin'", '130-year', 'suitable', 'managed', 'preoccupied', 'Boeotian', 'microscopic', 'unsuitable', 'confessed', 'noiseless', 'rock-like', 'melodramatic', 'designed', 'apprehended', 'post-reapportionment', 'mediocre', 'Abnormal', 'warless', 'bitter', 'reversible', 'prodded', 'deviated', 'expectable', 'opulent', 'endogenous', 'no-good', '145-pound', 'recognizable', 'earthy', 'Northeastern', 'extra-curricular', 'overvaulting', 'unorthodox', 'tremendous', 'Idle', 'attactive', 're-enacted', 'regretted', 'over-pretended', 'swathed', 'painful', 'outback', 'affirmative', 'nationalized', 'retranslated', 'semi-conscious', 'exuberant', 'cooped', 'double-married', 'Viewed', 'unpaired', 'fierce', 'bedfast', 'lop', 'transformed', 'uncontrollable', 'influenced', 'rundown', 'husband-wife', '75,000-ton', 'imponderable', 'decorticated', '11-shot', 'floral', 'illumined', 'necrotic', 'braved', 'steroid-induced', 'long-bodied', 'Critical', 'unprofitable', 'one-gee', 'Choctaw', 'uncaused', 'declared', 'squeaky', 'Follow-up', 'unwelcome', 'eternal', 'informed', 'documentary', 'painless', 'two-fisted', 'disappointed', 'apathetic', 'Russo-American', 'nutritional', 'displeased', 'wrathful', 'finished', '700-mile', 'synchronized', 'indiscreet', 'manipulated', 'Aggregate', 'counter-balanced', 'insulted', 'commissioned', 'cortico-hypothalamic', 'Prohibited', 'stripped', 'exerted', 'Amateur', 'impeccable', 'objective', 'unfenced', 'agreeable', 'satisfied', 'numerological', 'full-time', 'interstage', 'named', 'transparent', 'meaningless', 'consulted', 'sketched', 'overshadowed', 'Newport-based', 'deductive', 'dainty-legged', 'trans-political', 're-scheduled', 'earmarked', 'white', 'Positive', 'straight-out', 'hereditary', 'timeworn', 'fallible', 'fatigued', 'utilitarian', '40-grain', 'Okay', 'emigrated', 'sorriest', 'harmful', 'refractory', 'seeming', 'splashy', 'leased', 'endearing', 'schematic', 'psychotherapeutic', '65-year-old', 'salt-crusted', 'unlucky', 'Homeric', 'summed', 'paunchy', 'thanked', 'artful', 'Principal', 'changed', 'annual', 'screamed', 'established', 'once-a-month', 'now-historic', 'erred', 'augmented', 'Antithyroid', 'folksy', 'exiled', 'Atlantic', 'Nonspecific', 'soft-spoken', 'precipitated', 'privately-owned', 'Unsuccessful', 'brightest', 'Locked', 'unruly', 'windy', 'retrograde', 'undiluted', 'bloodshot', 'causative', 'unprovocative', 'physical-chemical', 'panoramic', 'uncritical', 'effected', 'sometimes-necessary', 'willed', 'unconcerned', 'crack', 'dispassionate', 'inevitable', 'superceded', 'repaired', 'add-on', 'Aegean', 'punnished', 'interglacial', 'mustached', 'smooth', 'decadent', 'Wrong', 'form-creating', 'Arctic', 'kidnaped', 'Spike-haired', 'deepened', 'surreptitious', 'Cryptic', 'recanted', 'Commercial', 'Selected', 'broken-nosed', 'announced', 'Spiritual', 'complied', 'united', 'Arterial', 'orange', 'commercial', 'resisted', 'super-Herculean', 'Successive', 'familial', 'reinstated', 'slick-headed', 'unburned', 'deviant', 'peremptory', 'described', 'olden', 'material-formal', 'resultant', 'sensed', 'peddled', 'best-educated', 'door-fronted', 'metamorphosed', 'dang', 'utmost', 'tiresome', 'appropriated', 'artificial', 'rationalized', 'demon-ridden', 'unfathomable', 'streaked', 'ecstatic', 'flared', 'south', 'competitive', 'anarchical', 'herded', 'squeezed', 'Deep', 'affianced', 'contemporary', 'Hemmed', 'deep', '15-to-one', 'traditionalized', 'dizzy', 'always-present', 'contradictory', 'symbolic', 'mud-caked', 'craft-industrial', 'Incapable', 'misleading', 'over', 'dimensional', 'Wiry', 'haunted', 'cornered', 'dogged', 'depicted', 'urged', 'volcanic', 'tokenish', 'streamed', '195-page', 'sterile', 'reverent', 'cubed', 'silhouetted', 'counterfeit', 'maudlin', 'half-filled', 'institutionalized', 'baronial', 'docile', 'husky', 'sea-blessed', 'blacked-in', 'Biblical', 'pardonable', 'modal', 'accumulated', 'newly-married', 'rival', 'undersized', 'reaffirmed', 'banked', 'thankless', 'bawdy', 'Young', 'Fearless', 'Innumerable', 'contributed', 'forfeit', 'percussive', 'commando-trained', 'swanky', 'formal', 'city-bred', 'carrier-based', 'twenty-mile', 'shorter', 'honeymooned', 'power-hungry', 'Iodinated', 'encompassed', 'consumptive', 'briefed', 'reproduced', 'encumbered', 'Ionic', 'pretty', 'thickened', 'birthed', 'socio-archaeological', 'mummified', 'dictatorial', 'pro', 'immediate', 'common-sense', 'peaked', 'imparted', 'killed', 'heretofore-accepted', 'cassocked', 'pro-Western', 'clean-shaven', 'undimmed', 'expended', 'morphemic', 'hung', 'arid', 'garbled', 'unmodified', 'Granted', 'Standard', 'invalid', 'oily', 'bobbin-to-cone', 'irksome', 'accrued', 'true-false', 'plenary', 'strong-made', 'central', 'billed', "enter'd", 'infirm', 'irresponsible', 'raspberry', 'multi-colored', 'taught', 'Martian', 'gravid', 'law-abiding', 'cynical', 'officered', 'home-and-home', 'perceptual', 'woven', 'refurbished', 'unproblematic', 'Light', 'processed', 'biochemical', 'finely-spun', 'petulant', 'militated', 'epileptic', 'uncharged', 'characteristic', 'expired', 'gouged', 'residential', 'underscored', 'overgenerous', 'small', 'rakish', 'praised', 'Overt', 'looking', 'systemic', 'Previous', 'preconscious', 'tousled', 'Bible-loving', 'Repeated', 'veracious', 'apprenticed', 'sexualized', 'tube-nosed', 'forthcoming', 'caloric', 'communicative', 'disloyal', 'ethereal', 'delphic', 'Shunted', '1800-square-foot', 'chalked', 'grassed', 'stern', 'best-looking', 'Ravel-like', 'moth-eaten', 'dark-haired', 'betrothed', 'furious', 'unperformed', 'leavened', 'visited', 'unspeakable', 'outlying', 'not-so-lonely', '10-day', 'untrue', 'pedimented', 'unstuffy', 'transposed', 'avoided', 'Magnetic', 'somatic', 'squelched', 'after-school', 'text-ordered', 'illiterate', 'nautical', 'unleavened', 'puzzling', 'far-ranging', 'congenital', 'non-polygynous', 'phony', 'slow-acting', 'alkaline', 'safer', 'baleful', 'indecipherable', 'Wide', 'fifty-pound', 'leather-hard', 'majesterial', 'unsheltered', 'twenty-year', 'elephantine', 'etymological', 'clear', 'sturdy', 'well-grooved', 'Preoccupied', 'Wooded', 'psychical', 'boarded', 'repressive', 'threefold', 'climbed', 'patristic', 'paginated', 'monotonous', 'savored', 'self-energizing', 'Graceful', 'orbital', 'discernible', 'contracted', 'distortable', 'catlike', 'waspish', 'lyophilized', 'engaging', 'audio-visual', 'well-fed', 'effortless', 'Best', 'inadequate', 'Lockian', 'appreciable', 'procured', 'Physical', 'impertinent', 'contrite', 'danced', 'exaggerated', 'disabled', 'simple-seeming', 'caged', 'rainless', 'voted', 'sorest', 'feline', 'world-shaking', 'mean', 'corny', 'Finished', 'rough-tough', 'fecund', 'entitled', 'Full', 'Financial', 'uncourageous', 'loose-jowled', 'imprecise', 'categorical', 'thirty-caliber', 'screened', 'hydrostatic', 'blighted', 'fore', 'pre-season', 'on-level', 'defiant', 'beneficial', 'fibrous', 'two-term', 'conceptual', 'tactual', 'indigent', 'closeted', 'five-column', 'migrated', 'illusory', 'greasy', 'psychoactive', 'sanctioned', 'helpless', 'sudden', 'Enzymatic', 'law-governed', 'outmaneuvered', 'still-dark', 'stable', 'anti-democratic', 'drama-filled', 'credulous', 'sincere', 'well-to-do', 'Husky', 'short-lived', 'mechanized', 'philanthropic', 'fresh', 'total', 'relationship-building', 'acute', 'bloated', 'Buffeted', 'underground', 'unworn', 'diversionary', 'ethical', 'wonderful', 'self-enclosed', 'conservative', 'detachable', 'well-deserved', 'Customary', 'uninfluenced', 'Greatest', 'intellectual', 'easier', 'half-educated', 'bottomless', 'White', 'Confronted', 'post-bellum', 'downed', 'simulated', 'devastated', 'pupated', 'invaluable', 'rougher', 'Loyal', 'Consonantal', 'caressed', 'disorderly', 'atypical', 'impractical', 'aligned', 'pushed', 'directed', 'Asian', 'co-ordinated', 'willowy', 'non-itemized', 'primeval', 'bulk', 'compounded', 'puny', 'expressive', 'pseudo', 'anti-missile', 'dishonored', 'cozy', 'lusty', 'drowsy', 'never-predictable', 'awe-inspiring', 'curt', 'strapping', 'nonparticulate', 'shivered', 'thrilled', 'thrombosed', 'ever-increasing', 'looted', 'swank', 'nonmetallic', 'mournful', 'celiac', 'bargain-priced', 'bull-necked', 'coaxial', 'birdied', 'pre-existent', 'jilted', 'italicized', 'soul-searching', 'catalytic', 'devoted', 'provisioned', 'Fundamental', 'bayed', 'rendered', 'worth-waiting-for', 'hypothesized', 'unhitched', 'oversimplified', 'voluble', '15-hit', 'frail', 'fourteen-team', 'meteoritic', 'taut-nerved', 'knobby-knuckled', 'vital', 'blundered', 'annunciated', 'honorable', 'prearranged', 'gratifying', 'lowly', 'strait-laced', 'problem-solving', 'one-sided', 'buoyant', 'booked', 'lit', 'subsumed', 'Protogeometric', 'sudden-end', 'instrumental', 'righteous', 'Straight', 'outrun', 'youngish', 'false', 'chronicled', 'Large', 'uncontrolled', 'peppery', 'weather-resistant', 'fractured', 'gawky', 'dyed', 'interlobular', 'oneasy', 'Fuzzy', 'calorie-heavy', 'stolid', 'Olde', 'intramural', 'on-stage', 'momentary', 'intertwined', 'permeated', 'longish', 'Kohnstamm-positive', 'Ready', 'grand', 'black-haired', 'monastic', 'peculiar', 'allotted', 'stalled', 'well-designed', 'incapacitated', 'skeletal', 'crowned', 'performed', 'conformist', 'voiceless', 'fee-per-case', 'voiced', 'stumbled', 'spurred', '11-year', 'flashlight-type', 'Then', 'swished', 'patent', 'coal-black', 'sprightly', 'goddamn', 'smallish', 'legged', 'impious', 'painstaking', 'legal', 'wiped', 'Miltonic', 'nahce', 'minimal', 'Qualitative', 'sunburnt', 'unspoken', 'three-dimentional', 'pictured', 'amusing', 'newborn', 'winged', 'curative', 'Pre-attack', 'wielded', 'tripartite', 'cute', 'imperious', 'imbedded', 'three-foot', 'docketed', 'Dingy-looking', 'fetid', 'labile', 'louder', 'tweezed', 'prodigious', 'fluid', 'qualified', 'lay-up', 'practicable', 'null-type', 'judged', 'heady', 'eyd', 'clawed', 'democratic', 'grokked', 'assembled', 'stupid', 'godlike', 'fearsome', 'Rental', 'too-large', 'boiled', 'exclusive', 'persuaded', 'right', 'highest', 'trumped-up', 'hired', 'dappled', 'leisurely', 'six-month', 'particularistic-seeming', 'wide-ranging', 'rusty', 'classical', 'Caucasian', 'legislation-delaying', 'Hunkerish', 'pliant', 'emptied', 'minor', 'aniseikonic', 'machine-gunned', 'sooner', 'bake', 'dangerous', 'deputized', 'indelicate', 'corporate', 'brash', 'numerous', 'shaped', 'simmered', 'due', '150-milliampere', 'particulate', 'next-door', 'failed', 'non-Jewish', 'laughed', 'inorganic', 'truth-revealing', 'five-day', 'violated', 'deluxe', 'drained', 'majestic', 'studious', 'linen-covered', 'mock', 'eked', 'flat-topped', 'awesome', 'tropical', 'nighted', 'general', 'widespread', 'chalk-white', 'sombre', 'location-minded', 'Official', 'high-salaried', 'spotty', 'ole', 'cleft', 'Mennonite', 'smashed-out', 'Environmental', 'ended', 'two-story', 'Braddock-against-the-Indians', 'scanned', 'co-operative', 'silky', 'shocked', 'vacated', 'sedentary', 'unsigned', 'limited', 'Contrary', 'contrary', 'remarkable', 'Just', 'cutest', 'asked', '545-yard', 'tested', 'inapt', 'uniform', 'laced', 'intermeshed', 'worldly', 'unobtrusive', '50-megaton', 'tell-tale', 'esthetic', 'undreamed', 'trite', 'suited', 'interrupted', 'naked', 'naughtier', 'furrowed', 'Swedish', 'entrenched', 'last-mentioned', 'recumbent', 'Vocal', 'desolate', 'versed', 'exhausted', 'khaki', 'firmer', 'ostracized', 'philological', 'sunken', 'yellow-bellied', 'unscathed', 'choral', 'half-crocked', 'Meager', 'Venturesome', 'Editorial', 'shelled', 'backed', 'finest', 'tenebrous', 'present', 'Sprouted', 'copied', 'nonionic', 'Scientific', 'vitriolic', 'Trans-illuminated', 'protozoan', 'fictitious', 'hacked', 'Ten-thousand-dollar', 'decisive', 'stomped', 'nonmusical', 'red-blooded', 'outboard', 'Front', 'overt', 'careless', 'positive', 'Tibetan', 'individualistic', 'cataclysmic', 'learned', 'candidate-picking', 'derogatory', 'inoperable', 'reflective', 'consonant', 'seduced', 'steadier', 'seeped', '10-gallon', 'healthier', 'Accepted', 'athletic', 'short-of-war', 'positioned', 'exchanged', 'Congolese', 'high', 'destroyed', 'forgiven', 'non-propagating', 'lectured', 'ratified', 'Opaque', 'postwar', 'overconfident', 'persistent', 'diamond-studded', 'continual', 'arboreal', 'unanswered', 'belowground', 'Jewish-Gentile', '80-hp', 'complex-valued', 'Weekly', '1200-square-foot', 'Wooden', 'servile', 'amorous', 'conspicuous', 'scribbled', 'congregational', 'Hessian', '52-year', 'sheep-lined', 'two-way', 'sterilized', 'aggrieved', 'Assyrian', 'watered', 'drastic', 'no-driving', 'Bantu', 'solaced', 'thirsted', 'staminate', 'archaeological', 'geometrical', 'trapped', 'lapped', 'sore', 'enthralled', 'misshapen', 'upper-middle', 'Conceived', 'advertising-conscious', 'injected', 'Elizabethan', 'psychological', 'interstitial', 'quiet', 'joint', 'interconnected', 'torpid', 'khaki-bound', 'assigned', 'undistinguished', 'saved', 'brownish', 'specific', 'anti-personality', 'padded', 'fortune-happy', 'dehumidified', 'crawled', 'tactile', 'multiple', 'ineffectual', 'jovial', 'Alarmed', 'do-good', '38-point', 'condoned', 'Blanched', 'traditional', 'advantageous', 'notched', 'staggered', 'enabled', 'dramatic', 'bequeathed', '25-mile-square', 'flexible', 'chainlike', 'stratified', 'repelled', 'time-cast', 'Elaborate', 'killable', 'juiciest', 'vocalic', 'hospitable', 'psychoanalytic', 'light-headed', 'finger-held', 'better-than-average', '13/16-inch', 'childlike', 'required', 'trying', 'anchored', 'Lithe', 'imcomplete', '5-passenger', 'elicited', 'secularist', 'half-digested', 'eye-undeceiving', 'dug', 'unpartisan', 'quadrupled', 'Precious', 'staved', 'aware', 'other-directed', 'joyous', 'valid', 'leguminous', 'seed-bearing', 'divisional', 'analeptic', 'fickle', '33-man', 'out-reaching', 'abbreviated', 'spiced', 'concretistic', 'rephrased', 'indigestible', 'plastered', 'scandalized', 'leathery', 'truant', 'broad-brimmed', 'free-burning', 'Norwegian', 'whimsical', 'ineluctable', 'dedifferentiated', 'hand-filed', 'motherly', 'stuffed', 'confident', 'humble', 'inborn', 'stored-up', 'railway-based', 'phonetic', 'painteresque', 'unacknowledged', 'thimble-sized', 'conscionable', 'gooshey', 'nutrient', 'stubborn', 'defensive', 'accelerated', 'sung', 'recently-passed', 'traced', 'aural', 'two-lane', 'ridden', 'observable', 'poisoned', 'involuntary', 'cameo-like', 'well-balanced', 'tall-growing', 'by-passing', 'preflight', 'scholarly', 'dummy', 'abandoned', 'financed', 'half-crazy', 'fantastic', 'stone-gray', 'non-volatile', 'go-to-war', "guerrilla-th'-wisp", 'complex', 'unanalyzed', 'unself-conscious', 'peed', 'better-remembered', 'rude', 'disgruntled', 'commandeered', 'home-grown', 'virgin', 'sun-burned', 'connected', 'supplemented', 'recommended', 'ensconced', 'Finnish', 'quasi-recitative', 'hijacked', 'hunted', 'consonantal', 'Papal', 'amplified', 'snappy', 'burnt', 'transitional', 'unphysical', 'admitted', 'anthropomorphic', 'tidy', 'Victorian', 'thermoelectric', 'mousy', 'separated', 'younguh', 'accepting', 'deep-sea', 'Natural', 'pressure-sensing', 'collared', 'untellable', 'demoniac', '3-month', 'cognitive', 'missionary', 'boldest', 'biggest', 'reserved', 'foremost', 'sentenced', 'watched', 'expelled', 'ornamented', 'rustproof', 'spilled', 'half-past', 'surplus', 'costumed', 'pampered', 'Shocked', 'well-braced', 'instinctive', 'hardy', 'hand-written', 'august', 'Unspeakable', 'Compared', 'forgitful', 'accessible', 'convertible', 'dandy', 'elapsed', 'willinge', 'weighty', 'alone', 'clouded', 'anti-discriminatory', 'detected', 'inimical', 'actuated', 'self-conscious', 'dank', 'misled', 'sepulchred', 'burnt-red', 'weekly', 'pelvic', 'taxpaying', 'lengthwise', 'whiskered', 'Trouble-free', 'efficient', 'York-mind', 'second-rate', 'zodiacal', 'unmindful', 'Tough', 'plumed', 'unfertilized', 'mayoral', 'burdened', 'appalled', 'recoverable', 'transcultural', 'equal', 'fragrant', 'far-flung', 'stifled', 'thick', 'gruff', 'electro-magnetic', 'fastened', 'groomed', 'simplest', '25-gallon', 'semiautomatic', 'muscled', 'wild-sounding', 'picketed', 'unuttered', 'reclassified', 'cardinal', 'matchless', 'veteran', 'olive', 'candid', 'unlaundered', 'recorded', 'future-time', 'tar-soaked', 'guileless', 'less', 'neo-', 'foster', 'commented', 'Clad', 'mum', 'Fear-maddened', 'platitudinous', 'believed', 'horrid', 'squirmed', 'Engaged', 'ambiguous', 'employee-contributed', 'ceased', 'bright-green', 'exterior', 'foolhardy', 'discerned', 'clamorous', 'listener-supported', 'scalloped', 'blushed', 'deafened', 'bigger', 'pre-set', 'thickest', 'educational', 'accomplished', 'gassed', 'deceptive', 'showered', 'blistered', 'back-lighted', 'obstinate', 'modified', 'analytic', 'remarked', 'odious', 'prettiest', 'attuned', 'fawn-colored', 'deepest', 'defined', 'frothier', 'provoked', 'social', 'paused', 'endangered', 'commanded', 'unnoticed', 'fade-in', 'plain-spoken', 'tiered', 'embittered', 'collapsed', 'striped', 'Morphophonemic', 'seventeen-inch', 'investigated', 'inward', 'hazy', 'chilled', 'demythologized', 'cheerful', 'meant', 'dual', 'worse', 'prehistoric', 'delicately-textured', 'rifled', 'tradition-minded', 'caught', 'Fosterite', 'lathered', 'ashen', 'tool', 'guaranteed-neutral', 'non-hydrogen-bonded', 'well-molded', 'promoted', 'per-year', 'broiled', 'sulky', 'affable', 'worried', 'managerial', 'restrictive', 'cross-legged', 'anti-Kennedy', 'soft', 'leaped', 'acceptable', 'Related', 'vested', 'wellknown', 'petted', 'Fired', 'threadbare', 'neuter', 'Subtitled', 'substituted', 'red-visored', 'claimed', 'sauterne', 'far-off', 'said', 'willing', 'operatic', 'fear-filled', 'fine-drawn', 'intangible', 'disbanded', 'overpopulated', 'contented', 'mesenteric', 'tipsy', 'triple', 'enlightened', 'unpromising', 'held', 'smoky', 'inscrutable', 'seamless', 'froze', 'prophesied', 'incongruous', 'morphologic', 'uglier', 'suave', 'lace-drawn', 'not-so-pale', 'resolute', 'round-eyed', 'monumental', 'twirled', 'bashful', 'round-tipped', 'wavy', 'poor', 'concentrated', 'Built', 'handicapped', 'cross', 'Puny', '27-year-old', 'hard-won', 'Sooner', '25-foot', 'abridged', 'Rumanian', 'ransacked', 'fun-loving', 'tattooed', 'subsurface', 'Grecian', 'faceless', 'checked', 'twofold', 'stochastic', 'bouncy', 'anti-human', 'affronted', 'round-faced', 'seasoned', 'willow-lined', 'resurgent', 'dived', 'glossed', 'resulted', 'phenomenological', 'blasphemous', 'peeled', 'chartered', 'chromium-plated', 'unemotional', 'brain-wracking', 'terrestrial', 'unchallenged', 'area-wide', 'yongst', 'plagued', 'Mass', 'fancier', 'fermented', 'cardiovascular', 'ring-labeled', 'silver-gray', 'non-public', 'flung', 'cavernous', 'Washed', 'veritable', 'implored', 'trans-illuminated', 'wormy', 'shot', 'dried-up', 'mingled', 'sinusoidal', 'recursive', 'pig-drunk', 'quadric', 'celebrated', 'radioactive', 'ultraviolet', 'peaceful', 'socially-oriented', 'sized', 'Estimated', 'incurable', 'cared', 'diffuse', 'shown', 'slow-growing', 'enchained', 'dilapidated', 'uninterested', 'whitehaired', 'memorialized', 'licked', 'undisclosed', 'boycotted', 'normative', 'analogous', 'plastic', 'patented', 'coded', 'five-year', 'fast-growing', 'beyond-normal', 'wrecked', 'green-scaled', 'institutional', 'odd', 'lame', 'everyday', 'short-cut', 'southbound', 'pituitary', 'subatomic', 'Acceptable', 'Israeli', 'Stoic-patristic', '3/8-inch-thick', 'oleophilic', 'Anti-A', 'hour-long', 'matriculated', 'tetragonal', 'virtuous', 'boon', 'delicious', 'superficial', 'geared', 'independent', 'drafted', 'circumscribed', 'insurmountable', 'inner', 'contradicted', 'Encouraged', 'ashamed', 'robed', 'Grinned', 'advisory', 'syntactic', 'lubricated', 'muggy', 'out-of-bounds', 'dispelled', 'Stalinist-corrupted', 'magnificent', 'Relative', 'Sicilian', 'hitched', 'interpeople', 'open-ended', 'unsalted', 'broadcast', 'manic-depressive', 'Protestant-dominated', 'synonymous', 'eliminated', 'steeped', 'master', '12-month', 'scrumptious', 'critical-intellectual', 'envisaged', 'organismic', 'miscarried', 'unkind', 'fogged', 'crisp', '67-year-old', 'east', 'splenetic', 'vine-shaded', 'Korean', 'then', 'conventionalized', 'immovable', 'hungry', 'inexorable', 'routine', 'entered', 'on-site', 'handled', 'revised', 'Graduate', 'fissured', 'crudest', 'slender', 'encouraged', 'argued', 'sunk', 'plotted', 'valueless', 'inexact', 'fugual', 'sublunary', 'Possible', 'less-indomitable', 'felt', 'communicational', 'matched', 'stepwise', 'wakeful', 'tertiary', 'inexpert', 'hummed', 'proprietory', 'school-leaving', 'pedantic', 'Rounded', 'English-speaking', 'snob-clannish', 'intra-state', 'nonpolitical', 'rid', 'precarious', 'diachronic', 'fossilized', 'gallus-snapping', 'slack', 'fiendish', 'cross-eyed', 'Stainless', 'anti-A', 'diffused', 'Ideal', 'molten', 'voluntary', 'heat-processing', 'local', 'cosponsored', 'planetary', 'remarried', 'evinced', 'occupied', 'topical', 'westerly', 'thematic', 'brooken', 'unsaid', 'defensible', 'seven-concert', 'day-after-day', 'grim', 'Northwestern', 'semi-major', 'muddleheaded', 'sensual', 'powerful', 'injurious', 'undamaged', 'unaware', 'truth-packed', 'feathered', 'unhinged', 'year-old', 'hopeful', 'orphaned', 'non-literary', '30-minute', 'obnoxious', 'forgot', 'packaged', 'flirtatious', 'mannered', 'brackish', 'half-transparent', 'sixteen-year-old', 'suffocated', 'distilled', 'stabbed', 'great', 'unending', 'knock-down', 'solar', 'good-size', 'day-by-day', 'black-and-orange', 'free-wheeling', 'stewed', 'pimpled', 'multi-lingual', 'tangential', 'penniless', 'ratable', 'impassable', 'awake', 'adjacent', 'labor-saving', 'widowed', 'constitutional', 'pervasive', 'pre-historic', 'hobbled', 'manly', 'legendary', 'probable', 'furnished', 'Handsome', 'pink-petticoated', 'piquant', 'circumpolar', 'self-unloading', 'framed', 'knifelike', 'run-scoring', 'ten-minute', 'softened', 'pathless', 'See-through', 'taken', 'extraneous', 'supersonic', 'harpy', 'Serious', 'nonresident', 'focused', 'simple', 'staunchest', 'high-sounding', 'antagonistic', 'knelt', 'foreclosed', 'despoiled', '18-1/2-inch', 'glassless', 'noxious', 'blood-specked', 'hoped-for', 'scalar', 'bodily', 'sixty-five-mile', 'Filigreed', 'Jacobean', 'gleeful', 'pumped-up', 'do-it-yourself', 'sensitized', 'obtained', 'comparable', 'subnormal', 'pro-Europe', 'Englishy', 'take-up', 'long-vanished', 'dynamic', 'resplendent', 'Western', 'coarse', 'silver-painted', 'prima-facie', 'tiny', 'justified', 'Moorish', 'obeyed', 'hypertrophied', 'mist-like', 'Proper', 'civic', 'chanted', 'dialectical', 'undiminished', 'severe-looking', 'most-valuable', 'heterozygous', 'savory', 'proverbial', 'thyroxine-binding', 'sed', 'elastic', 'afferent', 'loved', 'Vital', 'lustrous', 'applicable', 'unfamiliar', 'ever-present', 'Caught', 'pumped', 'best-known', 'Worse', 'Crimean', 'struggled', 'carpeted', 'bipartisan', 'jammed', 'colossal', 'sharp', 'north-south', 'inconceivable', 'military', 'diaphragmic', 'safest', 'muddy-tasting', 'linear', 'fluted', 'significant', 'dog-eared', 'waited', 'loud-voiced', 'evangelical', 'radiant', 'non-sentimental', 'centrifuged', 'rejected', 'barrel-wide', 'brocaded', 'tea-drinking', 'unexplainable', 'radiated', 'cherry', 'Japanese', 'Baroque', 'gelatin-like', 'fiery', 'beetling', 'nineteen-year-old', 'wicked', 'unimaginative', 'west', 'unmatched', 'corrupt', 'rumored', 'sonorous', 'funeral', 'writing-like', 'good-living', 'sensuous', 'perishable', '6-year', 'redoubled', 'Politics-ridden', 'aided', 'continued', 'myriad', 'overnight', 'in-plant', 'Questioned', 'Republican', 'renal', 'Violent', 'semi-processed', 'hot-slough', 'atrophied', 'poorer', 'manifested', 'notable', 'Armenian', 'unimproved', 'Sleepy-eyed', 'becalmed', 'visual', 'flooded', 'unburdened', 'trusted', 'got', 'snow-white', 'cohnfidunt', 'subsidized', 'Anti-Communist', 'worldwide', 'sure-enough', 'masked', 'spared', 'raged', 'occipital', 'undesirable', 'tan', 'thrust', 'harassed', 'rough-and-tumble', 'Anglo-Protestant', 'overeager', 'cursory', 'worshipped', 'indicated', 'hopeless', 'two-hour', 'collonaded', 'easy-to-spot', 'full-banded', 'spot-promoted', 'complaisant', 'Comparable', 'betrayed', 'labelled', 'handy', '39-year-old', 'agreed-upon', 'incurred', 'precautionary', 'keen', 'presumed', 'extant', 'pragmatic', 'reprinted', 'connective', 'academic', 'less-developed', 'ensued', 'Balanced', 'sternal', 'gold-filled', 'Bare', 'rescinded', 'overpriced', "dam'", 'totted', 'malposed', 'all-too-brief', 'gyro-stabilized', 'all-night', 'allied', 'palliative', 'radical', 'tulip-shaped', 'unjust', 'ordained', 'Mechanized', 'worshiped', 'evaluated', 'cursed', 'iliac', 'high-rep', 'Hungarian', 'salacious', "sor'l", 'Titled', 'far-out', 'Pure', 'wisest', 'granular', 'good-looking', 'Rough', 'farmer-type', 'crisis-oriented', 'nonracial', 'healed', 'Bacterial', 'unabashed', 'bolder', 'Unmarried', 'suburban', 'Christmas-season', 'humbled', 'wrong-headed', 'penultimate', 'jocular', 'noted', 'slow-scrambling', 'unappreciated', 'menial', 'nastier', 'Homozygous', 'bear-like', 'non-authoritative', 'reconciled', 'p.', 'restored', 'Thrifty', 'conducted', 'binding', 'overactive', 'limber', 'intimated', 'browbeaten', 'Tribal', 'Higher', 'cellular', 'irritable', 'graphic', 'fire-resistant', 'coordinated', 'legislative', 'centric', 'frizzled', 'middle-', 'Sweet-sour', 'isothermal', 'cold-blooded', 'sold', 'socialistic', 'unveiled', 'tried', 'spouted', 'nonchalant', 'Botulinal', 'perturbed', 'impulsive', 'absent', 'per-game', 'luxurious', 'zoned', 'Communist-inspired', 'closely-packed', 'blunter', 'mirthless', 'distributive', 'groggy', 'shuddery', 'minimized', 'Practical', 'poured', 'renewed', 'zealous', 'Jovian', 'balled', 'disregarded', 'opportunistic', 'knotted', 'converted', 'dilated', 'weather-royal', 'congenial', 'envious', 'eager', 'rear', 'self-sustaining', 'over-occupied', 'money-minded', 'suspended', 'edentulous', 'lonelier', 'pre-marital', 'prewar', 'cents-per-hour', 'irreducible', 'universalistic', 'nearby', 'brassy', 'Unimpressed', 'normal', 'teensy', 'unblemished', 'slow', 'monetary', 'wire-haired', 'Moscow-allied', 'slung', 'month-long', 'methodical', 'pseudo-scientific', 'scrub', 'paralleled', 'never-to-be-forgotten', 'stiffened', 'talkative', 'confusing', 'mortal', 'hemolytic', 'level-headed', 'Severe', 'courtly', 'unshakable', 'British-American', 'terminated', 'shack-up', 'intercontinental', 'halted', 'polluted', 'buttressed', 'unfitting', 'captive', 'prosodic', 'half-expressed', 'encephalographic', 'purple', 'Danish', 'see-lective', 'amiss', 'afflicted', 'topmost', 'frayed', 'unavailing', 'rutted', 'Curly', 'remotest', 'three-judge', 'Subject', 'baffling', 'Comprised', 'premarital', 'Drunk', 'weaned', 'Square', 'soggy', 'crashed', 'rainy', 'token', 'weakened', 'proffered', 'Cassite', 'fluffy', 'morbid-minded', 'substerilization', 'well-played', 'moralistic', 'superlunary', 'repressed', 'clerical', 'test-like', 'sinuous', 'deposited', 'unrequited', 'inherent', 'lyrical', 'destitute', 'stellar', 'twice-a-year', 'wilted', 'impartial', 'Eurasian', 'frog-eating', 'littered', 'lavish', 'communal', 'fractional', 'salutary', 'unlamented', 'beefed-up', 'grade-constructed', 'incredible', 'Armed', 'touched', 'Dear', 'orchestral', 'biological', 'lynched', 'six-ton', 'gemlike', 'fifty-cent', 'mocked', 'speechless', 'finite-dimensional', 'fusiform', 'fascinated', 'dispersed', 'shattered', 'macromolecular', 'free', 'Judicial', 'policy-oriented', 'resourceful', 'unsavory', 'intra-mural', 'transplantable', 'betel-stained', 'pickled', 'freed', 'earsplitting', 'imagined', 'alphabetic', 'advertised', 'dismaying', 'Tougher', 'downstream', 'detestable', 'unknown', 'mandatory', 'inaudible', 'ill-conceived', 'likely', 'reasonable', 'minced', 'raucous', 'accustomed', 'impenetrable', 'oviform', 'nihilistic', 'Drawn', 'treasured', 'Scrooge-like', 'calculated', 'secretarial', 'conciliatory', 'unprecedented', 'transmitted', 'entertaining', 'worshipful', 'Cold', 'pianistic', 'further', 'disjointed', 'spontaneous', 'rewarding', 'precocious', 'unused', 'malevolent', 'cannibalistic', 'chaperoned', 'nauseated', 'stashed', 'lineal', 'concordant', 'homebuilding', 'unabridged', 'Colombian', 'manned', 'money-fed', 'demented', 'people-oriented', 'pressure-measuring', 'pulsed', 'upturned', 'bested', 'Home-keeping', 'combatted', 'vile', 'thin-soled', 'addle-brained', 'evaded', 'fairest', 'enforceable', 'high-minded', 'palmed', 'diligent', 'congruent', 'donated', 'vulcanized', 'burdensome', 'slimmer', 'bereft', 'grilled', '3-game', 'blind', 'starred', 'interesting', 'seven-week', 'all-lesbian', 'hardest', 'scarlet', 'figured', 'bloody', 'bleacher-type', 'savage', 'world-oriented', 'hedonistic', 'favorite', 'downgraded', 'unexpected', 'harmless', 'hot-colored', 'insulated', 'telephoned', 'prepositional', 'displaced', 'acrobatic', 'low-down', 'Ripe', 'three-men-and-a-helper', 'ambidextrous', 'eighty-year-old', 'sweet-throated', 'Righteous', 'non-forthcoming', 'strengthened', 'non-comparable', 'scoffed', 'pitiless', 'Hooked', 'inviting', 'seventy-five-foot', 'unalienable', 'urban', 'humiliating', 'shrewd', 'senior-graduate', 'hawked', 'intolerant', 'oral', 'purtiest', 'unproductive', 'more-than-average', 'species-dependent', 'high-set', 'quick-frozen', 'nonagricultural', 'well-bred', 'salable', 'squat', 'far-famed', 'flowered', 'immortalized', 'bored', 'decayed', 'sullen', 'sensible', 'briefly-illumed', 'sober', 'elegiac', 'coasted', 'Separate', 'debilitated', 'sleek', 'four-story', 'spaniel-like', 'Latin', 'sprained', 'immense', 'evaporative', '260-member', 'febrile', 'turquoise', 'alternate', 'half-standard', 'latent', 'depressing', 'light-reflecting', 'sore-ridden', 'buxom', 'Orwellian', 'edematous', 'coercive', 'maverick', 'off-road', '10-yr.', 'freest', 'desperate', 'mild-voiced', 'stabilized', 'sly', 'squashed', 'raced', 'cortical', 'tracked', 'emancipated', 'indubitable', 'dominated', 'plated', 'uninjured', 'sharpened', 'construed', 'shopworn', 'essential', 'halfway', 'subject', 'pre-French', 'conjugal', 'rooted', 'mystified', 'toiled', 'likened', 'skiddy', 'semi-skilled', 'justifiable', 'smeared', 'wracked', 'side-stepped', 'unsealed', 'saddled', 'razor-edged', 'sweet-smelling', 'panicky', 'supercilious', 'senseless', 'round', 'unstaring', 'joined', 'uninitiated', 'harrowing', 'plunged', 'tonal', 'opposed', 'unemployed', 'boxy', 'warranted', 'whetted', 'known', 'liable', 'cooperative', 'separable', 'germinal', 'tuneful', 'grit-impregnated', 'cometary', 'flat-footed', 'dismissed', 'arrested', 'convex', 'Statistical', 'patient', 'shantung-like', 'complicated', 'autonomic-somatic', 'pompous', 'actuarial', 'slowly-mending', 'distinguished', 'associate', 'southern', 'top-heavy', 'starboard', 'proportionate', 'Situated', 'Religious', 'indefatigable', 'broad', 'rigged', 'steamed', 'incidental', 'dreamed', 'acquitted', 'penciled', 'benighted', 'incestuous', 'eight-foot', 'fluid-filled', 'unmated', 'paraded', 'interference-like', 'muddied', 'crestfallen', 'offensive', 'disgusting', 'half-conscious', 'open-mouthed', 'Philosophic', 'Discreet', 'impudent', 'twenty-nine-foot-wide', 'quadripartite', 'insoluble', 'rectangular', 'Lived', 'penalized', 'domed', 'redistributed', 'unglued', 'sickened', 'standardized', 'age-old', 'mealynosed', 'dour', 'angry', 'deserving', 'lax', 'Bible-emancipated', 'dust-settling', 'knee-type', 'intra-stellar', 'aerodynamic', 'guilty', 'inventive', 'Big', 'fool', 'provocative', "Gre't", '22-year-old', 'attracted', 'flexural', 'hearty', 'full-grown', 'husky-voiced', 'Mad', 'model', 'shelved', 'fawned', 'life-like', 'untouched', 'topsy-turvy', 'agleam', 'drawn', 'sideways', 'snake-like', 'horrified', 'dulled', 'time-consuming', 'dullest', 'unhesitant', 'coal-like', 'welcomed', 'invalidated', 'squalid', 'submissive', 'Arbitrary', 'rawboned', 'off-key', '7-room', 'ferocious', 'livid', 'medical', 'headed', 'Read', 'literary', 'imperiled', '6-foot', 'venomous', 'six-foot', 'Warmongering', 'personal', 'Protestant', 'permitted', 'divers', 'registered', 'blocky', 'nubile', 'vehicular', 'unanimous', 'roundabout', 'fevered', 'arched', 'corroborated', 'entry-limiting', 'Moral', 'indestructible', 'commingled', 'Excellent', 'osmotic', 'bitterest', 'sallow', 'died', 'horn-rimmed', 'winded', 'fulfilled', 'slightest', 'well-modulated', 'Haitian', 'statistical', 'redemptive', 'lost', 'spaced', 'salivary', 'deep-set', 'all-married', 'dissimilar', 'venerated', 'paranormal', 'moon-washed', 'mined', 'Important', 'emblematic', 'tawdry', 'disarmed', 'affluent', 'indistinct', 'begun', 'dream-ridden', 'Beaten', 'lowdown', 'Greek-speaking', 'aseptic', 'co-educational', 'soiled', 'cautious', 'stoned', 'Multiple', 'Northern', 'brazen', 'kindled', 'refused', 'spruced', 'vocal', 'down-to-earth', 'colorless', 'gauged', 'accommodated', 'explored', 'geometric', 'interlaced', 'humane', 'mandated', 'easy-to-operate', 'gynecological', 'ohmic', 'scented', 'overpaid', 'lush', 'encamped', 'violent', 'orthopedic', 'broadest', 'tangled', 'explosive', 'Incorporated', 'ecclesiastical', 'agreed', 'studied', 'Equal', 'Chinese-Soviet', 'racial', 'porous', 'unpatriotic', 'spacious', 'projective', 'Green', 'softest', 'young', 'monoclinic', 'rubberized', 'spread-eagled', 'mutual', 'computed', 'Molten', 'swayed', 'net-like', 'judge-made', 'cordial', 'prized', 'unknowing', 'Hostile', 'transcribed', 'fried', 'six-dollar', 'eye-filling', 'Housed', 'sought', 'tinted', 'promotional', 'cemented', 'assertive', 'interaxial', 'prepubescent', 'federal', '6-ounce', 'hell-bound', 'Channel-type', 'lumped', 'frost-bitten', 'breathtaking', 'sleek-headed', 'divine', 'contrived', 'formative', 'reposed', 'dictated', 'reelected', 'wedge-shaped', 'sick', 'ball-hawking', 'lively', "year-'round", 'unmixed', 'Periclean', 'staunch', 'unbounded', 'rumpled', 'knowing', 'electrical', 'realistic', 'daunted', 'soared', 'busier', 'cerulean', 'infuriating', 'benign', 'preferable', 'long-overdue', 'drafty', 'fabricated', 'elucidated', 'sq.', 'unfurled', 'disorganized', 'detonated', 'Anti-recession', 'neoliberal', 'mineralized', 'dry', 'imprisoned', 'Measured', 'titian-haired', 'relational', 'snug-fitting', 'generalized', 'pursuant', 'nilpotent', 'asinine', 'waked', 'knite', 'medium', 'terror-stricken', 'paid-for', 'half-forgotten', 'beefy', 'well-trained', 'deputy', 'peaceable', 'strengtened', 'drab', 'levied', 'Jeffersonian', 'reappeared', 'pilloried', 'drove', 'druncke', 'formed', 'Outraged', 'action-oriented', 'hailed', 'Alternate', 'Cascaded', 'horned', 'Run-down', 'beloved', 'fast-spreading', 'washed', 'counseled', 'assistant', 'staggering', 'wronged', 'eye-deceiving', 'well-cemented', 'classified', 'dispossessed', 'hefty', 'digestible', 'ineffable', 'preceeded', 'bald', 'parsimonious', 'Naval', 'not-less-deadly', 'outdistanced', 'delineated', 'worn', 'gravest', 'law-unto-itself', 'field-flattening', 'clocked', 'South-Asian', 'inclined', 'amended', 'semipublic', 'English-born', 'underdeveloped', 'jeweled', 'jacketed', 'assayed', 'optimal', 'yellowish', 'greater', 'married', 'printed', 'excitatory', 'misbranded', 'docked', 'Physiological', 'interdependent', 'appetizing', 'unimpeachable', 'twenty-five-dollar', 'assisted', 'unconventional', 'Gloomy', 'qualitative', 'nonmythological', 'natty', 'diluted', 'ambitious', 'Syrian', 'sales-conscious', 'non-verbal', 'veridical', 'left-justified', 'pistol-packing', 'half-witted', 'sidelong', 'non-professional', 'sculptural', 'nationalistic', '162-game', 'behaved', 'Vast', 'blue-eyed', 'vulnerable', 'water-soluble', 'varying', 'three-panel', 'buoyed', 'unmolested', 'racked', 'prohibited', 'scandalizing', 'euphoric', 'hydroxyl-rich', 'built-in', 'nationalist', 'strong', 'Born', 'ultra-fast', 'inviolable', 'lenient', 'compositional', 'darling', 'premonitory', 'accountable', 'flanked', 'engaged', 'unspectacular', 'rigorous', 'hypophysectomised', 'acoustical', 'Late', 'non-systematic', 'friendly', 'tougher', 'spare', 'active', 'contacted', 'economic', 'Solid', 'half-melted', 'senilis', 'Saudi-American', 'afforded', 'tangible', 'unrolled', 'optimum', 'biographical', 'southern-central', 'unquestionable', '50-year-old', 'emergent', 'disconnected', 'marketed', 'rear-looking', 'mastered', 'gimbaled', 'Colorful', 'unshed', 'cross-licensing', 'thirty-foot', 'gay', '200-megaton', 'hushed', 'silenced', 'swollen-looking', 'adaptable', 'lesser', 'twined', 'sixty-day', 'nested', 'pro-Communist', 'too-shiny', 'inhibited', 'Net', 'Displayed', 'impatient', 'senior', 'all-automatic', 'addressed', 'jealous', 'overseas', 'censored', 'anti-slavery', 'micrometeoritic', 'Lutheran', 'microsomal', 'beat-up', 'unjacketed', 'Fascist', 'belligerent', 'ungratified', 'depressed', 'grateful', 'nobler', 'Complete', 'dreamless', 'polled', 'schooled', 'two-fold', 'queer', 'toxic', 'angelic', 'overheard', 'struck', 'high-priced', 'planar', 'hypoactive', 'decent', 'personally-owned', 'beef-hungry', 'felicitous', 'over-stitched', 'motivated', 'blood-chilling', 'professional', 'ablated', 'sorry', 'expounded', 'self-ordained', 'black', 'bull-like', '200-man', 'shamed', 'One-inch', 'enriched', 'Aristotelian', 'Spanish', 'foreseeable', 'Spherical', 'chauffeured', 'astonishing', 'systematically-simple', 'principle', 'big-boned', 'baked', 'developmental', 'slipped', 'iodide-concentrating', 'embryonic', 'self-content', 'fond', 'exalted', 'Elected', 'appeased', 'well-brushed', 'differential', 'animate', 'catastrophic', 'nice', 'stymied', 'enclosed', 'Foreign', 'represented', 'sorted', 'inflected', 'two-game', 'wainscoted', 'marinated', 'unidirectional', 'ventilated', 'forceful', 'Cultural', 'eroded', 'pretentious', 'three-inning', 'narrower', 'spanned', 'amateurish', 'overemphasized', 'smallest', 'hunched', 'heavy-armed', 'General', 'believable', 'maximized', 'colonial', 'uneducated', 'acquired', 'hostile', 'impersonalized', 'Philco-sponsored', 'abortive', 'unredeemed', 'painted-in', 'levelled', 'mightiest', 'nostalgic', 'Demanded', 'fine-featured', 'congealed', 'trim', 'endothelial', 'thyroid-stimulating', 'dearer', 'upcoming', 'irrespective', 'better', 'weatherproof', 'dynamical', 'uncivil', 'unguided', 'susceptible', 'elevated', 'tongue-tied', 'frenzied', 'U.S.-Soviet', 'subgross', 'preisolated', 'bedazzled', 'well-administered', 'god-like', 'Emotional', 'five-member', 'wind-swept', 'right-angled', 'puritan', 'nicked', 'salty', 'state-sponsored', 'penned', 'unimportant', 'ladylike', 'felled', 'encouraging', 'devout', 'imbued', 'fundamentalist', 'flood-lighted', 'ripened', 'propagated', 'leafiest', 'peaky', 'jerky', 'upped', 'loneliest', 'unsloped', 'prospered', 'arcaded', 'white-topped', 'pseudo-glamorous', 'tied', 'music-loving', 'conclusive', 'syntactical', 'tall-masted', 'well-adjusted', 'ballistic', '14-power', 'counted', 'stilted', 'submarine', 'spent', 'more', 'glutted', 'analytical', 'loaded', 'come', 'altered', 'cruelest', 'mellowed', 'constituted', 'knotty', 'unstilted', 'supranational', 'run/chamber', 'lumbar', 'Old', 'unperceived', 'Literary', 'effeminate', 'Outstanding', 'cumbersome', 'S-11', 'deluded', 'Siamese', 'malnourished', 'blown-up', 'burlesque', 'anorthic', 'found', 'on-sure', 'exciting', 'hinted', 'relativistic', 'Orphic', 'unfixed', 'two-mile', 'romantick', 'Squat-style', 'null', 'freckled', 'red-haired', 'upgraded', 'subtler', 'pre-nuptial', 'out-of-state', 'welded', 'possible', 'round-the-clock', 'visualized', 'theistic', 'cackly', 'overcooked', 'Sizable', 'frowzy', 'full-blown', 'lexicostatistic', 'murky', 'expanded', '100-megaton', 'rudderless', 'eschewed', 'unintelligible', 'nonsingular', 'sanctified', 'floor-to-ceiling', 'sliced', 'puckish', 'Lightweight', 'Greasy', 'trampled', 'iodinated', 'antiquarian', 'Interesting', 'Carolingian', 'high-backed', 'wide-shouldered', 'ogled', 'endothermic', 'smoothest', 'manual', 'precious', 'higher-', 'raided', 'courageous', 'semisecret', 'trade-preparatory', 'descriptive', 'bundled', 'Waldensian', 'best-gaited', 'utilized', 'nerve-shattering', 'smoked', 'okay', 'bed-type', 'quoted', 'appointed', 'legislated', 'osseous', 'northernmost', 'Augustan', 'Tudor-style', 'gerundial', 'pooled', 'heroic', 'advanced', 'flowed', 'faier', 'Confused', 'free-blown', 'pre-determined', 'Settled', 'adopted', 'now-misplaced', 'deficient', 'bound', 'worthless', 'Bathyran', 'surrendered', 'Subdued', 'transient', 'upper-middle-', 'ever-expanding', 'National', 'offbeat', 'taunted', 'Approved', 'northwest', 'Roman-camp', 'grave', 'custodial', 'statutory', 'rolled-up', 'rain-slick', 'feminine', 'semi-inflated', 'avid', 'unheard-of', 'Dark', 'planed', 'ulcerated', 'heavenward', 'immature', 'approved', 'malleable', 'textile-exporting', 'punctured', 'super-high', 'navy-blue', 'lucrative', 'appraised', 'Part-time', 'seismological', 'introjected', 'votive', 'single', 'Electrical', 'flagrant', 'fashioned', 'unpicturesque', 'operated', 'infrequent', 'spray-dried', 'cut', 'septic', 'binuclear', 'contested', 'Private', 'analyzed', 'hewed', 'boxed', 'Funny', 'restorative', 'non-competitive', 'receded', 'Played', 'unheeding', 'Verbal', 'mollified', 'Europeanized', 'supernatural', 'allocated', 'curricular', 'Byronic', 'sickish', 'kinetic', 'liked', 'patriotic', 'Based', 'overall', 'condemnatory', 'discontinuous', 'ice-filled', 'serious-minded', 'budgeted', 'easy-to-reach', 'listed', 'answered', 'Hawaiian', 'unnatural', 'mated', 'oceanographic', 'two-system', 'phonic', 'skipped', 'remote', 'warty', 'obligated', 'half-mincing', 'mononuclear', 'unenvied', 'callous', 'protein-bound', 'Copernican', 'Temporary', 'cerebrated', 'Commission-controlled', 'inter-plant', 'beat', 'Sturdy', 'coincidental', 'churchgoing', 'graven', 'current', 'work-weary', 'Younger', 'subordinated', 'kittenish', 'breathless', 'throttled', 'wide-winged', 'crisis-to-crisis', 'three-round', 'unclear', 'hospitalized', 'mythic', 'stoked', 'syrupy', 'tall', 'half-starved', 'semitropical', 'quick-handling', 'ultra-liberal', 'urbanized', 'line-driven', 'sure', 'freedom-conscious', 'acclaimed', 'ejected', 'attached', 'doleful', 'interpersonal', 'life-death', 'longer-lived', 'Explicit', 'nude', 'undeveloped', 'charged', 'expressionistic', 'respiratory', 'conventional', 'unskilled', 'marveled', 'tenable', 'judicious', 'five-ply', '100-ton', 'certified', 'cryptic', 'admirable', 'limped', 'fiercest', 'ego-adaptive', 'Cromwellian', 'russet', 'unshelled', 'balding', 'three-room', 'available', 'attended', 'flattest', 'concretistic-seeming', 'indeterminate', 'darker', 'bronzed', 'thrived', 'familistical', 'commendable', 'iron', 'kicked', 'humanist', 'wan', 'inspected', 'bruited', 'postulated', 'callable', 'abler', 'infiltrated', '5-foot', 'oil-bearing', 'incessant', 'metal-cleaning', 'various', 'future-day', 'African', 'advisable', 'rainbow-hued', 'hand-painted', 'nondiscriminatory', 'mosaic-like', 'representative', 'non-propagandistic', 'trailed', '450-mile-long', 'midwestern', 'Named', 'datelined', 'hard-to-please', 'intial', 'briefest', 'answerable', 'Aristotelean-Thomistic', 'Primary', 'Unwholesome', 'noisy', 'convenient', 'borne', 'questionable', 'efficacious', 'temperate', 'outdated', 'Gaunt', 'barbaric', 'hoisted', 'diaphanous', 'troubled', 'wired', 'withheld', 'telling', 'head-in-the-clouds', 'beaten', 'More', 'engrossed', 'trichloroacetic', 'charcoal-broiled', 'colloquial', 'floodlit', 'south-eastern', 'ghostlike', 'Damp', 'gainful', 'animal-like', 'dealt', 'Considered', 'D.O.A.', 'muffled', 'marital', 'heterogeneous', 'lowliest', 'heat-absorbing', 'aerated', 'debilitating', 'paramilitary', 'acted', 'unconvincing', 'unrestricted', 'sherbet-colored', 'officious', 'wreathed', 'sickly-tolerant', 'Competitive', 'not-yet-married', 'two-bedroom', 'colicky', 'disfigured', 'Ashamed', 'overturned', 'unmanageable', 'cut-to-a-familiar-pattern', 'all-pervading', '64-cent', 'escorted', 'stroked', 'lanky', 'knowed', 'swingy', 'alike', 'inexplicable', 'bleached', 'impervious', 'muscle-shaping', 'Lebanese', 'Pressure-happy', 'Relevant', 'massive', 'Fresh', 'conned', 'articulate', 'slow-firing', 'chinked', 'spelled', 'Formosan', 'recited', 'lacerated', 'Analytical', 'male', 'tacit', 'liberal-led', 'Unoccupied', 'galvanic', 'Capellan', 'sarcastic', 'kept', 'tasty', 'selfish', 'three-wood', 'varied', '56-yard', 'originated', 'terse', 'Interim', 'inducted', 'melodious', 'rackety', 'twin', 'hyperfine', 'hard-hit', 'ruddy', 'proportional', 'upholstered', 'capital', 'half-hearted', 'stung', 'summoned', 'intermittent', 'Absent-minded', 'codified', 'ascribed', 'southeastern', 'uncomfortable', 'fitful', 'goaded', 'Extruded', '2-run', 'vague', 'disaffected', 'one-time', 'ceramic', 'simplified', 'flimsy', 'erect', 'scientific', 'impromptu', 'sunny', 'tailored', 'square-built', 'fine-looking', '70-year-old', 'hind', 'pulse-timing', 'blocked', 'reliable', 'magical', 'opposite', 'mettlesome', 'spliced', 'Relieved', 'grizzled', 'evidenced', 'countrywide', 'uninominal', 'grey-skied', 'stumpy', 'disastrous', 'littlest', 'sales-building', 'redecorated', 'high-positive', 'Systemic', 'marvelous', 'poorest', 'swart', 'quickened', 'rose', 'viable', 'parochial', 'combat-inflicted', 'light', 'prolific', 'Long', 'investigative', 'Hydraulic', 'controlled', 'Wilsonian', 'inaccessible', 'craven', 'purposed', 'divisible', 'bunkered', 'drizzly', 'predetermined', 'virulent', 'manure-scented', 'automated', 'hindmost', 'manic', 'Closer', 'staid', 'auxiliary', 'Land-based', 'indulgent', 'little', 'intensified', 'understanded', 'anti-Rh', 'intractable', 'wont', 'Necessary', 'equivocal', 'defeated', 'stubbed', 'Various', 'oblique', 'easygoing', 'unrecoverable', 'fuzzy', 'thorny', 'lucid', 'family-oriented', 'scot-free', 'buttery', 'wanted', 'Rich', 'sailorly', 'gentlemanly', 'penal', 'increased', 'condemned', 'rubber-like', 'integrative', '5-mile', 'localized', 'wry-faced', 'Registered', 'prepupal', 'foreign', 'dreadful', 'fast-closing', 'totemic', 'unclouded', 'rangy', 'encrusted', 'rose-pink', 'usurped', 'curbside', 'Increased', 'genetic', 'haunting', 'laminated', 'prayerful', 'rescued', 'addicted', 'Inscribed', 'coexistent', 'raped', 'conspired', 'thoughtful', 'vacant', 'backwater', 'psychiatric', 'blue-collar', 'ravenous', 'asserted', 'self-styled', 'reticulate', 'maladaptive', 'eight-week', 'razor-sharp', 'hatted', 'draughty', 'despatched', 'general-purpose', 'obsequious', 'sinful', 'hemispherical', 'sobered', 'picturesque', 'demonstrated', 'revelatory', 'undependable', 'primary', 'determined', 'evil', 'self-seeking', 'Startled', 'planoconcave', 'satisfactory', 'snug', 'startled', 'taxable', 'tucked', 'best-selling', 'heterogamous', 'meaningful', '5-game', 'played', 'light-hearted', 'healthy', 'orthodox', 'arrived', 'dimly-outlined', 'privileged', 'treble', 'released', 'creamed', 'lawful', 'Biggest', 'forlorn', 'water-filled', 'finer', 'Typical', 'cultural', 'all-over', 'extracted', 'logged', 'Viennese', 'intuitive', 'deloused', 'jewelled', 'threaded', 'unsmiling', 'certain', 'darkest', 'attempted', 'amiable', 'iron-shod', '11-year-old', 'aflame', 'blind-folded', 'limp', 'talked', 'sneaky', 'probabilistic', 'Political', 'nine-state', 'busiest', 'uptown', 'vibrionic', 'fake', 'fragmented', 'upward-mobile', 'offered', 'nut-like', 'fleetest', 'paleocortical', 'viewless', 'dark', 'antithetical', 'full-year', 'luminescent', 'haphazard', 'fit', 'longsuffering', 'flush', 'out-moded', 'indiscriminating', 'commuted', 'stunned', 'enigmatic', 'misconstrued', 'square', 'appealed', 'laborious', 'twenty-five-year-old', 'saddened', 'irate', 'materialistic', 'reviewed', 'conversational', 'brown-edged', 'electronic', 'deterministic', 'rockbound', 'tomblike', 'costive', '2-hour-and-27-minute', 'insidious', 'gotten', 'boosted', 'motional', 'indispensable', '60-inch', 'cheated', 'semi-independent', 'Ptolemaic', 'jumpy', 'telegraphic', 'tax-aided', 'Listed', 'year-long', 'avaliable', 'superimposed', 'Ciceronian', 'unilateral', 'perverse', 'near-at-hand', 'angular', 'strenuous', 'identified', 'equipotent', 'aired', 'imprinted', 'hardened', 'eclectic', 'titled', 'poignant', 'frazzled', 'pre-eminent', 'psychopharmacological', 'phosphorescent', 'Shorter', 'prodigal', 'metered', 'flashy', 'builder/active', 'invitational', 'scattered', 'dwarfed', 'all-American-boy', 'teen-age', 'out-of-school', 'incalculable', 'lordly', 'proceeded', 'compulsive', 'alloted', 'unattached', 'sharpest', 'non-profit', 'fallow', 'Jansenist', 'hurdled', 'liturgical', 'perpetuated', 'unfelt', 'Outside', 'nutritive', 'unachieved', 'rowdy', 'waxy', 'Cynical', 'unforgivable', 'sat', 'arithmetized', 'earned', 'unchanging', 'toasted', 'braided', 'infinitesimal', 'recent', 'case-to-case', 'mammoth', 'gas-fired', 'rented', 'quasi-mechanistic', 'flippant', 'submerged', 'secular', 'stagnant', 'worthwhile', 'bureaucratic', 'commonest', 'marred', 'different-color', 'sub-surface', 'cratered', 'compelling', 'yeller', 'washed-out', 'contraceptive', 'antithyroid', 'succeeding', 'ephemeral', 'deep-eyed', 'juridical', 'high-stepped', 'frictional', 'largest', 'undemocratic', 'editorial', 'dreaded', 'diehard', 'Faulknerian', 'Parisian', 'operational', 'European', 'arrogant', 'interested', 'centered', 'upstream', 'special', 'bewhiskered', 'molal', 'slaked', 'vigilant', 'foreseen', 'paradoxical', 'introductory', 'Hard-surface', 'delicate-beyond-description', 'virile', 'atheromatous', 'raised', 'bravest-feathered', 'fictional', 'Intangible', 'ponderous', 'decorated', 'memorial', 'unfertile', 'stylistic', 'incomprehensible', 'serological', 'featured', 'hand-woven', 'surveyed', 'piezoelectric', 'top', 'neglected', 'dissipated', 'endorsed', 'erotic', 'neurological', 'dusky', 'shaven', 'Ground', 'indebted', 'ritualized', "bushwhackin'", 'parted', 'related', 'rateable', 'Reluctant', 'sobbed', 'main', 'spatial', 'deadliest', 'scabbed', 'profit-motivated', 'Salted', 'morocco-bound', 'eared', 'burst', 'vindictive', 'classless', 'lazy', 'divergent', 'jittery', 'spineless', 'Nice', 'Resolved', 'murdered', 'one-man', 'browny', 'silicate', 'Like', 'deserted', 'ample', 'too-hearty', 'oaken', 'cosmical', 'necessary', 'nonexistent', 'wall-stabilized', 'large', 'opalescent', 'slotted', 'blood-stained', 'politic', 'sensitive', 'tariff-free', 'Soignee', 'Recent', 'slender-waisted', 'preferred', 'substitute', 'polyether-type', 'Visual', 'once-popular', 'accosted', 'nine-year', 'listened', 'uncommunicative', 'six-inch', 'well-ruled', 'obstructed', 'intelligible', 'antitrust', 'starched', 'Major', 'unconstitutional', 'civilian', 'based', 'morphological', 'trimmed', 'liberal-conservative', 'nice-looking', 'ridiculous', 'lumpish', 'neocortical-hypothalamic', 'morning-frightened', 'oxidised', 'benefited', 'hustled', 'Soviet-Western', 'insatiable', 'miserable', 'univalent', 'murderous', 'appalling', 'chromium-substituted', 'pithy', 'canvassed', 'pliable', 'soft-headed', 'obscure', 'unfettered', 'induced', 'commenced', 'hand-to-hand', 'nine-to-five', 'hydrophilic', 'unrifled', 'Dutch', 'industrialized', 'Anglo-Saxon', 'Trichrome', 'photosensitive', 'cement-and-glass', 'care-free', 'remorseless', 'temporal', 'chromatic', 'six-man', 'lustful', 'Technical', '52-year-old', 'formulated', 'resounding', 'wanting-to-be-alone', 'evolved', 'Stained', 'muddy', 'soapy', 'oath-taking', 'collapsible', 'preliterate', 'melted', 'anatomical', 'pulmonary', 'guarded', 'drive-yourself', 'Basic', 'resinlike', 'personalized', 'undifferentiated', 'mailed-fist-in-velvet-glove', 'subversive', 'Vigorous', 'secluded', 'slow-baked', 'Filipino', 'spiked', 'Dominated', 'cowardly', 'image-provoking', 'metropolitan', 'irresistible', 'beguiling', 'unnumbered', 'newly-emerging', 'cloudless']
+from functools import lru_cache
+import mmap
+from pathlib import Path
+import struct
+from typing import Sequence
+
+
+WORD_TABLE_VERSION = 1
+
+MAGIC = b"BBWL"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sHHI")
+TABLE_ENTRY = struct.Struct("<16sIQ")
+OFFSET = struct.Struct("<I")
+
+
+class WordList(Sequence[str]):
+    def __init__(self, buffer: mmap.mmap, count: int, offsets_start: int):
+        self._buffer = buffer
+        self._count = count
+        self._offsets_start = offsets_start
+        self._blob_start = offsets_start + (count + 1) * OFFSET.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):  # pyright: ignore [reportIncompatibleMethodOverride]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("word index out of range")
+
+        start, end = struct.unpack_from(
+            "<II", self._buffer, self._offsets_start + index * OFFSET.size
+        )
+        return self._buffer[self._blob_start + start : self._blob_start + end].decode(
+            "utf-8"
+        )
+
+
+@lru_cache
+def word_table(version: int) -> dict[str, WordList]:
+    filepath = Path(__file__).with_name(f"_words_v{version}.bin")
+    with open(filepath, "rb") as words_file:
+        buffer = mmap.mmap(words_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, format_version, list_count, table_version = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or format_version != FORMAT_VERSION:
+        raise ValueError(f"{filepath} is not a version {FORMAT_VERSION} word file")
+    if table_version != version:
+        raise ValueError(f"{filepath} contains word table version {table_version}")
+
+    word_lists = {}
+    for a in range(list_count):
+        name, count, offsets_start = TABLE_ENTRY.unpack_from(
+            buffer, HEADER.size + a * TABLE_ENTRY.size
+        )
+        word_lists[name.rstrip(b"\0").decode("utf-8")] = WordList(
+            buffer, count, offsets_start
+        )
+
+    return word_lists
+
+
+modifiers = word_table(WORD_TABLE_VERSION)["modifiers"]
+names = word_table(WORD_TABLE_VERSION)["names"]
+appraisals = word_table(WORD_TABLE_VERSION)["appraisals"]
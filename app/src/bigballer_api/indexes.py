@@ -0,0 +1,285 @@
+"""
+bigballer web - collect items
+    Copyright (C) 2023  Michael Manis - michaelmanis@tutanota.com
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Secondary indexes for every N1QL query the API runs
+
+    python -m bigballer_api.indexes create [--defer]
+    python -m bigballer_api.indexes build
+    python -m bigballer_api.indexes check
+
+create is idempotent. Missing indexes are created, ones whose definition no
+longer matches INDEXES are dropped and created again, and idx_ indexes that
+are not in INDEXES anymore are dropped. With --defer, indexes are only
+declared and build creates them all in one pass over the data.
+check EXPLAINs each query and fails unless it is covered by its index
+(answered from the index alone, without fetching documents)
+"""
+import argparse
+import asyncio
+import json
+import re
+import sys
+
+from bigballer_api import data, item_schema
+from bigballer_api.data import close_db, connect_db
+from bigballer_api.pagination import KEYSET_FILTER, KEYSET_ORDER
+
+
+BUCKET = "bigballer"
+SCOPE = "bigballer"
+
+# name -> collection, index keys, partial index condition
+INDEXES = {
+    # get_items
+    "idx_items_owner": (
+        "items",
+        [
+            "owner",
+            "creation_time",
+            "META().id",
+            *item_schema.SUMMARY_FIELDS,
+            "trade_id",
+        ],
+        None,
+    ),
+    # migrate_items
+    "idx_items_schema": ("items", ["IFMISSING(schema_version, 0)"], None),
+    # jobs.start_workers
+    "idx_items_pending": (
+        "items",
+        ["status", "render_claimed_at"],
+        "status IN ['pending', 'rendering']",
+    ),
+    # get_trades
+    "idx_trades_sender": (
+        "trades",
+        ["sender_id", "creation_time", "META().id", "status", "recipient_id"],
+        None,
+    ),
+    # get_trades with a status filter
+    "idx_trades_sender_status": (
+        "trades",
+        ["sender_id", "status", "creation_time", "META().id", "recipient_id"],
+        None,
+    ),
+    # user_search.refresh
+    "idx_users_creation": (
+        "users",
+        ["creation_time", "steam_personaname", "steam_avatarmedium"],
+        None,
+    ),
+}
+
+# Same shapes as the endpoints' queries, keep them in sync
+# index name -> statement, named parameters
+QUERY_CHECKS = {
+    "idx_items_owner": (
+        f"SELECT META().id, creation_time, {', '.join(item_schema.SUMMARY_FIELDS)}, trade_id FROM items WHERE owner = $user_id "
+        f"{KEYSET_FILTER} {KEYSET_ORDER} LIMIT $limit",
+        {"user_id": "", "after_time": 0, "after_id": "", "limit": 11},
+    ),
+    "idx_items_schema": (
+        "SELECT RAW META().id FROM items WHERE IFMISSING(schema_version, 0) < $version",
+        {"version": item_schema.SCHEMA_VERSION},
+    ),
+    "idx_items_pending": (
+        "SELECT RAW META().id FROM items WHERE status IN ['pending', 'rendering'] AND (status = 'pending' OR render_claimed_at < $stale_before)",
+        {"stale_before": 0},
+    ),
+    "idx_trades_sender": (
+        "SELECT META().id, creation_time, status, sender_id, recipient_id FROM trades WHERE sender_id = $user_id "
+        f"{KEYSET_FILTER} {KEYSET_ORDER} LIMIT $limit",
+        {"user_id": "", "after_time": 0, "after_id": "", "limit": 11},
+    ),
+    "idx_trades_sender_status": (
+        "SELECT META().id, creation_time, status, sender_id, recipient_id FROM trades WHERE sender_id = $user_id AND status = 'sent' "
+        f"{KEYSET_FILTER} {KEYSET_ORDER} LIMIT $limit",
+        {"user_id": "", "after_time": 0, "after_id": "", "limit": 11},
+    ),
+    "idx_users_creation": (
+        "SELECT META().id, creation_time, steam_personaname, steam_avatarmedium FROM users WHERE creation_time > $since",
+        {"since": 0},
+    ),
+}
+
+
+def _keyspace(collection: str) -> str:
+    return f"`{BUCKET}`.`{SCOPE}`.`{collection}`"
+
+
+async def _query(statement: str, **params) -> list:
+    bigballer_scope = data.scope()
+    result = bigballer_scope.query(statement, **params)
+    return [row async for row in result.rows()]
+
+
+async def _existing_indexes() -> dict[str, dict]:
+    rows = await _query(
+        "SELECT name, state, keyspace_id, index_key, `condition` FROM system:indexes WHERE bucket_id = $bucket AND scope_id = $scope",
+        bucket=BUCKET,
+        scope=SCOPE,
+    )
+    return {row["name"]: row for row in rows}
+
+
+async def _index_states() -> dict[str, str]:
+    return {name: row["state"] for name, row in (await _existing_indexes()).items()}
+
+
+def _normalize(expression: str) -> str:
+    # The server quotes, parenthesizes and cases expressions its own way
+    return re.sub(r"[\s`()]", "", expression).replace("'", '"').lower()
+
+
+def _matches(index: dict, collection: str, keys: list[str], where: str | None) -> bool:
+    return (
+        index.get("keyspace_id") == collection
+        and [_normalize(k) for k in index.get("index_key", [])]
+        == [_normalize(k) for k in keys]
+        and _normalize(index.get("condition") or "") == _normalize(where or "")
+    )
+
+
+async def _drop(name: str, collection: str):
+    await _query(f"DROP INDEX `{name}` IF EXISTS ON {_keyspace(collection)}")
+
+
+async def create(defer: bool):
+    existing = await _existing_indexes()
+    for name, index in existing.items():
+        if name.startswith("idx_") and name not in INDEXES:
+            await _drop(name, index["keyspace_id"])
+            print(f"{name}: dropped, no longer used")
+
+    for name, (collection, keys, where) in INDEXES.items():
+        if name in existing:
+            if _matches(existing[name], collection, keys, where):
+                print(f"{name}: exists ({existing[name]['state']})")
+                continue
+
+            await _drop(name, existing[name]["keyspace_id"])
+            print(f"{name}: definition changed, dropped")
+
+        statement = (
+            f"CREATE INDEX `{name}` IF NOT EXISTS"
+            f" ON {_keyspace(collection)}({', '.join(keys)})"
+        )
+        if where is not None:
+            statement += f" WHERE {where}"
+        if defer:
+            statement += ' WITH {"defer_build": true}'
+
+        await _query(statement)
+        print(f"{name}: created{' (deferred)' if defer else ''}")
+
+    if not defer:
+        await _wait_online()
+
+
+async def build():
+    states = await _index_states()
+
+    deferred: dict[str, list[str]] = {}
+    for name, (collection, _, _) in INDEXES.items():
+        if states.get(name) == "deferred":
+            deferred.setdefault(collection, []).append(name)
+
+    # All of a collection's indexes are built with a single scan of its data
+    for collection, names in deferred.items():
+        await _query(
+            f"BUILD INDEX ON {_keyspace(collection)}"
+            f"({', '.join(f'`{name}`' for name in names)})"
+        )
+        print(f"{collection}: building {', '.join(names)}")
+
+    await _wait_online()
+
+
+async def _wait_online():
+    while True:
+        states = await _index_states()
+        pending = [name for name in INDEXES if states.get(name) != "online"]
+        if len(pending) == 0:
+            return
+
+        print(f"Waiting for {', '.join(pending)}")
+        await asyncio.sleep(5)
+
+
+def _index_scans(plan) -> list[dict]:
+    if isinstance(plan, dict):
+        scans = [plan] if plan.get("#operator", "").startswith("IndexScan") else []
+        for value in plan.values():
+            scans.extend(_index_scans(value))
+        return scans
+    if isinstance(plan, list):
+        return [scan for value in plan for scan in _index_scans(value)]
+    return []
+
+
+def _fetches(plan) -> bool:
+    if isinstance(plan, dict):
+        return plan.get("#operator") == "Fetch" or any(
+            _fetches(value) for value in plan.values()
+        )
+    if isinstance(plan, list):
+        return any(_fetches(value) for value in plan)
+    return False
+
+
+async def check() -> bool:
+    ok = True
+    for name, (statement, params) in QUERY_CHECKS.items():
+        plan = (await _query(f"EXPLAIN {statement}", **params))[0]["plan"]
+        scans = _index_scans(plan)
+
+        if not any(scan.get("index") == name for scan in scans):
+            used = ", ".join(scan.get("index", "?") for scan in scans) or "no index"
+            print(f"{name}: NOT USED, query uses {used}")
+            ok = False
+        elif _fetches(plan) or not all("covers" in scan for scan in scans):
+            print(f"{name}: NOT COVERING")
+            print(json.dumps(plan, indent=2))
+            ok = False
+        else:
+            print(f"{name}: covered")
+
+    return ok
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Manage the API's N1QL indexes")
+    commands = parser.add_subparsers(dest="command", required=True)
+    create_parser = commands.add_parser("create")
+    create_parser.add_argument(
+        "--defer", action="store_true", help="declare indexes without building them"
+    )
+    commands.add_parser("build")
+    commands.add_parser("check")
+    args = parser.parse_args()
+
+    await connect_db()
+    try:
+        if args.command == "create":
+            await create(args.defer)
+        elif args.command == "build":
+            await build()
+        elif not await check():
+            sys.exit(1)
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
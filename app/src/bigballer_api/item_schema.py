@@ -0,0 +1,199 @@
+"""
+bigballer web - collect items
+    Copyright (C) 2023  Michael Manis - michaelmanis@tutanota.com
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+How items are stored
+
+encode() turns an item, as roll() returns it, into a compact document:
+    words: [word table version, modifier id, name id, appraisal id]
+    rarity: index into rarity_names
+    stats: base stat points, in STAT_NAMES order
+    materials: [body, headwear, [eyes], [items]], each one either
+        [index into MATERIALS, color] for materials from the tables,
+        [CUSTOM, metalness, transmission, ior, color] for generated ones,
+        or the whole material when neither brings it back exactly
+    mesh: without its height and weight, which are the item's (in meters)
+    mesh_key: name of the published GLB, export_path is derived from it
+Everything else is stored as is. decode() reverses it, for whole documents
+and projections of them alike. Documents from before schema_version are
+already in decoded form.
+
+MATERIALS is part of the schema, changing a table material that items
+reference needs a new SCHEMA_VERSION
+"""
+import bigballer_api.generator as roller
+
+
+SCHEMA_VERSION = 1
+
+CUSTOM = -1
+
+MATERIALS = [
+    m
+    for rarity_name in roller.rarity_names
+    for m in roller.material_rarity_table[rarity_name]
+]
+_material_ids = {m["name"]: a for a, m in enumerate(MATERIALS)}
+
+# What item lists show, besides META().id and creation_time.
+# appraisal, modifier and name are only stored by items from before word ids,
+# rarity_name by items from before schema_version
+SUMMARY_FIELDS = ["words", "appraisal", "modifier", "name", "rarity", "rarity_name"]
+
+# What rendering reads and writes
+MESH_FIELDS = ["mesh", "height", "weight", "status"]
+STATUS_FIELDS = ["status", "mesh_key", "export_path", "variant_key"]
+
+_MATERIAL_FIELDS = [
+    "body_material",
+    "headwear_material",
+    "eye_materials",
+    "item_materials",
+]
+
+
+def _decode_material(material):
+    # Some color schemes leave out headwear with [] instead of None
+    if not isinstance(material, list) or len(material) == 0:
+        return material
+
+    if material[0] == CUSTOM:
+        _, metalness, transmission, ior, color = material
+        return roller.custom_material(metalness, transmission, ior, color)
+
+    material_id, color = material
+    return roller.table_material(MATERIALS[material_id], color)
+
+
+def _encode_material(material):
+    if not isinstance(material, dict):
+        return material
+
+    color = list(material["color"])
+    if material["name"] in _material_ids:
+        encoded = [_material_ids[material["name"]], color]
+    elif material["name"] == "custom":
+        encoded = [
+            CUSTOM,
+            material["metalness"],
+            material["transmission"],
+            material["ior"],
+            color,
+        ]
+    else:
+        return material
+
+    # e.g. rolled before a table material changed
+    if _decode_material(encoded) != {**material, "color": color}:
+        return material
+
+    return encoded
+
+
+def encode(item: dict) -> dict:
+    doc = dict(item)
+    doc["schema_version"] = SCHEMA_VERSION
+
+    words = doc.get("words")
+    if isinstance(words, dict):
+        doc["words"] = [
+            words["version"],
+            words["modifier"],
+            words["name"],
+            words["appraisal"],
+        ]
+
+    if "rarity_name" in doc:
+        doc["rarity"] = roller.rarity_names.index(doc.pop("rarity_name"))
+
+    stats = doc.get("base_stats")
+    if isinstance(stats, dict) and set(stats) == set(roller.STAT_NAMES):
+        del doc["base_stats"]
+        doc["stats"] = [stats[stat] for stat in roller.STAT_NAMES]
+
+    if all(field in doc for field in _MATERIAL_FIELDS):
+        doc["materials"] = [
+            _encode_material(doc.pop("body_material")),
+            _encode_material(doc.pop("headwear_material")),
+            [_encode_material(m) for m in doc.pop("eye_materials")],
+            [_encode_material(m) for m in doc.pop("item_materials")],
+        ]
+
+    mesh = doc.get("mesh")
+    if (
+        isinstance(mesh, dict)
+        and "height" in doc
+        and "weight" in doc
+        and mesh.get("height") == doc["height"] / 100
+        and mesh.get("weight") == doc["weight"]
+    ):
+        doc["mesh"] = {k: v for k, v in mesh.items() if k not in ("height", "weight")}
+
+    if "mesh_key" in doc:
+        doc.pop("export_path", None)
+    elif "export_path" in doc:
+        # Published before mesh_key was stored, the file name is the mesh key
+        mesh_key = doc["export_path"].rsplit("/", 1)[-1].removesuffix(".glb")
+        if roller.export_url(mesh_key) == doc["export_path"]:
+            del doc["export_path"]
+            doc["mesh_key"] = mesh_key
+
+    return doc
+
+
+def decode(doc: dict) -> dict:
+    """Raises ValueError for documents of a newer schema"""
+    if doc.get("schema_version", 0) > SCHEMA_VERSION:
+        raise ValueError(f"Unknown item schema version {doc['schema_version']}")
+
+    item = dict(doc)
+    item.pop("schema_version", None)
+
+    words = item.get("words")
+    if isinstance(words, list):
+        version, modifier, name, appraisal = words
+        item["words"] = {
+            "version": version,
+            "modifier": modifier,
+            "name": name,
+            "appraisal": appraisal,
+        }
+
+    if isinstance(item.get("rarity"), int):
+        item["rarity_name"] = roller.rarity_names[item.pop("rarity")]
+
+    if "stats" in item:
+        item["base_stats"] = dict(zip(roller.STAT_NAMES, item.pop("stats")))
+
+    if "materials" in item:
+        body, headwear, eyes, items = item.pop("materials")
+        item["body_material"] = _decode_material(body)
+        item["headwear_material"] = _decode_material(headwear)
+        item["eye_materials"] = [_decode_material(m) for m in eyes]
+        item["item_materials"] = [_decode_material(m) for m in items]
+
+    mesh = item.get("mesh")
+    if isinstance(mesh, dict) and "height" not in mesh and "height" in item:
+        item["mesh"] = {
+            **mesh,
+            "height": item["height"] / 100,
+            "weight": item["weight"],
+        }
+
+    if "mesh_key" in item:
+        mesh_key = item.pop("mesh_key")
+        item["export_path"] = (
+            roller.export_url(mesh_key) if mesh_key is not None else None
+        )
+
+    return item
@@ -0,0 +1,179 @@
+"""
+bigballer web - collect items
+    Copyright (C) 2023  Michael Manis - michaelmanis@tutanota.com
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Background rendering of rolled items
+
+Rolled items are inserted with status "pending" and their ids are queued here,
+a whole roll (e.g. a pack) at a time. Workers claim each item by moving it to
+"rendering" with a compare-and-swap, so an item is only rendered by one
+process, render the claimed meshes in a single Blender job, upload them and
+flip the items to "ready" (or "failed" once settings().generation_max_attempts
+is exhausted). Claims older than settings().render_lease are abandoned and
+taken over at startup
+"""
+import asyncio
+import time
+import traceback
+from uuid import uuid4
+
+from acouchbase.collection import AsyncCollection
+from couchbase.exceptions import (
+    CasMismatchException,
+    CouchbaseException,
+    DocumentNotFoundException,
+)
+from couchbase.options import GetOptions, MutateInOptions
+import couchbase.subdocument as SD
+
+from bigballer_api import data, item_schema
+import bigballer_api.generator as roller
+from bigballer_api.settings import settings
+
+
+CLAIM_FIELDS = ["render_owner", "render_claimed_at"]
+
+_queue: asyncio.Queue[list[str]] | None = None
+_workers: list[asyncio.Task] = []
+_owner = str(uuid4())
+
+
+def enqueue(item_ids: list[str]):
+    _queue.put_nowait(item_ids)  # pyright: ignore [reportOptionalMemberAccess]
+
+
+def _stale_before() -> int:
+    return round((time.time() - settings().render_lease) * 1000)
+
+
+async def _claim(col_items: AsyncCollection, item_id: str) -> dict | None:
+    """Claims a pending or abandoned item for this process, returns its mesh"""
+    try:
+        item_query = await col_items.get(
+            item_id, GetOptions(project=item_schema.MESH_FIELDS + CLAIM_FIELDS)
+        )
+    except DocumentNotFoundException:
+        return None
+
+    item = item_query.content_as[dict]
+    if item.get("status") != "pending" and not (
+        item.get("status") == "rendering"
+        and item.get("render_claimed_at", 0) < _stale_before()
+    ):
+        return None
+
+    try:
+        await col_items.mutate_in(
+            item_id,
+            [
+                SD.upsert("status", "rendering"),
+                SD.upsert("render_owner", _owner),
+                SD.upsert("render_claimed_at", round(time.time() * 1000)),
+            ],
+            MutateInOptions(cas=item_query.cas),
+        )
+    except CasMismatchException:  # Claimed by another process first
+        return None
+
+    return item_schema.decode(item)["mesh"]
+
+
+async def _finish(col_items: AsyncCollection, item_id: str, changes: dict):
+    await col_items.mutate_in(
+        item_id,
+        [SD.upsert(path, value) for path, value in changes.items()]
+        + [SD.remove(path) for path in CLAIM_FIELDS],
+    )
+
+
+async def _render_items(item_ids: list[str]):
+    col_items = data.items()
+
+    claimed = await asyncio.gather(
+        *[_claim(col_items, item_id) for item_id in item_ids]
+    )
+    meshes = {
+        item_id: mesh for item_id, mesh in zip(item_ids, claimed) if mesh is not None
+    }
+
+    for attempt in range(1, settings().generation_max_attempts + 1):
+        if len(meshes) == 0:
+            return
+
+        try:
+            results = await roller.render_batch(meshes)
+        except Exception as e:
+            results = {item_id: e for item_id in meshes}
+
+        for item_id, result in results.items():
+            if isinstance(result, Exception):
+                print(f"Render attempt {attempt} failed for item {item_id}")
+                traceback.print_exception(result)
+                continue
+
+            await _finish(
+                col_items,
+                item_id,
+                {
+                    "mesh_key": result["mesh_key"],
+                    "variant_key": result["variant_key"],
+                    "status": "ready",
+                },
+            )
+            del meshes[item_id]
+
+    for item_id in meshes:
+        await _finish(col_items, item_id, {"status": "failed"})
+
+
+async def _worker():
+    while True:
+        item_ids = await _queue.get()  # pyright: ignore [reportOptionalMemberAccess]
+        try:
+            await _render_items(item_ids)
+        except Exception:
+            traceback.print_exc()
+        finally:
+            _queue.task_done()  # pyright: ignore [reportOptionalMemberAccess]
+
+
+async def start_workers():
+    global _queue
+
+    _queue = asyncio.Queue()
+    for _ in range(max(1, settings().blender_pool_size)):
+        _workers.append(asyncio.create_task(_worker()))
+
+    # Pick up anything unclaimed, or claimed by a process that went away.
+    # Other processes may queue the same items, claiming sorts that out.
+    # New rolls are still rendered when this fails, e.g. without the index
+    bigballer_scope = data.scope()
+    try:
+        pending_query = bigballer_scope.query(
+            "SELECT RAW META().id FROM items WHERE status IN ['pending', 'rendering'] AND (status = 'pending' OR render_claimed_at < $stale_before)",
+            stale_before=_stale_before(),
+        )
+        pending = [item_id async for item_id in pending_query.rows()]
+    except CouchbaseException:
+        traceback.print_exc()
+        return
+
+    for a in range(0, len(pending), settings().rolls_per_pack):
+        enqueue(pending[a : a + settings().rolls_per_pack])
+
+
+async def stop_workers():
+    for worker in _workers:
+        worker.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
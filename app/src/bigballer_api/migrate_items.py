@@ -0,0 +1,128 @@
+"""
+bigballer web - collect items
+    Copyright (C) 2023  Michael Manis - michaelmanis@tutanota.com
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Rewrites item documents of older schemas in the current one (see item_schema)
+
+    python -m bigballer_api.migrate_items [--batch-size N] [--dry-run]
+
+Items are replaced with a compare-and-swap, so ones changed by the API while
+they are being migrated are read again. Safe to re-run, and to run while
+the API is up
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from couchbase.exceptions import CasMismatchException, DocumentNotFoundException
+from couchbase.options import ReplaceOptions
+
+from bigballer_api import data, item_schema
+from bigballer_api.data import close_db, connect_db
+
+
+MAX_ATTEMPTS = 5
+
+
+def _size(doc: dict) -> int:
+    return len(json.dumps(doc, separators=(",", ":")).encode("utf-8"))
+
+
+async def _migrate(item_id: str, dry_run: bool) -> tuple[int, int]:
+    """Returns the document's size before and after"""
+    col_items = data.items()
+
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            item_query = await col_items.get(item_id)
+        except DocumentNotFoundException:
+            return 0, 0
+
+        doc = item_query.content_as[dict]
+        migrated = item_schema.encode(item_schema.decode(doc))
+        if dry_run or migrated == doc:
+            return _size(doc), _size(migrated)
+
+        try:
+            await col_items.replace(
+                item_id, migrated, ReplaceOptions(cas=item_query.cas)
+            )
+            return _size(doc), _size(migrated)
+        except CasMismatchException:
+            if attempt == MAX_ATTEMPTS:
+                raise
+
+    return 0, 0
+
+
+async def migrate(batch_size: int, dry_run: bool) -> bool:
+    outdated_query = data.scope().query(
+        "SELECT RAW META().id FROM items WHERE IFMISSING(schema_version, 0) < $version",
+        version=item_schema.SCHEMA_VERSION,
+    )
+    item_ids = [item_id async for item_id in outdated_query.rows()]
+    print(f"{len(item_ids)} items to migrate to schema {item_schema.SCHEMA_VERSION}")
+
+    ok = True
+    size_before = 0
+    size_after = 0
+    for a in range(0, len(item_ids), batch_size):
+        batch = item_ids[a : a + batch_size]
+        results = await asyncio.gather(
+            *[_migrate(item_id, dry_run) for item_id in batch],
+            return_exceptions=True,
+        )
+
+        for item_id, result in zip(batch, results):
+            if isinstance(result, Exception):
+                print(f"{item_id}: {result!r}")
+                ok = False
+                continue
+
+            size_before += result[0]
+            size_after += result[1]
+
+        print(f"{min(a + batch_size, len(item_ids))}/{len(item_ids)}")
+
+    print(
+        f"{size_before} bytes -> {size_after} bytes"
+        f"{' (dry run, nothing written)' if dry_run else ''}"
+    )
+    return ok
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Rewrite items in the current item schema"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=100, help="items migrated at once"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="only report the size savings"
+    )
+    args = parser.parse_args()
+
+    await connect_db()
+    try:
+        ok = await migrate(args.batch_size, args.dry_run)
+    finally:
+        await close_db()
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
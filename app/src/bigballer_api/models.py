@@ -12,24 +12,88 @@ bigballer web - collect items
     You should have received a copy of the GNU Affero General Public License
     along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from datetime import datetime
-from typing import Literal
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_validator
+
+from bigballer_api.pagination import decode_cursor
+
+
+class Material(BaseModel):
+    name: str
+    metalness: float
+    roughness: float
+    transmission: float
+    opacity: float
+    thickness: float
+    ior: float
+    color: list[float]  # HSV
 
 
 class Item(BaseModel):
-    pass
+    """A whole item, as rolled"""
+
+    model_config = ConfigDict(extra="allow")
+
+    seed: int
+    generator_version: int
+    roll: float
+    rarity_name: str
+    points: float
+    base_stats: dict[str, int]
+    height_roll: float
+    height: float
+    weight: float
+    body_material: Material
+    # Some color schemes roll no headwear as [] instead of None
+    headwear_material: Material | list | None
+    eye_materials: list[Material]
+    item_materials: list[Material]
+    modifier: str
+    name: str
+    appraisal: str
+
+
+class ItemSummary(BaseModel):
+    id: str
+    creation_time: int  # Unix milliseconds
+    modifier: str
+    name: str
+    appraisal: str
+    rarity_name: str | None = None
+    trade_id: str | None = None  # Only shown to the owner
+
+
+class ItemsPage(BaseModel):
+    items: list[ItemSummary]
+    next_cursor: str | None
+
+
+class ItemStatus(BaseModel):
+    id: str
+    status: Literal["pending", "rendering", "ready", "failed"]
+    export_path: str | None
+    variant_key: str | None
 
 
 class User(BaseModel):
     pass
 
 
+def _valid_cursor(v: str | None) -> str | None:
+    if v is not None:
+        decode_cursor(v)
+    return v
+
+
 class ItemsQuery(BaseModel):
     user_id: str | None = Field(min_length=38, max_length=64)
     limit: int = Field(10, gt=0, le=20)
-    offset: int = Field(0, ge=0)
+    # next_cursor of the last page. A field_validator would only run once
+    # FastAPI builds the model, turning bad cursors into 500s instead of 422s
+    cursor: Annotated[str | None, AfterValidator(_valid_cursor)] = Field(
+        None, max_length=256
+    )
 
 
 class TradeQuery(ItemsQuery):
@@ -56,5 +120,46 @@ class TradeStatusUpdate(BaseModel):
 
 class Trade(TradeRequest):
     sender_id: str
-    creation_time: datetime
+    creation_time: int  # Unix milliseconds
     status: Literal["sent", "completed", "cancelled", "rejected"]
+
+
+class TradeSummary(BaseModel):
+    id: str
+    creation_time: int  # Unix milliseconds
+    status: Literal["sent", "completed", "cancelled", "rejected"]
+    sender_id: str
+    recipient_id: str
+
+
+class TradesPage(BaseModel):
+    trades: list[TradeSummary]
+    next_cursor: str | None
+
+
+class PineconeBalance(BaseModel):
+    new_pinecones: int  # accrued since the balance was last spent from
+    total_pinecones: int
+
+
+class UserSearchResult(BaseModel):
+    id: str
+    steam_personaname: str
+    steam_avatarmedium: str | None
+
+
+# Only shown to players. Everything else, e.g. materials and the mesh,
+# is what the model is rendered from and stays exact
+DISPLAY_FLOAT_FIELDS = ["points", "height_roll", "height", "weight"]
+
+
+def round_display_floats(item: dict, digits: int) -> dict:
+    """Copy of a rolled item with its display-only floats rounded"""
+    return {
+        k: (
+            round(v, digits)
+            if k in DISPLAY_FLOAT_FIELDS and isinstance(v, float)
+            else v
+        )
+        for k, v in item.items()
+    }
@@ -0,0 +1,74 @@
+"""
+bigballer web - collect items
+    Copyright (C) 2023  Michael Manis - michaelmanis@tutanota.com
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Keyset pagination on (creation_time, META().id)
+
+Pages continue after the last row of the previous page instead of skipping
+rows with OFFSET, so every page is a range scan no matter how deep it is.
+Clients only ever see an opaque cursor
+"""
+import base64
+import json
+
+
+KEYSET_ORDER = "ORDER BY creation_time, META().id"
+# Only valid when $after_time and $after_id are passed
+KEYSET_FILTER = (
+    "AND (creation_time > $after_time"
+    " OR (creation_time = $after_time AND META().id > $after_id))"
+)
+
+
+def encode_cursor(creation_time: int, doc_id: str) -> str:
+    return (
+        base64.urlsafe_b64encode(json.dumps([creation_time, doc_id]).encode("utf-8"))
+        .rstrip(b"=")
+        .decode("ascii")
+    )
+
+
+def decode_cursor(cursor: str) -> tuple[int, str]:
+    """Raises ValueError if the cursor wasn't made by encode_cursor()"""
+    try:
+        creation_time, doc_id = json.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(creation_time, int) or not isinstance(doc_id, str):
+        raise ValueError("Invalid cursor")
+
+    return creation_time, doc_id
+
+
+def keyset_params(cursor: str | None) -> tuple[str, dict]:
+    """Returns the N1QL filter and named parameters for the page after cursor"""
+    if cursor is None:
+        return "", {}
+
+    after_time, after_id = decode_cursor(cursor)
+    return KEYSET_FILTER, {"after_time": after_time, "after_id": after_id}
+
+
+def page(rows: list[dict], limit: int) -> tuple[list[dict], str | None]:
+    """
+    Queries should fetch limit + 1 rows, so whether there is a next page
+    is known without another round trip
+    """
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1]["creation_time"], rows[-1]["id"])
@@ -0,0 +1,101 @@
+"""
+bigballer web - collect items
+    Copyright (C) 2023  Michael Manis - michaelmanis@tutanota.com
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Pinecone balances
+
+Users earn settings().pinecone_base_amount pinecones every
+settings().pinecone_base_rate milliseconds. A user document stores its
+balance as of last_pinecone_time, and whatever has accrued since is derived
+on read. The balance is only written back when pinecones are spent
+"""
+import time
+
+from acouchbase.collection import AsyncCollection
+from couchbase.exceptions import CasMismatchException
+from couchbase.options import ReplaceOptions
+import couchbase.subdocument as SD
+
+from bigballer_api import data
+from bigballer_api.settings import settings
+
+
+# Concurrent spends by the same user are retried this many times
+SPEND_ATTEMPTS = 5
+
+FIELDS = ["pinecones", "last_pinecone_time"]
+
+
+def accrued(user: dict, current_time: int) -> tuple[int, int]:
+    """
+    Pinecones earned since last_pinecone_time, and when the last whole
+    period of them ended. The partial period keeps counting towards the next
+    """
+    # ex: if the rate is 5 minutes and 11 minutes have elapsed, periods == 2
+    periods = max(0, current_time - user["last_pinecone_time"]) // (
+        settings().pinecone_base_rate
+    )
+
+    return (
+        periods * settings().pinecone_base_amount,
+        user["last_pinecone_time"] + periods * settings().pinecone_base_rate,
+    )
+
+
+def balance(user: dict, current_time: int) -> int:
+    return user["pinecones"] + accrued(user, current_time)[0]
+
+
+async def spend(
+    col_users: AsyncCollection, user_id: str, cost: int, item_count: int = 0
+) -> bool:
+    """
+    Takes cost from the user's balance and adds item_count to their items,
+    in a single compare-and-swap of the user document. Returns False,
+    without writing anything, if they cannot afford it
+    """
+    for attempt in range(1, SPEND_ATTEMPTS + 1):
+        user_query = await col_users.get(user_id)
+        user = user_query.content_as[dict]
+
+        new_pinecones, last_pinecone_time = accrued(user, round(time.time() * 1000))
+        if user["pinecones"] + new_pinecones < cost:
+            return False
+
+        user["pinecones"] += new_pinecones - cost
+        user["last_pinecone_time"] = last_pinecone_time
+        data.update_user_summary(user, item_count=item_count)
+
+        try:
+            await col_users.replace(user_id, user, ReplaceOptions(cas=user_query.cas))
+            return True
+        except CasMismatchException:
+            if attempt == SPEND_ATTEMPTS:
+                raise
+
+    return False
+
+
+async def refund(
+    col_users: AsyncCollection, user_id: str, cost: int, item_count: int = 0
+):
+    """Undoes a successful spend()"""
+    # Counters reject a delta of 0
+    spec = []
+    if cost > 0:
+        spec.append(SD.increment("pinecones", cost))
+    if item_count > 0:
+        spec.append(SD.decrement("item_count", item_count))
+
+    if len(spec) > 0:
+        await col_users.mutate_in(user_id, spec)
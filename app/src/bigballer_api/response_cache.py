@@ -0,0 +1,175 @@
+"""
+bigballer web - collect items
+    Copyright (C) 2023  Michael Manis - michaelmanis@tutanota.com
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Cached responses of public, per-user endpoints
+
+Every user has a generation number that is part of the keys of their
+entries, so invalidate() drops all of a user's entries at once by bumping
+it. Entries live in this process unless settings().response_cache_collection
+names a Couchbase collection to share them (and the generations) through
+"""
+from datetime import timedelta
+import hashlib
+import traceback
+
+from acouchbase.collection import AsyncCollection
+from couchbase.exceptions import CouchbaseException, DocumentNotFoundException
+from couchbase.options import IncrementOptions, SignedInt64, UpsertOptions
+
+from bigballer_api import data
+from bigballer_api.cache import LRUCache
+from bigballer_api.settings import settings
+
+
+class LocalBackend:
+    def __init__(self, max_size: int, ttl: float):
+        self._entries = LRUCache(max_size, ttl)
+        # Never evicted, a forgotten generation would revive stale entries
+        self._generations: dict[str, int] = {}
+
+    async def generation(self, user_id: str) -> int:
+        return self._generations.get(user_id, 0)
+
+    async def bump(self, user_id: str):
+        self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    async def get(self, key: str) -> dict | None:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: dict):
+        self._entries.set(key, value)
+
+    def stats(self) -> dict:
+        return {"backend": "local", **self._entries.stats()}
+
+
+class CouchbaseBackend:
+    def __init__(self, collection_name: str, ttl: float):
+        self.collection_name = collection_name
+        self.ttl = timedelta(seconds=ttl)
+        self.hits = 0
+        self.misses = 0
+
+        self._collection: AsyncCollection | None = None
+
+    def _get_collection(self) -> AsyncCollection:
+        # The database is only connected at startup
+        if self._collection is None:
+            self._collection = data.scope().collection(self.collection_name)
+
+        return self._collection
+
+    async def generation(self, user_id: str) -> int:
+        try:
+            generation_query = await self._get_collection().get(f"gen::{user_id}")
+        except DocumentNotFoundException:
+            return 0
+
+        return generation_query.content_as[int]
+
+    async def bump(self, user_id: str):
+        await self._get_collection().binary().increment(
+            f"gen::{user_id}", IncrementOptions(initial=SignedInt64(1))
+        )
+
+    async def get(self, key: str) -> dict | None:
+        try:
+            entry_query = await self._get_collection().get(key)
+        except DocumentNotFoundException:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry_query.content_as[dict]
+
+    async def set(self, key: str, value: dict):
+        await self._get_collection().upsert(key, value, UpsertOptions(expiry=self.ttl))
+
+    def stats(self) -> dict:
+        return {
+            "backend": f"couchbase:{self.collection_name}",
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_backend: LocalBackend | CouchbaseBackend | None = None
+
+
+def get_backend() -> LocalBackend | CouchbaseBackend:
+    global _backend
+
+    if _backend is None:
+        if settings().response_cache_collection:
+            _backend = CouchbaseBackend(
+                settings().response_cache_collection, settings().response_cache_ttl
+            )
+        else:
+            _backend = LocalBackend(
+                settings().response_cache_size, settings().response_cache_ttl
+            )
+
+    return _backend
+
+
+# A failing shared cache only costs requests their cache hits
+async def key(namespace: str, user_id: str, *parts) -> str | None:
+    """
+    Key of a response about user_id that depends on parts. Take it before
+    building the response, so an invalidation in between is not missed
+    """
+    try:
+        generation = await get_backend().generation(user_id)
+    except CouchbaseException:
+        traceback.print_exc()
+        return None
+
+    digest = hashlib.sha256(
+        repr((user_id, generation, parts)).encode("utf-8")
+    ).hexdigest()
+
+    return f"{namespace}::{digest}"
+
+
+async def get(cache_key: str | None) -> dict | None:
+    if cache_key is None:
+        return None
+
+    try:
+        return await get_backend().get(cache_key)
+    except CouchbaseException:
+        traceback.print_exc()
+        return None
+
+
+async def put(cache_key: str | None, value: dict):
+    if cache_key is None:
+        return
+
+    try:
+        await get_backend().set(cache_key, value)
+    except CouchbaseException:
+        traceback.print_exc()
+
+
+async def invalidate(*user_ids: str):
+    for user_id in user_ids:
+        try:
+            await get_backend().bump(user_id)
+        except CouchbaseException:
+            traceback.print_exc()
+
+
+def stats() -> dict:
+    return get_backend().stats()
@@ -25,17 +25,34 @@ def settings():
 
 
 class _Settings(BaseSettings):
+    admin_ids: list[str] = []  # claimed_ids that may see /health/details
     aws_profile: str | None = None
     baller_generation_script_filepath: str
     base_baller_blend_filepath: str
     base_baller_output_path: str
     blender_binary_filepath: str
+    blender_job_timeout: float = 60  # seconds
+    blender_jobs_per_worker: int = 100  # recycle workers after this many jobs
+    blender_pool_size: int = os.cpu_count() or 1  # 0 disables the pool
     cdn_prefix: str = ""
     db_password: str
     db_url: AnyUrl
     db_username: str
+    generation_max_attempts: int = 3
+    geometry_variant_max_parts: int = 6  # eyes/items beyond this share geometry
+    geometry_variant_steps: int = 4  # height/weight steps per size
+    geometry_variants: bool = False
+    glb_cache_max_bytes: int = 2 * 1024**3  # 0 deletes GLBs once published
     host: str = "0.0.0.0"
     hot_reload: bool = False
+    http_max_connections: int = 20
+    http_timeout: float = 10  # seconds
+    jwt_cache_size: int = 10000  # verified tokens
+    jwt_cache_ttl: float = 300  # seconds
+    jwt_key_id: str = "app_rsa_public.pem"  # kid of public_key_filepath
+    jwt_lifetime: int = 60 * 60 * 24 * 30  # seconds, 1 month
+    jwt_previous_public_keys: dict[str, str] = {}  # kid -> filepath
+    local_storage_path: str = ""  # base_baller_output_path/published if unset
     oid_endpoint: AnyHttpUrl = "https://steamcommunity.com/openid/login"  # pyright: ignore [reportGeneralTypeIssues] # noqa: E501
     oid_redirect: AnyHttpUrl = "http://localhost:1234/api/loginResponse"  # pyright: ignore [reportGeneralTypeIssues] # noqa: E501
     pack_roll_cost: int = 4000
@@ -44,13 +61,26 @@ class _Settings(BaseSettings):
     port: int = 8000
     private_key_filepath: str
     public_key_filepath: str
+    render_lease: float = 600  # seconds before a render claim is abandoned
+    response_cache_collection: str = ""  # share cached responses through it
+    response_cache_size: int = 10000  # responses, when not shared
+    response_cache_ttl: float = 60  # seconds
+    response_float_digits: int | None = None  # round display-only floats of rolls
     roll_cost: int = 1000
     rolls_per_pack: int = 5
     s3_bucket_name: str = ""
     s3_bucket_prefix: str = ""
     starting_pinecones: int = 4000
     steam_api_key: str
+    upload_concurrency: int = 8  # files uploaded at once
+    upload_max_attempts: int = 4
+    upload_multipart_threshold: int = 8 * 1024**2  # also the part size
+    upload_part_concurrency: int = 4  # parts uploaded at once, per file
+    upload_retry_backoff: float = 0.5  # seconds, doubled after every attempt
     use_s3: bool = False
+    user_search_limit: int = 5
+    user_search_refresh_interval: float = 10  # seconds
+    user_search_scan_limit: int = 200  # matches ranked per search
     website_url: AnyHttpUrl = (
         "http://localhost:1234"  # pyright: ignore [reportGeneralTypeIssues]
     )
@@ -0,0 +1,73 @@
+"""
+bigballer web - collect items
+    Copyright (C) 2023  Michael Manis - michaelmanis@tutanota.com
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import httpx
+
+from bigballer_api.settings import settings
+
+
+PLAYER_SUMMARIES_URL = (
+    "https://api.steampowered.com/ISteamUser/GetPlayerSummaries/v0002/"
+)
+OPENID_VALID_RESPONSE = "ns:http://specs.openid.net/auth/2.0\nis_valid:true\n"
+
+
+_client: httpx.AsyncClient = None
+
+
+async def open_client():
+    global _client
+
+    # Shared so connections to steam are kept alive between requests
+    _client = httpx.AsyncClient(
+        timeout=settings().http_timeout,
+        limits=httpx.Limits(max_connections=settings().http_max_connections),
+    )
+
+
+async def close_client():
+    await _client.aclose()
+
+
+async def get_player_summary(steam_id: str) -> dict | None:
+    """
+    Returns None if there is no such steam account
+
+    Raises httpx.HTTPStatusError if steam rejects the request,
+    httpx.TransportError if steam can't be reached
+    and ValueError if steam responds with garbage
+    """
+    res = await _client.get(
+        PLAYER_SUMMARIES_URL,
+        params={"key": settings().steam_api_key, "steamids": steam_id},
+    )
+    res.raise_for_status()
+
+    try:
+        players = res.json()["response"]["players"]
+    except (KeyError, TypeError) as e:
+        raise ValueError("Unexpected player summary response") from e
+
+    return players[0] if len(players) > 0 else None
+
+
+async def check_openid_authentication(validation_params: dict) -> bool:
+    """
+    Raises httpx.HTTPStatusError if steam rejects the request
+    and httpx.TransportError if steam can't be reached
+    """
+    res = await _client.get(str(settings().oid_endpoint), params=validation_params)
+    res.raise_for_status()
+
+    return res.text == OPENID_VALID_RESPONSE
@@ -0,0 +1,147 @@
+"""
+bigballer web - collect items
+    Copyright (C) 2023  Michael Manis - michaelmanis@tutanota.com
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Locking items to trades, within a transaction
+
+A sender's items are locked to a trade by setting their trade_id while it is
+pending. Every item of a call is read concurrently and checked before any of
+them is written, so a failed check leaves the transaction untouched.
+Transactions only offer whole-document operations, not sub-document ones
+"""
+import asyncio
+
+from acouchbase.transactions import AttemptContext
+from couchbase.exceptions import DocumentNotFoundException
+from couchbase.transactions import TransactionGetResult
+
+from bigballer_api import data
+
+
+class TradeLockError(Exception):
+    """Items are missing, not owned by who they should be, or locked elsewhere"""
+
+    def __init__(self, item_ids: list[str]):
+        super().__init__(f"Items cannot be traded: {', '.join(item_ids)}")
+        self.item_ids = item_ids
+
+
+async def _get_items(
+    context: AttemptContext, item_ids: list[str]
+) -> list[TransactionGetResult | DocumentNotFoundException]:
+    item_queries = await asyncio.gather(
+        *[context.get(data.items(), item_id) for item_id in item_ids],
+        return_exceptions=True,
+    )
+    for item_query in item_queries:
+        if isinstance(item_query, Exception) and not isinstance(
+            item_query, DocumentNotFoundException
+        ):
+            raise item_query
+
+    return item_queries  # pyright: ignore [reportGeneralTypeIssues]
+
+
+async def _get_owned(
+    context: AttemptContext, item_ids: list[str], owner: str, trade_id: str | None
+) -> list[TransactionGetResult]:
+    """Items of owner that are locked to trade_id, or unlocked if it is None"""
+    item_queries = await _get_items(context, item_ids)
+
+    bad_ids = []
+    for item_id, item_query in zip(item_ids, item_queries):
+        if isinstance(item_query, DocumentNotFoundException):
+            bad_ids.append(item_id)
+            continue
+
+        item = item_query.content_as[dict]
+        if item.get("owner") != owner or item.get("trade_id") != trade_id:
+            bad_ids.append(item_id)
+
+    if len(bad_ids) > 0:
+        raise TradeLockError(bad_ids)
+
+    return item_queries  # pyright: ignore [reportGeneralTypeIssues]
+
+
+async def _replace_all(
+    context: AttemptContext, item_queries: list[TransactionGetResult], changes: dict
+):
+    """Applies changes to every item, None values remove the field"""
+
+    async def replace(item_query: TransactionGetResult):
+        item = item_query.content_as[dict]
+        for key, value in changes.items():
+            if value is None:
+                item.pop(key, None)
+            else:
+                item[key] = value
+
+        await context.replace(item_query, item)
+
+    await asyncio.gather(*[replace(item_query) for item_query in item_queries])
+
+
+async def lock(context: AttemptContext, item_ids: list[str], owner: str, trade_id: str):
+    """Locks owner's unlocked items to trade_id, raises TradeLockError"""
+    item_queries = await _get_owned(context, item_ids, owner, None)
+    await _replace_all(context, item_queries, {"trade_id": trade_id})
+
+
+async def unlock(context: AttemptContext, item_ids: list[str], trade_id: str):
+    """
+    Unlocks whichever of the items are locked to trade_id.
+    Anything else, including items that no longer exist, is left alone
+    """
+    item_queries = [
+        item_query
+        for item_query in await _get_items(context, item_ids)
+        if not isinstance(item_query, DocumentNotFoundException)
+        and item_query.content_as[dict].get("trade_id") == trade_id
+    ]
+    await _replace_all(context, item_queries, {"trade_id": None})
+
+
+async def exchange(context: AttemptContext, trade: dict, trade_id: str):
+    """
+    Swaps the owners of a trade's items and unlocks them. The sender's items
+    must still be locked to the trade and the recipient's must be unlocked,
+    raises TradeLockError
+    """
+    sender_queries, recipient_queries = await asyncio.gather(
+        _get_owned(context, trade["sender_items"], trade["sender_id"], trade_id),
+        _get_owned(context, trade["recipient_items"], trade["recipient_id"], None),
+        return_exceptions=True,
+    )
+    bad_ids = []
+    for result in [sender_queries, recipient_queries]:
+        if isinstance(result, TradeLockError):
+            bad_ids.extend(result.item_ids)
+        elif isinstance(result, BaseException):
+            raise result
+
+    if len(bad_ids) > 0:
+        raise TradeLockError(bad_ids)
+
+    await asyncio.gather(
+        _replace_all(
+            context,
+            sender_queries,  # pyright: ignore [reportGeneralTypeIssues]
+            {"owner": trade["recipient_id"], "trade_id": None},
+        ),
+        _replace_all(
+            context,
+            recipient_queries,  # pyright: ignore [reportGeneralTypeIssues]
+            {"owner": trade["sender_id"], "trade_id": None},
+        ),
+    )
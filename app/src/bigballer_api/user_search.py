@@ -0,0 +1,107 @@
+"""
+bigballer web - collect items
+    Copyright (C) 2023  Michael Manis - michaelmanis@tutanota.com
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU Affero General Public License as published
+    by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU Affero General Public License for more details.
+    You should have received a copy of the GNU Affero General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+In-process prefix index of users' steam persona names
+
+Names are kept lowercased in a sorted list, so a prefix search is a binary
+search followed by a short scan. Persona names are only set when a user is
+created, so the index is kept fresh by polling for users created since the
+last refresh
+"""
+import asyncio
+import bisect
+import heapq
+import traceback
+
+from bigballer_api import data
+from bigballer_api.settings import settings
+
+
+# Transactions may commit a while after their creation_time,
+# so every refresh looks this far back again
+REFRESH_OVERLAP = 60000  # milliseconds
+
+# (lowercased name, user id), sorted
+_names: list[tuple[str, str]] = []
+# user id -> search result
+_users: dict[str, dict] = {}
+_last_creation_time = 0
+_refresher: asyncio.Task | None = None
+
+
+def add(user_id: str, personaname: str, avatarmedium: str):
+    if user_id not in _users:
+        bisect.insort(_names, (personaname.lower(), user_id))
+
+    _users[user_id] = {
+        "id": user_id,
+        "steam_personaname": personaname,
+        "steam_avatarmedium": avatarmedium,
+    }
+
+
+def search(prefix: str, limit: int) -> list[dict]:
+    """
+    Users whose persona name starts with prefix, ignoring case.
+    Exact matches come first, then the shortest (closest) names
+    """
+    prefix = prefix.lower()
+    start = bisect.bisect_left(_names, (prefix,))
+
+    candidates = []
+    for name, user_id in _names[start : start + settings().user_search_scan_limit]:
+        if not name.startswith(prefix):
+            break
+        candidates.append((len(name), name, user_id))
+
+    return [_users[user_id] for _, _, user_id in heapq.nsmallest(limit, candidates)]
+
+
+async def refresh():
+    global _last_creation_time
+
+    bigballer_scope = data.scope()
+    users_query = bigballer_scope.query(
+        "SELECT META().id, creation_time, steam_personaname, steam_avatarmedium FROM users WHERE creation_time > $since",
+        since=_last_creation_time - REFRESH_OVERLAP,
+    )
+
+    async for user in users_query.rows():
+        if user.get("steam_personaname") is None:
+            continue
+
+        add(user["id"], user["steam_personaname"], user.get("steam_avatarmedium"))
+        _last_creation_time = max(_last_creation_time, user["creation_time"])
+
+
+async def _refresh_forever():
+    while True:
+        await asyncio.sleep(settings().user_search_refresh_interval)
+        try:
+            await refresh()
+        except Exception:
+            traceback.print_exc()
+
+
+async def start():
+    global _refresher
+
+    await refresh()
+    _refresher = asyncio.create_task(_refresh_forever())
+
+
+async def stop():
+    if _refresher is not None:
+        _refresher.cancel()
+        await asyncio.gather(_refresher, return_exceptions=True)
@@ -1,26 +1,139 @@
+"""
+Compiles the generator's word table from the Brown corpus
+
+    python gen.py --version 2
+
+Words are normalized, filtered and deduplicated case-insensitively in a single
+pass over the corpus. Each list is sorted so a word's id is its index, and
+the table is written as _words_v{version}.bin. Items store word ids together
+with the table version, so published tables must never be edited in place.
+Compile a new version instead
+"""
+import argparse
+from collections import Counter, defaultdict
+import re
+import struct
+
 from nltk.corpus import brown
 
 
-def main():
-    modifiers = {
-        w[0]
-        for w in brown.tagged_words()
-        if w[1] in ("JJ", "JJ+JJ", "JJR", "NNS$", "NR$", "NN+HVZ", "OD", "RBR", "VBG")
-    }
-    items = {w[0] for w in brown.tagged_words() if w[1] == "NN"}
-    appraisals = {
-        w[0]
-        for w in brown.tagged_words()
-        if w[1] in ("JJ", "JJR", "JJT", "JJS", "RBR", "VBN")
+# Must match app/src/bigballer_api/generator/_words.py
+MAGIC = b"BBWL"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sHHI")
+TABLE_ENTRY = struct.Struct("<16sIQ")
+OFFSET = struct.Struct("<I")
+
+WORD_LIST_TAGS = {
+    "modifiers": {"JJ", "JJ+JJ", "JJR", "NNS$", "NR$", "NN+HVZ", "OD", "RBR", "VBG"},
+    "names": {"NN"},
+    "appraisals": {"JJ", "JJR", "JJT", "JJS", "RBR", "VBN"},
+}
+
+# Letters, optionally joined by single hyphens or apostrophes
+WORD_PATTERN = re.compile(r"^[A-Za-z]+(?:['-][A-Za-z]+)*$")
+MIN_WORD_LENGTH = 3
+MAX_WORD_LENGTH = 24
+
+
+def normalize(word: str) -> str | None:
+    """Returns None for words which shouldn't be used"""
+    word = word.strip()
+
+    if not MIN_WORD_LENGTH <= len(word) <= MAX_WORD_LENGTH:
+        return None
+    if WORD_PATTERN.match(word) is None:
+        return None
+
+    return word
+
+
+def choose_spelling(spellings: Counter) -> str:
+    # Capitalized duplicates usually just started a sentence,
+    # only keep capitals for words that are never seen in lowercase
+    lowercase = [s for s in spellings if s.islower()]
+    if len(lowercase) > 0:
+        return min(lowercase)
+
+    return min(spellings, key=lambda s: (-spellings[s], s))
+
+
+def compile_word_lists(tagged_words) -> tuple[dict[str, list[str]], dict]:
+    stats = {
+        name: {"matched": 0, "rejected": 0, "spellings": 0, "words": 0}
+        for name in WORD_LIST_TAGS
     }
+    # list name -> casefolded word -> spelling counts
+    spellings = {name: defaultdict(Counter) for name in WORD_LIST_TAGS}
+
+    for word, tag in tagged_words:
+        list_names = [name for name, tags in WORD_LIST_TAGS.items() if tag in tags]
+        if len(list_names) == 0:
+            continue
+
+        normalized = normalize(word)
+        for name in list_names:
+            stats[name]["matched"] += 1
+            if normalized is None:
+                stats[name]["rejected"] += 1
+            else:
+                spellings[name][normalized.casefold()][normalized] += 1
+
+    word_lists = {}
+    for name, words in spellings.items():
+        stats[name]["spellings"] = sum(len(s) for s in words.values())
+        stats[name]["words"] = len(words)
+        word_lists[name] = [choose_spelling(words[key]) for key in sorted(words)]
+
+    return word_lists, stats
+
+
+def write_word_lists(filepath: str, version: int, word_lists: dict[str, list[str]]):
+    table_size = HEADER.size + TABLE_ENTRY.size * len(word_lists)
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(word_lists), version)
+    table = b""
+    body = b""
+    for name, words in word_lists.items():
+        encoded = [w.encode("utf-8") for w in words]
+
+        offsets = [0]
+        for w in encoded:
+            offsets.append(offsets[-1] + len(w))
+
+        table += TABLE_ENTRY.pack(
+            name.encode("utf-8"), len(encoded), table_size + len(body)
+        )
+        body += b"".join(OFFSET.pack(o) for o in offsets)
+        body += b"".join(encoded)
+
+    with open(filepath, "wb") as words_file:
+        words_file.write(header + table + body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--version", type=int, required=True)
+    parser.add_argument("--output", help="defaults to _words_v{version}.bin")
+    args = parser.parse_args()
+
+    word_lists, stats = compile_word_lists(brown.tagged_words())
 
-    print(len(modifiers), len(items), len(appraisals))
-    print(len(modifiers) * len(items) * len(appraisals))
+    for name, list_stats in stats.items():
+        print(
+            f"{name}: {list_stats['matched']} tagged, "
+            f"{list_stats['rejected']} rejected, "
+            f"{list_stats['spellings']} spellings, "
+            f"{list_stats['words']} words"
+        )
+    combinations = 1
+    for words in word_lists.values():
+        combinations *= len(words)
+    print(f"{combinations} combinations")
 
-    with open("_words.py", "w", encoding="UTF-8") as words_file:
-        print(f"modifiers={list(modifiers)}", file=words_file)
-        print(f"items={list(items)}", file=words_file)
-        print(f"appraisals={list(appraisals)}", file=words_file)
+    write_word_lists(
+        args.output or f"_words_v{args.version}.bin", args.version, word_lists
+    )
 
 
 if __name__ == "__main__":
@@ -188,6 +188,23 @@ const viewGltf = (ballerData) => {
   );
 };
 
+// Rolled ballers are rendered in the background,
+// so the model may not be available yet
+const viewBaller = async (ballerId, ballerData) => {
+  if (!ballerData["export_path"]) {
+    const res = await fetch(`/api/item/${ballerId}/status`);
+    const itemStatus = await res.json();
+    if (itemStatus["status"] !== "ready") {
+      console.log(`Baller ${ballerId} is ${itemStatus["status"]}`);
+      return;
+    }
+    ballerData["export_path"] = itemStatus["export_path"];
+    ballerData["variant_key"] = itemStatus["variant_key"];
+  }
+
+  viewGltf(ballerData);
+};
+
 const onWindowResize = () => {
   const width = window.innerWidth;
   const height = window.innerHeight;
@@ -222,7 +239,7 @@ const formatBaller = (ballerId, ballerData) => {
 
   const btnPreview = document.createElement("button");
   btnPreview.appendChild(document.createTextNode("View Baller"));
-  btnPreview.addEventListener("click", () => { viewGltf(ballerData) });
+  btnPreview.addEventListener("click", () => { viewBaller(ballerId, ballerData) });
   ballerDiv.appendChild(btnPreview);
 
   return ballerDiv;